@@ -0,0 +1,106 @@
+"""
+Comparing Particle Resamplers
+=============================
+This example compares the run time and variance of the particle resamplers in Stone Soup, for
+numbers of particles from :math:`10^3` to :math:`10^7`, along with resampling many particle states
+(e.g. those of many tracks) together with :meth:`~.Resampler.batch_resample`.
+"""
+
+# %%
+# Set up
+# ------
+# Particle states are created with random weights, and a single dimension state vector holding the
+# index of each particle, such that the number of times each particle is resampled can be counted.
+import timeit
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from stonesoup.resampler.particle import SystematicResampler, StratifiedResampler, \
+    MultinomialResampler, ResidualResampler, MetropolisResampler
+from stonesoup.types.array import StateVectors
+from stonesoup.types.state import ParticleState
+
+np.random.seed(1990)
+
+
+def random_particles(number_particles):
+    weights = np.random.exponential(size=number_particles)
+    return ParticleState(
+        StateVectors([np.arange(number_particles)]),
+        log_weight=np.log(weights / np.sum(weights)))
+
+
+resamplers = {
+    'Systematic': SystematicResampler(),
+    'Stratified': StratifiedResampler(),
+    'Multinomial': MultinomialResampler(),
+    'Residual': ResidualResampler(),
+    'Metropolis': MetropolisResampler(),
+}
+
+# %%
+# Run time
+# --------
+# The systematic and stratified resamplers are linear in the number of particles, with no sorting
+# of weights. The multinomial resampler requires a binary search for each particle, and the
+# Metropolis resampler a number of iterations that depends on the spread of the weights, but no
+# cumulative sum across all particles, such that it can be split across an
+# :attr:`~.MetropolisResampler.executor`.
+numbers_particles = [10**3, 10**4, 10**5, 10**6, 10**7]
+times = {name: [] for name in resamplers}
+for number_particles in numbers_particles:
+    particles = random_particles(number_particles)
+    for name, resampler in resamplers.items():
+        times[name].append(min(timeit.repeat(
+            lambda: resampler.resample(particles), number=1,
+            repeat=3 if number_particles < 10**6 else 1)))
+
+fig, ax = plt.subplots()
+for name, resampler_times in times.items():
+    ax.loglog(numbers_particles, resampler_times, marker='o', label=name)
+ax.set_xlabel('Number of particles')
+ax.set_ylabel('Time (s)')
+_ = ax.legend()
+
+# %%
+# Variance
+# --------
+# A lower variance in the number of times each particle is resampled, relative to its expected
+# number (number of particles multiplied by its weight), means less noise is added by
+# resampling. Systematic resampling resamples each particle within one of its expected number.
+repeats = 100
+variances = {name: [] for name in resamplers}
+for number_particles in numbers_particles[:3]:
+    particles = random_particles(number_particles)
+    expected = np.exp(particles.log_weight) * number_particles
+    for name, resampler in resamplers.items():
+        squared_errors = 0
+        for _ in range(repeats):
+            new_particles = resampler.resample(particles)
+            counts = np.bincount(
+                np.asarray(new_particles.state_vector[0], dtype=int), minlength=number_particles)
+            squared_errors += (counts - expected)**2
+        variances[name].append(np.mean(squared_errors / repeats))
+
+fig, ax = plt.subplots()
+for name, resampler_variances in variances.items():
+    ax.semilogx(numbers_particles[:3], resampler_variances, marker='o', label=name)
+ax.set_xlabel('Number of particles')
+ax.set_ylabel('Mean variance of count per particle')
+_ = ax.legend()
+
+# %%
+# Batch resampling
+# ----------------
+# Many particle states, for example those of 1,000 tracks, can be resampled in a single call,
+# rather than one call per particle state.
+particles_list = [random_particles(1000) for _ in range(1000)]
+for name in ('Systematic', 'Multinomial'):
+    resampler = resamplers[name]
+    loop_time = min(timeit.repeat(
+        lambda: [resampler.resample(particles) for particles in particles_list],
+        number=1, repeat=3))
+    batch_time = min(timeit.repeat(
+        lambda: resampler.batch_resample(particles_list), number=1, repeat=3))
+    print(f'{name}: {loop_time:.3f}s in turn, {batch_time:.3f}s batched')
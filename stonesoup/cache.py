@@ -0,0 +1,161 @@
+"""Caching of predictions and measurement predictions.
+
+Predictions and measurement predictions are typically requested many times for the same track
+within a single scan (e.g. once per detection by a hypothesiser, and again by an updater). The
+:class:`ScanCache` stores these results for the duration of a scan, keyed on the identity of the
+arguments rather than their (potentially expensive, or unhashable) values.
+
+Methods are made cacheable with the :func:`cache_method` decorator. When called within
+:meth:`ScanCache.scan` (as trackers do for each step), results are stored in that tracker's cache
+and released at the end of the scan. Outside of a scan, each component instance falls back to its
+own small least recently used cache.
+"""
+import contextlib
+import datetime
+import functools
+import numbers
+from collections import OrderedDict, namedtuple
+from contextvars import ContextVar
+
+from .base import Base, Property
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'capacity', 'size'])
+
+_active_cache = ContextVar('active_cache', default=None)
+
+_VALUE_TYPES = (numbers.Number, str, bytes, datetime.datetime, datetime.timedelta, type(None))
+
+
+class ScanCache(Base):
+    """Scan scoped cache
+
+    A bounded, least recently used cache of method results, which is cleared at the end of each
+    :meth:`scan`. Keys are formed from the identity of the arguments (other than simple value
+    types such as numbers and timestamps), so no hashing of states or arrays takes place, and
+    references to arguments are held so that identities cannot be reused whilst cached.
+
+    Example
+    -------
+    A tracker step is wrapped in a scan, such that any predictions made are reused within the
+    step and then released:
+
+    .. code-block:: python
+
+        with cache.scan():
+            associations = data_associator.associate(tracks, detections, time)
+            ...
+    """
+    capacity: int = Property(
+        default=4096,
+        doc="Maximum number of results held. Least recently used results are evicted when "
+            "full. `None` will not limit the size of the cache. Default 4096.")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_entries'] = OrderedDict()
+        return state
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _make_key(func, instance, args, kwargs):
+        key = [func, id(instance)]
+        refs = [instance]
+        for name, value in (*enumerate(args), *kwargs.items()):
+            key.append(name)
+            if isinstance(value, _VALUE_TYPES):
+                key.append(value)
+            else:
+                key.append(id(value))
+                refs.append(value)
+        return tuple(key), tuple(refs)
+
+    def get(self, func, instance, *args, **kwargs):
+        """Get result of method, computing and storing it if not already cached
+
+        Parameters
+        ----------
+        func : callable
+            Unbound method
+        instance : object
+            Instance the method is bound to
+        \\*args, \\*\\*kwargs
+            Arguments passed to the method
+
+        Returns
+        -------
+        : object
+            Result of ``func(instance, *args, **kwargs)``
+        """
+        key, refs = self._make_key(func, instance, args, kwargs)
+        try:
+            cached_refs, result = self._entries[key]
+        except KeyError:
+            pass
+        else:
+            if all(ref is cached_ref for ref, cached_ref in zip(refs, cached_refs)):
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return result
+
+        self.misses += 1
+        result = func(instance, *args, **kwargs)
+        self._entries[key] = refs, result
+        self._entries.move_to_end(key)
+        if self.capacity is not None and len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        """Remove all results from the cache. Hit and miss counts are retained."""
+        self._entries.clear()
+
+    def cache_info(self):
+        """Report cache statistics
+
+        Returns
+        -------
+        : namedtuple
+            Hits, misses, capacity and current size of the cache.
+        """
+        return CacheInfo(self.hits, self.misses, self.capacity, len(self._entries))
+
+    @contextlib.contextmanager
+    def scan(self):
+        """Context manager for a single scan
+
+        Whilst active, all methods decorated with :func:`cache_method` store their results in
+        this cache. On exit, the cache is cleared, such that predictions do not persist (and keep
+        states alive) beyond the scan.
+        """
+        token = _active_cache.set(self)
+        try:
+            yield self
+        finally:
+            _active_cache.reset(token)
+            self.clear()
+
+
+def cache_method(func):
+    """Decorator to cache results of a method with :class:`ScanCache`
+
+    Uses the active scan's cache if there is one, otherwise a cache held on the instance,
+    with capacity of 128.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = _active_cache.get()
+        if cache is None:
+            try:
+                cache = self.__dict__['_instance_cache']
+            except KeyError:
+                cache = self.__dict__['_instance_cache'] = ScanCache(capacity=128)
+        return cache.get(func, self, *args, **kwargs)
+    return wrapper
@@ -23,9 +23,7 @@ class DataAssociator(Base):
         doc="Generate a set of hypotheses for each track-detection pair")
 
     def generate_hypotheses(self, tracks, detections, timestamp, **kwargs):
-        return {track: self.hypothesiser.hypothesise(
-                    track, detections, timestamp, **kwargs)
-                for track in tracks}
+        return self.hypothesiser.batch_hypothesise(tracks, detections, timestamp, **kwargs)
 
     @abstractmethod
     def associate(self, tracks: Set[Track], detections: Set[Detection],
@@ -0,0 +1,183 @@
+import copy
+import functools
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Mapping, Sequence
+
+from .base import DataAssociator
+from ..base import Property
+from ..cache import ScanCache
+from ..hypothesiser import Hypothesiser
+from ..types.hypothesis import Hypothesis
+from ..types.multihypothesis import MultipleHypothesis
+from ..types.track import Track
+
+
+def _single_hypotheses(hypothesis):
+    if isinstance(hypothesis, MultipleHypothesis):
+        return list(hypothesis)
+    return [hypothesis]
+
+
+def _associate_cluster(associator, timestamp, tracks, detections, **kwargs):
+    with ScanCache().scan():
+        associations = associator.associate(set(tracks), set(detections), timestamp, **kwargs)
+    return [associations[track] for track in tracks]
+
+
+def _associate_cluster_indexed(associator, timestamp, tracks, detections, **kwargs):
+    """As :func:`_associate_cluster`, also returning index of each hypothesis's detection"""
+    hypotheses = _associate_cluster(associator, timestamp, tracks, detections, **kwargs)
+    detection_indexes = {id(detection): index for index, detection in enumerate(detections)}
+    return [
+        (hypothesis,
+         [detection_indexes.get(id(single_hypothesis.measurement))
+          for single_hypothesis in _single_hypotheses(hypothesis)])
+        for hypothesis in hypotheses]
+
+
+class _PrecomputedHypothesiser(Hypothesiser):
+    """Hypothesiser returning hypotheses already generated for each track"""
+    hypotheses: Mapping[Track, Sequence[Hypothesis]] = Property(
+        doc="Hypotheses for each track")
+
+    def hypothesise(self, track, detections, timestamp, **kwargs):
+        return self.hypotheses[track]
+
+
+class ClusteredDataAssociator(DataAssociator):
+    """Clustered Data Associator
+
+    A front-end to another :class:`~.DataAssociator`, which splits the association problem
+    into independent clusters. Hypotheses are generated for all tracks and detections with
+    :attr:`hypothesiser`, forming a graph linking each track to the detections it has a
+    (gated) hypothesis with. Each connected component of this graph is a cluster, which is
+    passed to the :attr:`associator` separately, with the resulting associations merged.
+    Where the :attr:`hypothesiser` is that of the :attr:`associator`, the hypotheses are
+    reused rather than generated again for each cluster (except with a process pool).
+    Where association is, for example, a cubic time assignment problem or an exponential
+    enumeration of joint events, many small clusters are much cheaper to solve than one
+    large problem.
+
+    Clusters can optionally be associated in parallel, with an :attr:`executor` such as a
+    :class:`~concurrent.futures.ThreadPoolExecutor` or
+    :class:`~concurrent.futures.ProcessPoolExecutor`. With a process pool, only the latest
+    state of each track is sent, with the returned hypotheses linked back to the tracks and
+    detections of this process.
+
+    Note
+    ----
+    Results only match those of the :attr:`associator` applied to all tracks and detections
+    where the :attr:`hypothesiser` gates out the detections which have no effect on a track's
+    association. Associators which index detections across time (i.e.
+    :class:`~.MFADataAssociator`) aren't suitable.
+    """
+    associator: DataAssociator = Property(
+        doc="Associator used to associate each cluster")
+    hypothesiser: Hypothesiser = Property(
+        default=None,
+        doc="Hypothesiser used to generate hypotheses that determine the clusters. Default "
+            "`None`, where the hypothesiser of the :attr:`associator` is used.")
+    executor: Executor = Property(
+        default=None,
+        doc="Executor used to associate clusters in parallel. Default `None`, where clusters "
+            "are associated in turn.")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.hypothesiser is None:
+            self.hypothesiser = self.associator.hypothesiser
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_property_executor'] = None
+        return state
+
+    @staticmethod
+    def cluster(tracks, hypotheses):
+        """Partition tracks and detections into independent clusters
+
+        Parameters
+        ----------
+        tracks : collection of :class:`~.Track`
+            Tracks to cluster
+        hypotheses : dict of :class:`~.Track`: :class:`~.MultipleHypothesis`
+            Hypotheses for each track
+
+        Returns
+        -------
+        : list of tuple
+            Tracks and detections of each cluster, as lists in order of first appearance
+        """
+        detection_tracks = {}
+        for track in tracks:
+            for hypothesis in hypotheses[track]:
+                if hypothesis:
+                    detection_tracks.setdefault(hypothesis.measurement, []).append(track)
+
+        clusters = []
+        clustered = set()
+        for track in tracks:
+            if track in clustered:
+                continue
+            clustered.add(track)
+            cluster_tracks = [track]
+            cluster_detections = []
+            # Breadth first search over tracks connected by detections
+            for cluster_track in cluster_tracks:
+                for hypothesis in hypotheses[cluster_track]:
+                    if not hypothesis or hypothesis.measurement in clustered:
+                        continue
+                    clustered.add(hypothesis.measurement)
+                    cluster_detections.append(hypothesis.measurement)
+                    for other_track in detection_tracks[hypothesis.measurement]:
+                        if other_track not in clustered:
+                            clustered.add(other_track)
+                            cluster_tracks.append(other_track)
+            clusters.append((cluster_tracks, cluster_detections))
+        return clusters
+
+    def associate(self, tracks, detections, timestamp, **kwargs):
+        tracks = list(tracks)
+        hypotheses = self.generate_hypotheses(tracks, detections, timestamp, **kwargs)
+        clusters = self.cluster(tracks, hypotheses)
+
+        associator = self.associator
+        if self.hypothesiser is associator.hypothesiser:
+            associator = copy.copy(associator)
+            associator.hypothesiser = _PrecomputedHypothesiser(hypotheses)
+
+        if self.executor is None or len(clusters) <= 1:
+            associations = {}
+            for cluster_tracks, cluster_detections in clusters:
+                associations.update(associator.associate(
+                    set(cluster_tracks), set(cluster_detections), timestamp, **kwargs))
+            return associations
+
+        if isinstance(self.executor, ProcessPoolExecutor):
+            # Only latest state of each track sent to workers, with hypotheses linked back to
+            # the tracks and detections of this process
+            results = self.executor.map(
+                functools.partial(
+                    _associate_cluster_indexed, self.associator, timestamp, **kwargs),
+                [[Track([track.state], id=track.id) for track in cluster_tracks]
+                 for cluster_tracks, _ in clusters],
+                [cluster_detections for _, cluster_detections in clusters],
+                chunksize=max(1, len(clusters) // (4 * (os.cpu_count() or 1))))
+            associations = {}
+            for (cluster_tracks, cluster_detections), result in zip(clusters, results):
+                for track, (hypothesis, detection_indexes) in zip(cluster_tracks, result):
+                    for single_hypothesis, index in zip(
+                            _single_hypotheses(hypothesis), detection_indexes):
+                        if index is not None:
+                            single_hypothesis.measurement = cluster_detections[index]
+                    associations[track] = hypothesis
+        else:
+            results = self.executor.map(
+                functools.partial(_associate_cluster, associator, timestamp, **kwargs),
+                [cluster_tracks for cluster_tracks, _ in clusters],
+                [cluster_detections for _, cluster_detections in clusters])
+            associations = {}
+            for (cluster_tracks, _), result in zip(clusters, results):
+                associations.update(zip(cluster_tracks, result))
+        return associations
@@ -1,3 +1,9 @@
+import heapq
+from collections import defaultdict
+
+import numpy as np
+from scipy.special import logsumexp
+
 from .base import DataAssociator
 from ..base import Property
 from ..hypothesiser import Hypothesiser
@@ -6,8 +12,7 @@ from ..types.detection import MissedDetection
 from ..types.hypothesis import (
     SingleProbabilityHypothesis, ProbabilityJointHypothesis)
 from ..types.multihypothesis import MultipleHypothesis
-from ..types.numeric import Probability
-import itertools
+from ..types.numeric import Probability, Probabilities
 
 
 class PDA(DataAssociator):
@@ -48,12 +53,29 @@ class JPDA(DataAssociator):
           \frac{prob_{association(MissedDetection, Track)}}{gate\ ratio}
 
     then Detection is assumed to be outside Track's gate, and the probability
-    of association is dropped from the Gaussian Mixture.  This calculation
-    takes place in the function :meth:`enumerate_JPDA_hypotheses`.
+    of association is dropped from the Gaussian Mixture.
+
+    Tracks are first partitioned by :meth:`cluster_tracks` into clusters which
+    share no detections (with non-zero probability of association), such that
+    detections outside a track's gate don't join clusters. Joint events are
+    then enumerated independently for each cluster by :meth:`_joint_events`,
+    with a depth-first search which skips gated out detections and discards
+    branches as soon as a detection is repeated. The marginal association
+    probabilities are calculated in a single pass over each cluster's joint
+    events. Where :attr:`max_joint_hypotheses` is set, the depth-first search
+    becomes a branch and bound search, which keeps only that number of most
+    likely joint events in each cluster, pruning branches which can't improve
+    on them.
     """
 
     hypothesiser: PDAHypothesiser = Property(
         doc="Generate a set of hypotheses for each prediction-detection pair")
+    max_joint_hypotheses: int = Property(
+        default=None,
+        doc="Maximum number of joint hypotheses per cluster of tracks. Where set, only this "
+            "number of most likely joint hypotheses are used to approximate the marginal "
+            "association probabilities, found with a branch and bound search. Default `None`, "
+            "where all joint hypotheses are used.")
 
     def associate(self, tracks, detections, timestamp, **kwargs):
 
@@ -61,54 +83,191 @@ class JPDA(DataAssociator):
         # available Detections
         hypotheses = self.generate_hypotheses(tracks, detections, timestamp, **kwargs)
 
-        # enumerate the Joint Hypotheses of track/detection associations
-        joint_hypotheses = \
-            self.enumerate_JPDA_hypotheses(tracks, hypotheses)
-
         # Calculate MultiMeasurementHypothesis for each Track over all
-        # available Detections with probabilities drawn from JointHypotheses
+        # available Detections with probabilities drawn from joint events
+        # within each cluster of tracks
         new_hypotheses = dict()
 
-        for track in tracks:
+        for cluster in self.cluster_tracks(tracks, hypotheses):
+            marginals = self._marginal_probabilities(
+                cluster, hypotheses, self.max_joint_hypotheses)
+
+            for track, track_marginals in zip(cluster, marginals):
+
+                single_measurement_hypotheses = list()
 
-            single_measurement_hypotheses = list()
-
-            # record the MissedDetection hypothesis for this track
-            prob_misdetect = Probability.sum(
-                joint_hypothesis.probability
-                for joint_hypothesis in joint_hypotheses
-                if not joint_hypothesis.hypotheses[track].measurement)
-
-            single_measurement_hypotheses.append(
-                SingleProbabilityHypothesis(
-                    hypotheses[track][0].prediction,
-                    MissedDetection(timestamp=timestamp),
-                    measurement_prediction=hypotheses[track][0].measurement_prediction,
-                    probability=prob_misdetect))
-
-            # record hypothesis for any given Detection being associated with
-            # this track
-            for hypothesis in hypotheses[track]:
-                if not hypothesis:
-                    continue
-                pro_detect_assoc = Probability.sum(
-                    joint_hypothesis.probability
-                    for joint_hypothesis in joint_hypotheses
-                    if joint_hypothesis.hypotheses[track].measurement is hypothesis.measurement)
+                # record the MissedDetection hypothesis for this track
+                prob_misdetect = Probability.sum(
+                    probability
+                    for hypothesis, probability in zip(hypotheses[track], track_marginals)
+                    if not hypothesis)
 
                 single_measurement_hypotheses.append(
                     SingleProbabilityHypothesis(
-                        hypothesis.prediction,
-                        hypothesis.measurement,
-                        measurement_prediction=hypothesis.measurement_prediction,
-                        probability=pro_detect_assoc))
+                        hypotheses[track][0].prediction,
+                        MissedDetection(timestamp=timestamp),
+                        measurement_prediction=hypotheses[track][0].measurement_prediction,
+                        probability=prob_misdetect))
 
-            result = MultipleHypothesis(single_measurement_hypotheses, True, 1)
+                # record hypothesis for any given Detection being associated with
+                # this track
+                for hypothesis, probability in zip(hypotheses[track], track_marginals):
+                    if not hypothesis:
+                        continue
 
-            new_hypotheses[track] = result
+                    single_measurement_hypotheses.append(
+                        SingleProbabilityHypothesis(
+                            hypothesis.prediction,
+                            hypothesis.measurement,
+                            measurement_prediction=hypothesis.measurement_prediction,
+                            probability=probability))
+
+                result = MultipleHypothesis(single_measurement_hypotheses, True, 1)
+
+                new_hypotheses[track] = result
 
         return new_hypotheses
 
+    @staticmethod
+    def cluster_tracks(tracks, multihypths):
+        """Partition tracks into clusters which share no detections
+
+        Tracks are in the same cluster if they are connected by detections which each has a
+        non-zero probability of association with, such that joint events of each cluster are
+        independent of those of other clusters.
+
+        Parameters
+        ----------
+        tracks : collection of :class:`~.Track`
+            Tracks to cluster
+        multihypths : dict of :class:`~.Track`: :class:`~.MultipleHypothesis`
+            Hypotheses for each track
+
+        Returns
+        -------
+        : list of list of :class:`~.Track`
+            Clusters of tracks, with tracks ordered such that those sharing detections are near
+            each other.
+        """
+        detection_tracks = defaultdict(list)
+        for track in tracks:
+            for hypothesis in multihypths[track]:
+                if hypothesis and hypothesis.probability > 0:
+                    detection_tracks[hypothesis.measurement].append(track)
+
+        clusters = []
+        clustered = set()
+        for track in tracks:
+            if track in clustered:
+                continue
+            clustered.add(track)
+            cluster = [track]
+            # Breadth first search over tracks connected by detections
+            for cluster_track in cluster:
+                for hypothesis in multihypths[cluster_track]:
+                    if not hypothesis or hypothesis.probability <= 0:
+                        continue
+                    for other_track in detection_tracks.pop(hypothesis.measurement, ()):
+                        if other_track not in clustered:
+                            clustered.add(other_track)
+                            cluster.append(other_track)
+            clusters.append(cluster)
+        return clusters
+
+    @staticmethod
+    def _joint_events(options, max_events=None):
+        """Enumerate valid joint events by depth first search
+
+        Parameters
+        ----------
+        options : list of list of (float, object)
+            For each track, the log probability of each hypothesis and the measurement (or `None`
+            for missed detection).
+        max_events : int, optional
+            If set, only this number of most likely events are returned, with branches which
+            can't improve on those already found pruned.
+
+        Returns
+        -------
+        : list of (float, tuple of int)
+            Log probability of each joint event, and index of each track's hypothesis in it.
+        """
+        n_tracks = len(options)
+        orders = [
+            sorted(range(len(track_options)), key=lambda i, o=track_options: -o[i][0])
+            for track_options in options]
+        # Upper bound on log probability from remaining tracks, ignoring conflicts
+        bounds = [0.] * (n_tracks + 1)
+        for i in reversed(range(n_tracks)):
+            bounds[i] = bounds[i + 1] + max(
+                (log_prob for log_prob, _ in options[i]), default=-np.inf)
+
+        events = []
+        choices = [0] * n_tracks
+        used_measurements = set()
+
+        def search(depth, log_prob):
+            if max_events is not None and len(events) >= max_events \
+                    and log_prob + bounds[depth] <= events[0][0]:
+                return
+            if depth == n_tracks:
+                event = (log_prob, tuple(choices))
+                if max_events is None:
+                    events.append(event)
+                elif len(events) < max_events:
+                    heapq.heappush(events, event)
+                else:
+                    heapq.heapreplace(events, event)
+                return
+            for index in orders[depth]:
+                hypothesis_log_prob, measurement = options[depth][index]
+                if hypothesis_log_prob == -np.inf:
+                    break  # Remaining hypotheses also impossible
+                if measurement is not None:
+                    if measurement in used_measurements:
+                        continue
+                    used_measurements.add(measurement)
+                choices[depth] = index
+                search(depth + 1, log_prob + hypothesis_log_prob)
+                if measurement is not None:
+                    used_measurements.remove(measurement)
+
+        search(0, 0.)
+        return events
+
+    @classmethod
+    def _hypothesis_options(cls, tracks, multihypths):
+        return [
+            [(Probability(hypothesis.probability).log_value,
+              hypothesis.measurement if hypothesis else None)
+             for hypothesis in multihypths[track]]
+            for track in tracks]
+
+    @classmethod
+    def _marginal_probabilities(cls, tracks, multihypths, max_events=None):
+        """Marginal probabilities of each track's hypotheses, over joint events of tracks
+
+        Returns
+        -------
+        : list of :class:`~.Probabilities`
+            For each track, probability of each hypothesis in the same order as `multihypths`
+        """
+        events = cls._joint_events(cls._hypothesis_options(tracks, multihypths), max_events)
+        if not events:
+            return [Probabilities(np.zeros(len(multihypths[track]))) for track in tracks]
+        log_probs = np.array([log_prob for log_prob, _ in events])
+        choices = np.array([choice for _, choice in events], dtype=np.intp)
+        log_total = logsumexp(log_probs)
+        # Weights relative to total, scaled by largest to avoid underflow
+        max_log_prob = np.max(log_probs)
+        weights = np.exp(log_probs - max_log_prob)
+        log_scale = max_log_prob - log_total
+        marginals = []
+        for i, track in enumerate(tracks):
+            sums = np.bincount(choices[:, i], weights=weights, minlength=len(multihypths[track]))
+            marginals.append(Probabilities(sums) * Probability(log_scale, log_value=True))
+        return marginals
+
     @classmethod
     def enumerate_JPDA_hypotheses(cls, tracks, multihypths):
 
@@ -117,32 +276,13 @@ class JPDA(DataAssociator):
         if not tracks:
             return joint_hypotheses
 
-        # perform a simple level of gating - all track/detection pairs for
-        # which the probability of association is a certain multiple less
-        # than the probability of missed detection - detection is outside the
-        # gating region, association is impossible
-        possible_assoc = list()
+        tracks = list(tracks)
 
-        for track in tracks:
-            track_possible_assoc = list()
-            for hypothesis in multihypths[track]:
-                # Always include missed detection (gate ratio < 1)
-                track_possible_assoc.append(hypothesis)
-            possible_assoc.append(track_possible_assoc)
-
-        # enumerate all valid JPDA joint hypotheses
-        enum_JPDA_hypotheses = (
-            joint_hypothesis
-            for joint_hypothesis in itertools.product(*possible_assoc)
-            if cls.isvalid(joint_hypothesis))
-
-        # turn the valid JPDA joint hypotheses into 'JointHypothesis'
-        for joint_hypothesis in enum_JPDA_hypotheses:
-            local_hypotheses = {}
-
-            for track, hypothesis in zip(tracks, joint_hypothesis):
-                local_hypotheses[track] = \
-                    multihypths[track][hypothesis.measurement]
+        # enumerate all valid JPDA joint hypotheses, searching only
+        # combinations where no measurement is repeated
+        for _, choices in cls._joint_events(cls._hypothesis_options(tracks, multihypths)):
+            local_hypotheses = {
+                track: multihypths[track][index] for track, index in zip(tracks, choices)}
 
             joint_hypotheses.append(
                 ProbabilityJointHypothesis(local_hypotheses))
@@ -0,0 +1,84 @@
+import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from ..cluster import ClusteredDataAssociator
+from ..neighbour import GNNWith2DAssignment
+from ..probability import JPDA
+from ...types.detection import Detection
+from ...types.state import GaussianState
+from ...types.track import Track
+
+
+@pytest.fixture(params=[None, ThreadPoolExecutor, ProcessPoolExecutor])
+def executor(request):
+    if request.param is None:
+        yield None
+    else:
+        with request.param(2) as executor:
+            yield executor
+
+
+@pytest.fixture()
+def tracks_and_detections():
+    timestamp = datetime.datetime.now()
+    tracks = [
+        Track([GaussianState(np.array([[x, 0, y, 0]]), np.diag([1, 0.1, 1, 0.1]), timestamp)])
+        for x, y in ((0, 0), (1.2, 0.9), (2.1, 0), (50, 50), (51, 50), (100, 0), (200, 0))]
+    detections = {
+        Detection(np.array([[x, y]]), timestamp)
+        for x, y in (
+            (0.4, 0.3), (1.6, 0.6), (2.3, 1.1), (0.1, 1.3), (50, 50.5), (100, 1), (150, 0))}
+    return tracks, detections, timestamp
+
+
+def test_cluster(distance_hypothesiser, tracks_and_detections):
+    tracks, detections, timestamp = tracks_and_detections
+    associator = ClusteredDataAssociator(GNNWith2DAssignment(distance_hypothesiser))
+    assert associator.hypothesiser is distance_hypothesiser
+
+    hypotheses = associator.generate_hypotheses(tracks, detections, timestamp)
+    clusters = associator.cluster(tracks, hypotheses)
+    assert [set(cluster_tracks) for cluster_tracks, _ in clusters] == [
+        set(tracks[:3]), set(tracks[3:5]), {tracks[5]}, {tracks[6]}]
+    assert [len(cluster_detections) for _, cluster_detections in clusters] == [4, 1, 1, 0]
+    assert set().union(*(cluster_detections for _, cluster_detections in clusters)) \
+        == {detection for detection in detections if detection.state_vector[0] != 150}
+
+
+def test_clustered_gnn(distance_hypothesiser, tracks_and_detections, executor):
+    tracks, detections, timestamp = tracks_and_detections
+    associator = GNNWith2DAssignment(distance_hypothesiser)
+    clustered_associator = ClusteredDataAssociator(associator, executor=executor)
+
+    expected = associator.associate(tracks, detections, timestamp)
+    associations = clustered_associator.associate(tracks, detections, timestamp)
+    assert associations.keys() == expected.keys()
+    for track in tracks:
+        if expected[track]:
+            assert associations[track].measurement is expected[track].measurement
+        else:
+            assert not associations[track]
+
+
+def test_clustered_jpda(probability_hypothesiser, tracks_and_detections, executor):
+    tracks, detections, timestamp = tracks_and_detections
+    probability_hypothesiser.include_all = False
+    associator = JPDA(probability_hypothesiser)
+    clustered_associator = ClusteredDataAssociator(associator, executor=executor)
+
+    expected = associator.associate(tracks, detections, timestamp)
+    associations = clustered_associator.associate(tracks, detections, timestamp)
+    assert associations.keys() == expected.keys()
+    for track in tracks:
+        expected_probabilities = {
+            hypothesis.measurement if hypothesis else None: float(hypothesis.probability)
+            for hypothesis in expected[track]}
+        probabilities = {
+            hypothesis.measurement if hypothesis else None: float(hypothesis.probability)
+            for hypothesis in associations[track]}
+        assert probabilities.keys() == expected_probabilities.keys()
+        for measurement, probability in probabilities.items():
+            assert probability == pytest.approx(expected_probabilities[measurement])
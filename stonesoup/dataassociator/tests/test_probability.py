@@ -1,10 +1,12 @@
 import datetime
+import itertools
 
 import pytest
 import numpy as np
 
 from ..probability import PDA, JPDA
 from ...types.detection import Detection, MissedDetection
+from ...types.numeric import Probability
 from ...types.state import GaussianState
 from ...types.track import Track
 try:
@@ -116,3 +118,85 @@ def test_no_tracks_probability(associator):
 
     # Since no Tracks went in, there should be no associations
     assert not associations
+
+
+def _brute_force_marginals(tracks, hypotheses):
+    joint_probs = [
+        (joint, np.prod([float(hyp.probability) for hyp in joint]))
+        for joint in itertools.product(*(hypotheses[track] for track in tracks))
+        if JPDA.isvalid(joint)]
+    total = sum(prob for _, prob in joint_probs)
+    marginals = {}
+    for track_index, track in enumerate(tracks):
+        for hypothesis in hypotheses[track]:
+            marginals[track, hypothesis.measurement if hypothesis else None] = sum(
+                prob for joint, prob in joint_probs
+                if joint[track_index] is hypothesis) / total
+    return marginals
+
+
+@pytest.mark.parametrize('max_joint_hypotheses', [None, 10000])
+def test_jpda_marginals(probability_hypothesiser, max_joint_hypotheses):
+    timestamp = datetime.datetime.now()
+    tracks = [
+        Track([GaussianState(np.array([[x, 0, y, 0]]), np.diag([1, 0.1, 1, 0.1]), timestamp)])
+        for x, y in ((0, 0), (1, 1), (2, 0), (50, 50), (51, 50))]
+    detections = {
+        Detection(np.array([[x, y]]), timestamp)
+        for x, y in ((0.5, 0.5), (1.5, 0.5), (2, 1), (0, 1), (50, 50.5))}
+
+    associator = JPDA(probability_hypothesiser, max_joint_hypotheses=max_joint_hypotheses)
+    hypotheses = associator.generate_hypotheses(tracks, detections, timestamp)
+    expected = _brute_force_marginals(tracks, hypotheses)
+
+    associations = associator.associate(tracks, detections, timestamp)
+    for track in tracks:
+        for hypothesis in associations[track]:
+            measurement = hypothesis.measurement if hypothesis else None
+            assert float(hypothesis.probability) \
+                == pytest.approx(expected[track, measurement], abs=1e-12)
+
+    # Joint hypotheses from enumeration match valid subset of product
+    joint_hypotheses = JPDA.enumerate_JPDA_hypotheses(tracks, hypotheses)
+    assert len(joint_hypotheses) == sum(
+        1 for _ in filter(JPDA.isvalid, itertools.product(
+            *(hypotheses[track] for track in tracks))))
+    assert float(Probability.sum(hyp.probability for hyp in joint_hypotheses)) \
+        == pytest.approx(1)
+
+
+def test_jpda_clusters(probability_hypothesiser):
+    timestamp = datetime.datetime.now()
+    probability_hypothesiser.include_all = False
+    tracks = [
+        Track([GaussianState(np.array([[x, 0, 0, 0]]), np.diag([1, 0.1, 1, 0.1]), timestamp)])
+        for x in (0, 2, 100, 200)]
+    detections = {Detection(np.array([[x, 0]]), timestamp) for x in (1, 100)}
+
+    hypotheses = JPDA(probability_hypothesiser).generate_hypotheses(
+        tracks, detections, timestamp)
+    clusters = JPDA.cluster_tracks(tracks, hypotheses)
+    assert sorted(map(set, clusters), key=len) == [{tracks[2]}, {tracks[3]}, set(tracks[:2])]
+
+
+def test_jpda_max_joint_hypotheses(probability_hypothesiser):
+    timestamp = datetime.datetime.now()
+    tracks = [
+        Track([GaussianState(np.array([[x, 0, 0, 0]]), np.diag([1, 0.1, 1, 0.1]), timestamp)])
+        for x in range(4)]
+    detections = {Detection(np.array([[x + 0.5, 0]]), timestamp) for x in range(4)}
+
+    hypotheses = JPDA(probability_hypothesiser).generate_hypotheses(
+        tracks, detections, timestamp)
+    options = JPDA._hypothesis_options(tracks, hypotheses)
+    all_events = JPDA._joint_events(options)
+    best_events = JPDA._joint_events(options, 5)
+    assert len(best_events) == 5
+    assert sorted(best_events, reverse=True) == sorted(all_events, reverse=True)[:5]
+
+    # Approximate marginals still sum to one
+    associations = JPDA(probability_hypothesiser, max_joint_hypotheses=5).associate(
+        tracks, detections, timestamp)
+    for track in tracks:
+        assert float(Probability.sum(hyp.probability for hyp in associations[track])) \
+            == pytest.approx(1)
@@ -240,6 +240,57 @@ def test_tpr_tree_measurement_models(
         assert len(associated_measurements) <= nn_associator.number_of_neighbours
 
 
+@pytest.mark.skipif(rtree is None, reason="'rtree' module not available")
+def test_tpr_tree_incremental(distance_hypothesiser, measurement_model, updater):
+    '''Test TPR tree maintained between scans matches one built afresh'''
+    nn_associator = TPRTreeNN(distance_hypothesiser, measurement_model,
+                              datetime.timedelta(hours=1))
+    timestamp = datetime.datetime.now()
+
+    tracks = {Track([GaussianState(np.array([[x, 1, x, 1]]), np.diag([1, 0.1, 1, 0.1]),
+                                   timestamp)])
+              for x in range(0, 50, 5)}
+
+    def measurements(hypotheses):
+        return {track: {hypothesis.measurement for hypothesis in track_hypotheses if hypothesis}
+                for track, track_hypotheses in hypotheses.items()}
+
+    for step in range(1, 5):
+        timestamp += datetime.timedelta(seconds=1)
+        detections = {Detection(np.array([[x + step, x + step]]), timestamp,
+                                measurement_model=measurement_model)
+                      for x in range(0, 50, 5)}
+        info = nn_associator.tree_info()
+        hypotheses = nn_associator.generate_hypotheses(tracks, detections, timestamp)
+        fresh_associator = TPRTreeNN(distance_hypothesiser, measurement_model,
+                                     datetime.timedelta(hours=1))
+        assert measurements(hypotheses) == measurements(
+            fresh_associator.generate_hypotheses(tracks, detections, timestamp))
+
+        new_info = nn_associator.tree_info()
+        assert new_info.size == len(tracks)
+        assert new_info.queries - info.queries == len(detections)
+        if step == 1:
+            assert new_info.bulk_loads == new_info.inserts == len(tracks)
+        elif step == 3:
+            # Only the updated and new tracks inserted, and deleted track removed
+            assert new_info.inserts - info.inserts == 2
+            assert new_info.deletes - info.deletes == 2
+        else:
+            # Nothing changed, so tree not modified
+            assert new_info.inserts == info.inserts
+            assert new_info.deletes == info.deletes
+
+        if step == 2:
+            # Update one track, delete another and add a new track
+            track, deleted_track = sorted(tracks, key=lambda track: track.state_vector[0])[:2]
+            hypothesis = min(
+                hypothesis for hypothesis in hypotheses[track] if hypothesis)
+            track.append(updater.update(hypothesis))
+            tracks = tracks - {deleted_track} | {Track([GaussianState(
+                np.array([[100, 1, 100, 1]]), np.diag([1, 0.1, 1, 0.1]), timestamp)])}
+
+
 def test_missed_detection_nearest_neighbour(nn_associator):
     '''Test method for nearest neighbour and KD tree'''
     timestamp = datetime.datetime.now()
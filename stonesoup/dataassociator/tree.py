@@ -1,5 +1,7 @@
 import datetime
-from collections import defaultdict
+import itertools
+import time
+from collections import defaultdict, namedtuple
 from operator import attrgetter
 from typing import Sequence
 
@@ -121,6 +123,12 @@ class DetectionKDTreeMixIn(Base):
             for track in tracks}
 
 
+TreeInfo = namedtuple(
+    'TreeInfo',
+    ['inserts', 'deletes', 'bulk_loads', 'queries', 'query_results', 'stale_results', 'seconds',
+     'size'])
+
+
 class TPRTreeMixIn(Base):
     """Detection TPR tree based mixin
 
@@ -158,16 +166,51 @@ class TPRTreeMixIn(Base):
         if self.vel_mapping is None:
             self.vel_mapping = [i + 1 for i in self.pos_mapping]
 
+        self._tree_counts = dict.fromkeys(TreeInfo._fields[:-1], 0)
         self._reset_tree()
 
-    def _reset_tree(self):
-        # Create tree
-        tree_property = rtree.index.Property(
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Tree can't be pickled, so rebuilt on next use
+        state.update(
+            _tree=None, _coords=dict(), _states=dict(), _ids=dict(), _id_tracks=dict())
+        return state
+
+    def _tree_property(self):
+        return rtree.index.Property(
             type=rtree.index.RT_TPRTree,
             tpr_horizon=self.horizon_time.total_seconds(),
             dimension=len(self.pos_mapping))
-        self._tree = rtree.index.RtreeContainer(properties=tree_property)
-        self._coords = dict()
+
+    def _reset_tree(self):
+        # Tree created (bulk loaded) on next update
+        self._tree = None
+        self._coords = dict()  # Tree coordinates, by track
+        self._states = dict()  # State used for coordinates, by track
+        self._ids = dict()  # Tree ID, by track
+        self._id_tracks = dict()  # Track, by tree ID
+        self._next_id = 0
+        self._tree_inserts = 0  # Incremental inserts since tree bulk loaded
+
+    def tree_info(self):
+        """Report TPR tree statistics
+
+        The tree is maintained incrementally between calls: tracks are inserted on first
+        being seen, deleted once no longer passed in, and reinserted only when their state has
+        been updated since they were inserted. Deletion is lazy, with stale entries ignored in
+        queries, and the tree bulk loaded afresh (clearing stale entries) once the number of
+        incremental inserts exceeds the number of tracks.
+
+        Returns
+        -------
+        : namedtuple
+            Number of tracks inserted (including those bulk loaded), deleted and bulk loaded
+            into the tree; the number of tree queries (one per detection), the number of
+            entries they returned and how many of those were stale; the total time in
+            seconds spent maintaining and querying the tree; and the number of tracks
+            currently in the tree.
+        """
+        return TreeInfo(**self._tree_counts, size=len(self._coords))
 
     def _track_tree_coordinates(self, track):
         state_vector = track.mean[self.pos_mapping, :]
@@ -185,38 +228,83 @@ class TPRTreeMixIn(Base):
         return ((*min_pos, *max_pos), (*min_vel, *max_vel),
                 track.timestamp.astimezone(datetime.timezone.utc).timestamp())
 
+    def _add_track(self, track):
+        self._coords[track] = coords = self._track_tree_coordinates(track)
+        self._states[track] = track.state
+        self._ids[track] = track_id = self._next_id
+        self._id_tracks[track_id] = track
+        self._next_id += 1
+        return track_id, coords
+
+    def _remove_track(self, track):
+        # Entry left in tree (deleting from a TPR tree is costly), and ignored by queries
+        # until tree rebuilt
+        del self._coords[track]
+        del self._states[track]
+        del self._id_tracks[self._ids.pop(track)]
+        self._tree_counts['deletes'] += 1
+
+    def _update_tree(self, tracks):
+        """Insert, delete and update tracks in tree, only touching tracks that have changed"""
+        if self._tree is not None and self._tree_inserts > len(tracks):
+            # Rebuild, clearing stale entries, with cost amortised over inserts since last built
+            self._reset_tree()
+        if self._tree is None:
+            # Bulk load all tracks, in order of time
+            items = [(*self._add_track(track), None)
+                     for track in sorted(tracks, key=attrgetter('timestamp'))]
+            if items:
+                self._tree = rtree.index.Index(iter(items), properties=self._tree_property())
+                self._tree_time = items[-1][1][-1]
+            else:
+                self._tree = rtree.index.Index(properties=self._tree_property())
+                self._tree_time = -np.inf
+            self._tree_counts['inserts'] += len(items)
+            self._tree_counts['bulk_loads'] += len(items)
+            return
+
+        deleted_tracks = self._coords.keys() - tracks
+        new_tracks = tracks - self._coords.keys()
+        # Tracks in tree with a new updated state
+        updated_tracks = [
+            track for track in tracks
+            if track not in new_tracks
+            and track.state is not self._states[track] and isinstance(track.state, Update)]
+
+        for track in itertools.chain(deleted_tracks, updated_tracks):
+            self._remove_track(track)
+        inserted_tracks = sorted(
+            itertools.chain(new_tracks, updated_tracks), key=attrgetter('timestamp'))
+        if not inserted_tracks:
+            return
+        if inserted_tracks[0].timestamp.astimezone(datetime.timezone.utc).timestamp() \
+                < self._tree_time:
+            # Tree time only moves forward, so rebuild to insert older tracks
+            self._reset_tree()
+            self._update_tree(tracks)
+            return
+        for track in inserted_tracks:
+            self._tree.insert(*self._add_track(track))
+        self._tree_counts['inserts'] += len(inserted_tracks)
+        self._tree_inserts += len(inserted_tracks)
+        self._tree_time = self._coords[inserted_tracks[-1]][-1]
+
     def generate_hypotheses(self, tracks, detections, timestamp, **kwargs):
         # No need for tree here.
         if not tracks:
             return dict()
+        if not isinstance(tracks, (set, frozenset)):
+            tracks = set(tracks)
 
         # Update the tree in this first section
-        sorted_tracks = sorted(tracks.union(self._tree), key=attrgetter('timestamp'))
-        # Get initial starting time from earliest track
-        c_time = sorted_tracks[0].timestamp
-        for track in sorted_tracks:
-            if track not in self._tree:  # track not in tree, so insert it
-                self._coords[track] = self._track_tree_coordinates(track)
-                self._tree.insert(track, self._coords[track])
-
-            elif track not in tracks:  # track in tree, but not in tracks now; remove it from tree
-                coords = self._coords[track][:-1] \
-                            + ((self._coords[track][-1] - 1e-6,
-                                c_time.astimezone(datetime.timezone.utc).timestamp()),)
-                self._tree.delete(track, coords)
-                del self._coords[track]
-            elif isinstance(track.state, Update):  # Track in tree, and updated; so update it.
-                coords = self._coords[track][:-1] \
-                            + ((self._coords[track][-1]-1e-6,
-                                c_time.astimezone(datetime.timezone.utc).timestamp()),)
-                self._tree.delete(track, coords)
-                self._coords[track] = self._track_tree_coordinates(track)
-                self._tree.insert(track, self._coords[track])
-            # Set current tree to tracks timestamp
-            c_time = track.timestamp
+        start_time = time.perf_counter()
+        self._update_tree(tracks)
+        self._tree_counts['seconds'] += time.perf_counter() - start_time
 
         # With tree up to date, find tracks that intersect with detections
         track_detections = defaultdict(set)
+        inv_model_matrices = dict()
+        zero_velocity = (0, 0)*len(self.pos_mapping)
         for detection in sorted(detections, key=attrgetter('timestamp')):
             if detection.measurement_model is not None:
                 model = detection.measurement_model
@@ -225,8 +313,11 @@ class TPRTreeMixIn(Base):
 
             # Convert detection to track state space
             if isinstance(model, LinearModel):
-                model_matrix = model.matrix(**kwargs)
-                inv_model_matrix = sp.linalg.pinv(model_matrix)
+                try:
+                    inv_model_matrix = inv_model_matrices[model]
+                except KeyError:
+                    inv_model_matrix = inv_model_matrices[model] = \
+                        sp.linalg.pinv(model.matrix(**kwargs))
                 state_meas = (inv_model_matrix
                               @ detection.state_vector)[self.pos_mapping, :]
             else:
@@ -235,16 +326,21 @@ class TPRTreeMixIn(Base):
 
             # Find intersections
             det_time = detection.timestamp.astimezone(datetime.timezone.utc).timestamp()
-            intersected_tracks = self._tree.intersection((
+            start_time = time.perf_counter()
+            track_ids = list(self._tree.intersection((
                 (*state_meas.ravel(), *state_meas.ravel()),
-                (0, 0)*len(self.pos_mapping),
-                (det_time, det_time + 1e-3)))
-            try:
-                for track in intersected_tracks:
+                zero_velocity,
+                (det_time, det_time + 1e-3))))
+            self._tree_counts['seconds'] += time.perf_counter() - start_time
+            self._tree_counts['queries'] += 1
+            self._tree_counts['query_results'] += len(track_ids)
+            for track_id in track_ids:
+                try:
+                    track = self._id_tracks[track_id]
+                except KeyError:  # Stale entry of deleted or updated track; IDs aren't reused
+                    self._tree_counts['stale_results'] += 1
+                else:
                     track_detections[track].add(detection)
-            except KeyError:
-                self._reset_tree()
-                return self.generate_hypotheses(tracks, detections, timestamp, **kwargs)
 
         return {track: self.hypothesiser.hypothesise(
             track, track_detections[track], timestamp, **kwargs)
@@ -1,4 +1,5 @@
 import numpy as np
+import scipy.ndimage
 
 try:
     import cv2
@@ -13,12 +14,19 @@ from ..types.sensordata import ImageFrame
 
 
 class CFAR(Feeder):
-    """Cell-averaging (CA) Constant False Alarm Rate (CFAR) image data feeder
+    """Constant False Alarm Rate (CFAR) image data feeder
 
     The CFAR feeder reads grayscale frames from an appropriate :class:`~.FrameReader`or
     :class:`~.Feeder` and outputs binary frames whose pixel values are either 0 or 255,
     indicating the lack or presence of a detection, respectively.
 
+    Each pixel is compared to a threshold computed from the surrounding square window of train
+    pixels, excluding a central square of guard pixels. By default, cell-averaging (CA) CFAR is
+    used, where the threshold is the mean of the train pixels. Greatest-of (GO) and smallest-of
+    (SO) CFAR instead use the greater or smaller mean of the leading (above) and lagging (below)
+    halves of the window, and ordered-statistic (OS) CFAR uses the :attr:`rank`-th smallest train
+    pixel. Only pixels for which the full window is within the image are tested.
+
     See `here <https://en.wikipedia.org/wiki/Constant_false_alarm_rate#Cell-averaging_CFAR>`__ for
     more information on CA-CFAR.
 
@@ -33,19 +41,41 @@ class CFAR(Feeder):
     squared: bool = Property(doc="If set to True, the threshold will be computed as a function of "
                                  "the sum of squares. The default is False, in which case a "
                                  "simple sum will be evaluated.", default=False)
+    method: str = Property(
+        doc="The CFAR method used to compute the threshold: one of 'CA' (cell-averaging), "
+            "'GO' (greatest-of), 'SO' (smallest-of) or 'OS' (ordered-statistic). Default 'CA'.",
+        default='CA')
+    rank: int = Property(
+        doc="For OS-CFAR, the rank of the train pixel (from smallest, starting at 0) used as the "
+            "threshold. Default `None`, which uses three quarters of the number of train pixels.",
+        default=None)
 
     @BufferedGenerator.generator_method
     def data_gen(self):
         for timestamp, frame in self.reader:
             img = frame.pixels.copy()
-            output_img = self.cfar(img, self.train_size, self.guard_size, self.alpha, self.squared)
+            output_img = self.cfar(img, self.train_size, self.guard_size, self.alpha, self.squared,
+                                   self.method, self.rank)
             new_frame = ImageFrame(output_img, frame.timestamp)
             yield timestamp, new_frame
 
     @staticmethod
-    def cfar(input_img, train_size=10, guard_size=4, alpha=1., squared=False):
+    def _box_sums(integral_img, size):
+        """Sum of every `size` by `size` box, from an integral image with leading zero row and
+        column"""
+        box_sums = integral_img[size:, size:] - integral_img[:-size, size:]
+        box_sums -= integral_img[size:, :-size]
+        box_sums += integral_img[:-size, :-size]
+        return box_sums
+
+    @classmethod
+    def cfar(cls, input_img, train_size=10, guard_size=4, alpha=1., squared=False, method='CA',
+             rank=None):
         """ Perform Constant False Alarm Rate (CFAR) detection on an input image
 
+        Sums of train pixels are computed from an integral image (summed-area table), such that
+        the cost per pixel is independent of the window size.
+
         Parameters
         ----------
         input_img: numpy.ndarray
@@ -59,46 +89,86 @@ class CFAR(Feeder):
         squared: bool
             If set to True, the threshold will be computed as a function of the sum of squares.
             The default is False, in which case a simple sum will be evaluated.
+        method: str
+            The CFAR method: 'CA', 'GO', 'SO' or 'OS'. Default 'CA'.
+        rank: int
+            Rank of train pixel used as threshold for OS-CFAR. Default `None`, which uses three
+            quarters of the number of train pixels.
         Returns
         -------
         numpy.ndarray
             Output image containing 255 for pixels where a target is detected and 0 otherwise.
         """
-        # Get width and height of image
-        width, height = input_img.shape
+        method = method.upper()
+        if method not in ('CA', 'GO', 'SO', 'OS'):
+            raise ValueError(f"Unknown CFAR method {method!r}")
+
         # Compute the CFAR window size
-        window_size = 1 + 2*guard_size + 2*train_size
+        half_size = guard_size + train_size
+        window_size = 1 + 2*half_size
+        guard_window_size = 2*guard_size + 1
         # Initialise empty output image
         output_img = np.zeros(input_img.shape, np.uint8)
-        # Iterate through all pixels
-        for i in range(height-window_size):
-            for j in range(width-window_size):
-                # Compute coordinates of test pixel
-                c_i = i + guard_size + train_size
-                c_j = j + guard_size + train_size
-                # Select the pixels inside the window
-                v = input_img[i:i + window_size, j:j + window_size].copy()
-                # Exclude pixels inside guard zone
-                v[train_size:train_size + 2 * guard_size + 1,
-                  train_size:train_size + 2 * guard_size + 1] = 0
-                # # The above should be equivalent to the code below
-                # v = np.zeros((window_size, window_size))
-                # for k in range(window_size):
-                #     for l in range(window_size):
-                #         if (k >= train_size) and (k < (window_size - train_size)) \
-                #                 and (l >= train_size) and (l < (window_size - train_size)):
-                #             continue
-                #         v[k, l] += input_img[i+k,j+l]
-                # Compute the threshold
-                if squared:
-                    v = v**2
-                threshold = np.sum(v) / (window_size**2 - (2*guard_size + 1)**2)
-                # Populate the output image
-                input_value = input_img[c_i, c_j]
-                if squared:
-                    input_value = input_value**2
-                if input_value/threshold > alpha:
-                    output_img[c_i, c_j] = 255
+        height, width = input_img.shape
+        if height < window_size or width < window_size:
+            return output_img
+
+        img = np.asarray(input_img, dtype=np.float64)
+        if squared:
+            img = img**2
+        # Test pixels for which the full window is within the image
+        test_values = img[half_size:height-half_size, half_size:width-half_size]
+
+        if method == 'OS':
+            footprint = np.ones((window_size, window_size), dtype=bool)
+            footprint[train_size:train_size + guard_window_size,
+                      train_size:train_size + guard_window_size] = False
+            n_train = np.count_nonzero(footprint)
+            if rank is None:
+                rank = (3*n_train) // 4
+            threshold = scipy.ndimage.rank_filter(img, rank, footprint=footprint)[
+                half_size:height-half_size, half_size:width-half_size]
+        else:
+            # Integral image, with leading zero row and column
+            integral_img = np.zeros((height + 1, width + 1))
+            np.cumsum(np.cumsum(img, axis=0), axis=1, out=integral_img[1:, 1:])
+
+            if method == 'CA':
+                window_sums = cls._box_sums(integral_img, window_size)
+                guard_sums = cls._box_sums(integral_img, guard_window_size)[
+                    train_size:height - 2*guard_size - train_size,
+                    train_size:width - 2*guard_size - train_size]
+                threshold = window_sums
+                threshold -= guard_sums
+                threshold /= window_size**2 - guard_window_size**2
+            else:
+                # Sums over leading and lagging halves of window (rows above and below the test
+                # pixel), each excluding guard pixels.
+                n_rows, n_cols = test_values.shape
+                row_sums = integral_img[:, window_size:] - integral_img[:, :-window_size]
+                guard_row_sums = \
+                    integral_img[:, train_size + guard_window_size:width - train_size + 1] \
+                    - integral_img[:, train_size:width - train_size - guard_window_size + 1]
+                # Leading half: rows [r - half_size, r), lagging half: rows (r, r + half_size]
+                leading_sums = (row_sums[half_size:half_size + n_rows]
+                                - row_sums[:n_rows]) \
+                    - (guard_row_sums[half_size:half_size + n_rows]
+                       - guard_row_sums[train_size:train_size + n_rows])
+                lagging_sums = (row_sums[window_size:window_size + n_rows]
+                                - row_sums[half_size + 1:half_size + 1 + n_rows]) \
+                    - (guard_row_sums[half_size + 1 + guard_size:half_size + 1 + guard_size
+                                      + n_rows]
+                       - guard_row_sums[half_size + 1:half_size + 1 + n_rows])
+                n_half_train = half_size*window_size - guard_size*guard_window_size
+                if method == 'GO':
+                    threshold = np.maximum(leading_sums, lagging_sums) / n_half_train
+                else:
+                    threshold = np.minimum(leading_sums, lagging_sums) / n_half_train
+
+        # Populate the output image
+        with np.errstate(divide='ignore', invalid='ignore'):
+            detected = test_values/threshold > alpha
+        output_img[half_size:height-half_size, half_size:width-half_size][detected] = 255
         return output_img
 
 
@@ -37,3 +37,47 @@ def test_ccl_detections(datadir):
     expected_result_filename = Path(datadir.join('expected_result_ccl.png'))
     img = mpimg.imread(expected_result_filename) * 255
     assert np.array_equal(labels_img, img)
+
+
+def _cfar_reference(img, train_size, guard_size, alpha, squared, method, rank):
+    img = img.astype(np.float64)
+    if squared:
+        img = img**2
+    half_size = train_size + guard_size
+    window_size = 2*half_size + 1
+    mask = np.ones((window_size, window_size), dtype=bool)
+    mask[train_size:-train_size, train_size:-train_size] = False
+    output_img = np.zeros(img.shape, np.uint8)
+    for i in range(half_size, img.shape[0] - half_size):
+        for j in range(half_size, img.shape[1] - half_size):
+            window = img[i-half_size:i+half_size+1, j-half_size:j+half_size+1]
+            if method == 'CA':
+                threshold = np.mean(window[mask])
+            elif method == 'OS':
+                threshold = np.sort(window[mask])[rank]
+            else:
+                halves = (np.mean(window[:half_size][mask[:half_size]]),
+                          np.mean(window[half_size+1:][mask[half_size+1:]]))
+                threshold = max(halves) if method == 'GO' else min(halves)
+            if img[i, j] > alpha*threshold:
+                output_img[i, j] = 255
+    return output_img
+
+
+@pytest.mark.parametrize('method, rank', [('CA', None), ('GO', None), ('SO', None), ('OS', 20)])
+@pytest.mark.parametrize('squared', [False, True])
+def test_cfar_methods(method, rank, squared):
+    rng = np.random.default_rng(1990)
+    img = rng.rayleigh(10, size=(40, 45))
+    img[rng.integers(40, size=10), rng.integers(45, size=10)] += 50
+
+    output_img = CFAR.cfar(img, 4, 2, 2., squared, method, rank)
+    expected_img = _cfar_reference(img, 4, 2, 2., squared, method, rank)
+    assert np.count_nonzero(output_img)
+    assert np.array_equal(output_img, expected_img)
+
+
+def test_cfar_small_image():
+    assert not np.any(CFAR.cfar(np.ones((10, 10)), 4, 2))
+    with pytest.raises(ValueError, match="Unknown CFAR method"):
+        CFAR.cfar(np.ones((10, 10)), method='XX')
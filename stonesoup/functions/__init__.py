@@ -1,7 +1,10 @@
 """Mathematical functions used within Stone Soup"""
 import copy
+from functools import lru_cache
 
 import numpy as np
+from scipy.linalg import solve_triangular
+from scipy.stats import multivariate_normal
 
 from ..types.numeric import Probability
 from ..types.array import StateVector, StateVectors, CovarianceMatrix
@@ -72,6 +75,9 @@ def cholesky_eps(A, lower=False):
 def jacobian(fun, x,  **kwargs):
     """Compute Jacobian through finite difference calculation
 
+    Where the state vector of `x` has multiple columns, the Jacobian is evaluated about each of
+    them with a single call of `fun`.
+
     Parameters
     ----------
     fun : function handle
@@ -79,30 +85,37 @@ def jacobian(fun, x,  **kwargs):
         Must be of the form "y = fun(x)", where y can be a scalar or \
         :class:`numpy.ndarray` of shape `(Nd, 1)` or `(Nd,)`
     x : :class:`State`
-        A state with state vector of shape `(Ns, 1)`
+        A state with state vector of shape `(Ns, 1)` or `(Ns, N)`
 
     Returns
     -------
-    jac: :class:`numpy.ndarray` of shape `(Nd, Ns)`
-        The computed Jacobian
+    jac: :class:`numpy.ndarray` of shape `(Nd, Ns)` or `(N, Nd, Ns)`
+        The computed Jacobian, or Jacobians for each of `N` state vectors
     """
 
-    ndim, _ = np.shape(x.state_vector)
+    ndim, num_states = np.shape(x.state_vector)
 
     # For numerical reasons the step size needs to large enough. Aim for 1e-8
     # relative to spacing between floating point numbers for each dimension
-    delta = 1e8*np.spacing(x.state_vector.astype(np.float64).ravel())
+    delta = 1e8*np.spacing(x.state_vector.astype(np.float64))
     # But at least 1e-8
     # TODO: Is this needed? If not, note special case at zero.
     delta[delta < 1e-8] = 1e-8
 
     x2 = copy.copy(x)  # Create a clone of the input
-    x2.state_vector = np.tile(x.state_vector, ndim+1) + np.eye(ndim, ndim+1)*delta[:, np.newaxis]
+    # Each state vector, perturbed in each dimension in turn, followed by the state vector
+    x2.state_vector = (
+        np.asarray(x.state_vector)[:, :, np.newaxis]
+        + np.eye(ndim, ndim+1)[:, np.newaxis, :]*delta[:, :, np.newaxis]
+    ).reshape(ndim, num_states*(ndim+1))
     x2.state_vector = x2.state_vector.view(StateVectors)
 
     F = fun(x2, **kwargs)
+    F = np.reshape(F, (-1, num_states, ndim+1))
 
-    jac = np.divide(F[:, :ndim] - F[:, -1:], delta)
+    jac = np.divide(F[:, :, :ndim] - F[:, :, -1:], delta.T).transpose(1, 0, 2)
+    if num_states == 1:
+        jac = jac[0]
     return jac.astype(np.float64)
 
 
@@ -631,19 +644,109 @@ def gm_reduce_single(means, covars, weights):
     return mean.view(StateVector), covar.view(CovarianceMatrix)
 
 
+def cholesky_factor(covar):
+    """Lower Cholesky factor and log-determinant of a covariance matrix
+
+    Factorisations are cached by value of the covariance, such that repeated evaluations with the
+    same covariance (e.g. a measurement model's noise, or a measurement prediction evaluated
+    against many detections) factorise it once.
+
+    Parameters
+    ----------
+    covar : :class:`numpy.ndarray` of shape (num_dims, num_dims)
+        Positive-definite covariance matrix
+
+    Returns
+    -------
+    : :class:`numpy.ndarray` of shape (num_dims, num_dims)
+        Lower triangular Cholesky factor, which is read-only
+    : float
+        Log-determinant of the covariance
+
+    Raises
+    ------
+    numpy.linalg.LinAlgError
+        If the covariance isn't positive-definite
+    """
+    covar = np.ascontiguousarray(covar, dtype=np.float64)
+    return _cholesky_factor(covar.tobytes(), covar.shape[0])
+
+
+@lru_cache(maxsize=256)
+def _cholesky_factor(covar_bytes, ndim):
+    lower = np.linalg.cholesky(np.frombuffer(covar_bytes).reshape(ndim, ndim))
+    lower.flags.writeable = False
+    return lower, 2*np.sum(np.log(np.diag(lower)))
+
+
+def gaussian_logpdf(residuals, covar):
+    """Log pdf of a zero mean multivariate Gaussian
+
+    Evaluates the log pdf for all residuals with a single triangular solve, using the cached
+    Cholesky factor of the covariance (see :func:`cholesky_factor`). Where the covariance isn't
+    positive-definite, :func:`scipy.stats.multivariate_normal.logpdf` is used.
+
+    Parameters
+    ----------
+    residuals : :class:`numpy.ndarray` of shape (num_dims, num_residuals)
+        Residuals (e.g. :class:`~.StateVector` or :class:`~.StateVectors`), which may hold custom
+        types such as :class:`~.Bearing`
+    covar : :class:`numpy.ndarray` of shape (num_dims, num_dims)
+        Covariance matrix
+
+    Returns
+    -------
+    : :class:`numpy.ndarray` of shape (num_residuals, )
+        Log pdf of each residual
+    """
+    residuals = np.asarray(residuals, dtype=np.float64)
+    try:
+        lower, log_det = cholesky_factor(covar)
+    except np.linalg.LinAlgError:
+        return np.atleast_1d(multivariate_normal.logpdf(residuals.T, cov=covar))
+    whitened = solve_triangular(lower, residuals, lower=True, check_finite=False)
+    return -0.5 * (np.sum(whitened**2, axis=0) + lower.shape[0]*np.log(2*np.pi) + log_det)
+
+
+def match_float_dtype(array, like):
+    """Cast a floating point array to the floating point precision of another array
+
+    Models evaluate in double precision, so this allows arrays held in lower precision
+    (e.g. particle state vectors and log weights stored as `float32` to halve memory) to remain
+    so. Arrays which aren't floating point (e.g. object arrays of :class:`~.Angle` types, or
+    integers) are returned unchanged.
+
+    Parameters
+    ----------
+    array : :class:`numpy.ndarray`
+        Array to cast
+    like : :class:`numpy.ndarray`
+        Array with floating point precision to match
+
+    Returns
+    -------
+    : :class:`numpy.ndarray`
+        The array, cast if required, retaining its type (e.g. :class:`~.StateVectors`)
+    """
+    if array.dtype != like.dtype and np.issubdtype(like.dtype, np.floating) \
+            and np.issubdtype(array.dtype, np.floating):
+        return array.astype(like.dtype)
+    return array
+
+
 def mod_bearing(x):
     r"""Calculates the modulus of a bearing. Bearing angles are within the \
     range :math:`-\pi` to :math:`\pi`.
 
     Parameters
     ----------
-    x: float
-        bearing angle in radians
+    x: float or :class:`numpy.ndarray`
+        bearing angle(s) in radians
 
     Returns
     -------
-    float
-        Angle in radians in the range math: :math:`-\pi` to :math:`+\pi`
+    float or :class:`numpy.ndarray`
+        Angle(s) in radians in the range math: :math:`-\pi` to :math:`+\pi`
     """
 
     x = (x+np.pi) % (2.0*np.pi)-np.pi
@@ -657,14 +760,19 @@ def mod_elevation(x):
 
     Parameters
     ----------
-    x: float
-        elevation angle in radians
+    x: float or :class:`numpy.ndarray`
+        elevation angle(s) in radians
 
     Returns
     -------
-    float
-        Angle in radians in the range math: :math:`-\pi/2` to :math:`+\pi/2`
+    float or :class:`numpy.ndarray`
+        Angle(s) in radians in the range math: :math:`-\pi/2` to :math:`+\pi/2`
     """
+    if np.ndim(x):
+        x = np.asarray(x, dtype=np.float64) % (2*np.pi)
+        N = x//(np.pi/2)
+        return np.select(
+            [(N == 1) | (N == 2), N == 3, N == 4], [np.pi - x, x - 2.0*np.pi, 0.], x)
     x = x % (2*np.pi)  # limit to 2*pi
     N = x//(np.pi/2)   # Count # of 90 deg multiples
     if N == 1:
@@ -2,11 +2,14 @@ import pytest
 import numpy as np
 from numpy import deg2rad
 from scipy.linalg import cholesky, LinAlgError
+from scipy.stats import multivariate_normal
 from pytest import approx, raises
 
 from .. import (
     cholesky_eps, jacobian, gm_reduce_single, mod_bearing, mod_elevation, gauss2sigma,
-    rotx, roty, rotz, cart2sphere, cart2angles, pol2cart, sphere2cart, dotproduct, gm_sample)
+    rotx, roty, rotz, cart2sphere, cart2angles, pol2cart, sphere2cart, dotproduct, gm_sample,
+    cholesky_factor, gaussian_logpdf)
+from ...types.angle import Bearing
 from ...types.array import StateVector, StateVectors, Matrix
 from ...types.state import State, GaussianState
 
@@ -115,6 +118,20 @@ def test_jacobian_large_values():
     assert np.allclose(jac, np.array([[2e10, 0.0], [0.0, 2.0]]))
 
 
+def test_jacobian_multiple_states():
+    def f(x):
+        return StateVectors([x.state_vector[0, :]**2 * x.state_vector[1, :],
+                             np.sin(x.state_vector[1, :])])
+
+    state_vectors = StateVectors([[1., -2., 3.], [0.5, 1., -1.5]])
+    jac = jacobian(f, State(state_vectors))
+    assert jac.shape == (3, 2, 2)
+    for state_vector, state_jac in zip(state_vectors, jac):
+        assert np.array_equal(state_jac, jacobian(f, State(state_vector)))
+        x, y = state_vector.ravel()
+        assert np.allclose(state_jac, [[2*x*y, x**2], [0, np.cos(y)]])
+
+
 def test_gm_reduce_single():
 
     means = StateVectors([StateVector([1, 2]), StateVector([3, 4]), StateVector([5, 6])])
@@ -158,6 +175,10 @@ def test_elevation():
     for ind, val in enumerate(rad_in):
         assert rad_out[ind] == approx(mod_elevation(val))
 
+    # Vectorised, matching scalar evaluation
+    rad_in = np.concatenate((rad_in, np.arange(-8, 9)*np.pi/2, np.random.uniform(-20, 20, 100)))
+    assert np.array_equal(mod_elevation(rad_in), [mod_elevation(val) for val in rad_in])
+
 
 @pytest.mark.parametrize(
     "mean",
@@ -332,3 +353,43 @@ def test_gm_sample(means, covars, weights, size):
         assert samples.shape[0] == means[0].shape[0]
     else:
         assert samples.shape[0] == means.shape[0]
+
+
+def test_cholesky_factor():
+    matrix = np.array([[0.4, -0.2, 0.1],
+                       [0.3, 0.1, -0.2],
+                       [-0.3, 0.0, 0.4]])
+    matrix = matrix@matrix.T
+
+    lower, log_det = cholesky_factor(matrix)
+    assert np.allclose(lower, cholesky(matrix, lower=True))
+    assert log_det == approx(np.linalg.slogdet(matrix)[1])
+    assert not lower.flags.writeable
+
+    # Cached by value
+    assert cholesky_factor(matrix.copy())[0] is lower
+    matrix[0, 0] += 1
+    assert cholesky_factor(matrix)[0] is not lower
+
+    with pytest.raises(LinAlgError):
+        cholesky_factor(np.zeros((3, 3)))
+
+
+def test_gaussian_logpdf():
+    covar = np.array([[2., 0.5], [0.5, 1.]])
+    residuals = StateVectors(np.random.randn(2, 10))
+
+    log_pdfs = gaussian_logpdf(residuals, covar)
+    assert log_pdfs.shape == (10, )
+    assert np.allclose(log_pdfs, multivariate_normal.logpdf(residuals.T, cov=covar))
+    assert gaussian_logpdf(residuals[:, :1], covar)[0] == approx(log_pdfs[0])
+
+    # Custom types
+    residuals = StateVector([Bearing(0.1), 2.])
+    assert gaussian_logpdf(residuals, covar)[0] \
+        == approx(multivariate_normal.logpdf([0.1, 2.], cov=covar))
+
+    # Positive semi-definite covariance left to scipy
+    covar = np.array([[1., 1.], [1., 1.]])
+    with pytest.raises(LinAlgError):
+        gaussian_logpdf(residuals, covar)
@@ -0,0 +1,126 @@
+import numpy as np
+
+
+def group_detections(detections):
+    """Group detections by timestamp and measurement model
+
+    Detections which share a timestamp and measurement model share the same
+    track prediction and measurement prediction, so can be scored together.
+
+    Parameters
+    ----------
+    detections : iterable of :class:`~.Detection`
+        Detections to group
+
+    Returns
+    -------
+    : dict of (:class:`datetime.datetime`, :class:`~.MeasurementModel`): list of \
+    :class:`~.Detection`
+        Detections, in iteration order, keyed by timestamp and measurement model
+    """
+    groups = {}
+    for detection in detections:
+        groups.setdefault((detection.timestamp, detection.measurement_model), []).append(detection)
+    return groups
+
+
+def measurement_angle_types(updater, measurement_model):
+    """Angle types of the measurement model of detections, if declared
+
+    Parameters
+    ----------
+    updater : :class:`~.Updater`
+        Updater, whose measurement model is used where detections have none
+    measurement_model : :class:`~.MeasurementModel`
+        Measurement model of the detections
+
+    Returns
+    -------
+    : tuple of :class:`~.Angle` type or None, or None
+        :attr:`~.MeasurementModel.angle_types` of the measurement model, or `None` where not
+        declared
+    """
+    if measurement_model is None:
+        measurement_model = getattr(updater, 'measurement_model', None)
+    return getattr(measurement_model, 'angle_types', None)
+
+
+def is_vectorisable(states, angle_types=None):
+    """Whether state vectors of states can be safely stacked into a float array
+
+    Object arrays (e.g. those containing :class:`~.Angle` types) are excluded as their wrapping
+    behaviour would be lost on conversion to float, unless the `angle_types` of the measurement
+    model are declared (see :attr:`~.MeasurementModel.angle_types`), such that wrapping can be
+    applied to the stacked innovations.
+    """
+    return angle_types is not None \
+        or all(state.state_vector.dtype != object for state in states)
+
+
+def stack_innovations(measurement_predictions, detections, mapping=None, mapping2=None,
+                      angle_types=None):
+    r"""Compute innovations and inverse innovation covariances for all pairs
+
+    Parameters
+    ----------
+    measurement_predictions : sequence of :class:`~.GaussianMeasurementPrediction`
+        :math:`T` measurement predictions, :math:`\hat{\mathbf{z}}_t` and :math:`S_t`
+    detections : sequence of :class:`~.Detection`
+        :math:`D` detections, :math:`\mathbf{z}_d`
+    mapping : sequence of int, optional
+        Dimensions of the measurement predictions to use
+    mapping2 : sequence of int, optional
+        Dimensions of the detections to use. Default same as `mapping`
+    angle_types : sequence of :class:`~.Angle` type or None, optional
+        Angle type of each measurement dimension (see
+        :attr:`~.MeasurementModel.angle_types`), used to wrap angular innovations
+
+    Returns
+    -------
+    : :class:`numpy.ndarray` of shape (T, D, m)
+        Innovations :math:`\hat{\mathbf{z}}_t - \mathbf{z}_d`
+    : :class:`numpy.ndarray` of shape (T, m, m)
+        Inverse innovation covariances :math:`S_t^{-1}`
+    """
+    means = np.array(
+        [measurement_prediction.state_vector[:, 0]
+         for measurement_prediction in measurement_predictions], dtype=np.float64)
+    covars = np.array(
+        [measurement_prediction.covar for measurement_prediction in measurement_predictions],
+        dtype=np.float64)
+    vectors = np.array(
+        [detection.state_vector[:, 0] for detection in detections], dtype=np.float64)
+
+    if mapping is not None:
+        if mapping2 is None:
+            mapping2 = mapping
+        mapping = np.asarray(mapping, dtype=np.intp)
+        means = means[:, mapping]
+        covars = covars[:, mapping[:, np.newaxis], mapping]
+        vectors = vectors[:, np.asarray(mapping2, dtype=np.intp)]
+        if angle_types is not None:
+            angle_types = [angle_types[dim] for dim in mapping]
+
+    innovations = means[:, np.newaxis, :] - vectors[np.newaxis, :, :]
+    for dim, angle_type in enumerate(angle_types or ()):
+        if angle_type is not None:
+            innovations[..., dim] = angle_type.mod_angle(innovations[..., dim])
+    return innovations, np.linalg.inv(covars)
+
+
+def squared_mahalanobis(innovations, inv_covars):
+    """Squared Mahalanobis distance for all innovations
+
+    Parameters
+    ----------
+    innovations : :class:`numpy.ndarray` of shape (T, D, m)
+        Innovations, as returned by :func:`stack_innovations`
+    inv_covars : :class:`numpy.ndarray` of shape (T, m, m)
+        Inverse innovation covariances, as returned by :func:`stack_innovations`
+
+    Returns
+    -------
+    : :class:`numpy.ndarray` of shape (T, D)
+        Squared Mahalanobis distances
+    """
+    return np.einsum('tdi,tij,tdj->td', innovations, inv_covars, innovations)
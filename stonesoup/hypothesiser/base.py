@@ -1,5 +1,5 @@
 import datetime
-from typing import Set, Sequence
+from typing import Set, Sequence, Mapping
 
 from ..base import Base
 from ..types.detection import Detection
@@ -36,3 +36,31 @@ class Hypothesiser(Base):
             Ordered sequence of "best" to "worse" hypothesis.
         """
         raise NotImplementedError
+
+    def batch_hypothesise(self, tracks: Set[Track], detections: Set[Detection],
+                          timestamp: datetime.datetime, **kwargs) \
+            -> Mapping[Track, Sequence[Hypothesis]]:
+        """Hypothesise track and detection association for multiple tracks
+
+        Default implementation calls :meth:`hypothesise` for each track in turn. Hypothesisers
+        which are able to score all track-detection pairs at once should override this.
+
+        Parameters
+        ----------
+        tracks : set of :class:`~.Track`
+            Tracks which hypotheses will be generated for.
+        detections : set of :class:`~.Detection`
+            Detections used to generate hypotheses.
+        timestamp : datetime.datetime
+            A timestamp used when evaluating the state and measurement
+            predictions. Note that if a given detection has a non empty
+            timestamp, then prediction will be performed according to
+            the timestamp of the detection.
+
+        Returns
+        -------
+        : mapping of :class:`~.Track` : sequence of :class:`~.Hypothesis`
+            Ordered sequence of "best" to "worse" hypothesis for each track.
+        """
+        return {track: self.hypothesise(track, detections, timestamp, **kwargs)
+                for track in tracks}
@@ -1,6 +1,10 @@
+import numpy as np
+
+from ._utils import group_detections, is_vectorisable, measurement_angle_types, \
+    stack_innovations, squared_mahalanobis
 from .base import Hypothesiser
 from ..base import Property
-from ..measures import Measure
+from ..measures import Measure, SquaredMahalanobis, Mahalanobis
 from ..predictor import Predictor
 from ..types.detection import MissedDetection
 from ..types.hypothesis import SingleDistanceHypothesis
@@ -86,3 +90,76 @@ class DistanceHypothesiser(Hypothesiser):
                         measurement_prediction))
 
         return MultipleHypothesis(sorted(hypotheses, reverse=True))
+
+    def batch_hypothesise(self, tracks, detections, timestamp, **kwargs):
+        """Evaluate and return association hypotheses for all tracks.
+
+        Equivalent to calling :meth:`hypothesise` for each track, but where :attr:`measure` is
+        :class:`~.Mahalanobis` or :class:`~.SquaredMahalanobis` (and :meth:`hypothesise` isn't
+        overridden by a subclass), track predictions and
+        measurement predictions are made once per track for each distinct detection timestamp
+        and measurement model (together for all tracks, where the updater supports it; see
+        :meth:`~.Updater.batch_predict_measurement`), and distances for all track-detection pairs
+        are calculated in a single array operation.
+
+        Parameters
+        ----------
+        tracks : set of :class:`~.Track`
+            The track objects to hypothesise on
+        detections : set of :class:`~.Detection`
+            The available detections
+        timestamp : datetime.datetime
+            A timestamp used when evaluating the state and measurement
+            predictions. Note that if a given detection has a non empty
+            timestamp, then prediction will be performed according to
+            the timestamp of the detection.
+
+        Returns
+        -------
+        : dict of :class:`~.Track`: :class:`~.MultipleHypothesis`
+            A container of :class:`~SingleDistanceHypothesis` objects for each track
+        """
+        if type(self.measure) not in (SquaredMahalanobis, Mahalanobis) or not tracks \
+                or type(self).hypothesise is not DistanceHypothesiser.hypothesise:
+            # Subclasses overriding hypothesise are called for each track
+            return super().batch_hypothesise(tracks, detections, timestamp, **kwargs)
+
+        tracks = list(tracks)
+        track_hypotheses = {
+            track: [SingleDistanceHypothesis(
+                self.predictor.predict(track, timestamp=timestamp, **kwargs),
+                MissedDetection(timestamp=timestamp),
+                self.missed_distance)]
+            for track in tracks}
+
+        for (detections_timestamp, measurement_model), group in \
+                group_detections(detections).items():
+            predictions = [
+                self.predictor.predict(track, timestamp=detections_timestamp, **kwargs)
+                for track in tracks]
+            measurement_predictions = self.updater.batch_predict_measurement(
+                predictions, measurement_model, **kwargs)
+
+            angle_types = measurement_angle_types(self.updater, measurement_model)
+            if is_vectorisable(measurement_predictions, angle_types) \
+                    and is_vectorisable(group, angle_types):
+                distances = squared_mahalanobis(*stack_innovations(
+                    measurement_predictions, group,
+                    self.measure.mapping, self.measure.mapping2, angle_types))
+                if isinstance(self.measure, Mahalanobis):
+                    distances = np.sqrt(distances)
+            else:
+                distances = np.array([
+                    [self.measure(measurement_prediction, detection) for detection in group]
+                    for measurement_prediction in measurement_predictions])
+
+            for track, prediction, measurement_prediction, track_distances in zip(
+                    tracks, predictions, measurement_predictions, distances):
+                track_hypotheses[track].extend(
+                    SingleDistanceHypothesis(
+                        prediction, detection, distance, measurement_prediction)
+                    for detection, distance in zip(group, track_distances)
+                    if self.include_all or distance < self.missed_distance)
+
+        return {track: MultipleHypothesis(sorted(hypotheses, reverse=True))
+                for track, hypotheses in track_hypotheses.items()}
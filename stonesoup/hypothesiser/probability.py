@@ -1,17 +1,20 @@
 from functools import lru_cache
 
-from scipy.stats import multivariate_normal, chi2
+from scipy.stats import chi2
 from scipy.linalg import det
 from scipy.special import gamma
 import numpy as np
 
+from ._utils import group_detections, is_vectorisable, measurement_angle_types, \
+    stack_innovations, squared_mahalanobis
 from .base import Hypothesiser
 from ..base import Property
+from ..functions import gaussian_logpdf
 from ..measures import SquaredMahalanobis
 from ..types.detection import MissedDetection
 from ..types.hypothesis import SingleProbabilityHypothesis
 from ..types.multihypothesis import MultipleHypothesis
-from ..types.numeric import Probability
+from ..types.numeric import Probability, Probabilities
 from ..predictor import Predictor
 from ..updater import Updater
 
@@ -147,9 +150,9 @@ class PDAHypothesiser(Hypothesiser):
                 prediction, detection.measurement_model, **kwargs)
             # Calculate difference before to handle custom types (mean defaults to zero)
             # This is required as log pdf coverts arrays to floats
-            log_pdf = multivariate_normal.logpdf(
-                (detection.state_vector - measurement_prediction.state_vector).ravel(),
-                cov=measurement_prediction.covar)
+            log_pdf = gaussian_logpdf(
+                detection.state_vector - measurement_prediction.state_vector,
+                measurement_prediction.covar)[0]
             pdf = Probability(log_pdf, log_value=True)
 
             if measure(measurement_prediction, detection) \
@@ -180,6 +183,111 @@ class PDAHypothesiser(Hypothesiser):
 
         return MultipleHypothesis(hypotheses, normalise=True, total_weight=1)
 
+    def batch_hypothesise(self, tracks, detections, timestamp, **kwargs):
+        """Evaluate and return association hypotheses for all tracks.
+
+        Equivalent to calling :meth:`hypothesise` for each track, but (unless :meth:`hypothesise`
+        is overridden by a subclass) track predictions and measurement predictions are made once
+        per track for each distinct detection timestamp and measurement model (together for all
+        tracks, where the updater supports it; see :meth:`~.Updater.batch_predict_measurement`),
+        and the likelihoods and gating distances of all track-detection pairs are calculated in a
+        single array operation.
+
+        Parameters
+        ----------
+        tracks : set of :class:`~.Track`
+            The track objects to hypothesise on
+        detections : set of :class:`~.Detection`
+            The available detections
+        timestamp : datetime.datetime
+            A timestamp used when evaluating the state and measurement
+            predictions. Note that if a given detection has a non empty
+            timestamp, then prediction will be performed according to
+            the timestamp of the detection.
+
+        Returns
+        -------
+        : dict of :class:`~.Track`: :class:`~.MultipleHypothesis`
+            A container of :class:`~.SingleProbabilityHypothesis` objects for each track
+        """
+        if not tracks:
+            return {}
+        if type(self).hypothesise is not PDAHypothesiser.hypothesise:
+            # Subclasses overriding hypothesise are called for each track
+            return super().batch_hypothesise(tracks, detections, timestamp, **kwargs)
+
+        tracks = list(tracks)
+        missed_probability = Probability(1 - self.prob_detect*self.prob_gate)
+        track_hypotheses = {
+            track: [SingleProbabilityHypothesis(
+                self.predictor.predict(track, timestamp=timestamp, **kwargs),
+                MissedDetection(timestamp=timestamp),
+                missed_probability)]
+            for track in tracks}
+        validated_measurements = np.zeros(len(tracks), dtype=int)
+
+        for (detections_timestamp, measurement_model), group in \
+                group_detections(detections).items():
+            predictions = [
+                self.predictor.predict(track, timestamp=detections_timestamp, **kwargs)
+                for track in tracks]
+            measurement_predictions = self.updater.batch_predict_measurement(
+                predictions, measurement_model, **kwargs)
+
+            angle_types = measurement_angle_types(self.updater, measurement_model)
+            if is_vectorisable(measurement_predictions, angle_types) \
+                    and is_vectorisable(group, angle_types):
+                innovations, inv_covars = stack_innovations(
+                    measurement_predictions, group, angle_types=angle_types)
+                distances = squared_mahalanobis(innovations, inv_covars)
+                ndim = innovations.shape[-1]
+                log_pdfs = -0.5 * (distances + ndim*np.log(2*np.pi)
+                                   - np.linalg.slogdet(inv_covars)[1][:, np.newaxis])
+            else:
+                measure = SquaredMahalanobis(state_covar_inv_cache_size=None)
+                distances = np.array([
+                    [measure(measurement_prediction, detection) for detection in group]
+                    for measurement_prediction in measurement_predictions])
+                log_pdfs = np.array([
+                    gaussian_logpdf(
+                        np.hstack([detection.state_vector - measurement_prediction.state_vector
+                                   for detection in group]),
+                        measurement_prediction.covar)
+                    for measurement_prediction in measurement_predictions])
+
+            gate_threshold = self._gate_threshold(
+                self.prob_gate, measurement_predictions[0].ndim)
+            valid = distances <= gate_threshold
+            validated_measurements += np.sum(valid, axis=1)
+
+            probabilities = Probabilities(log_pdfs, log_value=True) * self.prob_detect
+            if self.clutter_spatial_density is not None:
+                probabilities /= self.clutter_spatial_density
+
+            for track, prediction, measurement_prediction, track_probabilities, track_valid \
+                    in zip(tracks, predictions, measurement_predictions, probabilities, valid):
+                for detection, probability, valid_measurement in zip(
+                        group, track_probabilities, track_valid):
+                    if not (self.include_all or valid_measurement):
+                        continue
+                    track_hypotheses[track].append(
+                        SingleProbabilityHypothesis(
+                            prediction,
+                            detection,
+                            probability,
+                            measurement_prediction))
+
+        if self.clutter_spatial_density is None:
+            for hypotheses, track_validated_measurements in zip(
+                    track_hypotheses.values(), validated_measurements):
+                for hypothesis in hypotheses[1:]:  # Skip missed detection
+                    hypothesis.probability *= self._validation_region_volume(
+                        self.prob_gate, hypothesis.measurement_prediction) \
+                        / track_validated_measurements
+
+        return {track: MultipleHypothesis(hypotheses, normalise=True, total_weight=1)
+                for track, hypotheses in track_hypotheses.items()}
+
     @classmethod
     @lru_cache()
     def _validation_region_volume(cls, prob_gate, meas_pred):
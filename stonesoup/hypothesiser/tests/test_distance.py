@@ -2,11 +2,17 @@ from operator import attrgetter
 import datetime
 
 import numpy as np
+import pytest
 
 from ..distance import DistanceHypothesiser
+from ...models.measurement.nonlinear import CartesianToBearingRange
+from ...models.transition.linear import (
+    CombinedLinearGaussianTransitionModel, ConstantVelocity)
+from ...predictor.kalman import ExtendedKalmanPredictor
 from ...types.detection import Detection
-from ...types.state import GaussianState
+from ...types.state import GaussianState, State
 from ...types.track import Track
+from ...updater.kalman import ExtendedKalmanUpdater
 from ... import measures
 
 
@@ -66,3 +72,89 @@ def test_distance_include_all(predictor, updater):
     last_hypothesis = hypotheses[-1]
     assert last_hypothesis.measurement is detection3
     assert last_hypothesis.distance > hypothesiser.missed_distance
+
+
+@pytest.mark.parametrize('measure', [measures.Mahalanobis(), measures.SquaredMahalanobis(),
+                                     measures.Mahalanobis(mapping=[0]), measures.Euclidean()])
+def test_distance_batch(predictor, updater, measure):
+
+    timestamp = datetime.datetime.now()
+    tracks = {Track([GaussianState(np.array([[0], [1]]), np.diag([1, 2]), timestamp)]),
+              Track([GaussianState(np.array([[5], [1]]), np.diag([2, 1]), timestamp)]),
+              Track([GaussianState(np.array([[9], [4]]), np.diag([1, 1]), timestamp)])}
+    detections = {Detection(np.array([[2], [2]]), timestamp=timestamp),
+                  Detection(np.array([[6], [3]]), timestamp=timestamp),
+                  Detection(np.array([[3], [1]]),
+                            timestamp=timestamp + datetime.timedelta(seconds=1)),
+                  Detection(np.array([[30], [30]]), timestamp=timestamp)}
+
+    hypothesiser = DistanceHypothesiser(
+        predictor, updater, measure=measure, missed_distance=3)
+
+    batch_hypotheses = hypothesiser.batch_hypothesise(tracks, detections, timestamp)
+    assert batch_hypotheses.keys() == tracks
+
+    for track in tracks:
+        hypotheses = hypothesiser.hypothesise(track, detections, timestamp)
+        assert len(batch_hypotheses[track]) == len(hypotheses)
+        for batch_hypothesis, hypothesis in zip(batch_hypotheses[track], hypotheses):
+            assert batch_hypothesis.measurement is hypothesis.measurement \
+                or not (batch_hypothesis or hypothesis)
+            assert batch_hypothesis.distance == pytest.approx(hypothesis.distance)
+            assert batch_hypothesis.prediction.timestamp == hypothesis.prediction.timestamp
+
+
+def test_distance_batch_subclass(predictor, updater):
+    class CountingHypothesiser(DistanceHypothesiser):
+        calls = 0
+
+        def hypothesise(self, track, detections, timestamp, **kwargs):
+            type(self).calls += 1
+            return super().hypothesise(track, detections, timestamp, **kwargs)
+
+    timestamp = datetime.datetime.now()
+    tracks = {Track([GaussianState(np.array([[0], [1]]), np.diag([1, 2]), timestamp)]),
+              Track([GaussianState(np.array([[5], [1]]), np.diag([2, 1]), timestamp)])}
+    detections = {Detection(np.array([[2], [2]]), timestamp=timestamp)}
+    hypothesiser = CountingHypothesiser(
+        predictor, updater, measure=measures.Mahalanobis(), missed_distance=3)
+
+    # Overridden hypothesise used for each track, rather than batched
+    batch_hypotheses = hypothesiser.batch_hypothesise(tracks, detections, timestamp)
+    assert batch_hypotheses.keys() == tracks
+    assert CountingHypothesiser.calls == len(tracks)
+
+
+def test_distance_batch_no_tracks(predictor, updater):
+    hypothesiser = DistanceHypothesiser(
+        predictor, updater, measure=measures.Mahalanobis(), missed_distance=3)
+    assert hypothesiser.batch_hypothesise(
+        set(), {Detection(np.array([[2]]))}, datetime.datetime.now()) == {}
+
+
+def test_distance_batch_angles():
+    # Detections with bearing either side of pi, requiring wrapping of innovations
+    measurement_model = CartesianToBearingRange(
+        ndim_state=4, mapping=[0, 2], noise_covar=np.diag([0.01, 1]))
+    predictor = ExtendedKalmanPredictor(
+        CombinedLinearGaussianTransitionModel([ConstantVelocity(0.1)]*2))
+    updater = ExtendedKalmanUpdater(measurement_model)
+    timestamp = datetime.datetime.now()
+    tracks = {Track([GaussianState([[-10], [0], [y], [0]], np.diag([1, 1, 1, 1]), timestamp)])
+              for y in (-0.5, 0.5, 3)}
+    detections = {
+        Detection(measurement_model.function(State([[-10], [0], [y], [0]])),
+                  timestamp=timestamp, measurement_model=measurement_model)
+        for y in (-0.3, 0.2, 1)}
+    assert all(detection.state_vector.dtype == object for detection in detections)
+
+    hypothesiser = DistanceHypothesiser(
+        predictor, updater, measure=measures.Mahalanobis(), missed_distance=10)
+    batch_hypotheses = hypothesiser.batch_hypothesise(tracks, detections, timestamp)
+    for track in tracks:
+        hypotheses = hypothesiser.hypothesise(track, detections, timestamp)
+        assert len(batch_hypotheses[track]) == len(hypotheses) == 4
+        for batch_hypothesis, hypothesis in zip(batch_hypotheses[track], hypotheses):
+            assert batch_hypothesis.measurement is hypothesis.measurement \
+                or not (batch_hypothesis or hypothesis)
+            assert batch_hypothesis.distance == pytest.approx(hypothesis.distance)
@@ -82,3 +82,58 @@ def test_invalid_pda_arguments(predictor, updater):
     with pytest.raises(ValueError):
         PDAHypothesiser(predictor, updater,
                         prob_detect=0.9, prob_gate=0.99, include_all=True)
+
+
+@pytest.mark.parametrize('clutter_spatial_density, include_all', [
+    (1.2e-2, False), (1.2e-2, True), (None, False)])
+def test_pda_batch(predictor, updater, clutter_spatial_density, include_all):
+
+    timestamp = datetime.datetime.now()
+    tracks = {Track([GaussianState(np.array([[0], [1]]), np.diag([1, 2]), timestamp)]),
+              Track([GaussianState(np.array([[5], [1]]), np.diag([2, 1]), timestamp)])}
+    detections = {Detection(np.array([[2], [2]]), timestamp=timestamp),
+                  Detection(np.array([[6], [3]]), timestamp=timestamp),
+                  Detection(np.array([[3], [1]]),
+                            timestamp=timestamp + datetime.timedelta(seconds=1)),
+                  Detection(np.array([[30], [30]]), timestamp=timestamp)}
+
+    hypothesiser = PDAHypothesiser(predictor, updater,
+                                   clutter_spatial_density=clutter_spatial_density,
+                                   prob_detect=0.9, prob_gate=0.99,
+                                   include_all=include_all)
+
+    batch_hypotheses = hypothesiser.batch_hypothesise(tracks, detections, timestamp)
+    assert batch_hypotheses.keys() == tracks
+
+    for track in tracks:
+        hypotheses = hypothesiser.hypothesise(track, detections, timestamp)
+        assert len(batch_hypotheses[track]) == len(hypotheses)
+        for hypothesis in hypotheses:
+            if hypothesis:
+                batch_hypothesis = batch_hypotheses[track][hypothesis.measurement]
+            else:
+                batch_hypothesis = batch_hypotheses[track][0]
+                assert not batch_hypothesis
+            assert float(batch_hypothesis.probability) \
+                == pytest.approx(float(hypothesis.probability))
+
+
+def test_pda_batch_subclass(predictor, updater):
+    class CountingHypothesiser(PDAHypothesiser):
+        calls = 0
+
+        def hypothesise(self, track, detections, timestamp, **kwargs):
+            type(self).calls += 1
+            return super().hypothesise(track, detections, timestamp, **kwargs)
+
+    timestamp = datetime.datetime.now()
+    tracks = {Track([GaussianState(np.array([[0], [1]]), np.diag([1, 2]), timestamp)]),
+              Track([GaussianState(np.array([[5], [1]]), np.diag([2, 1]), timestamp)])}
+    detections = {Detection(np.array([[2], [2]]), timestamp=timestamp)}
+    hypothesiser = CountingHypothesiser(predictor, updater, clutter_spatial_density=1.2e-2,
+                                        prob_detect=0.9, prob_gate=0.99)
+
+    # Overridden hypothesise used for each track, rather than batched
+    batch_hypotheses = hypothesiser.batch_hypothesise(tracks, detections, timestamp)
+    assert batch_hypotheses.keys() == tracks
+    assert CountingHypothesiser.calls == len(tracks)
@@ -7,10 +7,10 @@ from ..dataassociator import DataAssociator
 from ..deleter import Deleter
 from ..models.base import LinearModel, ReversibleModel
 from ..models.measurement import MeasurementModel
+from ..types.array import StateVectors
 from ..types.hypothesis import SingleHypothesis
 from ..types.mixture import GaussianMixture
 from ..types.numeric import Probability
-from ..types.particle import Particle
 from ..types.state import State, GaussianState, ParticleState, TaggedWeightedGaussianState, \
     ASDGaussianState, EnsembleState
 from ..types.track import Track
@@ -274,12 +274,10 @@ class GaussianParticleInitiator(ParticleInitiator):
                                               size=self.number_particles)
         except AttributeError:
             raise AttributeError("No prior state")
-        particles = [
-            Particle(sample.reshape(-1, 1), weight=self.weight)
-            for sample in samples]
 
         self.prior_state = ParticleState(
-            particles,
+            StateVectors(samples.reshape(self.number_particles, -1).T),
+            log_weight=self._log_weights(),
             fixed_covar=self.initiator.prior_state.covar if self.use_fixed_covar else None
         )
 
@@ -287,6 +285,9 @@ class GaussianParticleInitiator(ParticleInitiator):
     def weight(self):
         return Probability(1 / self.number_particles)
 
+    def _log_weights(self):
+        return np.full(self.number_particles, -np.log(self.number_particles))
+
     def initiate(self, detections, timestamp, **kwargs):
         """Initiates tracks given unassociated measurements
 
@@ -308,13 +309,10 @@ class GaussianParticleInitiator(ParticleInitiator):
             samples = multivariate_normal.rvs(track.state_vector.ravel(),
                                               track.covar,
                                               size=self.number_particles)
-            particles = [
-                Particle(sample.reshape(-1, 1), weight=self.weight)
-                for sample in samples]
             track[-1] = ParticleStateUpdate(
-                None,
+                StateVectors(samples.reshape(self.number_particles, -1).T),
                 track.hypothesis,
-                particle_list=particles,
+                log_weight=self._log_weights(),
                 fixed_covar=track.covar if self.use_fixed_covar else None,
                 timestamp=track.timestamp)
 
@@ -9,10 +9,11 @@ from ...models.transition.linear import ConstantVelocity
 from ...updater.kalman import KalmanUpdater
 from ...types.detection import Detection
 from ...types.hypothesis import SingleHypothesis
+from ...types.columnar import ColumnarStates
 from ...types.state import GaussianState
 from ...predictor.kalman import KalmanPredictor
 from ..simple import SinglePointInitiator
-from ..wrapper import StatesLengthLimiter
+from ..wrapper import StatesLengthLimiter, ColumnarStatesConverter
 
 
 @pytest.mark.parametrize("max_len", (1, 5, 9))
@@ -62,3 +63,32 @@ def test_states_length_limiter(max_len):
 
     assert len(track) == max_len
     assert len(track.metadatas) == max_len
+
+
+def test_columnar_states_converter():
+    """Test ColumnarStatesConverter"""
+    start_time = datetime.now()
+    measurements = [Detection(np.array([[i*2.0]]), timestamp=start_time+timedelta(seconds=i))
+                    for i in range(10)]
+
+    transition_model = ConstantVelocity(0.05)
+    measurement_model = LinearGaussian(2, [0], np.array([[1]]))
+    predictor = KalmanPredictor(transition_model)
+    updater = KalmanUpdater(measurement_model)
+
+    prior = GaussianState(
+        np.array([[0], [0]]),
+        np.array([[100, 0], [0, 1]]), timestamp=start_time)
+    initiator = ColumnarStatesConverter(SinglePointInitiator(prior, measurement_model))
+
+    track = initiator.initiate(measurements[:1], start_time).pop()
+    assert isinstance(track.states, ColumnarStates)
+    for measurement in measurements[1:]:
+        prediction = predictor.predict(track, timestamp=measurement.timestamp)
+        posterior = updater.update(SingleHypothesis(prediction, measurement))
+        track.append(posterior)
+        assert track.state is posterior
+
+    assert len(track) == len(measurements)
+    assert track.states.ndim == 2
+    assert [state.hypothesis.measurement for state in track[1:]] == measurements[1:]
@@ -1,6 +1,7 @@
 import collections
 from .base import Initiator
 from ..base import Property
+from ..types.columnar import ColumnarStates
 
 
 class StatesLengthLimiter(Initiator):
@@ -29,3 +30,29 @@ class StatesLengthLimiter(Initiator):
             track.states = collections.deque(track.states, self.max_length)
             track.metadatas = collections.deque(track.metadatas, self.max_length)
         return tracks
+
+
+class ColumnarStatesConverter(Initiator):
+    """Wrapper that stores track states in columnar form
+
+    By default Stone Soup stores each track state as an individual object. For trackers
+    maintaining a large number of long lived tracks, this can use a significant amount of memory.
+
+    This wrapper converts the states list to a :class:`~.ColumnarStates` sequence, which holds
+    the state vectors and covariances of Gaussian states in arrays, only creating state objects
+    when accessed.
+
+    .. code-block:: python
+
+        from stonesoup.initiator.wrapper import ColumnarStatesConverter
+
+        initiator = ColumnarStatesConverter(<initiator model>)
+
+    """
+    initiator: Initiator = Property(doc="Stone Soup Initiator")
+
+    def initiate(self, *args, **kwargs):
+        tracks = self.initiator.initiate(*args, **kwargs)
+        for track in tracks:
+            track.states = ColumnarStates(track.states)
+        return tracks
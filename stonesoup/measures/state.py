@@ -55,6 +55,38 @@ class Measure(BaseMeasure):
         """
         return NotImplementedError
 
+    def pairwise(self, states1, states2):
+        r"""
+        Compute the distance between each pair of :class:`~.State` objects from two sequences
+
+        Parameters
+        ----------
+        states1 : sequence of :class:`~.State`
+        states2 : sequence of :class:`~.State`
+
+        Returns
+        -------
+        : :class:`numpy.ndarray`
+            distance measure between each pair of input :class:`~.State` objects, of shape
+            (len(states1), len(states2))
+
+        """
+        distances = np.empty((len(states1), len(states2)))
+        for i, state1 in enumerate(states1):
+            for j, state2 in enumerate(states2):
+                distances[i, j] = self(state1, state2)
+        return distances
+
+    def _state_vectors(self, states1, states2):
+        """Mapped state vectors (or means) of states, stacked as rows"""
+        mapping1 = slice(None) if self.mapping is None else self.mapping
+        mapping2 = slice(None) if self.mapping2 is None else self.mapping2
+        return tuple(
+            np.array([np.asarray(getattr(state, 'mean', state.state_vector),
+                                 dtype=np.float64)[mapping, 0]
+                      for state in states])
+            for states, mapping in ((states1, mapping1), (states2, mapping2)))
+
 
 class Euclidean(Measure):
     r"""Euclidean distance measure
@@ -93,6 +125,11 @@ class Euclidean(Measure):
         else:
             return distance.euclidean(state_vector1[:, 0], state_vector2[:, 0])
 
+    def pairwise(self, states1, states2):
+        if not len(states1) or not len(states2):
+            return np.empty((len(states1), len(states2)))
+        return distance.cdist(*self._state_vectors(states1, states2))
+
 
 class EuclideanWeighted(Measure):
     r"""Weighted Euclidean distance measure
@@ -144,6 +181,12 @@ class EuclideanWeighted(Measure):
                                       state_vector2[:, 0],
                                       self.weighting)
 
+    def pairwise(self, states1, states2):
+        if not len(states1) or not len(states2):
+            return np.empty((len(states1), len(states2)))
+        return distance.cdist(
+            *self._state_vectors(states1, states2), w=np.ravel(self.weighting))
+
 
 class SquaredMahalanobis(Measure):
     r"""Squared Mahalanobis distance measure
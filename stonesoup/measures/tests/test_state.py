@@ -475,3 +475,22 @@ def test_gaussian_kld_raise_errors():
 
     with pytest.raises(ValueError):
         measure(state1, state2)
+
+
+@pytest.mark.parametrize('measure', [
+    measures.Euclidean(),
+    measures.Euclidean(mapping=[0, 2], mapping2=[1, 2]),
+    measures.EuclideanWeighted(weighting=[1, 2, 3]),
+    measures.EuclideanWeighted(weighting=[1, 2], mapping=[0, 2]),
+    measures.Mahalanobis(),
+])
+def test_pairwise(measure):
+    rng = np.random.default_rng(1)
+    states1 = [GaussianState(rng.normal(size=(3, 1)), np.diag([1, 2, 3])) for _ in range(4)]
+    states2 = [GaussianState(rng.normal(size=(3, 1)), np.eye(3)) for _ in range(3)]
+
+    distances = measure.pairwise(states1, states2)
+    assert distances.shape == (4, 3)
+    assert np.allclose(
+        distances, [[measure(state1, state2) for state2 in states2] for state1 in states1])
+    assert measure.pairwise(states1, []).shape == (4, 0)
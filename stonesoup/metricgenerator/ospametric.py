@@ -1,4 +1,7 @@
-from itertools import chain, zip_longest
+import os
+from collections import defaultdict
+from concurrent.futures import Executor
+from itertools import chain
 
 import numpy as np
 from scipy.optimize import linear_sum_assignment
@@ -55,11 +58,14 @@ class _SwitchingLoss:
 class GOSPAMetric(MetricGenerator):
     """
     Computes the Generalized Optimal SubPattern Assignment (GOSPA) metric
-    for two sets of :class:`~.Track` objects. This implementation of GOSPA
-    is based on the auction algorithm.
+    for two sets of :class:`~.Track` objects. Truth states are assigned to
+    measured states with :func:`~scipy.optimize.linear_sum_assignment`, or
+    optionally the auction algorithm.
 
     The GOSPA metric is calculated at each time step in which a
-    :class:`~.Track` object is present
+    :class:`~.Track` object is present. States are grouped by timestamp in a
+    single pass, and time steps can optionally be computed in parallel with
+    an :attr:`executor`, with only the switching term computed in turn.
 
     Reference:
         [1] A. S. Rahmathullah, A. F. García-Fernández, L. Svensson,
@@ -81,11 +87,25 @@ class GOSPAMetric(MetricGenerator):
                                    "Or key to access a second set of tracks for track-to-track"
                                    " metric generation",
                                default='groundtruth_paths')
+    use_auction: bool = Property(
+        default=False,
+        doc="Use the auction algorithm (:meth:`compute_assignments`) to assign truth to measured "
+            "states, rather than :func:`~scipy.optimize.linear_sum_assignment`. Default `False`.")
+    executor: Executor = Property(
+        default=None,
+        doc="Executor used to compute time steps in parallel, such as a "
+            ":class:`~concurrent.futures.ProcessPoolExecutor`. Default `None`, where time steps "
+            "are computed in turn.")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.alpha = 2
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_property_executor'] = None
+        return state
+
     def compute_metric(self, manager):
         """Compute the metric using the data in the metric manager
 
@@ -140,6 +160,29 @@ class GOSPAMetric(MetricGenerator):
             return state_list, ids
         return state_list
 
+    @staticmethod
+    def _group_by_timestamp(states, state_ids):
+        """States and their ids grouped by timestamp"""
+        groups = defaultdict(lambda: ([], []))
+        for state, state_id in zip(states, state_ids):
+            group_states, group_ids = groups[state.timestamp]
+            group_states.append(state)
+            group_ids.append(state_id)
+        return groups
+
+    def _map_timestamps(self, func, *iterables):
+        """Map function over each timestamp's states, with :attr:`executor` if set"""
+        if self.executor is None:
+            return list(map(func, *iterables))
+        metrics = list(self.executor.map(
+            func, *iterables,
+            chunksize=max(1, len(iterables[0]) // (4 * (os.cpu_count() or 1)))))
+        for metric in metrics:
+            # Generator copied when computed in another process
+            metric = metric[0] if isinstance(metric, tuple) else metric
+            metric.generator = self
+        return metrics
+
     def compute_over_time(self, measured_states, measured_state_ids, truth_states,
                           truth_state_ids):
         """
@@ -161,25 +204,24 @@ class GOSPAMetric(MetricGenerator):
         for the GOSPA metric at each timestamp
         """
 
-        # Make a list of all the unique timestamps used
+        measured_groups = self._group_by_timestamp(measured_states, measured_state_ids)
+        truth_groups = self._group_by_timestamp(truth_states, truth_state_ids)
         # Make a sorted list of all the unique timestamps used
-        timestamps = sorted({
-            state.timestamp
-            for state in chain(measured_states, truth_states)})
+        timestamps = sorted(measured_groups.keys() | truth_groups.keys())
+        empty_group = ([], [])
+        measured_groups = [measured_groups.get(timestamp, empty_group) for timestamp in timestamps]
+        truth_groups = [truth_groups.get(timestamp, empty_group) for timestamp in timestamps]
+
+        results = self._map_timestamps(
+            self.compute_gospa_metric,
+            [meas_points for meas_points, _ in measured_groups],
+            [truth_points for truth_points, _ in truth_groups])
 
+        # Switching term depends on previous assignments, so computed in turn
         switching_metric = _SwitchingLoss(self.switching_penalty, self.p)
         gospa_metrics = []
-        for timestamp in timestamps:
-            meas_mask = [state.timestamp == timestamp for state in measured_states]
-            meas_points = np.array(measured_states)[meas_mask]
-            meas_ids = np.array(measured_state_ids)[meas_mask]
-
-            truth_mask = [state.timestamp == timestamp for state in truth_states]
-            truth_points = np.array(truth_states)[truth_mask]
-            truth_ids = np.array(truth_state_ids)[truth_mask]
-
-            metric, truth_to_measured_assignment = self.compute_gospa_metric(
-                    meas_points, truth_points)
+        for (metric, truth_to_measured_assignment), (_, meas_ids), (_, truth_ids) in zip(
+                results, measured_groups, truth_groups):
             truth_mapping = {
                 truth_id: meas_ids[meas_id] if meas_id != -1 else None
                 for truth_id, meas_id in zip(truth_ids, truth_to_measured_assignment)}
@@ -327,14 +369,10 @@ class GOSPAMetric(MetricGenerator):
         # c could be int, so force to float
         cost_matrix = np.full((m, n), self.c, dtype=np.float64)
 
-        for i_track, track_state, in zip_longest(range(m), track_states):
-            for i_truth, truth_state in zip_longest(range(n), truth_states):
-                if None in (track_state, truth_state):
-                    continue
-
-                distance = self.measure(track_state, truth_state)
-                if distance < self.c:
-                    cost_matrix[i_track, i_truth] = distance
+        # Distances between all pairs of states computed together
+        distances = self.measure.pairwise(track_states, truth_states)
+        np.minimum(distances, cost_matrix[:len(track_states), :len(truth_states)],
+                   out=cost_matrix[:len(track_states), :len(truth_states)])
 
         return cost_matrix
 
@@ -387,12 +425,19 @@ class GOSPAMetric(MetricGenerator):
             if self.alpha == 2:
                 gospa_metric['missed'] = opt_cost
         else:
-            # Use auction algorithm when both truth_states
-            # and measured_states are non-empty
+            # Assign when both truth_states and measured_states are non-empty
             cost_matrix = -1. * np.power(cost_matrix, self.p)
-            truth_to_measured_assignment, measured_to_truth_assignment, _ =\
-                self.compute_assignments(cost_matrix,
-                                         10 * num_truth_states * num_measured_states)
+            if self.use_auction:
+                truth_to_measured_assignment, measured_to_truth_assignment, _ =\
+                    self.compute_assignments(cost_matrix,
+                                             10 * num_truth_states * num_measured_states)
+            else:
+                truth_indexes, measured_indexes = linear_sum_assignment(
+                    cost_matrix, maximize=True)
+                truth_to_measured_assignment = np.full((num_truth_states, ), unassigned_index)
+                truth_to_measured_assignment[truth_indexes] = measured_indexes
+                measured_to_truth_assignment = np.full((num_measured_states, ), unassigned_index)
+                measured_to_truth_assignment[measured_indexes] = truth_indexes
 
             opt_cost -= np.sum(measured_to_truth_assignment == unassigned_index) * dummy_cost
             if self.alpha == 2:
@@ -476,22 +521,16 @@ class OSPAMetric(GOSPAMetric):
             each timestamp
         """
 
+        measured_groups = self._group_by_timestamp(measured_states, meas_ids)
+        truth_groups = self._group_by_timestamp(truth_states, truth_ids)
         # Make a sorted list of all the unique timestamps used
-        timestamps = sorted({
-            state.timestamp
-            for state in chain(measured_states, truth_states)})
-
-        ospa_distances = []
-
-        for timestamp in timestamps:
-            meas_points = [state
-                           for state in measured_states
-                           if state.timestamp == timestamp]
-            truth_points = [state
-                            for state in truth_states
-                            if state.timestamp == timestamp]
-            ospa_distances.append(
-                self.compute_OSPA_distance(meas_points, truth_points))
+        timestamps = sorted(measured_groups.keys() | truth_groups.keys())
+        empty_group = ([], [])
+
+        ospa_distances = self._map_timestamps(
+            self.compute_OSPA_distance,
+            [measured_groups.get(timestamp, empty_group)[0] for timestamp in timestamps],
+            [truth_groups.get(timestamp, empty_group)[0] for timestamp in timestamps])
 
         # If only one timestamp is present then return a SingleTimeMetric
         if len(timestamps) == 1:
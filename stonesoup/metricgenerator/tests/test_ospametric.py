@@ -1,5 +1,6 @@
 """GOSPA/OSPA tests."""
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
@@ -459,3 +460,39 @@ def test_switching_loss(associations, expected_losses):
     for association, expected_loss in zip(associations, expected_losses):
         switching_loss.add_associations(association)
         assert switching_loss.loss() == expected_loss
+
+
+@pytest.mark.parametrize('generator_type', [GOSPAMetric, OSPAMetric])
+def test_metric_solver_executor(generator_type):
+    rng = np.random.default_rng(1)
+    time = datetime.datetime(2018, 1, 1, 14)
+    times = [time + datetime.timedelta(seconds=i) for i in range(10)]
+    # Tracks and truths present at differing times, with differing numbers
+    tracks = {Track(states=[State(state_vector=rng.normal(i, 2, size=(2, 1)), timestamp=time)
+                            for time in times[rng.integers(3):]])
+              for i in range(8)}
+    truths = {GroundTruthPath(states=[GroundTruthState(state_vector=[[i], [i]], timestamp=time)
+                                      for time in times[:rng.integers(8, 11)]])
+              for i in range(6)}
+    manager = MultiManager([])
+    manager.add_data({'groundtruth_paths': truths, 'tracks': tracks})
+
+    kwargs = {'c': 3, 'p': 2}
+    if generator_type is GOSPAMetric:
+        kwargs['switching_penalty'] = 1
+        metric = generator_type(use_auction=True, **kwargs).compute_metric(manager)
+    else:
+        metric = generator_type(**kwargs).compute_metric(manager)
+
+    for executor in (None, ThreadPoolExecutor(2)):
+        generator = generator_type(executor=executor, **kwargs)
+        new_metric = generator.compute_metric(manager)
+        assert new_metric.time_range == metric.time_range
+        for new_single_metric, single_metric in zip(new_metric.value, metric.value):
+            assert new_single_metric.timestamp == single_metric.timestamp
+            assert new_single_metric.generator is generator
+            if generator_type is GOSPAMetric:
+                for key, value in single_metric.value.items():
+                    assert new_single_metric.value[key] == pytest.approx(value)
+            else:
+                assert new_single_metric.value == pytest.approx(single_metric.value)
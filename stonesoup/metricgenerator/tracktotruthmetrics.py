@@ -267,10 +267,14 @@ class SIAPMetrics(MetricGenerator):
         float
             Number of tracks in `tracks` set or list at `timestamp`
         """
-        return sum(
-            1
-            for track in tracks
-            if timestamp in (state.timestamp for state in track.states))
+        num_tracks = 0
+        for track in tracks:
+            try:
+                track.timestamp_index(timestamp)
+            except IndexError:
+                continue
+            num_tracks += 1
+        return num_tracks
 
     @staticmethod
     def num_associated_tracks_at_time(manager, tracks, timestamp):
@@ -657,8 +661,7 @@ class IDSIAPMetrics(SIAPMetrics):
         any
             `track` ID at `timestamp`
         """
-        state = track[timestamp]
-        index = track.index(state)
+        index = track.timestamp_index(timestamp)
         metadata = track.metadatas[index]
         return metadata.get(self.track_id)
 
@@ -1,13 +1,11 @@
 import uuid
 
 import numpy as np
-from ordered_set import OrderedSet
 from scipy.spatial import KDTree
 
 from ..base import Property
 from .base import MixtureReducer
 from ..types.state import TaggedWeightedGaussianState, WeightedGaussianState
-from ..measures import SquaredMahalanobis
 from operator import attrgetter
 
 
@@ -96,13 +94,15 @@ class GaussianMixtureReducer(MixtureReducer):
 
         """
         # Prune low weight components
-        pruned_weight_sum = 0
-        for component in components_list:
-            if component.weight < self.prune_threshold:
-                pruned_weight_sum += component.weight
-
-        remaining_components = [component for component in components_list
-                                if component.weight >= self.prune_threshold]
+        weights = np.array([float(component.weight) for component in components_list])
+        pruned = weights < self.prune_threshold
+        pruned_weight_sum = sum(
+            component.weight
+            for component, is_pruned in zip(components_list, pruned) if is_pruned)
+
+        remaining_components = [component
+                                for component, is_pruned in zip(components_list, pruned)
+                                if not is_pruned]
         # Distribute pruned weights across remaining components
         for component in remaining_components:
             component.weight += \
@@ -160,6 +160,13 @@ class GaussianMixtureReducer(MixtureReducer):
         that fall with a distance threshold :attr:`merge_threshold` into
         a single component.
 
+        As per [1], starting from the highest weighted component, all remaining
+        components within squared Mahalanobis distance :attr:`merge_threshold` of it (with
+        respect to each of their covariances) are merged with it, moment matching the
+        weighted components. This repeats until no components remain. The mixture is held
+        as stacked arrays whilst merging, with new components only created for those
+        that are the result of a merge.
+
         Parameters
         ----------
         components_list : :class:`~.list`
@@ -171,74 +178,94 @@ class GaussianMixtureReducer(MixtureReducer):
             Merged components
 
         """
+        components_list = list(components_list)
+        if not components_list:
+            return []
+        means = np.array([component.state_vector[:, 0] for component in components_list],
+                         dtype=np.float64)
+        covars = np.array([component.covar for component in components_list], dtype=np.float64)
+        weights = np.array([float(component.weight) for component in components_list])
+        inv_covars = np.linalg.inv(covars)
+
         if self.kdtree_max_distance is not None:
-            tree = KDTree(
-                np.vstack([component.state_vector[:, 0]
-                           for component in components_list]))
+            tree = KDTree(means)
         else:
             tree = None
 
-        # Sort components by weight
-        remaining_components = OrderedSet(sorted(
-            components_list, key=attrgetter('weight')))
-
+        remaining = np.ones(len(components_list), dtype=bool)
         merged_components = []
-        final_merged_components = []
-        measure = SquaredMahalanobis(state_covar_inv_cache_size=None)
-        while remaining_components:
-            # Get highest weighted component
-            best_component = remaining_components.pop()
+        # Highest weighted first (with ties in reverse order of the mixture)
+        for best_index in np.argsort(weights, kind='stable')[::-1]:
+            if not remaining[best_index]:
+                continue
+            remaining[best_index] = False
 
             # If kdtree_max_distance set, use this as gate
             if tree:
-                indexes = tree.query_ball_point(
-                    best_component.state_vector.ravel(),
-                    r=self.kdtree_max_distance)
-                matched_components = {components_list[i]
-                                      for i in indexes
-                                      if components_list[i] in remaining_components}
+                indexes = np.array(tree.query_ball_point(
+                    means[best_index], r=self.kdtree_max_distance), dtype=np.intp)
+                indexes = np.sort(indexes[remaining[indexes]])
             else:
-                # Modifying list in loop, so copy used
-                matched_components = remaining_components.copy()
+                indexes = np.flatnonzero(remaining)
 
             # Check for similar components against threshold
-            for component in matched_components:
-                # Calculate distance between component and best component
-                distance = measure(state1=component, state2=best_component)
-                # Merge if similar
-                if distance < self.merge_threshold:
-                    remaining_components.remove(component)
-                    best_component = self.merge_components(
-                        best_component, component
-                    )
+            diffs = means[indexes] - means[best_index]
+            distances = np.einsum('ni,nij,nj->n', diffs, inv_covars[indexes], diffs)
+            indexes = indexes[distances < self.merge_threshold]
+
+            best_component = components_list[best_index]
+            if indexes.size:
+                remaining[indexes] = False
+                best_component = self._merge_indexes(
+                    components_list, np.append(best_index, indexes), means, covars, weights)
             # Add potentially merged component to new mixture
             merged_components.append(best_component)
+
+        # Merging may change the order of weights, so sorted by final weight (stable, such that
+        # ties remain in the order merged)
+        merged_components.sort(key=lambda component: float(component.weight), reverse=True)
+
         if all(isinstance(component, TaggedWeightedGaussianState)
                for component in merged_components):
-            # Check for duplicate tags
-            components_tags = set(component.tag for component in merged_components)
-            if len(components_tags) != len(merged_components):
-                # There are duplicatze tags so assign
-                # new tags to the lower weighted shared ones
-                for shared_tag in components_tags:
-                    shared_components = sorted(
-                        (component for component in merged_components
-                            if component.tag == shared_tag),
-                        key=attrgetter('weight'),
-                        reverse=True)
-                    final_merged_components.append(shared_components[0])
-                    for component in shared_components[1:]:
-                        # Assign a new uuid
-                        component.tag = str(uuid.uuid4())
-                        final_merged_components.append(component)
-            else:
-                # No duplicates
-                final_merged_components.extend(merged_components)
-        else:
-            # Just weighted components (no tags)
-            final_merged_components.extend(merged_components)
+            # Check for duplicate tags, assigning new tags to the lower weighted
+            # of those which share a tag (as in descending weight order)
+            components_tags = set()
+            for component in merged_components:
+                if component.tag in components_tags:
+                    # Assign a new uuid
+                    component.tag = str(uuid.uuid4())
+                components_tags.add(component.tag)
         # Assign merged components to the mixture
-        return final_merged_components
+        return merged_components
+
+    @staticmethod
+    def _merge_indexes(components_list, indexes, means, covars, weights):
+        """Merge components at `indexes` (first being the highest weighted) into one"""
+        component = components_list[indexes[0]]
+        merge_weights = weights[indexes]
+        normalised_weights = merge_weights / np.sum(merge_weights)
+        merged_mean = normalised_weights @ means[indexes]
+        diffs = means[indexes] - merged_mean
+        merged_covar = np.einsum('n,nij->ij', normalised_weights, covars[indexes]) \
+            + np.einsum('n,ni,nj->ij', normalised_weights, diffs, diffs)
+        weight_sum = sum(components_list[index].weight for index in indexes)
+        if weight_sum > 1:
+            weight_sum = 1
+        if isinstance(component, TaggedWeightedGaussianState):
+            return TaggedWeightedGaussianState(
+                state_vector=merged_mean[:, np.newaxis],
+                covar=merged_covar,
+                weight=weight_sum,
+                tag=component.tag,
+                timestamp=component.timestamp
+            )
+        else:
+            return WeightedGaussianState(
+                state_vector=merged_mean[:, np.newaxis],
+                covar=merged_covar,
+                weight=weight_sum,
+                timestamp=component.timestamp
+            )
 
     def truncate(self, components_list):
         """
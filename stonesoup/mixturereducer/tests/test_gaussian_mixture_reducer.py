@@ -99,3 +99,63 @@ def test_gaussianmixture_truncating():
                                             max_number_components=5)
     reduced_mixture = mixturereducer.reduce(mixture)
     assert len(reduced_mixture) == 5
+
+
+def test_gaussianmixture_merge(kdtree_max_distance):
+    states = [
+        TaggedWeightedGaussianState(
+            state_vector=np.array([[0.], [1.]]), covar=np.eye(2), weight=0.3, tag=1),
+        TaggedWeightedGaussianState(
+            state_vector=np.array([[1.], [1.]]), covar=np.eye(2)*2, weight=0.1, tag=2),
+        TaggedWeightedGaussianState(
+            state_vector=np.array([[0.], [2.]]), covar=np.eye(2)*3, weight=0.2, tag=1),
+        TaggedWeightedGaussianState(
+            state_vector=np.array([[100.], [100.]]), covar=np.eye(2), weight=0.2, tag=1),
+    ]
+    mixturereducer = GaussianMixtureReducer(
+        merge_threshold=4, kdtree_max_distance=kdtree_max_distance)
+    merged_states = mixturereducer.merge(states)
+    assert len(merged_states) == 2
+
+    # Moment matched merge of first three components, keeping highest weighted tag
+    merged_state = merged_states[0]
+    weights = np.array([0.3, 0.1, 0.2]) / 0.6
+    means = [state.state_vector for state in states[:3]]
+    mean = sum(weight*mean for weight, mean in zip(weights, means))
+    covar = sum(weight*(state.covar + (state.state_vector - mean) @ (state.state_vector - mean).T)
+                for weight, state in zip(weights, states[:3]))
+    assert np.allclose(merged_state.state_vector, mean)
+    assert np.allclose(merged_state.covar, covar)
+    assert float(merged_state.weight) == pytest.approx(0.6)
+    assert merged_state.tag == 1
+
+    # Unmerged component retained, but with new tag as lower weight
+    assert merged_states[1] is states[3]
+    assert merged_states[1].tag != 1
+
+
+def test_gaussianmixture_merge_weight_order(kdtree_max_distance):
+    states = [
+        TaggedWeightedGaussianState(
+            state_vector=np.array([[0.], [0.]]), covar=np.eye(2), weight=0.5, tag='T'),
+        TaggedWeightedGaussianState(
+            state_vector=np.array([[50.], [50.]]), covar=np.eye(2), weight=0.45, tag='T'),
+        TaggedWeightedGaussianState(
+            state_vector=np.array([[50.], [51.]]), covar=np.eye(2), weight=0.4, tag='X'),
+    ]
+    mixturereducer = GaussianMixtureReducer(
+        merge_threshold=4, kdtree_max_distance=kdtree_max_distance)
+    merged_states = mixturereducer.merge(states)
+    assert len(merged_states) == 2
+
+    # Merge of second and third components now highest weighted, so keeps shared tag
+    assert float(merged_states[0].weight) == pytest.approx(0.85)
+    assert merged_states[0].tag == 'T'
+    assert merged_states[1] is states[0]
+    assert merged_states[1].tag != 'T'
+
+
+def test_gaussianmixture_merge_empty(kdtree_max_distance):
+    mixturereducer = GaussianMixtureReducer(
+        merge_threshold=4, kdtree_max_distance=kdtree_max_distance)
+    assert mixturereducer.merge([]) == []
@@ -1,11 +1,12 @@
 from abc import abstractmethod
+from functools import lru_cache
 from typing import TYPE_CHECKING, Union, Optional
 
 import numpy as np
 from scipy.stats import multivariate_normal
 
 from ..base import Base, Property
-from ..functions import jacobian as compute_jac
+from ..functions import jacobian as compute_jac, gaussian_logpdf
 from ..types.array import StateVector, StateVectors, CovarianceMatrix
 from ..types.numeric import Probability
 from ..types.state import State
@@ -58,7 +59,10 @@ class Model(Base):
         -------
         :class:`numpy.ndarray` of shape (:py:attr:`~ndim_meas`, \
         :py:attr:`~ndim_state`)
-            The model jacobian matrix evaluated around the given state vector.
+            The model jacobian matrix evaluated around the given state vector. Where the state
+            has multiple state vectors (e.g. :class:`~.StateVectors` of `N` columns), an array of
+            shape (`N`, :py:attr:`~ndim_meas`, :py:attr:`~ndim_state`) of the jacobian matrix
+            evaluated around each.
         """
 
         return compute_jac(self.function, state, **kwargs)
@@ -169,9 +173,15 @@ class LinearModel(Model):
         -------
         :class:`numpy.ndarray` of shape (:py:attr:`~ndim_meas`, \
         :py:attr:`~ndim_state`)
-            The model jacobian matrix evaluated around the given state vector.
+            The model jacobian matrix evaluated around the given state vector. Where the state
+            has `N` state vectors, the matrix repeated with shape (`N`, :py:attr:`~ndim_meas`,
+            :py:attr:`~ndim_state`).
         """
-        return self.matrix(**kwargs)
+        matrix = self.matrix(**kwargs)
+        if state is None or state.state_vector.shape[1] == 1:
+            return matrix
+        num_states = state.state_vector.shape[1]
+        return np.broadcast_to(matrix, (num_states, *np.shape(matrix)))
 
 
 class ReversibleModel(Model):
@@ -213,6 +223,18 @@ class TimeInvariantModel(Model):
     Base/Abstract class for all time-invariant models"""
 
 
+@lru_cache(maxsize=256)
+def _svd_sampling_factor(covar_bytes, ndim):
+    # As :meth:`numpy.random.RandomState.multivariate_normal`, so seeded samples are unchanged
+    covar = np.frombuffer(covar_bytes).reshape(ndim, ndim)
+    _, s, v = np.linalg.svd(covar)
+    if not np.allclose(np.dot(v.T * s, v), covar, rtol=1e-8, atol=1e-8):
+        return None  # Left to numpy to warn
+    factor = np.sqrt(s)[:, None] * v
+    factor.flags.writeable = False
+    return factor
+
+
 class GaussianModel(Model):
     """GaussianModel class
 
@@ -257,13 +279,23 @@ class GaussianModel(Model):
 
         random_state = random_state if random_state is not None else self.random_state
 
-        noise = multivariate_normal.rvs(
-            np.zeros(self.ndim), covar, num_samples, random_state=random_state)
+        factor = None
+        if random_state is None or isinstance(random_state, np.random.RandomState):
+            factor = self._sampling_factor(covar)
 
-        noise = np.atleast_2d(noise)
+        if factor is not None:
+            # Same samples as `multivariate_normal.rvs`, without factorising covariance each call
+            normal = (random_state if random_state is not None else np.random).standard_normal(
+                (num_samples, self.ndim))
+            noise = (normal @ factor).T
+        else:
+            noise = multivariate_normal.rvs(
+                np.zeros(self.ndim), covar, num_samples, random_state=random_state)
 
-        if self.ndim > 1:
-            noise = noise.T  # numpy.rvs method squeezes 1-dimensional matrices to integers
+            noise = np.atleast_2d(noise)
+
+            if self.ndim > 1:
+                noise = noise.T  # numpy.rvs method squeezes 1-dimensional matrices to integers
 
         if num_samples == 1:
             return noise.view(StateVector)
@@ -328,17 +360,24 @@ class GaussianModel(Model):
         if covar is None or None in covar:
             raise ValueError("Cannot generate pdf from None-type covariance")
 
-        # Calculate difference before to handle custom types (mean defaults to zero)
-        # This is required as log pdf coverts arrays to floats
-        likelihood = np.atleast_1d(
-            multivariate_normal.logpdf((state1.state_vector - self.function(state2, **kwargs)).T,
-                                       cov=covar))
+        likelihood = gaussian_logpdf(self._logpdf_residuals(state1, state2, **kwargs), covar)
 
         if len(likelihood) == 1:
             likelihood = likelihood[0]
 
         return likelihood
 
+    def _logpdf_residuals(self, state1, state2, **kwargs):
+        # Calculate difference before to handle custom types (mean defaults to zero)
+        # This is required as log pdf coverts arrays to floats
+        return state1.state_vector - self.function(state2, **kwargs)
+
+    @staticmethod
+    def _sampling_factor(covar):
+        """Factor of covariance used by :meth:`rvs`, or `None` if not positive semi-definite"""
+        covar = np.ascontiguousarray(covar, dtype=np.float64)
+        return _svd_sampling_factor(covar.tobytes(), covar.shape[0])
+
     @abstractmethod
     def covar(self, **kwargs) -> CovarianceMatrix:
         """Model covariance"""
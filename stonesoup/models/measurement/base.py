@@ -1,8 +1,12 @@
 from abc import abstractmethod, ABC
-from typing import Sequence
+from typing import Optional, Sequence, Tuple, Type
+
+import numpy as np
 
 from ..base import Model
 from ...base import Property
+from ...types.angle import Angle
+from ...types.array import StateVectors
 
 
 class MeasurementModel(Model, ABC):
@@ -20,3 +24,70 @@ class MeasurementModel(Model, ABC):
     def ndim_meas(self) -> int:
         """Number of measurement dimensions"""
         pass
+
+    @property
+    def angle_types(self) -> Optional[Tuple[Optional[Type[Angle]], ...]]:
+        """:class:`~.Angle` type of each measurement dimension, or `None` for dimensions which
+        aren't angular.
+
+        Where declared, measurements and residuals can be handled as float arrays (see
+        :meth:`float_function`), with angular dimensions wrapped to the range of their type by
+        :meth:`wrap_angles`, rather than as object arrays of :class:`~.Angle` types. Default
+        `None`, where angular dimensions aren't declared."""
+        return None
+
+    def float_function(self, state, **kwargs) -> StateVectors:
+        """Model function, without noise, as a float array
+
+        Equivalent to :meth:`~.Model.function`, but with angular dimensions (as declared by
+        :attr:`angle_types`) held as floats rather than :class:`~.Angle` types, so aren't
+        necessarily wrapped (see :meth:`wrap_angles`). By default, this converts the output of
+        :meth:`~.Model.function`.
+
+        Parameters
+        ----------
+        state: :class:`~.State`
+            An input state
+
+        Returns
+        -------
+        : :class:`~.StateVector` or :class:`~.StateVectors`
+            The model function evaluated, with `float64` dtype
+        """
+        return self.function(state, **kwargs).astype(np.float64)
+
+    def wrap_angles(self, vectors):
+        """Wrap angular dimensions of float measurement vectors or residuals
+
+        Parameters
+        ----------
+        vectors : :class:`numpy.ndarray` of shape (:attr:`ndim_meas`, n)
+            Measurement vectors or residuals
+
+        Returns
+        -------
+        : :class:`numpy.ndarray` of shape (:attr:`ndim_meas`, n)
+            Copy of the vectors, with `float64` dtype and angular dimensions wrapped as per
+            :attr:`angle_types`
+        """
+        vectors = vectors.astype(np.float64)
+        array = np.asarray(vectors)
+        for dim, angle_type in enumerate(self.angle_types or ()):
+            if angle_type is not None:
+                array[dim] = angle_type.mod_angle(array[dim])
+        return vectors
+
+    def _with_angle_types(self, vectors):
+        """Float measurement vectors, with angular dimensions as :class:`~.Angle` types"""
+        vectors = np.asarray(vectors)
+        out = vectors.astype(object)
+        for dim, angle_type in enumerate(self.angle_types):
+            if angle_type is not None:
+                out[dim] = [angle_type(value) for value in vectors[dim].tolist()]
+        return StateVectors(out)
+
+    def _logpdf_residuals(self, state1, state2, **kwargs):
+        if self.angle_types is None:
+            return super()._logpdf_residuals(state1, state2, **kwargs)
+        return self.wrap_angles(
+            state1.state_vector.astype(np.float64) - self.float_function(state2, **kwargs))
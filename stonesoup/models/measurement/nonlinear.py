@@ -2,7 +2,6 @@ from abc import ABC
 import copy
 from typing import Sequence, Tuple, Union
 
-from math import sqrt
 import numpy as np
 from scipy.linalg import inv, pinv, block_diag
 from scipy.stats import multivariate_normal
@@ -12,13 +11,64 @@ from ...types.numeric import Probability
 
 from ...functions import cart2pol, pol2cart, \
     cart2sphere, sphere2cart, cart2angles, \
-    build_rotation_matrix, cart2az_el_rg, az_el_rg2cart
+    build_rotation_matrix, cart2az_el_rg, az_el_rg2cart, jacobian as compute_jac
 from ...types.array import StateVector, CovarianceMatrix, StateVectors
 from ...types.angle import Bearing, Elevation, Azimuth
 from ..base import LinearModel, GaussianModel, ReversibleModel
 from .base import MeasurementModel
 
 
+@np.errstate(divide='ignore', invalid='ignore')
+def _bearing_partials(xyz):
+    """Partial derivatives of bearing with respect to each row of (2, N) or (3, N) Cartesian
+    positions, of shape (N, 2) or (N, 3)"""
+    x, y = xyz[0], xyz[1]
+    x2y2 = x**2 + y**2
+    partials = np.zeros(xyz.shape[::-1])
+    partials[:, 0] = -y/x2y2
+    partials[:, 1] = x/x2y2
+    return partials
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def _range_partials(xyz):
+    """Partial derivatives of range with respect to each row of (2, N) or (3, N) Cartesian
+    positions, of shape (N, 2) or (N, 3)"""
+    return (xyz / np.sqrt(np.sum(xyz**2, axis=0))).T
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def _elevation_partials(xyz):
+    """Partial derivatives of elevation (from the x, y plane) with respect to (3, N) Cartesian
+    positions, of shape (N, 3)"""
+    x, y, z = xyz
+    x2y2 = x**2 + y**2
+    r2 = x2y2 + z**2
+    sqrt_x2y2 = np.sqrt(x2y2)
+    sqrt_x2y2r2 = sqrt_x2y2*r2
+    return np.stack([-x*z/sqrt_x2y2r2, -y*z/sqrt_x2y2r2, sqrt_x2y2/r2], axis=-1)
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def _arcsin_partials(xyz, dim):
+    """Partial derivatives of :math:`asin(xyz_{dim}/r)` (i.e. azimuth or elevation of
+    :func:`~.cart2az_el_rg`) with respect to (3, N) Cartesian positions, of shape (N, 3)"""
+    r2 = np.sum(xyz**2, axis=0)
+    sqrt_r2_u2 = np.sqrt(r2 - xyz[dim]**2)
+    partials = -xyz[dim]*xyz / (r2*sqrt_r2_u2)
+    partials[dim] = sqrt_r2_u2/r2
+    return partials.T
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def _range_rate_partials(xyz_pos, xyz_vel):
+    """Partial derivatives of range rate with respect to (3, N) relative Cartesian positions and
+    velocities, each of shape (N, 3)"""
+    r = np.sqrt(np.sum(xyz_pos**2, axis=0))
+    rr = np.sum(xyz_pos*xyz_vel, axis=0) / r
+    return ((xyz_vel - rr*xyz_pos/r) / r).T, (xyz_pos / r).T
+
+
 class CombinedReversibleGaussianMeasurementModel(ReversibleModel, GaussianModel, MeasurementModel):
     r"""Combine multiple models into a single model by stacking them.
 
@@ -53,10 +103,21 @@ class CombinedReversibleGaussianMeasurementModel(ReversibleModel, GaussianModel,
     def mapping(self):
         return [x for model in self.model_list for x in model.mapping]
 
+    @property
+    def angle_types(self):
+        model_angle_types = [model.angle_types for model in self.model_list]
+        if any(angle_types is None for angle_types in model_angle_types):
+            return None
+        return tuple(angle_type for angle_types in model_angle_types for angle_type in angle_types)
+
     def function(self, state, **kwargs) -> StateVector:
         return np.vstack([model.function(state, **kwargs)
                           for model in self.model_list]).view(StateVector)
 
+    def float_function(self, state, **kwargs) -> StateVector:
+        return np.vstack([model.float_function(state, **kwargs)
+                          for model in self.model_list]).view(StateVector)
+
     @staticmethod
     def _linear_inverse_function(model, state, **kwargs):
         model_matrix = model.matrix(**kwargs)
@@ -81,6 +142,26 @@ class CombinedReversibleGaussianMeasurementModel(ReversibleModel, GaussianModel,
 
         return state_vector
 
+    def jacobian(self, state, **kwargs):
+        """Model jacobian matrix :math:`H_{jac}`
+
+        The jacobian matrices of each model in :attr:`model_list`, stacked.
+
+        Parameters
+        ----------
+        state : :class:`~.State`
+            An input state
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (:py:attr:`~ndim_meas`, :py:attr:`~ndim_state`)
+            The model jacobian matrix evaluated around the given state vector. Where the state
+            has `N` state vectors, an array of shape (`N`, :py:attr:`~ndim_meas`,
+            :py:attr:`~ndim_state`) of the jacobian matrix evaluated around each.
+        """
+        return np.concatenate(
+            [model.jacobian(state, **kwargs) for model in self.model_list], axis=-2)
+
     def covar(self, **kwargs) -> CovarianceMatrix:
         return block_diag(
             *(model.covar(**kwargs) for model in self.model_list)
@@ -138,6 +219,27 @@ class NonLinearGaussianMeasurement(MeasurementModel, GaussianModel, ABC):
         """3D axis rotation matrix"""
         return build_rotation_matrix(self.rotation_offset)
 
+    def _position_jacobian(self, rotated_partials, mapping):
+        """Model jacobian, from an array of shape (N, n, len(mapping)) of partial derivatives of
+        the first n measurement dimensions with respect to the rotated position (i.e. the
+        position in the rotated coordinate system, of state dimensions `mapping`)"""
+        num_states, ndim_partials, ndim_pos = rotated_partials.shape
+        jac = np.zeros((num_states, self.ndim_meas, self.ndim_state))
+        jac[:, :ndim_partials, mapping] = \
+            rotated_partials @ self.rotation_matrix[:ndim_pos, :ndim_pos]
+        return jac
+
+    def _defined_jacobian(self, jac, state):
+        """Jacobian from array of shape (N, ndim_meas, ndim_state) of analytic jacobians, with
+        those not defined analytically (e.g. at the sensor position) by finite differences"""
+        undefined = ~np.all(np.isfinite(jac), axis=(1, 2))
+        if np.any(undefined):
+            undefined_state = copy.copy(state)
+            undefined_state.state_vector = state.state_vector[:, undefined]
+            jac[undefined] = np.reshape(
+                compute_jac(self.function, undefined_state), (-1, *jac.shape[1:]))
+        return jac[0] if jac.shape[0] == 1 else jac
+
 
 class CartesianToElevationBearingRange(NonLinearGaussianMeasurement, ReversibleModel):
     r"""This is a class implementation of a time-invariant measurement model, \
@@ -225,6 +327,10 @@ class CartesianToElevationBearingRange(NonLinearGaussianMeasurement, ReversibleM
 
         return 3
 
+    @property
+    def angle_types(self):
+        return Elevation, Bearing, None
+
     def function(self, state, noise=False, **kwargs) -> StateVector:
         r"""Model function :math:`h(\vec{x}_t,\vec{v}_t)`
 
@@ -249,6 +355,9 @@ class CartesianToElevationBearingRange(NonLinearGaussianMeasurement, ReversibleM
             else:
                 noise = 0
 
+        return self._with_angle_types(self.float_function(state, **kwargs)) + noise
+
+    def float_function(self, state, **kwargs) -> StateVector:
         # Account for origin offset
         xyz = state.state_vector[self.mapping, :] - self.translation_offset
 
@@ -257,10 +366,8 @@ class CartesianToElevationBearingRange(NonLinearGaussianMeasurement, ReversibleM
 
         # Convert to Spherical
         rho, phi, theta = cart2sphere(xyz_rot[0, :], xyz_rot[1, :], xyz_rot[2, :])
-        elevations = [Elevation(i) for i in theta]
-        bearings = [Bearing(i) for i in phi]
 
-        return StateVectors([elevations, bearings, rho]) + noise
+        return StateVectors([theta, phi, rho]).astype(np.float64, copy=False)
 
     def inverse_function(self, detection, **kwargs) -> StateVector:
 
@@ -280,6 +387,31 @@ class CartesianToElevationBearingRange(NonLinearGaussianMeasurement, ReversibleM
         out = np.array([[Elevation(0.)], [Bearing(0.)], [0.]]) + out
         return out
 
+    def jacobian(self, state, **kwargs):
+        """Model jacobian matrix :math:`H_{jac}`
+
+        Calculated analytically, for any number of state vectors at once.
+
+        Parameters
+        ----------
+        state : :class:`~.State`
+            An input state
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (:py:attr:`~ndim_meas`, :py:attr:`~ndim_state`)
+            The model jacobian matrix evaluated around the given state vector. Where the state
+            has `N` state vectors, an array of shape (`N`, :py:attr:`~ndim_meas`,
+            :py:attr:`~ndim_state`) of the jacobian matrix evaluated around each.
+        """
+        xyz = state.state_vector[self.mapping, :].astype(np.float64) - self.translation_offset
+        xyz_rot = np.asarray(self.rotation_matrix @ xyz)
+
+        jac = self._position_jacobian(np.stack(
+            [_elevation_partials(xyz_rot), _bearing_partials(xyz_rot), _range_partials(xyz_rot)],
+            axis=1), self.mapping)
+        return self._defined_jacobian(jac, state)
+
 
 class CartesianToBearingRange(NonLinearGaussianMeasurement, ReversibleModel):
     r"""This is a class implementation of a time-invariant measurement model, \
@@ -361,6 +493,10 @@ class CartesianToBearingRange(NonLinearGaussianMeasurement, ReversibleModel):
 
         return 2
 
+    @property
+    def angle_types(self):
+        return Bearing, None
+
     def inverse_function(self, detection, **kwargs) -> StateVector:
         if not ((self.rotation_offset[0] == 0)
                 and (self.rotation_offset[1] == 0)):
@@ -404,6 +540,9 @@ class CartesianToBearingRange(NonLinearGaussianMeasurement, ReversibleModel):
             else:
                 noise = 0
 
+        return self._with_angle_types(self.float_function(state, **kwargs)) + noise
+
+    def float_function(self, state, **kwargs) -> StateVector:
         # Account for origin offset
         xyz = np.array([state.state_vector[self.mapping[0], :] - self.translation_offset[0, 0],
                         state.state_vector[self.mapping[1], :] - self.translation_offset[1, 0],
@@ -415,14 +554,39 @@ class CartesianToBearingRange(NonLinearGaussianMeasurement, ReversibleModel):
 
         # Covert to polar
         rho, phi = cart2pol(*xyz_rot[:2, :])
-        bearings = [Bearing(i) for i in phi]
-        return StateVectors([bearings, rho]) + noise
+
+        return StateVectors([phi, rho]).astype(np.float64, copy=False)
 
     def rvs(self, num_samples=1, **kwargs) -> Union[StateVector, StateVectors]:
         out = super().rvs(num_samples, **kwargs)
         out = np.array([[Bearing(0)], [0.]]) + out
         return out
 
+    def jacobian(self, state, **kwargs):
+        """Model jacobian matrix :math:`H_{jac}`
+
+        Calculated analytically, for any number of state vectors at once.
+
+        Parameters
+        ----------
+        state : :class:`~.State`
+            An input state
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (:py:attr:`~ndim_meas`, :py:attr:`~ndim_state`)
+            The model jacobian matrix evaluated around the given state vector. Where the state
+            has `N` state vectors, an array of shape (`N`, :py:attr:`~ndim_meas`,
+            :py:attr:`~ndim_state`) of the jacobian matrix evaluated around each.
+        """
+        xy = state.state_vector[self.mapping[:2], :].astype(np.float64) \
+            - self.translation_offset[:2, :]
+        xy_rot = np.asarray(self.rotation_matrix[:2, :2] @ xy)
+
+        jac = self._position_jacobian(np.stack(
+            [_bearing_partials(xy_rot), _range_partials(xy_rot)], axis=1), self.mapping[:2])
+        return self._defined_jacobian(jac, state)
+
 
 class CartesianToElevationBearing(NonLinearGaussianMeasurement):
     r"""This is a class implementation of a time-invariant measurement model, \
@@ -506,6 +670,10 @@ class CartesianToElevationBearing(NonLinearGaussianMeasurement):
 
         return 2
 
+    @property
+    def angle_types(self):
+        return Elevation, Bearing
+
     def function(self, state, noise=False, **kwargs) -> StateVector:
         r"""Model function :math:`h(\vec{x}_t,\vec{v}_t)`
 
@@ -530,6 +698,9 @@ class CartesianToElevationBearing(NonLinearGaussianMeasurement):
             else:
                 noise = 0
 
+        return self._with_angle_types(self.float_function(state, **kwargs)) + noise
+
+    def float_function(self, state, **kwargs) -> StateVector:
         # Account for origin offset
         xyz = state.state_vector[self.mapping, :] - self.translation_offset
 
@@ -539,15 +710,37 @@ class CartesianToElevationBearing(NonLinearGaussianMeasurement):
         # Convert to Angles
         phi, theta = cart2angles(xyz_rot[0, :], xyz_rot[1, :], xyz_rot[2, :])
 
-        bearings = [Bearing(i) for i in phi]
-        elevations = [Elevation(i) for i in theta]
-        return StateVectors([elevations, bearings]) + noise
+        return StateVectors([theta, phi]).astype(np.float64, copy=False)
 
     def rvs(self, num_samples=1, **kwargs) -> Union[StateVector, StateVectors]:
         out = super().rvs(num_samples, **kwargs)
         out = np.array([[Elevation(0.)], [Bearing(0.)]]) + out
         return out
 
+    def jacobian(self, state, **kwargs):
+        """Model jacobian matrix :math:`H_{jac}`
+
+        Calculated analytically, for any number of state vectors at once.
+
+        Parameters
+        ----------
+        state : :class:`~.State`
+            An input state
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (:py:attr:`~ndim_meas`, :py:attr:`~ndim_state`)
+            The model jacobian matrix evaluated around the given state vector. Where the state
+            has `N` state vectors, an array of shape (`N`, :py:attr:`~ndim_meas`,
+            :py:attr:`~ndim_state`) of the jacobian matrix evaluated around each.
+        """
+        xyz = state.state_vector[self.mapping, :].astype(np.float64) - self.translation_offset
+        xyz_rot = np.asarray(self.rotation_matrix @ xyz)
+
+        jac = self._position_jacobian(np.stack(
+            [_elevation_partials(xyz_rot), _bearing_partials(xyz_rot)], axis=1), self.mapping)
+        return self._defined_jacobian(jac, state)
+
 
 class Cartesian2DToBearing(NonLinearGaussianMeasurement):
     r"""This is a class implementation of a time-invariant measurement model, where measurements \
@@ -601,6 +794,10 @@ class Cartesian2DToBearing(NonLinearGaussianMeasurement):
             """
         return 1
 
+    @property
+    def angle_types(self):
+        return Bearing,
+
     def function(self, state, noise=False, **kwargs):
         r"""Model function :math:`h(\vec{x}_t,v_t)`
 
@@ -625,6 +822,9 @@ class Cartesian2DToBearing(NonLinearGaussianMeasurement):
             else:
                 noise = 0
 
+        return self._with_angle_types(self.float_function(state, **kwargs)) + noise
+
+    def float_function(self, state, **kwargs) -> StateVector:
         # Account for origin offset
         xyz = np.array([state.state_vector[self.mapping[0], :] - self.translation_offset[0, 0],
                         state.state_vector[self.mapping[1], :] - self.translation_offset[1, 0],
@@ -636,15 +836,39 @@ class Cartesian2DToBearing(NonLinearGaussianMeasurement):
 
         # Covert to polar
         _, phi = cart2pol(*xyz_rot[:2, :])
-        bearings = [Bearing(i) for i in phi]
 
-        return StateVectors([bearings]) + noise
+        return StateVectors([phi]).astype(np.float64, copy=False)
 
     def rvs(self, num_samples=1, **kwargs) -> Union[StateVector, StateVectors]:
         out = super().rvs(num_samples, **kwargs)
         out = np.array([[Bearing(0.)]]) + out
         return out
 
+    def jacobian(self, state, **kwargs):
+        """Model jacobian matrix :math:`H_{jac}`
+
+        Calculated analytically, for any number of state vectors at once.
+
+        Parameters
+        ----------
+        state : :class:`~.State`
+            An input state
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (:py:attr:`~ndim_meas`, :py:attr:`~ndim_state`)
+            The model jacobian matrix evaluated around the given state vector. Where the state
+            has `N` state vectors, an array of shape (`N`, :py:attr:`~ndim_meas`,
+            :py:attr:`~ndim_state`) of the jacobian matrix evaluated around each.
+        """
+        xy = state.state_vector[self.mapping[:2], :].astype(np.float64) \
+            - self.translation_offset[:2, :]
+        xy_rot = np.asarray(self.rotation_matrix[:2, :2] @ xy)
+
+        jac = self._position_jacobian(
+            _bearing_partials(xy_rot)[:, np.newaxis, :], self.mapping[:2])
+        return self._defined_jacobian(jac, state)
+
 
 class CartesianToBearingRangeRate(NonLinearGaussianMeasurement):
     r"""This is a class implementation of a time-invariant measurement model, \
@@ -741,6 +965,10 @@ class CartesianToBearingRangeRate(NonLinearGaussianMeasurement):
 
         return 3
 
+    @property
+    def angle_types(self):
+        return Bearing, None, None
+
     def function(self, state, noise=False, **kwargs) -> StateVector:
         r"""Model function :math:`h(\vec{x}_t,\vec{v}_t)`
 
@@ -766,6 +994,9 @@ class CartesianToBearingRangeRate(NonLinearGaussianMeasurement):
             else:
                 noise = 0
 
+        return self._with_angle_types(self.float_function(state, **kwargs)) + noise
+
+    def float_function(self, state, **kwargs) -> StateVector:
         # Account for origin offset in position to enable range and angles to be determined
         xy_pos = state.state_vector[self.mapping, :] - self.translation_offset
 
@@ -781,16 +1012,43 @@ class CartesianToBearingRangeRate(NonLinearGaussianMeasurement):
         # Use polar to calculate range rate
         rr = np.einsum('ij,ij->j', xy_pos, xy_vel) / np.linalg.norm(xy_pos, axis=0)
 
-        # Convert to bearings
-        bearings = [Bearing(i) for i in phi]
-
-        return StateVectors([bearings, rho, rr]) + noise
+        return StateVectors([phi, rho, rr]).astype(np.float64, copy=False)
 
     def rvs(self, num_samples=1, **kwargs) -> Union[StateVector, StateVectors]:
         out = super().rvs(num_samples, **kwargs)
         out = np.array([[Bearing(0)], [0.], [0.]]) + out
         return out
 
+    def jacobian(self, state, **kwargs):
+        """Model jacobian matrix :math:`H_{jac}`
+
+        Calculated analytically, for any number of state vectors at once.
+
+        Parameters
+        ----------
+        state : :class:`~.State`
+            An input state
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (:py:attr:`~ndim_meas`, :py:attr:`~ndim_state`)
+            The model jacobian matrix evaluated around the given state vector. Where the state
+            has `N` state vectors, an array of shape (`N`, :py:attr:`~ndim_meas`,
+            :py:attr:`~ndim_state`) of the jacobian matrix evaluated around each.
+        """
+        xyz_pos = np.asarray(
+            state.state_vector[self.mapping, :].astype(np.float64) - self.translation_offset)
+        xyz_vel = np.asarray(
+            state.state_vector[self.velocity_mapping, :].astype(np.float64) - self.velocity)
+        xyz_rot = self.rotation_matrix @ xyz_pos
+
+        jac = self._position_jacobian(np.stack(
+            [_bearing_partials(xyz_rot), _range_partials(xyz_rot)], axis=1), self.mapping)
+        # Range rate is independent of rotation
+        jac[:, 2, self.mapping], jac[:, 2, self.velocity_mapping] = \
+            _range_rate_partials(xyz_pos, xyz_vel)
+        return self._defined_jacobian(jac, state)
+
 
 class CartesianToElevationBearingRangeRate(NonLinearGaussianMeasurement, ReversibleModel):
     r"""This is a class implementation of a time-invariant measurement model, \
@@ -889,6 +1147,10 @@ class CartesianToElevationBearingRangeRate(NonLinearGaussianMeasurement, Reversi
 
         return 4
 
+    @property
+    def angle_types(self):
+        return Elevation, Bearing, None, None
+
     def function(self, state, noise=False, **kwargs) -> StateVector:
         r"""Model function :math:`h(\vec{x}_t,\vec{v}_t)`
 
@@ -914,6 +1176,9 @@ class CartesianToElevationBearingRangeRate(NonLinearGaussianMeasurement, Reversi
             else:
                 noise = 0
 
+        return self._with_angle_types(self.float_function(state, **kwargs)) + noise
+
+    def float_function(self, state, **kwargs) -> StateVector:
         # Account for origin offset in position to enable range and angles to be determined
         xyz_pos = state.state_vector[self.mapping, :] - self.translation_offset
 
@@ -929,12 +1194,7 @@ class CartesianToElevationBearingRangeRate(NonLinearGaussianMeasurement, Reversi
         # Use polar to calculate range rate
         rr = np.einsum('ij,ij->j', xyz_pos, xyz_vel) / np.linalg.norm(xyz_pos, axis=0)
 
-        bearings = [Bearing(i) for i in phi]
-        elevations = [Elevation(i) for i in theta]
-        return StateVectors([elevations,
-                             bearings,
-                             rho,
-                             rr]) + noise
+        return StateVectors([theta, phi, rho, rr]).astype(np.float64, copy=False)
 
     def inverse_function(self, detection, **kwargs) -> StateVector:
         theta, phi, rho, rho_rate = detection.state_vector
@@ -968,6 +1228,8 @@ class CartesianToElevationBearingRangeRate(NonLinearGaussianMeasurement, Reversi
     def jacobian(self, state, **kwargs):
         """Model jacobian matrix :math:`H_{jac}`
 
+        Calculated analytically, for any number of state vectors at once.
+
         Parameters
         ----------
         state : :class:`~.State`
@@ -975,82 +1237,24 @@ class CartesianToElevationBearingRangeRate(NonLinearGaussianMeasurement, Reversi
 
         Returns
         -------
-        :class:`numpy.ndarray` of shape (:py:attr:`~ndim_meas`, \
-        :py:attr:`~ndim_state`)
-            The model jacobian matrix evaluated around the given state vector.
+        :class:`numpy.ndarray` of shape (:py:attr:`~ndim_meas`, :py:attr:`~ndim_state`)
+            The model jacobian matrix evaluated around the given state vector. Where the state
+            has `N` state vectors, an array of shape (`N`, :py:attr:`~ndim_meas`,
+            :py:attr:`~ndim_state`) of the jacobian matrix evaluated around each.
         """
-        # Account for origin offset in position to enable range and angles to be determined
-        xyz_pos = state.state_vector[self.mapping, :] - self.translation_offset
-
-        # Determine the net velocity component in the engagement
-        xyz_vel = state.state_vector[self.velocity_mapping, :] - self.velocity
-
-        # Rotate into RADAR coordinate system to linearize around the correct
-        # state
-        xyz_pos = self.rotation_matrix @ xyz_pos
-        xyz_vel = self.rotation_matrix @ xyz_vel
-
-        jac = np.zeros((4, 6), dtype=np.float64)
-
-        x, y, z = xyz_pos
-        vx, vy, vz = xyz_vel
-        x2, y2, z2 = x**2, y**2, z**2
-        x2y2 = x2 + y2
-        r2 = x2y2 + z2
-        r = sqrt(r2)
-        sqrt_x2_y2 = sqrt(x2y2)
-        r32 = r2*r
-
-        # Jacobian encodes partial derivatives of measurement vector components
-        # Y = <theta, phi, r, rdot> against state vector
-        # X = <x, vx, y, vy, z, vz>.
-
-        # dtheta/dx
-        sqrt_x2_y2r2 = sqrt_x2_y2*r2
-        jac[0, 0] = -(x*z)/(sqrt_x2_y2r2)
-
-        # dtheta/dy
-        jac[0, 2] = -(y*z)/(sqrt_x2_y2r2)
-
-        # dthtea/dz
-        jac[0, 4] = sqrt_x2_y2/r2
-
-        # dphi/dx
-        jac[1, 0] = - y/(x2y2)
-
-        # dphi/dy
-        jac[1, 2] = x/(x2y2)
-
-        # dphi/dz = 0
-
-        # dr/dx and drdot/dvx
-        jac[2, 0] = jac[3, 1] = x/r
-
-        # dr/dx and drdot/dvy
-        jac[2, 2] = jac[3, 3] = y/r
-
-        # dr/dx and drdot/dvz
-        jac[2, 4] = jac[3, 5] = z/r
-
-        vx_x, vy_y, vz_z = vx*x, vy*y, vz*z
-
-        # drdot/dx
-        jac[3, 0] = (-x*(vy_y + vz_z) + vx*(y2 + z2))/r32
-
-        # drdot/dy
-        jac[3, 2] = (vy*(x2 + z2) - y*(vx_x + vz_z))/r32
-
-        # drdot/dz
-        jac[3, 4] = (vz*(x2y2) - (vx_x + vy_y)*z)/r32
-
-        # Up to this point, the Jacobian has been with respect to the state
-        # vector after rotating into the RADAR coordinate system. However, we
-        # want the Jacobian with respect to world state vector, so we must post
-        # multiply Jacobian by the RADAR rotation matrix.
-        jac[:, self.mapping] = jac[:, self.mapping] @ self.rotation_matrix
-        jac[:, self.velocity_mapping] = jac[:, self.velocity_mapping] @ self.rotation_matrix
+        xyz_pos = np.asarray(
+            state.state_vector[self.mapping, :].astype(np.float64) - self.translation_offset)
+        xyz_vel = np.asarray(
+            state.state_vector[self.velocity_mapping, :].astype(np.float64) - self.velocity)
+        xyz_rot = self.rotation_matrix @ xyz_pos
 
-        return jac
+        jac = self._position_jacobian(np.stack(
+            [_elevation_partials(xyz_rot), _bearing_partials(xyz_rot), _range_partials(xyz_rot)],
+            axis=1), self.mapping)
+        # Range rate is independent of rotation
+        jac[:, 3, self.mapping], jac[:, 3, self.velocity_mapping] = \
+            _range_rate_partials(xyz_pos, xyz_vel)
+        return self._defined_jacobian(jac, state)
 
 
 class RangeRangeRateBinning(CartesianToElevationBearingRangeRate):
@@ -1343,6 +1547,10 @@ class CartesianToAzimuthElevationRange(NonLinearGaussianMeasurement, ReversibleM
 
         return 3
 
+    @property
+    def angle_types(self):
+        return Azimuth, Elevation, None
+
     def function(self, state, noise=False, **kwargs) -> StateVector:
         r"""Model function :math:`h(\vec{x}_t,\vec{v}_t)`
 
@@ -1367,6 +1575,9 @@ class CartesianToAzimuthElevationRange(NonLinearGaussianMeasurement, ReversibleM
             else:
                 noise = 0
 
+        return self._with_angle_types(self.float_function(state, **kwargs)) + noise
+
+    def float_function(self, state, **kwargs) -> StateVector:
         # Account for origin offset
         xyz = state.state_vector[self.mapping, :] - self.translation_offset
 
@@ -1375,10 +1586,8 @@ class CartesianToAzimuthElevationRange(NonLinearGaussianMeasurement, ReversibleM
 
         # Convert to measurement space
         phi, theta, rho = cart2az_el_rg(xyz_rot[0, :], xyz_rot[1, :], xyz_rot[2, :])
-        elevations = [Elevation(i) for i in theta]
-        azimuths = [Azimuth(i) for i in phi]
 
-        return StateVectors([azimuths, elevations, rho]) + noise
+        return StateVectors([phi, theta, rho]).astype(np.float64, copy=False)
 
     def inverse_function(self, detection, **kwargs) -> StateVector:
 
@@ -1400,3 +1609,28 @@ class CartesianToAzimuthElevationRange(NonLinearGaussianMeasurement, ReversibleM
         out = super().rvs(num_samples, **kwargs)
         out = np.array([[Azimuth(0.)], [Elevation(0.)], [0.]]) + out
         return out
+
+    def jacobian(self, state, **kwargs):
+        """Model jacobian matrix :math:`H_{jac}`
+
+        Calculated analytically, for any number of state vectors at once.
+
+        Parameters
+        ----------
+        state : :class:`~.State`
+            An input state
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (:py:attr:`~ndim_meas`, :py:attr:`~ndim_state`)
+            The model jacobian matrix evaluated around the given state vector. Where the state
+            has `N` state vectors, an array of shape (`N`, :py:attr:`~ndim_meas`,
+            :py:attr:`~ndim_state`) of the jacobian matrix evaluated around each.
+        """
+        xyz = state.state_vector[self.mapping, :].astype(np.float64) - self.translation_offset
+        xyz_rot = np.asarray(self.rotation_matrix @ xyz)
+
+        jac = self._position_jacobian(np.stack(
+            [_arcsin_partials(xyz_rot, 0), _arcsin_partials(xyz_rot, 1),
+             _range_partials(xyz_rot)], axis=1), self.mapping)
+        return self._defined_jacobian(jac, state)
@@ -3,7 +3,7 @@ from pytest import approx
 import numpy as np
 
 from ....types.angle import Bearing
-from ....types.array import StateVector, CovarianceMatrix
+from ....types.array import StateVector, StateVectors, CovarianceMatrix
 from ....types.detection import Detection
 from ....types.state import State
 from ..linear import LinearGaussian
@@ -35,6 +35,12 @@ def test_non_linear(model):
     assert np.array_equal(meas_vector,
                           np.array([[np.pi/2], [10], [-np.pi/2], [10]]))
 
+    assert model.angle_types == (Bearing, None, Bearing, None)
+    float_vector = model.float_function(
+        Detection(StateVector([[0], [10], [10], [0], [-10]])))
+    assert float_vector.dtype == np.float64
+    assert np.array_equal(float_vector, meas_vector.astype(np.float64))
+
     assert model.mapping == [0, 1, 3, 4]
 
 
@@ -46,6 +52,12 @@ def test_jacobian(model):
                                         [0,          0,          0, 0, 0.1],
                                         [0,          0,          0, 1, 0]]))
 
+    states = State(StateVectors([[10.0, 0.], [10.0, 5.], [0.0, 1.], [10.0, -3.], [0.0, 4.]]))
+    jacobians = model.jacobian(states)
+    assert jacobians.shape == (2, 4, 5)
+    assert jacobians[0] == approx(jacobian)
+    assert jacobians[1] == approx(model.jacobian(State(states.state_vector[:, 1:])))
+
 
 def test_covar(model):
     covar = model.covar()
@@ -101,6 +113,11 @@ def test_non_linear_and_linear():
 
     assert model.covar() == approx(np.diag([1, 10, 20]))
 
+    states = State(StateVectors([[0, 3], [10, -4], [20, 5]]))
+    jacobians = model.jacobian(states)
+    assert jacobians.shape == (2, 3, 3)
+    assert jacobians[1] == approx(np.array([[0.16, 0.12, 0], [0.6, -0.8, 0], [0, 0, 1]]))
+
 
 def test_mismatch_ndim_state():
     with pytest.raises(ValueError):
@@ -106,3 +106,20 @@ def test_lgmodel(H, R, ndim_state, mapping):
     # Check first values produced by seed match
     for _ in range(3):
         assert all(lg1.rvs() == lg2.rvs())
+
+
+def test_lgmodel_rvs_seeded():
+    model = LinearGaussian(4, [0, 2], np.diag([2., 3.]), seed=1)
+    # Samples match those of scipy, with the same random state
+    random_state = np.random.RandomState(1)
+    assert np.array_equal(
+        model.rvs(5),
+        multivariate_normal.rvs(np.zeros(2), model.covar(), 5, random_state=random_state).T)
+    assert np.array_equal(
+        model.rvs(),
+        np.atleast_2d(
+            multivariate_normal.rvs(np.zeros(2), model.covar(), random_state=random_state)).T)
+
+    # Generators left to scipy
+    noise = model.rvs(3, random_state=np.random.default_rng(1))
+    assert noise.shape == (2, 3)
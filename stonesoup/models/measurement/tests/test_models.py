@@ -268,7 +268,7 @@ def test_models(h, ModelClass, state_vec, R,
     def fun(x):
         return model.function(x)
     H = compute_jac(fun, state)
-    assert np.array_equal(H, model.jacobian(state))
+    assert np.allclose(H, model.jacobian(state), atol=1e-6)
 
     # Check Jacobian has proper dimensions
     assert H.shape == (model.ndim_meas, ndim_state)
@@ -504,6 +504,54 @@ def test_angle_pdf():
     assert approx(reference_probability) == model.pdf(measurement, state)
 
 
+@pytest.mark.parametrize(
+    'model, angle_types',
+    [(CartesianToElevationBearingRange(6, [0, 2, 4], np.diag([0.1, 0.2, 1.])),
+      (Elevation, Bearing, None)),
+     (CartesianToBearingRange(4, [0, 2], np.diag([0.1, 1.])), (Bearing, None)),
+     (CartesianToElevationBearing(6, [0, 2, 4], np.diag([0.1, 0.2])), (Elevation, Bearing)),
+     (Cartesian2DToBearing(4, [0, 2], np.diag([0.1])), (Bearing, )),
+     (CartesianToBearingRangeRate(
+         ndim_state=6, mapping=[0, 2, 4], velocity_mapping=[1, 3, 5],
+         noise_covar=np.diag([0.1, 1., 2.])), (Bearing, None, None)),
+     (CartesianToElevationBearingRangeRate(
+         ndim_state=6, mapping=[0, 2, 4], velocity_mapping=[1, 3, 5],
+         noise_covar=np.diag([0.1, 0.2, 1., 2.])), (Elevation, Bearing, None, None)),
+     (CartesianToAzimuthElevationRange(6, [0, 2, 4], np.diag([0.1, 0.2, 1.])),
+      (Azimuth, Elevation, None)),
+     ])
+def test_float_function(model, angle_types):
+    assert model.angle_types == angle_types
+    assert len(model.angle_types) == model.ndim_meas
+
+    particles = ParticleState(StateVectors(np.random.randn(model.ndim_state, 100) * 10),
+                              log_weight=np.full(100, -np.log(100)))
+    float_vectors = model.float_function(particles)
+    assert float_vectors.dtype == np.float64
+    measurement_vectors = model.function(particles)
+    assert np.allclose(float_vectors, measurement_vectors.astype(np.float64))
+    for dim, angle_type in enumerate(angle_types):
+        if angle_type is not None:
+            assert all(isinstance(value, angle_type) for value in measurement_vectors[dim])
+
+    # Residuals wrapped as with angle types, in float arrays
+    measurement = State(model.function(particles[0], noise=True))
+    turns = np.array([[4*np.pi if angle_type else 0.] for angle_type in angle_types])
+    residuals = model.wrap_angles(
+        measurement.state_vector.astype(np.float64) - float_vectors + turns)
+    assert residuals.dtype == np.float64
+    assert np.allclose(residuals, (measurement.state_vector - measurement_vectors)
+                       .astype(np.float64))
+
+    # Log likelihoods as evaluated with angle types
+    log_pdfs = model.logpdf(measurement, particles)
+    assert np.allclose(
+        log_pdfs,
+        multivariate_normal.logpdf(
+            (measurement.state_vector - measurement_vectors).astype(np.float64).T,
+            cov=model.covar()))
+
+
 def h2d_rr(state_vector, pos_map, vel_map, translation_offset, rotation_offset, velocity):
 
     xyz = StateVector([[state_vector[pos_map[0], 0] - translation_offset[0, 0]],
@@ -961,6 +1009,50 @@ def test_rangeratemodels_with_particles(h, modelclass, state_vec, ndim_state, po
             cov=noise_covar)
 
 
+@pytest.mark.parametrize(
+    'model',
+    [CartesianToElevationBearingRange(
+        6, [0, 2, 4], np.diag([0.1, 0.2, 1.]), translation_offset=StateVector([10, -20, 5]),
+        rotation_offset=StateVector([0.1, -0.3, 0.8])),
+     CartesianToBearingRange(
+         4, [0, 2], np.diag([0.1, 1.]), translation_offset=StateVector([10, -20]),
+         rotation_offset=StateVector([0.1, -0.3, 0.8])),
+     CartesianToElevationBearing(
+         6, [0, 2, 4], np.diag([0.1, 0.2]), rotation_offset=StateVector([0.1, -0.3, 0.8])),
+     Cartesian2DToBearing(
+         4, [0, 2], np.diag([0.1]), rotation_offset=StateVector([0., 0., 0.8])),
+     CartesianToBearingRangeRate(
+         ndim_state=6, mapping=[0, 2, 4], velocity_mapping=[1, 3, 5],
+         noise_covar=np.diag([0.1, 1., 2.]), velocity=StateVector([1, -2, 3]),
+         rotation_offset=StateVector([0.1, -0.3, 0.8])),
+     CartesianToElevationBearingRangeRate(
+         ndim_state=6, mapping=[0, 2, 4], velocity_mapping=[1, 3, 5],
+         noise_covar=np.diag([0.1, 0.2, 1., 2.]), velocity=StateVector([1, -2, 3]),
+         rotation_offset=StateVector([0.1, -0.3, 0.8])),
+     CartesianToAzimuthElevationRange(
+         6, [0, 2, 4], np.diag([0.1, 0.2, 1.]), translation_offset=StateVector([10, -20, 5]),
+         rotation_offset=StateVector([0.1, -0.3, 0.8])),
+     ])
+def test_jacobian_multiple_states(model):
+    state_vectors = StateVectors(np.random.randn(model.ndim_state, 20) * 50)
+    jac = model.jacobian(State(state_vectors))
+    assert jac.shape == (20, model.ndim_meas, model.ndim_state)
+
+    for state_vector, state_jac in zip(state_vectors, jac):
+        single_jac = model.jacobian(State(state_vector))
+        assert single_jac.shape == (model.ndim_meas, model.ndim_state)
+        assert np.allclose(state_jac, single_jac, rtol=0, atol=1e-12)
+        assert np.allclose(
+            state_jac, compute_jac(model.function, State(state_vector)), rtol=1e-4, atol=1e-5)
+
+    # Finite difference used where not defined analytically, i.e. at sensor position
+    state_vector = StateVector(np.zeros(model.ndim_state))
+    for dim, offset in zip(model.mapping, model.translation_offset[:, 0]):
+        state_vector[dim, 0] = offset
+    np.testing.assert_array_equal(
+        model.jacobian(State(state_vector)), compute_jac(model.function, State(state_vector)))
+
+
 def test_rangeratemodel_analytic_jacobian():
     """Test the analytic Jacobian of CartesianToElevationBearingRangeRate.
 
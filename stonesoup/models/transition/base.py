@@ -7,9 +7,16 @@ import numpy as np
 
 from ..base import Model, GaussianModel
 from ...base import Property
+from ...cache import ScanCache
 from ...types.array import StateVector, StateVectors
 
 
+def _read_only_block_diag(_, *matrices):
+    matrix = block_diag(*matrices)
+    matrix.setflags(write=False)
+    return matrix
+
+
 class TransitionModel(Model):
     """Transition Model base class"""
 
@@ -31,9 +38,30 @@ class CombinedGaussianTransitionModel(TransitionModel, GaussianModel):
     Time Variant, and Time Invariant models can be combined together.
     If any of the models are time variant the keyword argument "time_interval"
     must be supplied to all methods
+
+    Combined (block diagonal) matrices are cached, keyed by the matrices of each model, such
+    that they are reused whilst each model returns the same (e.g. cached) matrices. Cached
+    matrices are read only.
     """
     model_list: Sequence[GaussianModel] = Property(doc="List of Transition Models.")
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._matrix_cache = ScanCache(capacity=64)
+
+    def cache_info(self):
+        """Report statistics of cache of combined matrices
+
+        Returns
+        -------
+        : namedtuple
+            Hits, misses, capacity and current size of the cache.
+        """
+        return self._matrix_cache.cache_info()
+
+    def _block_diag(self, matrices):
+        return self._matrix_cache.get(_read_only_block_diag, None, *matrices)
+
     def function(self, state, noise=False, **kwargs) -> StateVector:
         """Applies each transition model in :py:attr:`~model_list` in turn to the state's
         corresponding state vector components.
@@ -87,7 +115,9 @@ class CombinedGaussianTransitionModel(TransitionModel, GaussianModel):
         -------
         :class:`numpy.ndarray` of shape (:py:attr:`~ndim_meas`, \
         :py:attr:`~ndim_state`)
-            The model jacobian matrix evaluated around the given state vector.
+            The model jacobian matrix evaluated around the given state vector. Where the state
+            has `N` state vectors, an array of shape (`N`, :py:attr:`~ndim_state`,
+            :py:attr:`~ndim_state`) of the jacobian matrix evaluated around each.
         """
         temp_state = copy.copy(state)
         ndim_count = 0
@@ -98,7 +128,17 @@ class CombinedGaussianTransitionModel(TransitionModel, GaussianModel):
             J_list.append(model.jacobian(temp_state, **kwargs))
 
             ndim_count += model.ndim_state
-        out = block_diag(*J_list)
+
+        num_states = state.state_vector.shape[1]
+        if num_states == 1:
+            return block_diag(*J_list)
+
+        out = np.zeros((num_states, self.ndim_state, self.ndim_state))
+        ndim_count = 0
+        for model, J in zip(self.model_list, J_list):
+            ndim_slice = slice(ndim_count, model.ndim_state + ndim_count)
+            out[:, ndim_slice, ndim_slice] = J
+            ndim_count += model.ndim_state
         return out
 
     @property
@@ -123,4 +163,4 @@ class CombinedGaussianTransitionModel(TransitionModel, GaussianModel):
         """
 
         covar_list = [model.covar(**kwargs) for model in self.model_list]
-        return block_diag(*covar_list)
+        return self._block_diag(covar_list)
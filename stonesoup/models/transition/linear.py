@@ -5,6 +5,7 @@ from functools import lru_cache
 import numpy as np
 from scipy.integrate import quad
 from scipy.linalg import block_diag
+from scipy.special import factorial
 
 from .base import TransitionModel, CombinedGaussianTransitionModel
 from ..base import (LinearModel, GaussianModel, TimeVariantModel,
@@ -49,7 +50,7 @@ class CombinedLinearGaussianTransitionModel(LinearModel, CombinedGaussianTransit
 
         transition_matrices = [
             model.matrix(**kwargs) for model in self.model_list]
-        return block_diag(*transition_matrices)
+        return self._block_diag(transition_matrices)
 
 
 class LinearGaussianTimeInvariantTransitionModel(LinearGaussianTransitionModel,
@@ -109,6 +110,15 @@ class ConstantNthDerivative(LinearGaussianTransitionModel, TimeVariantModel):
     :class:`~.ConstantVelocity` and :class:`~.ConstantAcceleration` models
     respectively. To aid visualisation of :math:`F_t` the elements are
     calculated as the terms of the taylor expansion of each state variable.
+
+    The elements of :math:`F_t` and :math:`Q_t` are calculated in closed form:
+
+        .. math::
+            F_{ij} = \frac{\Delta t^{j-i}}{(j-i)!}\ (j \geq i), \quad
+            Q_{ij} = \frac{q\,\Delta t^{2N+1-i-j}}{(2N+1-i-j)\,(N-i)!\,(N-j)!}
+
+    Matrices are cached (shared between all instances) by time interval, as
+    typically the same few time intervals occur repeatedly. Cached matrices are read only.
     """
 
     constant_derivative: int = Property(
@@ -121,35 +131,39 @@ class ConstantNthDerivative(LinearGaussianTransitionModel, TimeVariantModel):
     def ndim_state(self):
         return self.constant_derivative + 1
 
-    def matrix(self, time_interval, **kwargs):
-        time_interval_sec = time_interval.total_seconds()
-        N = self.constant_derivative
-        Fmat = np.zeros((N + 1, N + 1))
-        dt = time_interval_sec
-        for i in range(0, N + 1):
-            for j in range(i, N + 1):
-                Fmat[i, j] = (dt ** (j - i)) / math.factorial(j - i)
-
+    @staticmethod
+    @lru_cache()
+    def _transitionmatrix(N, dt):
+        orders = np.arange(N + 1)
+        powers = orders[np.newaxis, :] - orders[:, np.newaxis]
+        Fmat = np.where(
+            powers >= 0, dt ** np.abs(powers) / factorial(np.abs(powers)), 0.)
+        Fmat.setflags(write=False)
         return Fmat
 
-    def covar(self, time_interval, **kwargs):
-        time_interval_sec = time_interval.total_seconds()
-        dt = time_interval_sec
-        N = self.constant_derivative
+    @staticmethod
+    @lru_cache()
+    def _covarmatrix(N, q, dt):
         if N == 1:
             covar = np.array([[dt**3 / 3, dt**2 / 2],
                               [dt**2 / 2, dt]])
         else:
-            Fmat = self.matrix(time_interval, **kwargs)
-            Q = np.zeros((N + 1, N + 1))
-            Q[N, N] = 1
-            igrand = Fmat @ Q @ Fmat.T
-            covar = np.zeros((N + 1, N + 1))
-            for l in range(0, N + 1):  # noqa: E741
-                for k in range(0, N + 1):
-                    covar[l, k] = (igrand[l, k]*dt / (1 + N*2 - l - k))
-        covar *= self.noise_diff_coeff
-        return CovarianceMatrix(covar)
+            orders = N - np.arange(N + 1)  # Order of Taylor term of last column of F
+            last_column = dt ** orders / factorial(orders)
+            covar = np.outer(last_column, last_column) * dt \
+                / (orders[:, np.newaxis] + orders[np.newaxis, :] + 1)
+        covar *= q
+        covar = CovarianceMatrix(covar)
+        covar.setflags(write=False)
+        return covar
+
+    def matrix(self, time_interval, **kwargs):
+        return self._transitionmatrix(self.constant_derivative, time_interval.total_seconds())
+
+    def covar(self, time_interval, **kwargs):
+        # Coefficient may be given as single element array
+        q = np.asarray(self.noise_diff_coeff, dtype=np.float64).item()
+        return self._covarmatrix(self.constant_derivative, q, time_interval.total_seconds())
 
 
 class RandomWalk(ConstantNthDerivative):
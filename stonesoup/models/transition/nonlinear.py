@@ -116,6 +116,71 @@ class ConstantTurn(GaussianTransitionModel, TimeVariantModel):
                 noise = 0
         return sv2 + noise
 
+    def jacobian(self, state, **kwargs):
+        """Model jacobian matrix :math:`F_{jac}`
+
+        Calculated analytically, for any number of state vectors at once.
+
+        Parameters
+        ----------
+        state : :class:`~.State`
+            An input state
+        time_interval : :class:`datetime.timedelta`
+            A time interval :math:`dt`
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (:py:attr:`~ndim_state`, :py:attr:`~ndim_state`)
+            The model jacobian matrix evaluated around the given state vector. Where the state
+            has `N` state vectors, an array of shape (`N`, :py:attr:`~ndim_state`,
+            :py:attr:`~ndim_state`) of the jacobian matrix evaluated around each.
+        """
+        jac = self._turn_jacobian(
+            state.state_vector, kwargs['time_interval'].total_seconds())
+        return jac[0] if jac.shape[0] == 1 else jac
+
+    @staticmethod
+    def _turn_jacobian(state_vectors, time_interval_sec):
+        """Jacobians of the constant turn function, for each column of a (5, N) array of
+        :math:`[x_{pos}, x_{vel}, y_{pos}, y_{vel}, \\omega]` state vectors"""
+        state_vectors = np.asarray(state_vectors, dtype=np.float64)
+        x_vel, y_vel, turn_rate = state_vectors[1, :], state_vectors[3, :], state_vectors[4, :]
+        dt = time_interval_sec
+
+        dAngle = turn_rate * dt
+        cos_dAngle = np.cos(dAngle)
+        sin_dAngle = np.sin(dAngle)
+
+        # sin(w*dt)/w and (1-cos(w*dt))/w, and their derivatives with respect to turn rate w,
+        # which are evaluated by series expansion for small turns to avoid cancellation error
+        small = np.abs(dAngle) < 1e-2
+        safe_turn_rate = np.where(small, 1., turn_rate)
+        sin_w = sin_dAngle / safe_turn_rate
+        cos_w = (1. - cos_dAngle) / safe_turn_rate
+        dsin_w = (dt*cos_dAngle - sin_w) / safe_turn_rate
+        dcos_w = (dt*sin_dAngle - cos_w) / safe_turn_rate
+        if np.any(small):
+            dAngle2 = dAngle**2
+            sin_w = np.where(small, dt*(1. - dAngle2/6. + dAngle2**2/120.), sin_w)
+            cos_w = np.where(small, dt*dAngle*(1/2. - dAngle2/24. + dAngle2**2/720.), cos_w)
+            dsin_w = np.where(
+                small, dt**2*dAngle*(-1/3. + dAngle2/30. - dAngle2**2/840.), dsin_w)
+            dcos_w = np.where(small, dt**2*(1/2. - dAngle2/8. + dAngle2**2/144.), dcos_w)
+
+        jac = np.zeros((state_vectors.shape[1], 5, 5))
+        jac[:, 0, 0] = jac[:, 2, 2] = jac[:, 4, 4] = 1.
+        jac[:, 0, 1] = jac[:, 2, 3] = sin_w
+        jac[:, 0, 3] = -cos_w
+        jac[:, 2, 1] = cos_w
+        jac[:, 1, 1] = jac[:, 3, 3] = cos_dAngle
+        jac[:, 1, 3] = -sin_dAngle
+        jac[:, 3, 1] = sin_dAngle
+        jac[:, 0, 4] = x_vel*dsin_w - y_vel*dcos_w
+        jac[:, 1, 4] = -dt*(x_vel*sin_dAngle + y_vel*cos_dAngle)
+        jac[:, 2, 4] = x_vel*dcos_w + y_vel*dsin_w
+        jac[:, 3, 4] = dt*(x_vel*cos_dAngle - y_vel*sin_dAngle)
+        return jac
+
     def covar(self, time_interval, **kwargs):
         """Returns the transition model noise covariance matrix.
 
@@ -188,6 +253,43 @@ class ConstantTurnSandwich(ConstantTurn):
                 noise = 0
         return sv_out + noise
 
+    def jacobian(self, state, **kwargs):
+        """Model jacobian matrix :math:`F_{jac}`
+
+        Calculated analytically for the turn, for any number of state vectors at once, with the
+        jacobians of the models in :attr:`model_list` in between.
+
+        Parameters
+        ----------
+        state : :class:`~.State`
+            An input state
+        time_interval : :class:`datetime.timedelta`
+            A time interval :math:`dt`
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (:py:attr:`~ndim_state`, :py:attr:`~ndim_state`)
+            The model jacobian matrix evaluated around the given state vector. Where the state
+            has `N` state vectors, an array of shape (`N`, :py:attr:`~ndim_state`,
+            :py:attr:`~ndim_state`) of the jacobian matrix evaluated around each.
+        """
+        sv_in = state.state_vector
+        ndim_state = self.ndim_state
+        ct_indices = np.array([0, 1, ndim_state - 3, ndim_state - 2, ndim_state - 1])
+
+        jac = np.zeros((sv_in.shape[1], ndim_state, ndim_state))
+        jac[:, ct_indices[:, np.newaxis], ct_indices] = self._turn_jacobian(
+            sv_in[ct_indices, :], kwargs['time_interval'].total_seconds())
+
+        state_tmp = copy.copy(state)
+        idx1 = 2
+        for model in self.model_list:
+            idx2 = idx1 + model.ndim
+            state_tmp.state_vector = sv_in[idx1:idx2, 0:]
+            jac[:, idx1:idx2, idx1:idx2] = model.jacobian(state_tmp, **kwargs)
+            idx1 = idx2
+        return jac[0] if jac.shape[0] == 1 else jac
+
     def covar(self, time_interval, **kwargs):
         """Returns the transition model noise covariance matrix.
 
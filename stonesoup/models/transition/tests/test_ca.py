@@ -1,12 +1,15 @@
 import datetime
+import math
 
+import pytest
 from pytest import approx
 import numpy as np
 import scipy as sp
+from scipy.integrate import quad
 from scipy.stats import multivariate_normal
 from ....types.state import State
 
-from ..linear import ConstantAcceleration
+from ..linear import ConstantAcceleration, ConstantNthDerivative
 from ..base import CombinedGaussianTransitionModel
 
 
@@ -140,3 +143,30 @@ def base(state_vec, noise_diff_coeffs):
         new_state_vec_w_enoise.T,
         mean=np.array(F@state_vec).ravel(),
         cov=Q)
+
+
+@pytest.mark.parametrize('N', [0, 1, 2, 3, 5])
+def test_constant_nth_derivative(N):
+    model = ConstantNthDerivative(constant_derivative=N, noise_diff_coeff=0.1)
+    dt = 2.5
+    time_interval = datetime.timedelta(seconds=dt)
+
+    F = model.matrix(time_interval)
+    expected_F = np.zeros((N + 1, N + 1))
+    for i in range(N + 1):
+        for j in range(i, N + 1):
+            expected_F[i, j] = dt**(j - i) / math.factorial(j - i)
+    assert F == approx(expected_F)
+
+    # Q is integral of noise on Nth derivative, transitioned over remaining interval
+    expected_Q = np.array([
+        [quad(lambda t: t**(N - k) / math.factorial(N - k) * t**(N - m) / math.factorial(N - m),
+              0, dt)[0]
+         for m in range(N + 1)]
+        for k in range(N + 1)]) * 0.1
+    assert model.covar(time_interval) == approx(expected_Q)
+
+    # Same read only matrices returned for same time interval
+    assert model.matrix(datetime.timedelta(seconds=dt)) is F
+    assert model.covar(datetime.timedelta(seconds=dt)) is model.covar(time_interval)
+    assert not F.flags.writeable
@@ -92,6 +92,11 @@ def test_nonlinear_combined(model_4):
         state,
         time_interval=t_delta).shape
     assert (DIM, 1) == combined_model.rvs(time_interval=t_delta).shape
+    jacobians = combined_model.jacobian(state, time_interval=t_delta)
+    assert (3, DIM, DIM) == jacobians.shape
+    for jacobian in jacobians:
+        assert np.array_equal(
+            jacobian, combined_model.jacobian(State(x_prior), time_interval=t_delta))
 
     # TODO: Figure out handling of pdf for non-linear models and singular convariance matrix
     # e.g. See Non-Linear Constant Turn model
@@ -99,3 +104,25 @@ def test_nonlinear_combined(model_4):
     assert isinstance(
         combined_model.pdf(State(x_post), State(x_prior),
                            time_interval=t_delta), Real)
+
+
+def test_combined_cache():
+    model = CombinedLinearGaussianTransitionModel(
+        [ConstantVelocity(0.1), ConstantVelocity(0.2),
+         LinearGaussianTimeInvariantTransitionModel(np.eye(2), covariance_matrix=np.eye(2))])
+    time_interval = datetime.timedelta(seconds=2)
+
+    F = model.matrix(time_interval=time_interval)
+    Q = model.covar(time_interval=time_interval)
+    assert F.shape == Q.shape == (6, 6)
+    assert model.cache_info().misses == 2
+    assert model.matrix(time_interval=datetime.timedelta(seconds=2)) is F
+    assert model.covar(time_interval=datetime.timedelta(seconds=2)) is Q
+    assert model.cache_info().hits == 2
+    assert not F.flags.writeable
+
+    # Different time interval gives new matrices
+    new_F = model.matrix(time_interval=datetime.timedelta(seconds=3))
+    assert new_F is not F
+    assert new_F[0, 1] == 3
+    assert model.cache_info().size == 3
@@ -1,7 +1,11 @@
 import datetime
 
 import numpy as np
+import pytest
+
 from ..nonlinear import ConstantTurn
+from ....functions import jacobian as compute_jac
+from ....types.array import StateVectors
 from ....types.state import State
 
 
@@ -65,3 +69,36 @@ def base(CT_model, model, state, linear_noise_coeffs, turn_noise_coeff):
         time_interval=time_interval,
         noise=noise)
     assert np.array_equal(new_state_vec_w_enoise, F + noise)
+
+
+@pytest.mark.parametrize('turn_rate', [0.3, -0.05, 1e-3, -1e-5, 0.])
+def test_ctmodel_jacobian(turn_rate):
+    model_obj = ConstantTurn(linear_noise_coeffs=[0.1, 0.1], turn_noise_coeff=0.01)
+    time_interval = datetime.timedelta(seconds=2)
+    state = State(np.array([[3.0], [1.0], [2.0], [-1.5], [turn_rate]]))
+
+    jac = model_obj.jacobian(state, time_interval=time_interval)
+    assert jac.shape == (5, 5)
+    if abs(turn_rate) > 1e-2:
+        assert np.allclose(
+            jac, compute_jac(model_obj.function, state, time_interval=time_interval),
+            atol=1e-6)
+    else:
+        # Finite difference not accurate for small turn rates: compare to the limit of the
+        # jacobian at zero turn rate
+        x_vel, y_vel, dt = 1.0, -1.5, 2.
+        assert np.allclose(
+            jac,
+            [[1, dt, 0, 0, -y_vel*dt**2/2],
+             [0, 1, 0, 0, -y_vel*dt],
+             [0, 0, 1, dt, x_vel*dt**2/2],
+             [0, 0, 0, 1, x_vel*dt],
+             [0, 0, 0, 0, 1]],
+            atol=1e-2)
+
+    # Evaluated for multiple states at once
+    states = State(StateVectors(
+        np.hstack([state.state_vector, [[-1.], [2.], [0.5], [3.], [0.1]]])))
+    jacobians = model_obj.jacobian(states, time_interval=time_interval)
+    assert jacobians.shape == (2, 5, 5)
+    assert np.array_equal(jacobians[0], jac)
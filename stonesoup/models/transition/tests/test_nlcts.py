@@ -3,9 +3,11 @@ import copy
 
 import numpy as np
 
-from stonesoup.models.transition.nonlinear import ConstantTurnSandwich
+from stonesoup.models.transition.nonlinear import ConstantTurn, ConstantTurnSandwich
 from stonesoup.models.transition.base import CombinedGaussianTransitionModel
 from stonesoup.models.transition.linear import ConstantVelocity, ConstantAcceleration
+from stonesoup.functions import jacobian as compute_jac
+from stonesoup.types.array import StateVectors
 from stonesoup.types.state import State
 
 
@@ -65,6 +67,23 @@ def base(ct_model, model, state, linear_noise_coeffs, turn_noise_coeff):
     assert np.array_equal(model_Q[-3:, -3:], Q1[-3:, -3:])
     assert np.array_equal(model_Q[2:-3, 2:-3], Q2)
 
+    # Ensure jacobian made up of CT and model list components
+    jac = model_obj.jacobian(state, time_interval=time_interval)
+    assert np.allclose(
+        jac, compute_jac(model_obj.function, state, time_interval=time_interval), atol=1e-6)
+    state2.state_vector = state.state_vector[idx, :]
+    assert np.array_equal(
+        jac[np.ix_(idx, idx)],
+        ConstantTurn(linear_noise_coeffs, turn_noise_coeff).jacobian(
+            state2, time_interval=time_interval))
+    state2.state_vector = state.state_vector[2:-3, :]
+    assert np.array_equal(
+        jac[2:-3, 2:-3], comb_model.jacobian(state2, time_interval=time_interval))
+    states = State(StateVectors(np.hstack([state.state_vector, state.state_vector + 1])))
+    jacobians = model_obj.jacobian(states, time_interval=time_interval)
+    assert jacobians.shape == (2, *jac.shape)
+    assert np.array_equal(jacobians[0], jac)
+
     # Eliminated the pdf based tests since for nonlinear models these will no
     # longer be Gaussian
 
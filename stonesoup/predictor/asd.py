@@ -4,7 +4,7 @@ from operator import itemgetter
 
 import numpy as np
 
-from ._utils import predict_lru_cache
+from ._utils import predict_cache
 from .kalman import KalmanPredictor
 from ..types.prediction import ASDGaussianStatePrediction
 from ..types.state import GaussianState
@@ -59,7 +59,7 @@ class ASDKalmanPredictor(KalmanPredictor):
 
         return predict_over_interval, timestamp_from_which_is_predicted
 
-    @predict_lru_cache()
+    @predict_cache
     def predict(self, prior, timestamp, **kwargs):
         r"""The predict function
 
@@ -1,7 +1,7 @@
 from ..base import Property
 from ..models.transition.categorical import MarkovianTransitionModel
 from ..predictor import Predictor
-from ..predictor._utils import predict_lru_cache
+from ..predictor._utils import predict_cache
 from ..types.prediction import Prediction
 
 
@@ -15,7 +15,7 @@ class HMMPredictor(Predictor):
         doc="The transition model used to predict states forward in `time`."
     )
 
-    @predict_lru_cache()
+    @predict_cache
     def predict(self, prior, timestamp=None, **kwargs):
         r"""Predicts a :class:`~.CategoricalState` forward using the :attr:`transition_model`.
 
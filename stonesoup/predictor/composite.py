@@ -2,7 +2,7 @@ from typing import Sequence
 
 from ..base import Property
 from ..predictor import Predictor
-from ..predictor._utils import predict_lru_cache
+from ..predictor._utils import predict_cache
 from ..types.prediction import CompositePrediction
 from ..types.state import CompositeState
 
@@ -35,7 +35,7 @@ class CompositePredictor(Predictor):
     def transition_model(self):
         raise NotImplementedError("A composition of predictors has no defined transition model")
 
-    @predict_lru_cache()
+    @predict_cache
     def predict(self, prior, timestamp=None, **kwargs):
         r"""The predict function
 
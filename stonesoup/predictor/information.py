@@ -1,6 +1,6 @@
 import numpy as np
 
-from ._utils import predict_lru_cache
+from ._utils import predict_cache
 from ..base import Property
 from .kalman import KalmanPredictor
 from ..types.prediction import Prediction
@@ -120,7 +120,7 @@ class InformationKalmanPredictor(KalmanPredictor):
         prior_state_mean = np.linalg.inv(prior.precision) @ prior.state_vector
         return self.transition_model.matrix(**kwargs) @ prior_state_mean
 
-    @predict_lru_cache()
+    @predict_cache
     def predict(self, prior, timestamp=None, control_input=None, **kwargs):
         r"""The predict function
 
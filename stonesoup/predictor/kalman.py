@@ -4,7 +4,7 @@ import numpy as np
 import scipy.linalg as la
 
 from .base import Predictor
-from ._utils import predict_lru_cache
+from ._utils import predict_cache
 from ..base import Property
 from ..types.prediction import Prediction, SqrtGaussianStatePrediction
 from ..models.base import LinearModel
@@ -157,7 +157,7 @@ class KalmanPredictor(Predictor):
 
         return trans_m @ prior_cov @ trans_m.T + trans_cov + ctrl_mat @ ctrl_noi @ ctrl_mat.T
 
-    @predict_lru_cache()
+    @predict_cache
     def predict(self, prior, timestamp=None, control_input=None, **kwargs):
         r"""The predict function
 
@@ -337,7 +337,7 @@ class UnscentedKalmanPredictor(KalmanPredictor):
         return self.transition_model.function(prior_state, **kwargs) + \
             self.control_model.function(**kwargs)
 
-    @predict_lru_cache()
+    @predict_cache
     def predict(self, prior, timestamp=None, control_input=None, **kwargs):
         r"""The unscented version of the predict step
 
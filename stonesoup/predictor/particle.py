@@ -6,9 +6,10 @@ from scipy.special import logsumexp
 from ordered_set import OrderedSet
 
 from .base import Predictor
-from ._utils import predict_lru_cache
+from ._utils import predict_cache
 from .kalman import KalmanPredictor, ExtendedKalmanPredictor
 from ..base import Property
+from ..functions import match_float_dtype
 from ..models.transition import TransitionModel
 from ..types.prediction import Prediction
 from ..types.state import GaussianState
@@ -23,7 +24,7 @@ class ParticlePredictor(Predictor):
     An implementation of a Particle Filter predictor.
     """
 
-    @predict_lru_cache()
+    @predict_cache
     def predict(self, prior, timestamp=None, **kwargs):
         """Particle Filter prediction step
 
@@ -47,11 +48,13 @@ class ParticlePredictor(Predictor):
             # TypeError: (timestamp or prior.timestamp) is None
             time_interval = None
 
-        new_state_vector = self.transition_model.function(
-            prior,
-            noise=True,
-            time_interval=time_interval,
-            **kwargs)
+        new_state_vector = match_float_dtype(
+            self.transition_model.function(
+                prior,
+                noise=True,
+                time_interval=time_interval,
+                **kwargs),
+            prior.state_vector)
 
         return Prediction.from_state(prior,
                                      parent=prior,
@@ -133,7 +136,7 @@ class MultiModelPredictor(Predictor):
     def probabilities(self):
         return np.cumsum(self.transition_matrix, axis=1)
 
-    @predict_lru_cache()
+    @predict_cache
     def predict(self, prior, timestamp=None, **kwargs):
         """Particle Filter prediction step
 
@@ -202,7 +205,7 @@ class RaoBlackwellisedMultiModelPredictor(MultiModelPredictor):
     particle model probabilities.
     """
 
-    @predict_lru_cache()
+    @predict_cache
     def predict(self, prior, timestamp=None, **kwargs):
         """Particle Filter prediction step
 
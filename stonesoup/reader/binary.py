@@ -0,0 +1,211 @@
+"""Binary log readers for Stone Soup.
+
+Readers of the append only, columnar binary log written by :class:`~.BinaryLogWriter`. Rather
+than all tracks at every scan, the log holds the changes of each scan: new tracks, new states and
+deleted tracks, along with detections. The log is a directory of segments, each holding a number
+of scans as :mod:`numpy` ``.npy`` files:
+
+- ``scans.npy``: time of each scan, and the number of new tracks, states, deleted tracks and
+  detections in the segment up to the end of each scan.
+- ``track_ids.npy``: id of each new track. Tracks are indexed in order of creation across the
+  whole log.
+- ``states.npy``: track index, timestamp and position in ``values.npy`` of each new state.
+- ``deleted.npy``: track index of each deleted track.
+- ``detections.npy``: timestamp and position in ``values.npy`` of each detection.
+- ``values.npy``: state vector (and covariance, where present) of each state and detection,
+  flattened.
+
+Segments are memory mapped, such that scans can be found by time, and read, without loading the
+whole log.
+"""
+import datetime
+from pathlib import Path
+
+import numpy as np
+
+from .base import DetectionReader
+from .file import FileReader
+from ..base import Property
+from ..buffered_generator import BufferedGenerator
+from ..tracker import Tracker
+from ..types.array import StateVector, CovarianceMatrix
+from ..types.detection import Detection
+from ..types.state import State, GaussianState
+from ..types.track import Track
+
+_SCAN_DTYPE = np.dtype([
+    ('time', 'M8[us]'), ('tracks', np.int64), ('states', np.int64), ('deleted', np.int64),
+    ('detections', np.int64)])
+_STATE_DTYPE = np.dtype([
+    ('track', np.int64), ('timestamp', 'M8[us]'), ('offset', np.int64), ('ndim', np.int32),
+    ('covar', np.bool_)])
+_DETECTION_DTYPE = np.dtype([
+    ('timestamp', 'M8[us]'), ('offset', np.int64), ('ndim', np.int32)])
+_SEGMENT_FILES = ('scans', 'track_ids', 'states', 'deleted', 'detections', 'values')
+
+
+class _Segment:
+    """Memory mapped segment of a binary log"""
+
+    def __init__(self, path, first_track):
+        for name in _SEGMENT_FILES:
+            setattr(self, name, np.load(path / f'{name}.npy', mmap_mode='r'))
+        self.first_track = first_track
+
+    def scan_slice(self, name, index):
+        """Slice of rows in array `name` logged in scan `index`"""
+        start = self.scans[name][index - 1] if index > 0 else 0
+        return slice(int(start), int(self.scans[name][index]))
+
+    def load_states(self, rows):
+        """Track indexes and states of rows of :attr:`states`"""
+        states = self.states[rows]
+        return states['track'].tolist(), [
+            _state(self.values, offset, ndim, covar, timestamp)
+            for offset, ndim, covar, timestamp in zip(
+                states['offset'].tolist(), states['ndim'].tolist(), states['covar'].tolist(),
+                states['timestamp'].tolist())]
+
+
+def _state(values, offset, ndim, covar, timestamp):
+    state_vector = StateVector(np.array(values[offset:offset + ndim]).reshape(ndim, 1))
+    if covar:
+        return GaussianState(
+            state_vector,
+            CovarianceMatrix(
+                np.array(values[offset + ndim:offset + ndim*(ndim + 1)]).reshape(ndim, ndim)),
+            timestamp=timestamp)
+    return State(state_vector, timestamp=timestamp)
+
+
+class _BinaryLogReader(FileReader):
+    path: Path = Property(doc="Directory of binary log. Str will be converted to Path")
+    start_time: datetime.datetime = Property(
+        default=None,
+        doc="Time of first scan to read. Default `None`, where read from the first scan.")
+    end_time: datetime.datetime = Property(
+        default=None,
+        doc="Time of last scan to read. Default `None`, where read to the last scan.")
+
+    def _segments(self):
+        """Segments of the log, as written so far"""
+        segments = []
+        first_track = 0
+        for path in sorted(path for path in self.path.iterdir() if path.name.isdigit()):
+            segment = _Segment(path, first_track)
+            first_track += len(segment.track_ids)
+            segments.append(segment)
+        return segments
+
+    @property
+    def times(self):
+        """Times of all scans in the log"""
+        segments = self._segments()
+        if not segments:
+            return []
+        return np.concatenate([segment.scans['time'] for segment in segments]).tolist()
+
+    def _scan_range(self, segment):
+        """First and (exclusive) last index of scans of segment between start and end time"""
+        times = segment.scans['time']
+        start = 0 if self.start_time is None \
+            else np.searchsorted(times, np.datetime64(self.start_time, 'us'))
+        end = len(times) if self.end_time is None \
+            else np.searchsorted(times, np.datetime64(self.end_time, 'us'), side='right')
+        return int(start), int(end)
+
+    def _scans(self, segments):
+        """Segment and scan index of each scan between start and end time"""
+        for segment in segments:
+            start, end = self._scan_range(segment)
+            for index in range(start, end):
+                yield segment, index
+
+
+class BinaryLogDetectionReader(_BinaryLogReader, DetectionReader):
+    """Binary Log Detection Reader
+
+    Reads detections logged by :class:`~.BinaryLogWriter`. As only state vectors and timestamps
+    are logged, detections have no measurement model or metadata. Scans between
+    :attr:`start_time` and :attr:`end_time` are found by time, without reading other scans.
+    """
+
+    @BufferedGenerator.generator_method
+    def detections_gen(self):
+        for segment, index in self._scans(self._segments()):
+            detections = segment.detections[segment.scan_slice('detections', index)]
+            yield segment.scans['time'][index].item(), {
+                Detection(
+                    StateVector(np.array(segment.values[offset:offset + ndim]).reshape(ndim, 1)),
+                    timestamp=timestamp)
+                for offset, ndim, timestamp in zip(
+                    detections['offset'].tolist(), detections['ndim'].tolist(),
+                    detections['timestamp'].tolist())}
+
+
+class BinaryLogTrackReader(_BinaryLogReader, Tracker):
+    """Binary Log Track Reader
+
+    Replays tracks logged by :class:`~.BinaryLogWriter`, returning the tracks existing at each
+    scan. States are :class:`~.GaussianState` where a covariance was logged, and
+    :class:`~.State` otherwise.
+
+    Where a :attr:`start_time` is set, tracks existing at that time are rebuilt from the states
+    of earlier scans, only creating states for tracks which haven't been deleted.
+    """
+
+    def __iter__(self):
+        self._tracks = {}
+        self.scan_iter = self._scan_gen()
+        return super().__iter__()
+
+    @property
+    def tracks(self):
+        return set(self._tracks.values())
+
+    def __next__(self):
+        return next(self.scan_iter)
+
+    def _scan_gen(self):
+        segments = self._segments()
+        if self.start_time is not None:
+            self._tracks = self._initial_tracks(segments)
+        for segment, index in self._scans(segments):
+            new_tracks = segment.scan_slice('tracks', index)
+            for track_index, track_id in enumerate(
+                    segment.track_ids[new_tracks].tolist(),
+                    segment.first_track + new_tracks.start):
+                self._tracks[track_index] = Track(id=track_id)
+            new_states = segment.scan_slice('states', index)
+            for track_index, state in zip(*segment.load_states(new_states)):
+                self._tracks[track_index].append(state)
+            for track_index in segment.deleted[segment.scan_slice('deleted', index)].tolist():
+                del self._tracks[track_index]
+            yield segment.scans['time'][index].item(), self.tracks
+
+    def _initial_tracks(self, segments):
+        """Tracks existing before :attr:`start_time`, with their states"""
+        track_ids, states, deleted = [], [], []
+        for segment in segments:
+            scans_before, _ = self._scan_range(segment)
+            if scans_before == 0:
+                break
+            last_scan = segment.scans[scans_before - 1]
+            track_ids.append(segment.track_ids[:last_scan['tracks']])
+            states.append((segment, slice(0, int(last_scan['states']))))
+            deleted.append(segment.deleted[:last_scan['deleted']])
+        if not track_ids:
+            return {}
+
+        track_ids = np.concatenate(track_ids).tolist()
+        deleted = set(np.concatenate(deleted).tolist())
+        tracks = {track_index: Track(id=track_id)
+                  for track_index, track_id in enumerate(track_ids)
+                  if track_index not in deleted}
+        deleted = np.array(sorted(deleted), dtype=np.int64)
+        for segment, rows in states:
+            # Only states of tracks not deleted are created
+            rows = np.flatnonzero(~np.isin(segment.states['track'][rows], deleted))
+            for track_index, state in zip(*segment.load_states(rows)):
+                tracks[track_index].append(state)
+        return tracks
@@ -5,6 +5,9 @@ of data that is in common formats.
 """
 
 import csv
+import itertools
+import re
+import warnings
 from datetime import datetime, timedelta
 from typing import Sequence, Collection, Mapping
 
@@ -20,6 +23,9 @@ from ..buffered_generator import BufferedGenerator
 from ..types.detection import Detection
 from ..types.groundtruth import GroundTruthPath, GroundTruthState
 
+# Extended ISO 8601 date, which NumPy can convert (unlike e.g. basic format, read as a year)
+_ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}(?:[T ]|$)')
+
 
 class _CSVReader(TextFileReader):
     state_vector_fields: Sequence[str] = Property(
@@ -34,6 +40,13 @@ class _CSVReader(TextFileReader):
         default=None, doc='List of columns to be saved as metadata, default all')
     csv_options: Mapping = Property(
         default={}, doc='Keyword arguments for the underlying csv reader')
+    chunk_size: int = Property(
+        default=None,
+        doc='Number of rows to read at a time in columnar mode, where each chunk of rows is '
+            'parsed into arrays, with the time field converted for the whole chunk. Extended ISO '
+            '8601 times and epoch timestamps are converted without parsing each row, and other '
+            'formats are parsed once per distinct value. Default `None`, where each row is '
+            'read and parsed in turn.')
 
     def _get_metadata(self, row):
         if self.metadata_fields is None:
@@ -58,6 +71,83 @@ class _CSVReader(TextFileReader):
             time_field_value = parse(row[self.time_field], ignoretz=True)
         return time_field_value
 
+    def _get_times(self, column):
+        """Times of a column of time field values, as :class:`numpy.datetime64` array"""
+        values = np.array(column)
+        if self.time_field_format is None and self.timestamp is True:
+            fractional, timestamps = np.modf(values.astype(np.float64))
+            return (timestamps.astype(np.int64) * 10**6
+                    + np.round(fractional * 1E6).astype(np.int64)).astype('datetime64[us]')
+        elif self.time_field_format is None and all(map(_ISO_DATE.match, column)):
+            # UTC designator dropped, as time zones are ignored
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('error', DeprecationWarning)
+                    times = np.char.rstrip(values, 'Z').astype('datetime64[us]')
+            except (ValueError, DeprecationWarning):
+                pass  # Not ISO 8601, or with time zone offset
+            else:
+                if not np.any(np.isnat(times)):
+                    return times
+        parsed_times = {
+            value: self._get_time({self.time_field: value}) for value in set(column)}
+        return np.array([parsed_times[value] for value in column], dtype='datetime64[us]')
+
+    def _read_chunks(self, csv_file):
+        """Read rows in chunks of :attr:`chunk_size`, as columns
+
+        Yields
+        ------
+        : :class:`numpy.ndarray`
+            Times of each row
+        : :class:`numpy.ndarray`
+            State vectors of each row, of shape (rows, dimensions, 1)
+        : list of dict
+            Metadata of each row
+        : dict
+            Values of each column, by field name
+        """
+        csv_options = dict(self.csv_options)
+        fieldnames = csv_options.pop('fieldnames', None)
+        csv_options.pop('restkey', None)
+        restval = csv_options.pop('restval', None)
+        reader = csv.reader(csv_file, **csv_options)
+        if fieldnames is None:
+            fieldnames = next((row for row in reader if row), [])
+        if self.metadata_fields is None:
+            metadata_fields = [field for field in fieldnames
+                               if field != self.time_field
+                               and field not in self.state_vector_fields]
+        else:
+            metadata_fields = [field for field in self.metadata_fields if field in fieldnames]
+
+        while True:
+            rows = list(itertools.islice(reader, self.chunk_size))
+            if not rows:
+                break
+            rows = [row for row in rows if row]  # Skip blank rows
+            if not rows:
+                continue
+            columns = dict(zip(
+                fieldnames, itertools.zip_longest(*rows, fillvalue=restval)))
+
+            state_vectors = np.empty((len(rows), len(self.state_vector_fields), 1))
+            for dim, field in enumerate(self.state_vector_fields):
+                state_vectors[:, dim, 0] = np.array(columns[field]).astype(np.float64)
+            if metadata_fields:
+                metadata = [dict(zip(metadata_fields, values))
+                            for values in zip(*(columns[field] for field in metadata_fields))]
+            else:
+                metadata = [{} for _ in rows]
+            yield self._get_times(columns[self.time_field]), state_vectors, metadata, columns
+
+    @staticmethod
+    def _time_groups(times):
+        """Time and slice of each run of rows with the same time"""
+        boundaries = [0, *(np.flatnonzero(times[1:] != times[:-1]) + 1), len(times)]
+        for start, end in zip(boundaries[:-1], boundaries[1:]):
+            yield times[start].item(), slice(start, end)
+
 
 class CSVGroundTruthReader(GroundTruthReader, _CSVReader):
     """A simple reader for csv files of truth data.
@@ -74,6 +164,9 @@ class CSVGroundTruthReader(GroundTruthReader, _CSVReader):
 
     @BufferedGenerator.generator_method
     def groundtruth_paths_gen(self):
+        if self.chunk_size is not None:
+            yield from self._columnar_groundtruth_paths_gen()
+            return
         with self.path.open(encoding=self.encoding, newline='') as csv_file:
             groundtruth_dict = {}
             updated_paths = set()
@@ -102,6 +195,32 @@ class CSVGroundTruthReader(GroundTruthReader, _CSVReader):
             # Yield remaining
             yield previous_time, updated_paths
 
+    def _columnar_groundtruth_paths_gen(self):
+        with self.path.open(encoding=self.encoding, newline='') as csv_file:
+            groundtruth_dict = {}
+            updated_paths = set()
+            previous_time = None
+            for times, state_vectors, metadata, columns in self._read_chunks(csv_file):
+                ids = columns[self.path_id_field]
+                for time, rows in self._time_groups(times):
+                    if previous_time is not None and previous_time != time:
+                        yield previous_time, updated_paths
+                        updated_paths = set()
+                    previous_time = time
+
+                    for id_, state_vector, row_metadata in zip(
+                            ids[rows], state_vectors[rows], metadata[rows]):
+                        state = GroundTruthState(
+                            state_vector.copy(), timestamp=time, metadata=row_metadata)
+                        if id_ not in groundtruth_dict:
+                            groundtruth_dict[id_] = GroundTruthPath(id=id_)
+                        groundtruth_path = groundtruth_dict[id_]
+                        groundtruth_path.append(state)
+                        updated_paths.add(groundtruth_path)
+
+            # Yield remaining
+            yield previous_time, updated_paths
+
 
 class CSVDetectionReader(DetectionReader, _CSVReader):
     """A simple detection reader for csv files of detections.
@@ -116,6 +235,9 @@ class CSVDetectionReader(DetectionReader, _CSVReader):
 
     @BufferedGenerator.generator_method
     def detections_gen(self):
+        if self.chunk_size is not None:
+            yield from self._columnar_detections_gen()
+            return
         with self.path.open(encoding=self.encoding, newline='') as csv_file:
             detections = set()
             previous_time = None
@@ -135,3 +257,23 @@ class CSVDetectionReader(DetectionReader, _CSVReader):
 
             # Yield remaining
             yield previous_time, detections
+
+    def _columnar_detections_gen(self):
+        with self.path.open(encoding=self.encoding, newline='') as csv_file:
+            detections = set()
+            previous_time = None
+            for times, state_vectors, metadata, _ in self._read_chunks(csv_file):
+                for time, rows in self._time_groups(times):
+                    if previous_time is not None and previous_time != time:
+                        yield previous_time, detections
+                        detections = set()
+                    previous_time = time
+
+                    detections.update(
+                        Detection(state_vector.copy(), timestamp=time,
+                                  metadata=row_metadata)
+                        for state_vector, row_metadata in zip(
+                            state_vectors[rows], metadata[rows]))
+
+            # Yield remaining
+            yield previous_time, detections
@@ -44,6 +44,11 @@ class _HDF5Reader(BinaryFileReader):
     metadata_fields: Collection[str] = Property(
         default=None, doc="Paths of datasets to be saved as metadata, default all"
     )
+    chunk_size: int = Property(
+        default=65536,
+        doc="Number of records read from each dataset at a time, which bounds memory used "
+            "whilst reading. Default 65536.",
+    )
 
     def _discover_metadata_fields(self, hdf5_file):
         """Recurse through all objects in a file and treat any dataset with
@@ -86,25 +91,126 @@ class _HDF5Reader(BinaryFileReader):
         : dict
             The metadata values for the record
         """
+        return self._get_metadatas(hdf5_file, row, row + 1)[0]
+
+    def _get_metadatas(self, hdf5_file, start, stop):
+        """Construct a dictionary of metadata values for each record in a range of rows.
+
+        Each metadata dataset is read once for the whole range.
+
+        Parameters
+        ----------
+        hdf5_file : :class:`h5py.File`
+            The HDF5 file to read from
+        start : int
+            The row index of the first record
+        stop : int
+            The row index after the last record
+
+        Returns
+        -------
+        : list of dict
+            The metadata values for each record
+        """
         if self.metadata_fields is None:
             self._discover_metadata_fields(hdf5_file)
 
-        local_metadata = {
-            **{
-                field: hdf5_file[field][row]
-                for field in self.metadata_fields
-                if field in hdf5_file
-                and h5py.check_string_dtype(hdf5_file[field].dtype) is None
-            },  # Merge string and non-string fields into the same dict
-            **{
-                field: hdf5_file[field].asstr()[row]
-                for field in self.metadata_fields
-                if field in hdf5_file
-                and h5py.check_string_dtype(hdf5_file[field].dtype) is not None
-            },
-        }
-
-        return local_metadata
+        fields = [field for field in self.metadata_fields if field in hdf5_file]
+        columns = [
+            hdf5_file[field][start:stop]
+            if h5py.check_string_dtype(hdf5_file[field].dtype) is None
+            else hdf5_file[field].asstr()[start:stop]
+            for field in fields]
+
+        if not fields:
+            return [{} for _ in range(stop - start)]
+        return [dict(zip(fields, values)) for values in zip(*columns)]
+
+    def _get_state_vectors(self, hdf5_file, start, stop):
+        """Read state vector fields for a range of rows.
+
+        Returns
+        -------
+        : :class:`numpy.ndarray` of shape (rows, fields, 1)
+            The state vector of each record
+        """
+        state_vectors = np.empty((stop - start, len(self.state_vector_fields), 1))
+        for index, field_path in enumerate(self.state_vector_fields):
+            state_vectors[:, index, 0] = hdf5_file[field_path][start:stop]
+        return state_vectors
+
+    def _get_times(self, raw_time_vals):
+        """Interpret an array of time values as datetime objects.
+
+        Each unique value is only parsed once.
+
+        Parameters
+        ----------
+        raw_time_vals : :class:`numpy.ndarray`
+            Formatted time strings, or POSIX timestamps to convert
+
+        Returns
+        -------
+        : list of :class:`datetime.datetime`
+            The unique parsed time values
+        : :class:`numpy.ndarray` of int
+            Index of each row's time in the unique time values
+        """
+        unique_raw_vals, inverse = np.unique(raw_time_vals, return_inverse=True)
+        times = []
+        time_indexes = {}
+        unique_indexes = np.empty(len(unique_raw_vals), dtype=int)
+        for index, raw_time_val in enumerate(unique_raw_vals):
+            time = self._get_time(raw_time_val)
+            # Different values may be equal once time resolution reduced
+            unique_indexes[index] = time_indexes.setdefault(time, len(times))
+            if unique_indexes[index] == len(times):
+                times.append(time)
+        return times, unique_indexes[inverse]
+
+    def _record_groups(self, hdf5_file, *fields):
+        """Read records in chunks, yielding groups of consecutive records with same time.
+
+        Groups spanning chunks are split, so consecutive groups may have the same time.
+
+        Parameters
+        ----------
+        hdf5_file : :class:`h5py.File`
+            The HDF5 file to read from
+        \\*fields : str
+            Paths of additional datasets to read for each record
+
+        Yields
+        ------
+        : :class:`datetime.datetime`
+            Time of records in group
+        : :class:`numpy.ndarray` of shape (rows, fields, 1)
+            State vectors of records
+        : list of dict
+            Metadata of records
+        : :class:`numpy.ndarray`
+            Values of each additional field for records
+        """
+        time_dataset = hdf5_file[self.time_field]
+        if not self.timestamp:
+            time_dataset = time_dataset.asstr()
+        n_records = len(hdf5_file[self.time_field])
+
+        for chunk_start in range(0, n_records, self.chunk_size):
+            chunk_stop = min(chunk_start + self.chunk_size, n_records)
+            times, time_indexes = self._get_times(time_dataset[chunk_start:chunk_stop])
+            state_vectors = self._get_state_vectors(hdf5_file, chunk_start, chunk_stop)
+            metadatas = self._get_metadatas(hdf5_file, chunk_start, chunk_stop)
+            field_values = [hdf5_file[field][chunk_start:chunk_stop] for field in fields]
+
+            group_bounds = [
+                0, *(np.flatnonzero(time_indexes[1:] != time_indexes[:-1]) + 1),
+                len(time_indexes)]
+            for start, stop in zip(group_bounds[:-1], group_bounds[1:]):
+                yield (times[time_indexes[start]],
+                       state_vectors[start:stop],
+                       metadatas[start:stop],
+                       *(values[start:stop] for values in field_values))
 
     def _get_time(self, raw_time_val):
         """Interpret a time value as a datetime object.
@@ -159,36 +265,22 @@ class HDF5GroundTruthReader(GroundTruthReader, _HDF5Reader):
             updated_paths = set()
             previous_time = None
 
-            time_values = hdf5_file[self.time_field]
-            if not self.timestamp:
-                time_values = time_values.asstr()
-
-            for i, raw_time_val in enumerate(time_values):
-
-                time = self._get_time(raw_time_val)
+            for time, state_vectors, metadatas, ids in self._record_groups(
+                    hdf5_file, self.path_id_field):
                 if previous_time is not None and previous_time != time:
                     yield previous_time, updated_paths
                     updated_paths = set()
                 previous_time = time
 
-                state = GroundTruthState(
-                    np.array(
-                        [
-                            [hdf5_file[field_path][i]]
-                            for field_path in self.state_vector_fields
-                        ],
-                        dtype=np.float64,
-                    ),
-                    timestamp=time,
-                    metadata=self._get_metadata(hdf5_file, i),
-                )
-
-                id_ = hdf5_file[self.path_id_field][i]
-                if id_ not in groundtruth_dict:
-                    groundtruth_dict[id_] = GroundTruthPath(id=id_)
-                groundtruth_path = groundtruth_dict[id_]
-                groundtruth_path.append(state)
-                updated_paths.add(groundtruth_path)
+                for state_vector, metadata, id_ in zip(state_vectors, metadatas, ids):
+                    state = GroundTruthState(
+                        state_vector.copy(), timestamp=time, metadata=metadata)
+
+                    if id_ not in groundtruth_dict:
+                        groundtruth_dict[id_] = GroundTruthPath(id=id_)
+                    groundtruth_path = groundtruth_dict[id_]
+                    groundtruth_path.append(state)
+                    updated_paths.add(groundtruth_path)
 
             # Yield remaining
             yield previous_time, updated_paths
@@ -214,31 +306,15 @@ class HDF5DetectionReader(DetectionReader, _HDF5Reader):
             detections = set()
             previous_time = None
 
-            time_values = hdf5_file[self.time_field]
-            if not self.timestamp:
-                time_values = time_values.asstr()
-
-            for i, raw_time_val in enumerate(time_values):
-
-                time = self._get_time(raw_time_val)
+            for time, state_vectors, metadatas in self._record_groups(hdf5_file):
                 if previous_time is not None and previous_time != time:
                     yield previous_time, detections
                     detections = set()
                 previous_time = time
 
-                detections.add(
-                    Detection(
-                        np.array(
-                            [
-                                [hdf5_file[field_path][i]]
-                                for field_path in self.state_vector_fields
-                            ],
-                            dtype=np.float64,
-                        ),
-                        timestamp=time,
-                        metadata=self._get_metadata(hdf5_file, i),
-                    )
-                )
+                detections.update(
+                    Detection(state_vector.copy(), timestamp=time, metadata=metadata)
+                    for state_vector, metadata in zip(state_vectors, metadatas))
 
             # Yield remaining
             yield previous_time, detections
@@ -0,0 +1,100 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from ..base import DetectionReader
+from ..binary import BinaryLogDetectionReader, BinaryLogTrackReader
+from ...base import Property
+from ...buffered_generator import BufferedGenerator
+from ...tracker import Tracker
+from ...types.detection import Detection
+from ...types.state import GaussianState, State
+from ...types.track import Track
+from ...writer.binary import BinaryLogWriter
+
+start = datetime.datetime(2018, 1, 1, 14)
+
+
+class _TestDetectionReader(DetectionReader):
+    @BufferedGenerator.generator_method
+    def detections_gen(self):
+        for i in range(10):
+            time = start + datetime.timedelta(seconds=i)
+            yield time, {Detection([[i], [j]], timestamp=time) for j in range(i % 3)}
+
+
+class _TestTracker(Tracker):
+    """Tracks with one state each scan, each track deleted after four scans"""
+    detector: DetectionReader = Property()
+
+    @property
+    def tracks(self):
+        return self._tracks
+
+    def __iter__(self):
+        self.detector_iter = iter(self.detector)
+        self._tracks = set()
+        return super().__iter__()
+
+    def __next__(self):
+        time, _ = next(self.detector_iter)
+        i = int((time - start).total_seconds())
+        self._tracks = {track for track in self._tracks if len(track) < 4}
+        self._tracks.add(Track(id=str(i)))
+        for track in self._tracks:
+            if int(track.id) % 2:
+                track.append(GaussianState([[i], [int(track.id)]], np.eye(2)*i, timestamp=time))
+            else:
+                track.append(State([[i]], timestamp=time))
+        return time, self.tracks
+
+
+@pytest.fixture()
+def binary_log(tmpdir):
+    path = tmpdir.join("log")
+    detector = _TestDetectionReader()
+    tracker = _TestTracker(detector)
+    with BinaryLogWriter(path.strpath, tracks_source=tracker, detections_source=detector,
+                         segment_size=3) as writer:
+        writer.write()
+    return path
+
+
+def _track_states(tracks):
+    return {track.id: [(type(state), state.state_vector.ravel().tolist(), state.timestamp,
+                        getattr(state, 'covar', np.empty(0)).tolist())
+                       for state in track]
+            for track in tracks}
+
+
+def test_detections_binary(binary_log):
+    expected = [(time, sorted(tuple(detection.state_vector.ravel()) for detection in detections))
+                for time, detections in _TestDetectionReader()]
+
+    reader = BinaryLogDetectionReader(binary_log.strpath)
+    assert reader.times == [time for time, _ in expected]
+    assert [(time, sorted(tuple(detection.state_vector.ravel()) for detection in detections))
+            for time, detections in reader] == expected
+
+    # Scans found by time
+    reader = BinaryLogDetectionReader(
+        binary_log.strpath, start_time=start + datetime.timedelta(seconds=2.5),
+        end_time=start + datetime.timedelta(seconds=5))
+    assert [(time, sorted(tuple(detection.state_vector.ravel()) for detection in detections))
+            for time, detections in reader] == expected[3:6]
+    for time, detections in reader:
+        assert all(detection.timestamp == time for detection in detections)
+
+
+@pytest.mark.parametrize('start_time', [None, start, start + datetime.timedelta(seconds=4)])
+def test_tracks_binary(binary_log, start_time):
+    expected = [(time, _track_states(tracks))
+                for time, tracks in _TestTracker(_TestDetectionReader())]
+    assert len(expected[-1][1]) == 4  # Some tracks deleted
+
+    reader = BinaryLogTrackReader(binary_log.strpath, start_time=start_time)
+    output = [(time, _track_states(tracks)) for time, tracks in reader]
+    if start_time is not None:
+        expected = [(time, tracks) for time, tracks in expected if time >= start_time]
+    assert output == expected
@@ -295,3 +295,65 @@ def test_tsv(tmpdir):
         assert 'identifier' in detection.metadata.keys()
         assert int(detection.metadata['z']) == 30 + n
         assert detection.metadata['identifier'] == '22018332'
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 100])
+@pytest.mark.parametrize('times, options', [
+    (['2018-01-01T14:00:00Z', '2018-01-01T14:00:00Z', '2018-01-01T14:01:00.5Z',
+      '2018-01-01T14:02:00Z', '2018-01-01T14:02:00Z'], {}),
+    (['2018-01-01 14:00:00+01:00', '2018-01-01 14:00:00+01:00', '2018-01-01 14:01:00+01:00',
+      '2018-01-01 14:02:00+01:00', '2018-01-01 14:02:00+01:00'], {}),
+    (['01/01/2018 14:00', '01/01/2018 14:00', '01/01/2018 14:01', '01/01/2018 14:02',
+      '01/01/2018 14:02'], {'time_field_format': '%d/%m/%Y %H:%M'}),
+    (['1514815200', '1514815200', '1514815260.25', '1514815320', '1514815320'],
+     {'timestamp': True}),
+    # Basic ISO 8601 and other numeric formats, which NumPy would misread
+    (['20200101', '20200101', '20200102', '20200103', '20200103'], {}),
+    (['20180101140000', '20180101140000', '20180101T140100', '20180101140200',
+      '20180101140200'], {}),
+])
+def test_csv_chunked(tmpdir, chunk_size, times, options):
+    csv_filename = tmpdir.join("test.csv")
+    with csv_filename.open('w') as csv_file:
+        csv_file.write("x,y,identifier,t\n")
+        for n, time in enumerate(times):
+            csv_file.write(f"{10 + n},{20 + n},{n % 2},\"{time}\"\n")
+
+    for reader_type, kwargs in ((CSVDetectionReader, {}),
+                                (CSVGroundTruthReader, {'path_id_field': 'identifier'})):
+        reader = reader_type(csv_filename.strpath, ["x", "y"], "t", **options, **kwargs)
+        chunked_reader = reader_type(
+            csv_filename.strpath, ["x", "y"], "t", chunk_size=chunk_size, **options, **kwargs)
+
+        if reader_type is CSVDetectionReader:
+            output = [(time, sorted((tuple(detection.state_vector.ravel()), detection.metadata)
+                                    for detection in detections))
+                      for time, detections in reader]
+            chunked_output = [
+                (time, sorted((tuple(detection.state_vector.ravel()), detection.metadata)
+                              for detection in detections))
+                for time, detections in chunked_reader]
+        else:
+            output = [(time, sorted((path.id, len(path), tuple(path.state_vector.ravel()))
+                                    for path in paths))
+                      for time, paths in reader]
+            chunked_output = [
+                (time, sorted((path.id, len(path), tuple(path.state_vector.ravel()))
+                              for path in paths))
+                for time, paths in chunked_reader]
+        assert len(output) == 3
+        assert chunked_output == output
+        assert all(isinstance(time, datetime.datetime) for time, _ in chunked_output)
+
+        # States don't hold references to (and so keep alive) the whole chunk
+        if reader_type is CSVDetectionReader:
+            state_vectors = [detection.state_vector
+                             for _, detections in chunked_reader for detection in detections]
+        else:
+            state_vectors = [state.state_vector
+                             for _, paths in chunked_reader for path in paths for state in path]
+        for state_vector in state_vectors:
+            array = state_vector
+            while isinstance(array.base, np.ndarray):
+                array = array.base
+            assert array.nbytes == state_vector.nbytes
@@ -344,3 +344,43 @@ def test_hdf5_time_resolution(tmpdir):
             assert len(detections) == 1
         elif time == datetime.datetime(2018, 1, 1, 14, 1, 20):
             assert len(detections) == 2
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+def test_hdf5_chunk_size(hdf5_gt_filename, chunk_size):
+    with h5py.File(hdf5_gt_filename, "r+") as hdf5_file:
+        del hdf5_file["t"]
+        hdf5_file.create_dataset(
+            "t",
+            data=[
+                "2018-01-01T14:00:00Z",
+                "2018-01-01T14:01:00Z",
+                "2018-01-01T14:01:00Z",
+                "2018-01-01T14:01:00Z",
+                "2018-01-01T14:03:00Z",
+            ],
+        )
+
+    detection_reader = HDF5DetectionReader(
+        hdf5_gt_filename.strpath, ["state/x", "state/y"], "t", chunk_size=chunk_size
+    )
+    output = list(detection_reader)
+    assert [time.minute for time, _ in output] == [0, 1, 3]
+    assert [len(detections) for _, detections in output] == [1, 3, 1]
+    assert sorted(
+        int(detection.state_vector[0, 0]) for detection in output[1][1]) == [11, 12, 13]
+    assert sorted(
+        int(detection.metadata["meta/valid"]) for detection in output[1][1]) == [41, 42, 43]
+
+    groundtruth_reader = HDF5GroundTruthReader(
+        hdf5_gt_filename.strpath,
+        state_vector_fields=["state/x", "state/y"],
+        time_field="t",
+        path_id_field="identifier",
+        chunk_size=chunk_size,
+    )
+    output = list(groundtruth_reader)
+    assert [time.minute for time, _ in output] == [0, 1, 3]
+    assert [len(paths) for _, paths in output] == [1, 2, 1]
+    final_paths = set.union(*(paths for _, paths in output))
+    assert sorted(len(path) for path in final_paths) == [2, 3]
@@ -4,7 +4,7 @@ from scipy.stats import multivariate_normal, uniform
 from typing import Sequence, Callable
 
 from .base import Regulariser
-from ..functions import cholesky_eps
+from ..functions import cholesky_eps, match_float_dtype
 from ..types.state import ParticleState
 from ..models.transition import TransitionModel
 from ..base import Property
@@ -91,8 +91,10 @@ class MCMCRegulariser(Regulariser):
             covar_est = posterior.covar
 
             # move particles
-            moved_particles.state_vector = moved_particles.state_vector + \
-                hopt * cholesky_eps(covar_est) @ np.random.randn(ndim, nparticles)
+            moved_particles.state_vector = match_float_dtype(
+                moved_particles.state_vector
+                + hopt * cholesky_eps(covar_est) @ np.random.randn(ndim, nparticles),
+                posterior.state_vector)
 
             # Apply constraints if defined
             if self.constraint_func is not None:
@@ -3,3 +3,25 @@ from ..base import Base
 
 class Resampler(Base):
     """Resampler base class"""
+
+    def batch_resample(self, particles_list, nparts=None):
+        """Resample multiple particle states
+
+        Resamples each particle state independently, for example those of many tracks. By
+        default this calls :meth:`resample` for each in turn, but resamplers may resample all
+        of them together.
+
+        Parameters
+        ----------
+        particles_list : sequence of :class:`~.ParticleState`
+            The particle states to be resampled according to their weights
+        nparts : int
+            The number of particles to be returned from resampling each particle state. Default
+            `None`, where the number of particles in each particle state is used.
+
+        Returns
+        -------
+        : list of :class:`~.ParticleState`
+            The particle states after resampling, in the same order
+        """
+        return [self.resample(particles, nparts) for particles in particles_list]
@@ -1,22 +1,78 @@
-import numpy as np
+from concurrent.futures import Executor
 from enum import Enum
 
+import numpy as np
+
 from .base import Resampler
 from ..base import Property
 from ..types.state import ParticleState
 
 
-class SystematicResampler(Resampler):
-    """
-    Traditional style resampler for particle filter. Calculates first random point in
-    (0, 1/nparts], then calculates `nparts` points that are equidistantly distributed across the
-    CDF. Complexity of order O(N) where N is the number of resampled particles.
+def _particle_states(particles_list):
+    return [particles if isinstance(particles, ParticleState)
+            else ParticleState(None, particle_list=particles)
+            for particles in particles_list]
+
 
+def _normalised_weights(particles_list):
+    """Normalised weights of all particle states, concatenated
+
+    Weights are normalised within each particle state in double precision, as log weights may
+    be stored in lower precision.
+
+    Returns
+    -------
+    : :class:`numpy.ndarray`
+        Weights of all particles
+    : :class:`numpy.ndarray`
+        Number of particles in each particle state
+    : :class:`numpy.ndarray`
+        Index of the first particle of each particle state
     """
+    sizes = np.array([len(particles) for particles in particles_list])
+    starts = np.cumsum(sizes) - sizes
+    if len(particles_list) == 1:
+        log_weights = np.asarray(particles_list[0].log_weight, dtype=np.float64)
+        weights = np.exp(log_weights - np.max(log_weights))
+        weights /= np.sum(weights)
+        return weights, sizes, starts
+    log_weights = np.concatenate(
+        [np.asarray(particles.log_weight, dtype=np.float64) for particles in particles_list])
+    weights = np.exp(log_weights - np.repeat(np.maximum.reduceat(log_weights, starts), sizes))
+    weights /= np.repeat(np.add.reduceat(weights, starts), sizes)
+    return weights, sizes, starts
+
+
+def _resampled_states(particles_list, index, nparts):
+    """Particle states from concatenated resampled indexes, with equal weights"""
+    new_particles_list = []
+    indexes = [index] if len(particles_list) == 1 else np.split(index, np.cumsum(nparts)[:-1])
+    for particles, particles_index, n in zip(particles_list, indexes, nparts):
+        new_particles = particles[particles_index]
+        new_particles.log_weight = np.full(
+            (n, ), np.log(1/n), dtype=particles.log_weight.dtype)
+        new_particles_list.append(new_particles)
+    return new_particles_list
+
+
+class _CDFResampler(Resampler):
+    """Resampler which picks particles from points sampled over the CDF of the weights
+
+    The CDF is formed in original particle order, so no sort of the weights is required. Points
+    are located with a binary search, and for multiple particle states this is carried out
+    across all particle states at once, with each particle state's CDF offset by its index.
+    """
+
+    def _points(self, nparts):
+        """Sample points in [0, 1) for :meth:`resample`, `nparts` long"""
+        raise NotImplementedError
+
+    def _batch_points(self, nparts):
+        """Sample points in [0, 1) for each particle state, concatenated"""
+        return np.concatenate([self._points(n) for n in nparts])
 
     def resample(self, particles, nparts=None):
-        """
-        Resample the particles
+        """Resample the particles
 
         Parameters
         ----------
@@ -30,30 +86,70 @@ class SystematicResampler(Resampler):
         particle state: :class:`~.ParticleState`
             The particle state after resampling
         """
+        return self.batch_resample([particles], nparts)[0]
+
+    def batch_resample(self, particles_list, nparts=None):
+        particles_list = _particle_states(particles_list)
+        if not particles_list:
+            return []
+        weights, sizes, starts = _normalised_weights(particles_list)
+        nparts = sizes if nparts is None else np.full(len(sizes), nparts)
+        if len(particles_list) == 1:
+            cdf = np.cumsum(weights)
+            index = np.searchsorted(cdf, self._points(nparts[0]) * cdf[-1])
+            np.minimum(index, sizes[0] - 1, out=index)
+        else:
+            # Each particle state's CDF offset by its index, as each has total weight of one
+            offsets = np.repeat(np.arange(len(sizes)), nparts)
+            index = np.searchsorted(np.cumsum(weights), self._batch_points(nparts) + offsets)
+            np.clip(index, starts[offsets], (starts + sizes - 1)[offsets], out=index)
+            index -= starts[offsets]
+        return _resampled_states(particles_list, index, nparts)
 
-        if not isinstance(particles, ParticleState):
-            particles = ParticleState(None, particle_list=particles)
-        if nparts is None:
-            nparts = len(particles)
 
-        log_weights = particles.log_weight
-        weight_order = np.argsort(log_weights, kind='stable')
-        max_log_value = log_weights[weight_order[-1]]
-        with np.errstate(divide='ignore'):
-            cdf = np.log(np.cumsum(np.exp(log_weights[weight_order] - max_log_value)))
-        cdf += max_log_value
+class SystematicResampler(_CDFResampler):
+    """
+    Traditional style resampler for particle filter. Calculates first random point in
+    (0, 1/nparts], then calculates `nparts` points that are equidistantly distributed across the
+    CDF. Complexity of order O(N) where N is the number of resampled particles.
 
-        # Pick random starting point
-        u_i = np.random.uniform(0, 1 / nparts)
+    As the points are evenly spaced, the number of copies of each particle is calculated directly
+    from the CDF (formed without sorting the weights), rather than searching for each point.
+    Multiple particle states are resampled together with :meth:`batch_resample`.
+    """
 
-        # Cycle through the cumulative distribution and copy the particle
-        # that pushed the score over the current value
-        u_j = u_i + (1 / nparts) * np.arange(nparts)
-        index = weight_order[np.searchsorted(cdf, np.log(u_j))]
+    def batch_resample(self, particles_list, nparts=None):
+        particles_list = _particle_states(particles_list)
+        if not particles_list:
+            return []
+        weights, sizes, starts = _normalised_weights(particles_list)
+        nparts = sizes if nparts is None else np.full(len(sizes), nparts)
 
-        new_particles = particles[index]
-        new_particles.log_weight = np.full((nparts, ), np.log(1/nparts))
-        return new_particles
+        # Pick random starting point for each particle state
+        u_i = np.random.uniform(0, 1 / nparts)
+
+        # Points u_i + j/nparts, for j in 0...nparts-1, at or below the CDF value of each
+        # particle, less one. The difference between consecutive particles is then the number of
+        # points which picked the particle.
+        cdf = np.cumsum(weights)
+        if len(particles_list) == 1:
+            positions = np.floor((cdf - u_i[0]) * nparts[0])
+            np.clip(positions, -1, nparts[0] - 1, out=positions)
+        else:
+            # CDF within each particle state, as each has total weight of one
+            cdf -= np.repeat(np.arange(len(sizes)), sizes)
+            particle_nparts = np.repeat(nparts, sizes)
+            positions = np.floor((cdf - np.repeat(u_i, sizes)) * particle_nparts)
+            np.clip(positions, -1, particle_nparts - 1, out=positions)
+        positions[starts + sizes - 1] = nparts - 1
+        counts = np.empty(len(positions), dtype=np.intp)
+        np.subtract(positions[1:], positions[:-1], out=counts[1:], casting='unsafe')
+        counts[starts] = positions[starts] + 1
+
+        index = np.repeat(np.arange(len(weights)), counts)
+        if len(particles_list) > 1:
+            index -= np.repeat(starts, nparts)
+        return _resampled_states(particles_list, index, nparts)
 
 
 class ESSResampler(Resampler):
@@ -104,55 +200,42 @@ class ESSResampler(Resampler):
         else:
             return particles
 
+    def batch_resample(self, particles_list, nparts=None):
+        particles_list = _particle_states(particles_list)
+        if not particles_list:
+            return []
+        if self.threshold is None:
+            self.threshold = len(particles_list[0]) / 2
+        weights, sizes, starts = _normalised_weights(particles_list)
+        ess = 1 / np.add.reduceat(weights**2, starts)
+        resample_indexes = np.flatnonzero(ess < self.threshold)
+
+        new_particles_list = list(particles_list)
+        for index, new_particles in zip(
+                resample_indexes,
+                self.resampler.batch_resample(
+                    [particles_list[index] for index in resample_indexes], nparts)):
+            new_particles_list[index] = new_particles
+        return new_particles_list
 
-class MultinomialResampler(Resampler):
+
+class MultinomialResampler(_CDFResampler):
     """
     Traditional style resampler for particle filter. Calculates a random point in (0, 1]
     individually for each particle, and picks the corresponding particle from the CDF calculated
     from particle weights. Complexity is of order O(NM) where N and M are the number of resampled
-    and existing particles respectively.
+    and existing particles respectively, reduced to O(N log M) with a binary search of the CDF.
     """
 
-    def resample(self, particles, nparts=None):
-        """Resample the particles
-
-        Parameters
-        ----------
-        particles : :class:`~.ParticleState` or list of :class:`~.Particle`
-            The particles or particle state to be resampled according to their weights
-        nparts : int
-            The number of particles to be returned from resampling
-
-        Returns
-        -------
-        particle state: :class:`~.ParticleState`
-            The particle state after resampling
-        """
-
-        if not isinstance(particles, ParticleState):
-            particles = ParticleState(None, particle_list=particles)
-        if nparts is None:
-            nparts = len(particles)
-
-        log_weights = particles.log_weight
-        weight_order = np.argsort(log_weights, kind='stable')
-        max_log_value = log_weights[weight_order[-1]]
-        with np.errstate(divide='ignore'):
-            cdf = np.log(np.cumsum(np.exp(log_weights[weight_order] - max_log_value)))
-        cdf += max_log_value
-
+    def _points(self, nparts):
         # Pick random points for each of the particles
-        u_j = np.random.rand(nparts)
-
-        # Pick particles that represent the chosen point from the CDF
-        index = weight_order[np.searchsorted(cdf, np.log(u_j))]
+        return np.random.rand(nparts)
 
-        new_particles = particles[index]
-        new_particles.log_weight = np.full((nparts, ), np.log(1/nparts))
-        return new_particles
+    def _batch_points(self, nparts):
+        return np.random.rand(np.sum(nparts))
 
 
-class StratifiedResampler(Resampler):
+class StratifiedResampler(_CDFResampler):
     """
     Traditional style resampler for particle filter. Splits the CDF into N evenly sized
     subpopulations ('strata'), then independently picks one value from each stratum. Complexity of
@@ -160,46 +243,19 @@ class StratifiedResampler(Resampler):
 
     """
 
-    def resample(self, particles, nparts=None):
-        """Resample the particles
-
-        Parameters
-        ----------
-        particles : :class:`~.ParticleState` or list of :class:`~.Particle`
-            The particles or particle state to be resampled according to their weights
-        nparts : int
-            The number of particles to be returned from resampling
-
-        Returns
-        -------
-        particle state: :class:`~.ParticleState`
-            The particle state after resampling
-        """
-
-        if not isinstance(particles, ParticleState):
-            particles = ParticleState(None, particle_list=particles)
-        if nparts is None:
-            nparts = len(particles)
-
-        log_weights = particles.log_weight
-        weight_order = np.argsort(log_weights, kind='stable')
-        max_log_value = log_weights[weight_order[-1]]
-        with np.errstate(divide='ignore'):
-            cdf = np.log(np.cumsum(np.exp(log_weights[weight_order] - max_log_value)))
-        cdf += max_log_value
-
+    def _points(self, nparts):
         # Strata lower bounds:
         s_l = np.arange(nparts) * (1 / nparts)
 
         # Independently pick a point in each stratum
-        u_j = np.random.uniform(s_l, s_l + (1 / nparts))
+        return np.random.uniform(s_l, s_l + (1 / nparts))
 
-        # Pick particles that represent the chosen point from the CDF
-        index = weight_order[np.searchsorted(cdf, np.log(u_j))]
-
-        new_particles = particles[index]
-        new_particles.log_weight = np.full((nparts, ), np.log(1/nparts))
-        return new_particles
+    def _batch_points(self, nparts):
+        # Position of each point within its particle state, and the number of points
+        offsets = np.repeat(np.cumsum(nparts) - nparts, nparts)
+        particle_nparts = np.repeat(nparts, nparts)
+        return (np.arange(np.sum(nparts)) - offsets + np.random.rand(np.sum(nparts))) \
+            / particle_nparts
 
 
 class ResidualMethod(Enum):
@@ -251,7 +307,7 @@ class ResidualResampler(Resampler):
             raise NotImplementedError("This resampler does not currently support up- or down-"
                                       "sampling")
 
-        log_weights = particles.log_weight
+        log_weights = np.asarray(particles.log_weight, dtype=np.float64)
 
         # Get the true weight of each particle
         weights = np.exp(log_weights)
@@ -262,15 +318,12 @@ class ResidualResampler(Resampler):
         floors = np.floor(weights * nparts)
 
         # Generate particle index from stage 1 resampling
-        # There might be a better way to do this, seems a complicated way to do a simple task
-        stage_1_index = np.array([index for sublist in
-                                  [[index]*int(floor) for index, floor in enumerate(floors)
-                                   if int(floor) != 0] for index in sublist])
+        stage_1_index = np.repeat(np.arange(len(floors)), floors.astype(np.intp))
 
         # **** Stage 2 ****
 
         # Calculate number of particles to be resampled from residuals
-        n_stage_2_parts = nparts - int(sum(floors))
+        n_stage_2_parts = nparts - int(np.sum(floors))
 
         # Check stage 2 is necessary (Necessary in all cases except where all weights = 1/N)
 
@@ -279,14 +332,9 @@ class ResidualResampler(Resampler):
             r_weights = weights - floors/nparts
 
             # Normalise residual weights
-            normalised_r_weights = r_weights * 1/sum(r_weights)
+            normalised_r_weights = r_weights * 1/np.sum(r_weights)
 
-            r_log_weights = np.log(normalised_r_weights)
-            weight_order = np.argsort(r_log_weights, kind='stable')
-            max_log_value = r_log_weights[weight_order[-1]]
-            with np.errstate(divide='ignore'):
-                cdf = np.log(np.cumsum(np.exp(r_log_weights[weight_order] - max_log_value)))
-            cdf += max_log_value
+            cdf = np.cumsum(normalised_r_weights)
 
             if self.residual_method == ResidualMethod.MULTINOMIAL:
                 # Pick random points for each of the particles
@@ -310,7 +358,8 @@ class ResidualResampler(Resampler):
                 raise ValueError("Invalid string variable given for stage 2 residual_method")
 
             # Pick particles that represent the chosen point from the CDF
-            stage_2_index = weight_order[np.searchsorted(cdf, np.log(u_j))]
+            stage_2_index = np.minimum(
+                np.searchsorted(cdf, u_j * cdf[-1]), len(normalised_r_weights) - 1)
             # Combine the indexes from both stages
             index = np.concatenate([stage_1_index, stage_2_index])
 
@@ -318,6 +367,109 @@ class ResidualResampler(Resampler):
             index = stage_1_index
 
         new_particles = particles[index]
-        new_particles.log_weight = np.full((nparts, ), np.log(1/nparts))
+        new_particles.log_weight = np.full(
+            (nparts, ), np.log(1/nparts), dtype=particles.log_weight.dtype)
+
+        return new_particles
 
+
+def _metropolis_index(log_weights, start, iterations, seed):
+    """Run Metropolis chains over particle indexes, one per resampled particle"""
+    rng = np.random.default_rng(seed)
+    index = start % len(log_weights)
+    current_log_weights = log_weights[index]
+    for _ in range(iterations):
+        proposal = rng.integers(len(log_weights), size=len(index))
+        proposal_log_weights = log_weights[proposal]
+        accept = np.log(rng.random(len(index))) <= proposal_log_weights - current_log_weights
+        index[accept] = proposal[accept]
+        current_log_weights[accept] = proposal_log_weights[accept]
+    return index
+
+
+class MetropolisResampler(Resampler):
+    r"""Metropolis resampler
+
+    Resampler which doesn't require a cumulative sum (or normalisation) of the weights [#]_. Each
+    resampled particle is the result of an independent Metropolis chain over the particles,
+    starting at the particle of the same index, which for each of :attr:`iterations` proposes a
+    particle uniformly at random, moving to it with probability of the ratio of its weight to
+    that of the current particle.
+
+    With no collective operation over the particles, the chains can be run in parallel, in chunks
+    of up to :attr:`chunk_size` particles, with an :attr:`executor` (such as a
+    :class:`~concurrent.futures.ThreadPoolExecutor`, as the work is carried out in NumPy). Each
+    chunk has its own random number generator, seeded from NumPy's global random state, so the
+    result doesn't depend on whether an executor is used.
+
+    The result is biased where chains are too short to converge. By default, the number of
+    iterations is chosen from the weights as
+    :math:`\lceil\log\epsilon/\log(1 - \bar{w}/w_{max})\rceil`, such that the bias is at most
+    :math:`\epsilon`, the :attr:`bias`.
+
+    References
+    ----------
+    .. [#] Murray L. M., Lee A., Jacob P. E., 2016, Parallel Resampling in the Particle Filter,
+       Journal of Computational and Graphical Statistics, Vol. 25, No. 3.
+    """
+    iterations: int = Property(
+        default=None,
+        doc="Number of iterations of each Metropolis chain. Default `None`, where this is "
+            "calculated from the weights, as per :attr:`bias`.")
+    bias: float = Property(
+        default=0.01,
+        doc="Maximum bias allowed when calculating number of iterations. Default 0.01.")
+    executor: Executor = Property(
+        default=None,
+        doc="Executor used to run chunks of chains in parallel. Default `None`, where chunks are "
+            "run in turn.")
+    chunk_size: int = Property(
+        default=2**16,
+        doc="Number of resampled particles per chunk. Default 65536.")
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_property_executor'] = None
+        return state
+
+    def _iterations(self, log_weights):
+        if self.iterations is not None:
+            return self.iterations
+        mean_ratio = np.mean(np.exp(log_weights - np.max(log_weights)))
+        if mean_ratio >= 1:  # Equal weights
+            return 0
+        return int(np.ceil(np.log(self.bias) / np.log1p(-mean_ratio)))
+
+    def resample(self, particles, nparts=None):
+        """Resample the particles
+
+        Parameters
+        ----------
+        particles : :class:`~.ParticleState` or list of :class:`~.Particle`
+            The particles or particle state to be resampled according to their weights
+        nparts : int
+            The number of particles to be returned from resampling
+
+        Returns
+        -------
+        particle state: :class:`~.ParticleState`
+            The particle state after resampling
+        """
+        if not isinstance(particles, ParticleState):
+            particles = ParticleState(None, particle_list=particles)
+        if nparts is None:
+            nparts = len(particles)
+
+        log_weights = np.asarray(particles.log_weight, dtype=np.float64)
+        iterations = self._iterations(log_weights)
+        starts = np.array_split(np.arange(nparts), max(1, -(-nparts // self.chunk_size)))
+        seeds = np.random.randint(2**32, size=len(starts), dtype=np.uint64)
+        map_ = map if self.executor is None or len(starts) == 1 else self.executor.map
+        index = np.concatenate(list(map_(
+            _metropolis_index,
+            [log_weights]*len(starts), starts, [iterations]*len(starts), seeds)))
+
+        new_particles = particles[index]
+        new_particles.log_weight = np.full(
+            (nparts, ), np.log(1/nparts), dtype=particles.log_weight.dtype)
         return new_particles
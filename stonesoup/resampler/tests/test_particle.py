@@ -1,11 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pytest
 
+from ...types.array import StateVectors
 from ...types.particle import Particle
 from ...types.state import ParticleState
 from ..particle import SystematicResampler, MultinomialResampler, StratifiedResampler, \
     ResidualResampler, ResidualMethod
-from ..particle import ESSResampler
+from ..particle import ESSResampler, MetropolisResampler
 
 
 def test_residual_method_errors():
@@ -457,3 +460,65 @@ def test_residual_systematic_alternating():
     # residual also gets resampled
     assert odd >= even
     assert resampler.residual_method == ResidualMethod.SYSTEMATIC
+
+
+@pytest.mark.parametrize('resampler', [
+    SystematicResampler(),
+    MultinomialResampler(),
+    StratifiedResampler(),
+    ESSResampler(),
+    MetropolisResampler(bias=1e-9),
+])
+@pytest.mark.parametrize('nparts', [None, 20])
+def test_batch_resample(resampler, nparts):
+    sizes = [5, 50, 13]
+    particles_list = []
+    for size in sizes:
+        weights = np.zeros(size)
+        weights[size // 2] = 1  # All weight on single particle
+        particles_list.append(ParticleState(
+            StateVectors([np.arange(size)]), weight=weights + 1e-16))
+
+    new_particles_list = resampler.batch_resample(particles_list, nparts)
+    assert len(new_particles_list) == len(particles_list)
+    for size, new_particles in zip(sizes, new_particles_list):
+        assert len(new_particles) == (nparts or size)
+        assert np.all(new_particles.state_vector == size // 2)
+        assert np.allclose(np.exp(new_particles.log_weight), 1 / (nparts or size))
+
+
+def test_systematic_low_variance():
+    weights = np.random.default_rng(1).uniform(size=1000)
+    weights /= np.sum(weights)
+    particles = ParticleState(StateVectors([np.arange(1000)]), weight=weights)
+
+    new_particles = SystematicResampler().resample(particles, 500)
+    counts = np.bincount(np.asarray(new_particles.state_vector, dtype=int)[0], minlength=1000)
+    # Each particle resampled within one of its expected count
+    assert np.all(counts >= np.floor(weights*500))
+    assert np.all(counts <= np.ceil(weights*500))
+
+
+def test_metropolis():
+    particles = ParticleState(
+        StateVectors([np.arange(100)]),
+        weight=np.linspace(0.1, 1, 100) / np.sum(np.linspace(0.1, 1, 100)))
+    resampler = MetropolisResampler(chunk_size=30)
+    assert resampler._iterations(particles.log_weight) > 0
+
+    np.random.seed(1)
+    new_particles = resampler.resample(particles)
+    assert len(new_particles) == 100
+
+    # Same result with chunks resampled in parallel
+    with ThreadPoolExecutor(2) as executor:
+        resampler.executor = executor
+        np.random.seed(1)
+        parallel_particles = resampler.resample(particles)
+    assert np.array_equal(new_particles.state_vector, parallel_particles.state_vector)
+
+    # Equal weights left as they are
+    particles = ParticleState(StateVectors([np.arange(10)]), weight=np.full(10, 0.1))
+    assert resampler._iterations(particles.log_weight) == 0
+    new_particles = resampler.resample(particles)
+    assert np.array_equal(new_particles.state_vector, particles.state_vector)
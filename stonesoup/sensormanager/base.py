@@ -1,11 +1,15 @@
 from abc import abstractmethod, ABC
+from concurrent.futures import Executor
 from typing import Callable, Set
+import functools
+import os
 import random
 import numpy as np
 import itertools as it
 from typing import TYPE_CHECKING
 
 from ..base import Base, Property
+from ..cache import ScanCache
 
 if TYPE_CHECKING:
     from ..sensor.sensor import Sensor
@@ -122,16 +126,41 @@ class RandomSensorManager(SensorManager):
         return configs
 
 
+def _config_reward(reward_function, tracks, timestamp, config):
+    with ScanCache().scan():
+        return reward_function(config, tracks, timestamp)
+
+
 class BruteForceSensorManager(SensorManager):
     """A sensor manager which returns a choice of action from those available. The sensor manager
     iterates through every possible configuration of sensors and actions and
     selects the configuration which returns the maximum reward as calculated by a reward function.
 
+    Rewards are evaluated within a :class:`~.ScanCache` scan, such that tracks are predicted once
+    for each call of :meth:`choose_actions`, rather than for every configuration. Configurations
+    can optionally be evaluated in parallel, with an :attr:`executor`.
+
+    Where the :attr:`reward_function` is separable (see :attr:`.RewardFunction.separable`), and
+    no managed sensor is mounted on a managed platform, the reward of each actionable's action
+    choices is evaluated once, in isolation. The best configurations are then found by branch
+    and bound over the sums of these rewards, rather than evaluating every configuration, such
+    that the number of reward evaluations grows with the sum, rather than the product, of the
+    number of action choices of each actionable.
     """
+    executor: Executor = Property(
+        default=None,
+        doc="Executor used to evaluate rewards in parallel, such as a "
+            ":class:`~concurrent.futures.ProcessPoolExecutor`. Default `None`, where rewards "
+            "are evaluated in turn.")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_property_executor'] = None
+        return state
+
     def choose_actions(self, tracks, timestamp, nchoose=1, return_reward=False, **kwargs):
         """Returns a chosen [list of] action(s) from the action set for each sensor.
         Chosen action(s) is selected by finding the configuration of sensors: actions which returns
@@ -165,19 +194,23 @@ class BruteForceSensorManager(SensorManager):
             # dictionary of sensors: list(action combinations)
             all_action_choices[actionable] = action_choices
 
-        # get tuple of dictionaries of sensors: actions
-        configs = ({sensor: action
-                    for sensor, action in zip(all_action_choices.keys(), actionconfig)}
-                   for actionconfig in it.product(*all_action_choices.values()))
-
         best_rewards = np.zeros(nchoose) - np.inf
         selected_configs = [None] * nchoose
-        for config in configs:
-            # calculate reward for dictionary of sensors: actions
-            reward = self.reward_function(config, tracks, timestamp)
-            if reward > min(best_rewards):
-                selected_configs[np.argmin(best_rewards)] = config
-                best_rewards[np.argmin(best_rewards)] = reward
+        with ScanCache().scan():
+            if self._separable():
+                self._branch_and_bound(
+                    all_action_choices, tracks, timestamp, best_rewards, selected_configs)
+            else:
+                # get tuple of dictionaries of sensors: actions
+                configs = ({sensor: action
+                            for sensor, action in zip(all_action_choices.keys(), actionconfig)}
+                           for actionconfig in it.product(*all_action_choices.values()))
+
+                # calculate reward for dictionary of sensors: actions
+                for config, reward in self._rewards(configs, tracks, timestamp):
+                    if reward > min(best_rewards):
+                        selected_configs[np.argmin(best_rewards)] = config
+                        best_rewards[np.argmin(best_rewards)] = reward
         if return_reward:
             # Return mapping of sensors and chosen actions for sensors
             # Also returns rewards
@@ -185,6 +218,67 @@ class BruteForceSensorManager(SensorManager):
         else:
             return selected_configs
 
+    def _separable(self):
+        """Whether the reward of a configuration is the sum of that of each actionable"""
+        if not getattr(self.reward_function, 'separable', False):
+            return False
+        # Actions of a platform affect the measurements of the sensors mounted on it
+        actionables = self.actionables
+        return not any(sensor in actionables
+                       for platform in self.platforms for sensor in platform.sensors)
+
+    def _rewards(self, configs, tracks, timestamp, batch_size=1024):
+        """Configurations and their rewards, evaluated with :attr:`executor` if set"""
+        if self.executor is None:
+            for config in configs:
+                yield config, self.reward_function(config, tracks, timestamp)
+            return
+
+        func = functools.partial(_config_reward, self.reward_function, tracks, timestamp)
+        # Submitted in batches, as the number of configurations may be very large
+        while batch := list(it.islice(configs, batch_size)):
+            yield from zip(batch, self.executor.map(
+                func, batch, chunksize=max(1, len(batch) // (4 * (os.cpu_count() or 1)))))
+
+    def _branch_and_bound(self, all_action_choices, tracks, timestamp, best_rewards,
+                          selected_configs):
+        """Find best configurations of separable reward, from the reward of each actionable's
+        action choices in isolation"""
+        partial_configs = ({actionable: actions}
+                           for actionable, action_choices in all_action_choices.items()
+                           for actions in action_choices)
+        partial_rewards = {actionable: [] for actionable in all_action_choices}
+        for config, reward in self._rewards(partial_configs, tracks, timestamp):
+            (actionable, actions), = config.items()
+            partial_rewards[actionable].append((reward, actions))
+
+        # Search choices in descending order of reward, such that once the bound on the reward
+        # of a choice is exceeded, so are those of the remaining choices
+        actionables = list(partial_rewards)
+        choices = [sorted(partial_rewards[actionable], key=lambda choice: choice[0],
+                          reverse=True)
+                   for actionable in actionables]
+        # Upper bound of reward from actionables from each depth onwards
+        bounds = np.zeros(len(choices) + 1)
+        for depth in reversed(range(len(choices))):
+            if not choices[depth]:
+                return  # No configurations
+            bounds[depth] = bounds[depth + 1] + choices[depth][0][0]
+
+        def search(depth, reward, config):
+            if depth == len(choices):
+                if reward > min(best_rewards):
+                    selected_configs[np.argmin(best_rewards)] = config
+                    best_rewards[np.argmin(best_rewards)] = reward
+                return
+            for partial_reward, actions in choices[depth]:
+                if reward + partial_reward + bounds[depth + 1] <= min(best_rewards):
+                    break
+                search(depth + 1, reward + partial_reward,
+                       {**config, actionables[depth]: actions})
+
+        search(0, 0., {})
+
 
 class GreedySensorManager(SensorManager):
     """A sensor manager that returns a choice of actions from those available. Calculates
@@ -215,23 +309,24 @@ class GreedySensorManager(SensorManager):
 
         chosen_actions = dict()
 
-        for actionable in self.actionables:
-            # get action 'generator(s)'
-            action_generators = actionable.actions(timestamp)
-            # list possible action combinations for the sensor/platform
-            action_choices = list(it.product(*action_generators))
-
-            best_rewards = np.zeros(nchoose) - np.inf
-            selected_actions = [None] * nchoose
-            for action in action_choices:
-                # calculate reward for each action
-                reward = self.reward_function({actionable: action}, tracks, timestamp)
-                if reward > min(best_rewards):
-                    selected_actions[np.argmin(best_rewards)] = action
-                    best_rewards[np.argmin(best_rewards)] = reward
-
-            # save nchoose best actions for the sensor/platform
-            chosen_actions[actionable] = selected_actions
+        with ScanCache().scan():
+            for actionable in self.actionables:
+                # get action 'generator(s)'
+                action_generators = actionable.actions(timestamp)
+                # list possible action combinations for the sensor/platform
+                action_choices = list(it.product(*action_generators))
+
+                best_rewards = np.zeros(nchoose) - np.inf
+                selected_actions = [None] * nchoose
+                for action in action_choices:
+                    # calculate reward for each action
+                    reward = self.reward_function({actionable: action}, tracks, timestamp)
+                    if reward > min(best_rewards):
+                        selected_actions[np.argmin(best_rewards)] = action
+                        best_rewards[np.argmin(best_rewards)] = reward
+
+                # save nchoose best actions for the sensor/platform
+                chosen_actions[actionable] = selected_actions
 
         # convert from single dict of actionable: list(actions) to list of dicts of
         # actionables: actions
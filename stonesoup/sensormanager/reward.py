@@ -35,6 +35,14 @@ class RewardFunction(Base, ABC):
     and chooses the appropriate sensing configuration to use at that time step.
     """
 
+    @property
+    def separable(self) -> bool:
+        """Whether the reward of a configuration is the sum of the rewards of each of its
+        actionables' actions in isolation (with the reward of an empty configuration being zero).
+        Sensor managers may then evaluate the actions of each actionable once, rather than every
+        configuration. Default `False`."""
+        return False
+
     def __call__(self, config: Mapping[Sensor, Sequence[Action]], tracks: Set[Track],
                  metric_time: datetime.datetime, *args, **kwargs):
         """
@@ -180,6 +188,12 @@ class ExpectedKLDivergence(RewardFunction):
             raise NotImplementedError('Only ParticleUpdater types are currently compatible '
                                       'with this reward function')
 
+    @property
+    def separable(self) -> bool:
+        """As each sensor's expected updates are from the track predictions, the reward is
+        separable where summed across targets (i.e. :attr:`method_sum` is `True`)."""
+        return self.method_sum
+
     def __call__(self, config: Mapping[Sensor, Sequence[Action]], tracks: Set[Track],
                  metric_time: datetime.datetime, *args, **kwargs):
         """
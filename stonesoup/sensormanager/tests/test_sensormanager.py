@@ -2,7 +2,9 @@ import numpy as np
 from datetime import datetime, timedelta
 from ordered_set import OrderedSet
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import copy
+import itertools as it
 
 import pytest
 
@@ -13,8 +15,8 @@ from ...types.track import Track
 from ...sensor.radar import RadarRotatingBearingRange
 from ...sensor.action.dwell_action import ChangeDwellAction
 from ...sensormanager import RandomSensorManager, BruteForceSensorManager, GreedySensorManager
-from ...sensormanager.reward import UncertaintyRewardFunction, ExpectedKLDivergence, \
-    MultiUpdateExpectedKLDivergence
+from ...sensormanager.reward import RewardFunction, UncertaintyRewardFunction, \
+    ExpectedKLDivergence, MultiUpdateExpectedKLDivergence
 from ...sensormanager.action import Actionable
 from ...sensormanager.optimise import OptimizeBruteSensorManager, \
     OptimizeBasinHoppingSensorManager
@@ -29,6 +31,7 @@ from ...measures import Mahalanobis
 from ...dataassociator.neighbour import GNNWith2DAssignment
 from ...platform import Platform
 from ...movable.grid import NStepDirectionalGridMovable
+from ...base import Property
 
 
 def test_random_choose_actions():
@@ -441,3 +444,90 @@ def test_sensor_manager_with_platform(params):
     )
     assert greedysensormanager.sensors == set()
     assert len(greedysensormanager.actionables) == 1
+
+
+class DwellReward(RewardFunction):
+    """Reward of each sensor's dwell centre, relative to its x position"""
+    is_separable: bool = Property(default=True)
+
+    @property
+    def separable(self):
+        return self.is_separable
+
+    def __call__(self, config, tracks, metric_time, *args, **kwargs):
+        self.calls = getattr(self, 'calls', 0) + 1
+        reward = 0.
+        for sensor, actions in config.items():
+            predicted_sensor = copy.deepcopy(sensor)
+            predicted_sensor.add_actions(actions)
+            predicted_sensor.act(metric_time)
+            reward += np.cos(predicted_sensor.dwell_centre[0, 0] - sensor.position[0, 0])
+        return reward
+
+
+@pytest.mark.parametrize('executor', [None, ThreadPoolExecutor, ProcessPoolExecutor])
+def test_brute_force_separable(executor):
+    time_start = datetime.now()
+    sensors = set()
+    for x in range(3):
+        sensor = RadarRotatingBearingRange(
+            position_mapping=(0, 2),
+            noise_covar=np.diag([np.radians(0.5) ** 2, 0.75 ** 2]),
+            ndim_state=4,
+            position=StateVector([x, 0]),
+            rpm=60,
+            fov_angle=np.radians(45),
+            dwell_centre=StateVector([0.0]),
+            max_range=100,
+            resolution=Angle(np.radians(90)))
+        sensor.timestamp = time_start
+        sensors.add(sensor)
+    timestamp = time_start + timedelta(seconds=1)
+    n_actions = len(list(it.product(*sensor.actions(timestamp))))
+
+    # Reference of every configuration evaluated
+    configs, rewards = BruteForceSensorManager(
+        sensors, reward_function=DwellReward(is_separable=False)).choose_actions(
+        set(), timestamp, nchoose=3, return_reward=True)
+
+    if executor is not None:
+        executor = executor(2)
+    try:
+        for reward_function in (DwellReward(), DwellReward(is_separable=False)):
+            sensor_manager = BruteForceSensorManager(
+                sensors, reward_function=reward_function, executor=executor)
+            chosen_configs, chosen_rewards = sensor_manager.choose_actions(
+                set(), timestamp, nchoose=3, return_reward=True)
+            if executor is None:
+                # Separable reward only evaluated for each sensor's actions in isolation
+                assert reward_function.calls == \
+                    (3*n_actions if reward_function.separable else n_actions**3)
+
+            assert sorted(chosen_rewards) == pytest.approx(sorted(rewards))
+            for config, reward in zip(chosen_configs, chosen_rewards):
+                assert reward_function(config, set(), timestamp) == pytest.approx(reward)
+                assert config.keys() == sensors
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def test_brute_force_separable_with_platform():
+    reward_function = DwellReward()
+    platform = Platform(movement_controller=NStepDirectionalGridMovable(
+        states=[State(StateVector([[0], [0]]), datetime.now())],
+        position_mapping=(0, 1), resolution=1, n_steps=1, step_size=1))
+    sensor = RadarRotatingBearingRange(
+        position_mapping=(0, 2), noise_covar=np.eye(2), ndim_state=4, rpm=60,
+        fov_angle=np.radians(45), dwell_centre=StateVector([0.0]), max_range=100)
+    platform.add_sensor(sensor)
+
+    # Platform's actions affect its sensor, so not separable
+    assert not BruteForceSensorManager(
+        platforms={platform}, reward_function=reward_function)._separable()
+    assert BruteForceSensorManager(
+        platforms={platform}, reward_function=reward_function,
+        take_sensors_from_platforms=False)._separable()
+    assert BruteForceSensorManager({sensor}, reward_function=reward_function)._separable()
+    assert not BruteForceSensorManager(
+        {sensor}, reward_function=lambda *args: 0.)._separable()
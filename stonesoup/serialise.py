@@ -47,6 +47,7 @@ from ruamel.yaml.constructor import ConstructorError
 from .base import Base, Property
 from .types.angle import Angle
 from .types.array import Matrix, StateVector
+from .types.columnar import ColumnarStates
 from .types.numeric import Probability
 from .sensor.sensor import Sensor
 
@@ -84,6 +85,10 @@ def init_typ(yaml):
     # deque
     yaml.representer.add_representer(deque, deque_to_yaml)
     yaml.constructor.add_constructor("!collections.deque", deque_from_yaml)
+
+    # Columnar states
+    yaml.representer.add_representer(ColumnarStates, columnar_states_to_yaml)
+    yaml.constructor.add_constructor(yaml_tag(ColumnarStates), columnar_states_from_yaml)
     # Probability
     yaml.representer.add_representer(Probability, probability_to_yaml)
     yaml.constructor.add_constructor(yaml_tag(Probability), probability_from_yaml)
@@ -272,3 +277,13 @@ def deque_from_yaml(constructor, node):
     """Convert YAML to collections.deque"""
     iterable, maxlen = constructor.construct_sequence(node, deep=True)
     return deque(iterable, maxlen)
+
+
+def columnar_states_to_yaml(representer, node):
+    """Convert ColumnarStates to YAML"""
+    return representer.represent_sequence(yaml_tag(ColumnarStates), list(node))
+
+
+def columnar_states_from_yaml(constructor, node):
+    """Convert YAML to ColumnarStates"""
+    return ColumnarStates(constructor.construct_sequence(node, deep=True))
@@ -13,7 +13,7 @@ from ..types.detection import TrueDetection, Clutter
 from ..types.groundtruth import GroundTruthPath, GroundTruthState
 from ..types.numeric import Probability
 from ..types.state import GaussianState, State
-from ..types.array import StateVector
+from ..types.array import StateVector, StateVectors
 from .base import DetectionSimulator, GroundTruthSimulator
 from stonesoup.buffered_generator import BufferedGenerator
 
@@ -200,6 +200,13 @@ class SwitchMultiTargetGroundTruthSimulator(MultiTargetGroundTruthSimulator):
 class SimpleDetectionSimulator(DetectionSimulator):
     """A simple detection simulator.
 
+    Where the :attr:`measurement_model` draws noise from a different random state to this
+    simulator (e.g. where either is seeded), detection decisions and measurement noise are
+    drawn for all truths at once. Where both use the same random state (e.g. NumPy's global
+    random state, where neither is seeded), they are instead drawn in turn for each truth, such
+    that output seeded via :func:`numpy.random.seed` is unchanged. In either case, clutter is
+    drawn all at once, in the same order as one at a time.
+
     Parameters
     ----------
     groundtruth : GroundTruthReader
@@ -231,15 +238,28 @@ class SimpleDetectionSimulator(DetectionSimulator):
         clutter detections per unit volume per timestep"""
         return self.clutter_rate/np.prod(np.diff(self.meas_range))
 
-    def __in_state_space(self, detection):
+    def _in_state_space(self, state_vectors):
         """
-        Checks if a measurement is in the state space
+        Checks which measurements are in the state space
         """
-        for dim in range(self.meas_range.ndim):
-            if not self.meas_range[dim][0] <= detection.state_vector[dim] \
-                                            <= self.meas_range[dim][-1]:
-                return False
-        return True
+        return np.all((self.meas_range[:, :1] <= state_vectors)
+                      & (state_vectors <= self.meas_range[:, -1:]), axis=0)
+
+    def _shares_random_state(self, random_state):
+        """Whether measurement model noise is drawn from `random_state`"""
+        model_random_state = getattr(self.measurement_model, 'random_state', None)
+        if model_random_state is None:  # NumPy's global random state
+            model_random_state = np.random.mtrand._rand
+        return model_random_state is random_state
+
+    def _add_real_detection(self, track, state_vector):
+        detection = TrueDetection(
+            state_vector,
+            timestamp=track[-1].timestamp,
+            groundtruth_path=track,
+            measurement_model=self.measurement_model)
+        detection.clutter = False
+        self.real_detections.add(detection)
 
     @BufferedGenerator.generator_method
     def detections_gen(self, random_state=None):
@@ -247,26 +267,47 @@ class SimpleDetectionSimulator(DetectionSimulator):
             self.real_detections.clear()
             self.clutter_detections.clear()
             random_state = random_state if random_state is not None else self.random_state
-            for track in tracks:
-                self.index = track[-1].metadata.get("index")
-                if random_state.rand() < self.detection_probability:
-                    detection = TrueDetection(
-                        self.measurement_model.function(track[-1], noise=True),
-                        timestamp=track[-1].timestamp,
-                        groundtruth_path=track,
-                        measurement_model=self.measurement_model)
-                    detection.clutter = False
-                    self.real_detections.add(detection)
+
+            tracks = list(tracks)
+            if self._shares_random_state(random_state):
+                # Detection decisions and measurement noise drawn in turn for each truth, so
+                # draws from the shared random state are in the same order
+                for track in tracks:
+                    self.index = track[-1].metadata.get("index")
+                    if random_state.rand() < self.detection_probability:
+                        self._add_real_detection(
+                            track, self.measurement_model.function(track[-1], noise=True))
+            else:
+                # Draw detection decisions for all truths at once
+                detection_probabilities = []
+                for track in tracks:
+                    self.index = track[-1].metadata.get("index")
+                    detection_probabilities.append(self.detection_probability)
+                detected = random_state.rand(len(tracks)) < np.array(
+                    detection_probabilities, dtype=float)
+                detected_tracks = [track for track, track_detected in zip(tracks, detected)
+                                   if track_detected]
+
+                if detected_tracks:
+                    # Measure all detected truths (with noise) in one call
+                    measurement_vectors = self.measurement_model.function(
+                        State(StateVectors(
+                            [track[-1].state_vector for track in detected_tracks])),
+                        noise=True)
+                    for index, track in enumerate(detected_tracks):
+                        self._add_real_detection(
+                            track, StateVector(measurement_vectors[:, index]))
 
             # generate clutter
-            for _ in range(random_state.poisson(self.clutter_rate)):
-                detection = Clutter(
-                    random_state.rand(self.measurement_model.ndim_meas, 1) *
-                    np.diff(self.meas_range) + self.meas_range[:, :1],
+            n_clutter = random_state.poisson(self.clutter_rate)
+            clutter_vectors = (random_state.rand(n_clutter, self.measurement_model.ndim_meas).T
+                               * np.diff(self.meas_range) + self.meas_range[:, :1])
+            clutter_vectors = clutter_vectors[:, self._in_state_space(clutter_vectors)]
+            for index in range(clutter_vectors.shape[1]):
+                self.clutter_detections.add(Clutter(
+                    clutter_vectors[:, index:index+1],
                     timestamp=time,
-                    measurement_model=self.measurement_model)
-                if self.__in_state_space(detection):
-                    self.clutter_detections.add(detection)
+                    measurement_model=self.measurement_model))
 
             yield time, self.real_detections | self.clutter_detections
 
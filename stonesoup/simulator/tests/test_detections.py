@@ -3,6 +3,8 @@ import datetime
 import pytest
 import numpy as np
 
+from ...models.measurement.linear import LinearGaussian
+from ...types.groundtruth import GroundTruthPath, GroundTruthState
 from ...types.state import State
 from ..simple import SimpleDetectionSimulator, SwitchDetectionSimulator, \
     SingleTargetGroundTruthSimulator, SwitchOneTargetGroundTruthSimulator
@@ -110,3 +112,64 @@ def test_switch_detection_simulator(
     # of detection at some point.
     assert len(total_detections - clutter_detections) \
         < len(test_detections - test_clutter_detections)
+
+
+def test_simple_detection_simulator_multiple_targets(measurement_model):
+    time = datetime.datetime.now()
+    paths = {GroundTruthPath([GroundTruthState([[i], [1], [2*i], [1]], timestamp=time)])
+             for i in range(10)}
+    meas_range = np.array([[-1, 1], [-1, 1]]) * 5000
+    simulate_detections = SimpleDetectionSimulator(
+        [(time, paths)], measurement_model, meas_range, detection_probability=1,
+        clutter_rate=50, seed=1)
+
+    for _, detections in simulate_detections:
+        real_detections = simulate_detections.real_detections
+        clutter_detections = simulate_detections.clutter_detections
+        assert detections == real_detections | clutter_detections
+
+    # Each truth detected once, measured from its own state
+    assert len(real_detections) == len(paths)
+    assert {detection.groundtruth_path for detection in real_detections} == paths
+    for detection in real_detections:
+        assert np.array_equal(
+            detection.state_vector,
+            measurement_model.function(detection.groundtruth_path[-1], noise=False))
+        assert detection.measurement_model is measurement_model
+
+    assert clutter_detections
+    for clutter in clutter_detections:
+        assert (meas_range[:, 0] <= clutter.state_vector.ravel()).all()
+        assert (meas_range[:, 1] >= clutter.state_vector.ravel()).all()
+
+
+def test_simple_detection_simulator_global_random_state():
+    time = datetime.datetime.now()
+    paths = {GroundTruthPath([GroundTruthState([[i], [1], [2*i], [1]], timestamp=time)])
+             for i in range(10)}
+    measurement_model = LinearGaussian(4, [0, 2], np.eye(2))
+    meas_range = np.array([[-1, 1], [-1, 1]]) * 5000
+    simulate_detections = SimpleDetectionSimulator(
+        [(time, paths)], measurement_model, meas_range, detection_probability=0.5,
+        clutter_rate=5)
+
+    np.random.seed(1)
+    for _ in simulate_detections:
+        pass
+
+    # Simulator and model share global random state, so draws made in turn for each truth
+    np.random.seed(1)
+    expected = {}
+    for path in paths:
+        if np.random.rand() < 0.5:
+            expected[path] = measurement_model.function(path[-1], noise=True)
+    assert len(simulate_detections.real_detections) == len(expected)
+    for detection in simulate_detections.real_detections:
+        assert np.array_equal(detection.state_vector, expected[detection.groundtruth_path])
+    n_clutter = np.random.poisson(5)
+    assert len(simulate_detections.clutter_detections) == n_clutter
+    expected_clutter = {
+        tuple((np.random.rand(2, 1) * np.diff(meas_range) + meas_range[:, :1]).ravel())
+        for _ in range(n_clutter)}
+    assert {tuple(clutter.state_vector.ravel())
+            for clutter in simulate_detections.clutter_detections} == expected_clutter
@@ -0,0 +1,68 @@
+import datetime
+import pickle
+
+import numpy as np
+
+from stonesoup.base import Base
+from stonesoup.cache import ScanCache, cache_method
+
+
+class Component(Base):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    @cache_method
+    def method(self, value, timestamp=None, array=None):
+        self.calls += 1
+        return object()
+
+
+def test_instance_cache():
+    component = Component()
+    value = object()
+    timestamp = datetime.datetime(2020, 1, 1)
+
+    result = component.method(value, timestamp=timestamp)
+    assert component.method(value, timestamp=timestamp) is result
+    # Equal timestamp, different instance
+    assert component.method(value, timestamp=datetime.datetime(2020, 1, 1)) is result
+    assert component.method(object(), timestamp=timestamp) is not result
+    assert component.calls == 2
+
+    # Arrays keyed on identity, so no hashing
+    array = np.array([1, 2])
+    result = component.method(value, array=array)
+    assert component.method(value, array=array) is result
+    assert component.method(value, array=array.copy()) is not result
+
+    assert component._instance_cache.capacity == 128
+
+
+def test_scan_cache():
+    cache = ScanCache(capacity=2)
+    component = Component()
+    values = [object() for _ in range(3)]
+
+    with cache.scan():
+        results = [component.method(value) for value in values]
+        assert len(cache) == 2  # First evicted
+        assert component.method(values[2]) is results[2]
+        assert component.method(values[1]) is results[1]
+        assert component.method(values[0]) is not results[0]
+        assert cache.cache_info() == (2, 4, 2, 2)
+
+    # Cleared at end of scan, and not used outside
+    assert len(cache) == 0
+    component.method(values[0])
+    assert cache.cache_info() == (2, 4, 2, 0)
+    assert len(component._instance_cache) == 1
+
+
+def test_scan_cache_pickle():
+    cache = ScanCache()
+    component = Component()
+    with cache.scan():
+        component.method(object())
+        assert len(pickle.loads(pickle.dumps(cache))) == 0
+        assert len(cache) == 1
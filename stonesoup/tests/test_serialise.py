@@ -178,6 +178,23 @@ def test_deque(base, serialised_file):
     assert new_instance == instance
 
 
+def test_columnar_states(serialised_file):
+    from stonesoup.types.columnar import ColumnarStates
+    from stonesoup.types.state import GaussianState
+
+    instance = ColumnarStates([GaussianState([[1], [2]], np.eye(2)),
+                               GaussianState([[3], [4]], np.eye(2)*2)])
+
+    serialised_str = serialised_file.dumps(instance)
+
+    new_instance = serialised_file.load(serialised_str)
+    assert isinstance(new_instance, ColumnarStates)
+    assert len(new_instance) == 2
+    for state, new_state in zip(instance, new_instance):
+        assert np.array_equal(state.state_vector, new_state.state_vector)
+        assert np.array_equal(state.covar, new_state.covar)
+
+
 def test_path(serialised_file):
     import pathlib
     import tempfile
@@ -1,5 +1,6 @@
 from .base import Tracker
 from ..base import Property
+from ..cache import ScanCache
 from ..reader import DetectionReader
 from ..types.state import TaggedWeightedGaussianState
 from ..types.mixture import GaussianMixture
@@ -33,9 +34,15 @@ class PointProcessMultiTargetTracker(Tracker):
             "births per timestep (Poission distributed). "
             "The tag should be "
             ":attr:`TaggedWeightedGaussianState.BIRTH`")
+    cache: ScanCache = Property(
+        default=None,
+        doc="Cache of predictions and measurement predictions, which is scoped to each step of "
+            "the tracker. Default `None`, where a new :class:`~.ScanCache` is created.")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        if self.cache is None:
+            self.cache = ScanCache()
         self.target_tracks = dict()
         self.gaussian_mixture = GaussianMixture()
 
@@ -79,23 +86,24 @@ class PointProcessMultiTargetTracker(Tracker):
 
     def __next__(self):
         time, detections = next(self.detector_iter)
-        # Add birth component
-        self.birth_component.timestamp = time
-        self.gaussian_mixture.append(self.birth_component)
-        # Perform GM Prediction and generate hypotheses
-        hypotheses = self.hypothesiser.hypothesise(
-                    self.gaussian_mixture.components,
-                    detections,
-                    time
-                    )
-        # Perform GM Update
-        self.gaussian_mixture = self.updater.update(hypotheses)
-        # Reduce mixture - Pruning and Merging
-        self.gaussian_mixture.components = \
-            self.reducer.reduce(self.gaussian_mixture.components)
-        # Update the tracks
-        self.update_tracks()
-        self.end_tracks()
+        with self.cache.scan():
+            # Add birth component
+            self.birth_component.timestamp = time
+            self.gaussian_mixture.append(self.birth_component)
+            # Perform GM Prediction and generate hypotheses
+            hypotheses = self.hypothesiser.hypothesise(
+                        self.gaussian_mixture.components,
+                        detections,
+                        time
+                        )
+            # Perform GM Update
+            self.gaussian_mixture = self.updater.update(hypotheses)
+            # Reduce mixture - Pruning and Merging
+            self.gaussian_mixture.components = \
+                self.reducer.reduce(self.gaussian_mixture.components)
+            # Update the tracks
+            self.update_tracks()
+            self.end_tracks()
         return time, self.tracks
 
     def end_tracks(self):
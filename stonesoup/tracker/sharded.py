@@ -0,0 +1,288 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence, Union
+
+import numpy as np
+
+from .simple import MultiTargetTracker
+from ..base import Property
+from ..cache import ScanCache
+from ..models.base import LinearModel, ReversibleModel
+from ..types.track import Track
+
+_worker_components = None
+
+
+def _init_worker(data_associator, updater):
+    global _worker_components
+    _worker_components = data_associator, updater
+
+
+def _worker_process_shard(tracks, detections, timestamp):
+    data_associator, updater = _worker_components
+    with ScanCache().scan():
+        return _process_shard(data_associator, updater, tracks, detections, timestamp)
+
+
+def _process_shard(data_associator, updater, tracks, detections, timestamp):
+    """Associate and update tracks of a single shard
+
+    Parameters
+    ----------
+    data_associator : :class:`~.DataAssociator`
+    updater : :class:`~.Updater`
+    tracks : list of :class:`~.Track`
+        Tracks of the shard
+    detections : list of :class:`~.Detection`
+        Detections within the (overlapping) extent of the shard
+    timestamp : datetime.datetime
+        Time of the detections
+
+    Returns
+    -------
+    : list of tuple
+        For each track, in order, the new state and index (within `detections`) of the
+        associated detection, or `None` if no detection associated
+    """
+    detection_indexes = {id(detection): index for index, detection in enumerate(detections)}
+    associations = data_associator.associate(set(tracks), set(detections), timestamp)
+    results = []
+    for track in tracks:
+        hypothesis = associations[track]
+        if hypothesis:
+            results.append(
+                (updater.update(hypothesis), detection_indexes[id(hypothesis.measurement)]))
+        else:
+            results.append((hypothesis.prediction, None))
+    return results
+
+
+class ShardedMultiTargetTracker(MultiTargetTracker):
+    """A multi target tracker which shards the surveillance area across processes.
+
+    This works as :class:`~.MultiTargetTracker`, but with the tracks and detections
+    partitioned by a regular grid over the :attr:`position_mapping` dimensions of the state
+    space, such that spatially independent regions can be associated and updated in
+    parallel, in a pool of :attr:`processes` (where set). Each track is owned by the grid cell
+    (shard) of its current position. Each shard receives the detections within its cell extended
+    by :attr:`overlap`, such that tracks near the edge of a shard can be associated to detections
+    across the border.
+
+    Where a detection is associated to tracks in more than one shard, those shards' results
+    are discarded, and their tracks and detections are associated and updated together in
+    this process. Shards are processed, and results merged, in order of their grid cell, so
+    results do not depend on the number of processes. Deletion and initiation are carried
+    out in this process, once all shards are complete.
+
+    Only the latest state of each track is sent to the workers, and workers use copies of
+    the :attr:`data_associator` and :attr:`updater` made on start up of the pool. These
+    components shouldn't therefore rely on state held from one step to the next, or on the
+    full history of tracks.
+
+    Positions of detections are the state space equivalent of their measurement: via the
+    (pseudo) inverse of the measurement matrix for :class:`~.LinearModel` measurement
+    models, or :meth:`~.ReversibleModel.inverse_function` otherwise.
+    """
+    position_mapping: Sequence[int] = Property(
+        doc="Mapping of the position dimensions of the state space, which are partitioned "
+            "into shards")
+    shard_size: Union[float, Sequence[float]] = Property(
+        doc="Size of each shard's grid cell, either a single value for all position "
+            "dimensions or one value per dimension")
+    overlap: float = Property(
+        default=0,
+        doc="Distance beyond its grid cell that a shard receives detections from. This should "
+            "cover how far a target may move between steps, plus the extent of any gate used "
+            "by the :attr:`data_associator`. Default 0.")
+    processes: int = Property(
+        default=0,
+        doc="Number of worker processes. `None` will use the number of CPUs. Default `0`, "
+            "where the shards are processed sequentially in this process (as with `1`).")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._executor = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        return state
+
+    def __iter__(self):
+        self.close()
+        return super().__iter__()
+
+    def __del__(self):
+        if getattr(self, '_executor', None) is not None:
+            self.close()
+
+    def close(self):
+        """Shut down the pool of worker processes, if started
+
+        This is called on completion of tracking, and when the tracker is garbage collected.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _shard_indexes(self, positions):
+        return np.floor(positions / np.asarray(self.shard_size, dtype=np.float64)).astype(int)
+
+    def _detection_positions(self, detections):
+        positions = []
+        for detection in detections:
+            measurement_model = detection.measurement_model
+            if measurement_model is None:
+                measurement_model = self.updater.measurement_model
+            if isinstance(measurement_model, LinearModel):
+                state_vector = np.linalg.pinv(measurement_model.matrix()) \
+                    @ np.asarray(detection.state_vector, dtype=np.float64)
+            elif isinstance(measurement_model, ReversibleModel):
+                state_vector = measurement_model.inverse_function(detection)
+            else:
+                raise ValueError(
+                    f"Can't determine position of detection with measurement model "
+                    f"{type(measurement_model).__name__}")
+            positions.append(np.asarray(state_vector, dtype=np.float64)[self.position_mapping, 0])
+        return np.array(positions, dtype=np.float64).reshape(-1, len(self.position_mapping))
+
+    def _shards(self, tracks, detections):
+        """Partition tracks and detections by grid cell, in order of cell"""
+        track_positions = np.array(
+            [np.asarray(track.state_vector, dtype=np.float64)[self.position_mapping, 0]
+             for track in tracks]).reshape(-1, len(self.position_mapping))
+        shards = {}
+        for track_index, cell in enumerate(map(tuple, self._shard_indexes(track_positions))):
+            shards.setdefault(cell, ([], []))[0].append(track_index)
+
+        detection_positions = self._detection_positions(detections)
+        lower_cells = self._shard_indexes(detection_positions - self.overlap)
+        upper_cells = self._shard_indexes(detection_positions + self.overlap)
+        for detection_index, (lower, upper) in enumerate(zip(lower_cells, upper_cells)):
+            for cell in itertools.product(*(
+                    range(low, up + 1) for low, up in zip(lower, upper))):
+                try:
+                    shards[cell][1].append(detection_index)
+                except KeyError:  # No tracks in this shard
+                    pass
+        return [shards[cell] for cell in sorted(shards)]
+
+    def _process_shards(self, shards, tracks, detections, time):
+        processes = self.processes if self.processes is not None else os.cpu_count()
+        if processes > 1 and len(shards) > 1:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    processes, initializer=_init_worker,
+                    initargs=(self.data_associator, self.updater))
+            # Only latest state of each track sent to workers
+            shard_tracks = [
+                [Track([tracks[index].state], id=tracks[index].id) for index in track_indexes]
+                for track_indexes, _ in shards]
+            shard_detections = [
+                [detections[index] for index in detection_indexes]
+                for _, detection_indexes in shards]
+            return list(self._executor.map(
+                _worker_process_shard, shard_tracks, shard_detections,
+                itertools.repeat(time)))
+        else:
+            return [
+                _process_shard(
+                    self.data_associator, self.updater,
+                    [tracks[index] for index in track_indexes],
+                    [detections[index] for index in detection_indexes],
+                    time)
+                for track_indexes, detection_indexes in shards]
+
+    @staticmethod
+    def _shard_results(track_indexes, detection_indexes, shard_result):
+        """Map shard result to indexes of all tracks and detections"""
+        return [(track_index, state, detection_indexes[index] if index is not None else None)
+                for track_index, (state, index) in zip(track_indexes, shard_result)]
+
+    def _merge_shards(self, shards, results, conflicts, tracks, detections, time):
+        """Merge conflicting shards, processing merged shards in this process"""
+        groups = list(range(len(shards)))  # Union find of shards
+
+        def find(index):
+            while groups[index] != index:
+                groups[index] = index = groups[groups[index]]
+            return index
+
+        for first, *others in conflicts:
+            for other in others:
+                groups[find(other)] = find(first)
+
+        merged_shards = {}
+        for shard_index in range(len(shards)):
+            merged_shards.setdefault(find(shard_index), []).append(shard_index)
+
+        new_shards, new_results = [], []
+        for shard_indexes in merged_shards.values():
+            if len(shard_indexes) == 1:
+                new_shards.append(shards[shard_indexes[0]])
+                new_results.append(results[shard_indexes[0]])
+                continue
+            track_indexes = [index
+                             for shard_index in shard_indexes
+                             for index in shards[shard_index][0]]
+            detection_indexes = sorted({index
+                                        for shard_index in shard_indexes
+                                        for index in shards[shard_index][1]})
+            shard_result = _process_shard(
+                self.data_associator, self.updater,
+                [tracks[index] for index in track_indexes],
+                [detections[index] for index in detection_indexes],
+                time)
+            new_shards.append((track_indexes, detection_indexes))
+            new_results.append(
+                self._shard_results(track_indexes, detection_indexes, shard_result))
+        return new_shards, new_results
+
+    def __next__(self):
+        try:
+            time, detections = next(self.detector_iter)
+        except StopIteration:
+            self.close()
+            raise
+        with self.cache.scan():
+            tracks = list(self.tracks)
+            detections_list = list(detections)
+            shards = self._shards(tracks, detections_list)
+            shard_results = self._process_shards(shards, tracks, detections_list, time)
+
+            # Map results back to tracks and detections of this process
+            results = [
+                self._shard_results(track_indexes, detection_indexes, shard_result)
+                for (track_indexes, detection_indexes), shard_result in zip(shards, shard_results)]
+
+            # Shards which associated the same detection are merged and processed again,
+            # until no detection is associated in more than one (merged) shard
+            while True:
+                detection_shards = {}
+                for shard_index, shard_result in enumerate(results):
+                    for *_, detection_index in shard_result:
+                        if detection_index is not None:
+                            detection_shards.setdefault(detection_index, set()).add(shard_index)
+                conflicts = [sorted(shard_indexes)
+                             for shard_indexes in detection_shards.values()
+                             if len(shard_indexes) > 1]
+                if not conflicts:
+                    break
+                shards, results = self._merge_shards(
+                    shards, results, conflicts, tracks, detections_list, time)
+
+            associated_detections = set()
+            for track_index, state, detection_index in itertools.chain.from_iterable(results):
+                if detection_index is not None:
+                    detection = detections_list[detection_index]
+                    # Link to detection in this process, rather than worker's copy
+                    state.hypothesis.measurement = detection
+                    associated_detections.add(detection)
+                tracks[track_index].append(state)
+
+            self._tracks -= self.deleter.delete_tracks(self.tracks)
+            self._tracks |= self.initiator.initiate(
+                detections - associated_detections, time)
+
+        return time, self.tracks
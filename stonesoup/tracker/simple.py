@@ -2,6 +2,7 @@ import numpy as np
 
 from .base import Tracker
 from ..base import Property
+from ..cache import ScanCache
 from ..dataassociator import DataAssociator
 from ..deleter import Deleter
 from ..reader import DetectionReader
@@ -40,9 +41,15 @@ class SingleTargetTracker(Tracker):
     data_associator: DataAssociator = Property(
         doc="Association algorithm to pair predictions to detections")
     updater: Updater = Property(doc="Updater used to update the track object to the new state.")
+    cache: ScanCache = Property(
+        default=None,
+        doc="Cache of predictions and measurement predictions, which is scoped to each step of "
+            "the tracker. Default `None`, where a new :class:`~.ScanCache` is created.")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        if self.cache is None:
+            self.cache = ScanCache()
         self._track = None
 
     @property
@@ -55,22 +62,23 @@ class SingleTargetTracker(Tracker):
 
     def __next__(self):
         time, detections = next(self.detector_iter)
-        if self._track is not None:
-            associations = self.data_associator.associate(
-                self.tracks, detections, time)
-            if associations[self._track]:
-                state_post = self.updater.update(associations[self._track])
-                self._track.append(state_post)
-            else:
-                self._track.append(
-                    associations[self._track].prediction)
-
-        if self._track is None or self.deleter.delete_tracks(self.tracks):
-            new_tracks = self.initiator.initiate(detections, time)
-            if new_tracks:
-                self._track = new_tracks.pop()
-            else:
-                self._track = None
+        with self.cache.scan():
+            if self._track is not None:
+                associations = self.data_associator.associate(
+                    self.tracks, detections, time)
+                if associations[self._track]:
+                    state_post = self.updater.update(associations[self._track])
+                    self._track.append(state_post)
+                else:
+                    self._track.append(
+                        associations[self._track].prediction)
+
+            if self._track is None or self.deleter.delete_tracks(self.tracks):
+                new_tracks = self.initiator.initiate(detections, time)
+                if new_tracks:
+                    self._track = new_tracks.pop()
+                else:
+                    self._track = None
 
         return time, self.tracks
 
@@ -98,9 +106,15 @@ class SingleTargetMixtureTracker(Tracker):
     data_associator: DataAssociator = Property(
         doc="Association algorithm to pair predictions to detections")
     updater: Updater = Property(doc="Updater used to update the track object to the new state.")
+    cache: ScanCache = Property(
+        default=None,
+        doc="Cache of predictions and measurement predictions, which is scoped to each step of "
+            "the tracker. Default `None`, where a new :class:`~.ScanCache` is created.")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        if self.cache is None:
+            self.cache = ScanCache()
         self._track = None
 
     @property
@@ -113,66 +127,67 @@ class SingleTargetMixtureTracker(Tracker):
 
     def __next__(self):
         time, detections = next(self.detector_iter)
-
-        if self._track is not None:
-            associations = self.data_associator.associate(
-                self.tracks, detections, time)
-
-            unassociated_detections = set(detections)
-            for track, multihypothesis in associations.items():
-
-                # calculate the Track's state as a Gaussian Mixture of
-                # its possible associations with each detection, then
-                # reduce the Mixture to a single Gaussian State
-                posterior_states = []
-                posterior_state_weights = []
-                for hypothesis in multihypothesis:
-                    if not hypothesis:
-                        posterior_states.append(hypothesis.prediction)
+        with self.cache.scan():
+            if self._track is not None:
+                associations = self.data_associator.associate(
+                    self.tracks, detections, time)
+
+                unassociated_detections = set(detections)
+                for track, multihypothesis in associations.items():
+
+                    # calculate the Track's state as a Gaussian Mixture of
+                    # its possible associations with each detection, then
+                    # reduce the Mixture to a single Gaussian State
+                    posterior_states = []
+                    posterior_state_weights = []
+                    for hypothesis in multihypothesis:
+                        if not hypothesis:
+                            posterior_states.append(hypothesis.prediction)
+                        else:
+                            posterior_states.append(
+                                self.updater.update(hypothesis))
+                        posterior_state_weights.append(
+                            hypothesis.probability)
+
+                    means = StateVectors([state.state_vector for state in posterior_states])
+                    covars = np.stack([state.covar for state in posterior_states], axis=2)
+                    weights = np.asarray(posterior_state_weights)
+
+                    # Recuce the mixture of states to one posterior estimate Gaussian
+                    post_mean, post_covar = gm_reduce_single(means, covars, weights)
+
+                    missed_detection_weight = next(
+                        hyp.weight for hyp in multihypothesis if not hyp)
+
+                    # Check if at least one reasonable measurement...
+                    if any(hypothesis.weight > missed_detection_weight
+                           for hypothesis in multihypothesis):
+                        # ...and if so use update type
+                        track.append(GaussianStateUpdate(
+                            post_mean, post_covar,
+                            multihypothesis,
+                            multihypothesis[0].measurement.timestamp))
                     else:
-                        posterior_states.append(
-                            self.updater.update(hypothesis))
-                    posterior_state_weights.append(
-                        hypothesis.probability)
-
-                means = StateVectors([state.state_vector for state in posterior_states])
-                covars = np.stack([state.covar for state in posterior_states], axis=2)
-                weights = np.asarray(posterior_state_weights)
-
-                # Recuce the mixture of states to one posterior estimate Gaussian
-                post_mean, post_covar = gm_reduce_single(means, covars, weights)
-
-                missed_detection_weight = next(hyp.weight for hyp in multihypothesis if not hyp)
-
-                # Check if at least one reasonable measurement...
-                if any(hypothesis.weight > missed_detection_weight
-                       for hypothesis in multihypothesis):
-                    # ...and if so use update type
-                    track.append(GaussianStateUpdate(
-                        post_mean, post_covar,
-                        multihypothesis,
-                        multihypothesis[0].measurement.timestamp))
+                        # ...and if not, treat as a prediction
+                        track.append(GaussianStatePrediction(
+                            post_mean, post_covar,
+                            multihypothesis[0].prediction.timestamp))
+
+                    # any detections in multihypothesis that had an
+                    # association score (weight) lower than or equal to the
+                    # association score of "MissedDetection" is considered
+                    # unassociated - candidate for initiating a new Track
+                    for hyp in multihypothesis:
+                        if hyp.weight > missed_detection_weight:
+                            if hyp.measurement in unassociated_detections:
+                                unassociated_detections.remove(hyp.measurement)
+
+            if self._track is None or self.deleter.delete_tracks(self.tracks):
+                new_tracks = self.initiator.initiate(detections, time)
+                if new_tracks:
+                    self._track = new_tracks.pop()
                 else:
-                    # ...and if not, treat as a prediction
-                    track.append(GaussianStatePrediction(
-                        post_mean, post_covar,
-                        multihypothesis[0].prediction.timestamp))
-
-                # any detections in multihypothesis that had an
-                # association score (weight) lower than or equal to the
-                # association score of "MissedDetection" is considered
-                # unassociated - candidate for initiating a new Track
-                for hyp in multihypothesis:
-                    if hyp.weight > missed_detection_weight:
-                        if hyp.measurement in unassociated_detections:
-                            unassociated_detections.remove(hyp.measurement)
-
-        if self._track is None or self.deleter.delete_tracks(self.tracks):
-            new_tracks = self.initiator.initiate(detections, time)
-            if new_tracks:
-                self._track = new_tracks.pop()
-            else:
-                self._track = None
+                    self._track = None
 
         return time, self.tracks
 
@@ -197,9 +212,15 @@ class MultiTargetTracker(Tracker):
     data_associator: DataAssociator = Property(
         doc="Association algorithm to pair predictions to detections")
     updater: Updater = Property(doc="Updater used to update the track object to the new state.")
+    cache: ScanCache = Property(
+        default=None,
+        doc="Cache of predictions and measurement predictions, which is scoped to each step of "
+            "the tracker. Default `None`, where a new :class:`~.ScanCache` is created.")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        if self.cache is None:
+            self.cache = ScanCache()
         self._tracks = set()
 
     @property
@@ -212,21 +233,21 @@ class MultiTargetTracker(Tracker):
 
     def __next__(self):
         time, detections = next(self.detector_iter)
+        with self.cache.scan():
+            associations = self.data_associator.associate(
+                self.tracks, detections, time)
+            associated_detections = set()
+            for track, hypothesis in associations.items():
+                if hypothesis:
+                    state_post = self.updater.update(hypothesis)
+                    track.append(state_post)
+                    associated_detections.add(hypothesis.measurement)
+                else:
+                    track.append(hypothesis.prediction)
 
-        associations = self.data_associator.associate(
-            self.tracks, detections, time)
-        associated_detections = set()
-        for track, hypothesis in associations.items():
-            if hypothesis:
-                state_post = self.updater.update(hypothesis)
-                track.append(state_post)
-                associated_detections.add(hypothesis.measurement)
-            else:
-                track.append(hypothesis.prediction)
-
-        self._tracks -= self.deleter.delete_tracks(self.tracks)
-        self._tracks |= self.initiator.initiate(
-            detections - associated_detections, time)
+            self._tracks -= self.deleter.delete_tracks(self.tracks)
+            self._tracks |= self.initiator.initiate(
+                detections - associated_detections, time)
 
         return time, self.tracks
 
@@ -253,9 +274,15 @@ class MultiTargetMixtureTracker(Tracker):
     data_associator: DataAssociator = Property(
         doc="Association algorithm to pair predictions to detections")
     updater: Updater = Property(doc="Updater used to update the track object to the new state.")
+    cache: ScanCache = Property(
+        default=None,
+        doc="Cache of predictions and measurement predictions, which is scoped to each step of "
+            "the tracker. Default `None`, where a new :class:`~.ScanCache` is created.")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        if self.cache is None:
+            self.cache = ScanCache()
         self._tracks = set()
 
     @property
@@ -268,59 +295,59 @@ class MultiTargetMixtureTracker(Tracker):
 
     def __next__(self):
         time, detections = next(self.detector_iter)
+        with self.cache.scan():
+            associations = self.data_associator.associate(
+                self.tracks, detections, time)
+            unassociated_detections = set(detections)
+            for track, multihypothesis in associations.items():
+
+                # calculate each Track's state as a Gaussian Mixture of
+                # its possible associations with each detection, then
+                # reduce the Mixture to a single Gaussian State
+                posterior_states = []
+                posterior_state_weights = []
+                for hypothesis in multihypothesis:
+                    if not hypothesis:
+                        posterior_states.append(hypothesis.prediction)
+                    else:
+                        posterior_states.append(
+                            self.updater.update(hypothesis))
+                    posterior_state_weights.append(
+                        hypothesis.probability)
+
+                means = StateVectors([state.state_vector for state in posterior_states])
+                covars = np.stack([state.covar for state in posterior_states], axis=2)
+                weights = np.asarray(posterior_state_weights)
 
-        associations = self.data_associator.associate(
-            self.tracks, detections, time)
-        unassociated_detections = set(detections)
-        for track, multihypothesis in associations.items():
-
-            # calculate each Track's state as a Gaussian Mixture of
-            # its possible associations with each detection, then
-            # reduce the Mixture to a single Gaussian State
-            posterior_states = []
-            posterior_state_weights = []
-            for hypothesis in multihypothesis:
-                if not hypothesis:
-                    posterior_states.append(hypothesis.prediction)
+                post_mean, post_covar = gm_reduce_single(means, covars, weights)
+
+                missed_detection_weight = next(hyp.weight for hyp in multihypothesis if not hyp)
+
+                # Check if at least one reasonable measurement...
+                if any(hypothesis.weight > missed_detection_weight
+                       for hypothesis in multihypothesis):
+                    # ...and if so use update type
+                    track.append(GaussianStateUpdate(
+                        post_mean, post_covar,
+                        multihypothesis,
+                        multihypothesis[0].measurement.timestamp))
                 else:
-                    posterior_states.append(
-                        self.updater.update(hypothesis))
-                posterior_state_weights.append(
-                    hypothesis.probability)
-
-            means = StateVectors([state.state_vector for state in posterior_states])
-            covars = np.stack([state.covar for state in posterior_states], axis=2)
-            weights = np.asarray(posterior_state_weights)
-
-            post_mean, post_covar = gm_reduce_single(means, covars, weights)
-
-            missed_detection_weight = next(hyp.weight for hyp in multihypothesis if not hyp)
-
-            # Check if at least one reasonable measurement...
-            if any(hypothesis.weight > missed_detection_weight
-                   for hypothesis in multihypothesis):
-                # ...and if so use update type
-                track.append(GaussianStateUpdate(
-                    post_mean, post_covar,
-                    multihypothesis,
-                    multihypothesis[0].measurement.timestamp))
-            else:
-                # ...and if not, treat as a prediction
-                track.append(GaussianStatePrediction(
-                    post_mean, post_covar,
-                    multihypothesis[0].prediction.timestamp))
-
-            # any detections in multihypothesis that had an
-            # association score (weight) lower than or equal to the
-            # association score of "MissedDetection" is considered
-            # unassociated - candidate for initiating a new Track
-            for hyp in multihypothesis:
-                if hyp.weight > missed_detection_weight:
-                    if hyp.measurement in unassociated_detections:
-                        unassociated_detections.remove(hyp.measurement)
-
-        self._tracks -= self.deleter.delete_tracks(self.tracks)
-        self._tracks |= self.initiator.initiate(
-            unassociated_detections, time)
+                    # ...and if not, treat as a prediction
+                    track.append(GaussianStatePrediction(
+                        post_mean, post_covar,
+                        multihypothesis[0].prediction.timestamp))
+
+                # any detections in multihypothesis that had an
+                # association score (weight) lower than or equal to the
+                # association score of "MissedDetection" is considered
+                # unassociated - candidate for initiating a new Track
+                for hyp in multihypothesis:
+                    if hyp.weight > missed_detection_weight:
+                        if hyp.measurement in unassociated_detections:
+                            unassociated_detections.remove(hyp.measurement)
+
+            self._tracks -= self.deleter.delete_tracks(self.tracks)
+            self._tracks |= self.initiator.initiate(
+                unassociated_detections, time)
 
         return time, self.tracks
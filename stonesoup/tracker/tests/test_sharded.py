@@ -0,0 +1,73 @@
+import gc
+
+import pytest
+
+from ...dataassociator.neighbour import GNNWith2DAssignment
+from ...hypothesiser.distance import DistanceHypothesiser
+from ...measures import Mahalanobis
+from ...models.measurement.linear import LinearGaussian
+from ...models.transition.linear import RandomWalk
+from ...predictor.kalman import KalmanPredictor
+from ...updater.kalman import KalmanUpdater
+from ..sharded import ShardedMultiTargetTracker
+from ..simple import MultiTargetTracker
+
+
+@pytest.mark.parametrize('processes', [0, 2])
+def test_sharded_multi_target_tracker(initiator, deleter, detector, processes):
+    predictor = KalmanPredictor(RandomWalk(1))
+    updater = KalmanUpdater(LinearGaussian(1, [0], [[2]]))
+    data_associator = GNNWith2DAssignment(
+        DistanceHypothesiser(predictor, updater, Mahalanobis(), 3))
+
+    tracker = MultiTargetTracker(
+        initiator, deleter, detector, data_associator, updater)
+    # Targets cross shard borders as they move
+    sharded_tracker = ShardedMultiTargetTracker(
+        initiator, deleter, detector, data_associator, updater,
+        position_mapping=[0], shard_size=7, overlap=8, processes=processes)
+
+    for (time, tracks), (sharded_time, sharded_tracks) in zip(tracker, sharded_tracker):
+        assert time == sharded_time
+        assert sorted(
+            tuple(float(state.state_vector[0, 0]) for state in track) for track in tracks
+        ) == pytest.approx(sorted(
+            tuple(float(state.state_vector[0, 0]) for state in track) for track in sharded_tracks
+        ))
+        for track in sharded_tracks:
+            # Associated detections are those of this process
+            hypothesis = getattr(track.state, 'hypothesis', None)
+            if hypothesis:
+                assert hypothesis.measurement in detector.current[1]
+    with pytest.raises(StopIteration):
+        next(sharded_tracker)
+    assert sharded_tracker._executor is None  # Pool shut down on completion
+
+
+def test_sharded_multi_target_tracker_pool(initiator, deleter, detector):
+    predictor = KalmanPredictor(RandomWalk(1))
+    updater = KalmanUpdater(LinearGaussian(1, [0], [[2]]))
+    data_associator = GNNWith2DAssignment(
+        DistanceHypothesiser(predictor, updater, Mahalanobis(), 3))
+
+    # Sequential by default
+    sharded_tracker = ShardedMultiTargetTracker(
+        initiator, deleter, detector, data_associator, updater,
+        position_mapping=[0], shard_size=7, overlap=8)
+    for _ in zip(range(3), sharded_tracker):
+        pass
+    assert sharded_tracker._executor is None
+
+    sharded_tracker = ShardedMultiTargetTracker(
+        initiator, deleter, detector, data_associator, updater,
+        position_mapping=[0], shard_size=7, overlap=8, processes=2)
+    for _ in zip(range(3), sharded_tracker):
+        pass
+    executor = sharded_tracker._executor
+    assert executor is not None
+
+    # Pool shut down when tracker garbage collected
+    del sharded_tracker
+    gc.collect()
+    with pytest.raises(RuntimeError):
+        executor.submit(int)
@@ -1,4 +1,13 @@
 import datetime
+
+from ...cache import ScanCache
+from ...dataassociator.neighbour import GNNWith2DAssignment
+from ...hypothesiser.distance import DistanceHypothesiser
+from ...measures import Mahalanobis
+from ...models.measurement.linear import LinearGaussian
+from ...models.transition.linear import RandomWalk
+from ...predictor.kalman import KalmanPredictor
+from ...updater.kalman import KalmanUpdater
 from ..simple import SingleTargetTracker, MultiTargetTracker, \
     MultiTargetMixtureTracker, SingleTargetMixtureTracker
 
@@ -92,3 +101,19 @@ def test_multi_target_mixture_tracker(
 
     assert max_tracks >= 3  # Should of had at least 3 tracks in single step
     assert len(total_tracks) >= 6  # Should of had at least 6 over all steps
+
+
+def test_multi_target_tracker_cache(initiator, deleter, detector):
+    predictor = KalmanPredictor(RandomWalk(1))
+    updater = KalmanUpdater(LinearGaussian(1, [0], [[2]]))
+    data_associator = GNNWith2DAssignment(
+        DistanceHypothesiser(predictor, updater, Mahalanobis(), 10))
+    cache = ScanCache(capacity=None)
+    tracker = MultiTargetTracker(
+        initiator, deleter, detector, data_associator, updater, cache)
+
+    for _ in tracker:
+        assert len(cache) == 0  # Cleared after each step
+
+    assert cache.hits > 0
+    assert cache.misses > 0
@@ -0,0 +1,202 @@
+import copy
+import functools
+import itertools
+import weakref
+from collections import abc
+
+import numpy as np
+
+from .array import StateVector, CovarianceMatrix
+
+_COLUMNS = ('state_vector', 'covar', 'timestamp')
+
+
+@functools.lru_cache(None)
+def _other_properties(state_type):
+    return tuple(name for name in state_type.properties if name not in _COLUMNS)
+
+
+class ColumnarStates(abc.MutableSequence):
+    """Columnar store of Gaussian states
+
+    A mutable sequence of states, which can be used in place of a :class:`list` for
+    :attr:`~.StateMutableSequence.states` (e.g. on a :class:`~.Track`), to reduce the memory used
+    per state. Rather than holding an object per state, the state vectors and covariance
+    matrices are held in preallocated (and grown as required) arrays, along with timestamps, the
+    state type and any other properties (e.g. :attr:`~.Update.hypothesis`) by reference.
+
+    States are only created when accessed, and are held weakly, such that the same state object is
+    returned whilst it is still referenced elsewhere (e.g. the state most recently appended).
+    States which can't be stored in columns (i.e. those without a covariance, or which differ in
+    dimension to the first state) are held as they are.
+
+    Note
+    ----
+    The :attr:`~.Prediction.prior` of predictions is not retained, as it would hold a reference
+    to the previous state. States shouldn't be modified in place once added to the sequence.
+    """
+
+    def __init__(self, states=None, capacity=16):
+        self._size = 0
+        self._ndim = None
+        self._means = np.empty((capacity, 0))
+        self._covars = np.empty((capacity, 0, 0))
+        self._timestamps = []
+        self._types = []  # None where state held as object
+        self._properties = []  # Other property values, or the state held as object
+        self._keys = []
+        self._key_counter = itertools.count()
+        self._states = weakref.WeakValueDictionary()
+        if states is not None:
+            self.extend(states)
+
+    @property
+    def ndim(self):
+        """Dimension of states held in columns, or `None` if no states yet stored in columns"""
+        return self._ndim
+
+    @property
+    def timestamps(self):
+        """Timestamps of all states in the sequence"""
+        return list(self._timestamps)
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self)!r})'
+
+    def __copy__(self):
+        inst = self.__class__.__new__(self.__class__)
+        inst.__dict__.update(self.__dict__)
+        inst._means = self._means[:self._size].copy()
+        inst._covars = self._covars[:self._size].copy()
+        for name in ('_timestamps', '_types', '_properties', '_keys'):
+            setattr(inst, name, copy.copy(getattr(self, name)))
+        inst._states = self._states.copy()
+        return inst
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_means'] = self._means[:self._size]
+        state['_covars'] = self._covars[:self._size]
+        state['_key_counter'] = next(self._key_counter)
+        del state['_states']
+        return state
+
+    def __setstate__(self, state):
+        state['_key_counter'] = itertools.count(state['_key_counter'])
+        self.__dict__.update(state)
+        self._states = weakref.WeakValueDictionary()
+
+    def _index(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('ColumnarStates index out of range')
+        return index
+
+    def _is_columnar(self, state):
+        properties = type(state).properties
+        if 'covar' not in properties or 'state_vector' not in properties:
+            return False
+        state_vector = state.state_vector
+        if not isinstance(state_vector, np.ndarray) or state_vector.dtype == object \
+                or state_vector.ndim != 2 or state_vector.shape[1] != 1:
+            return False
+        return self._ndim is None or state_vector.shape[0] == self._ndim
+
+    def _reserve(self, size):
+        capacity = self._means.shape[0]
+        if size <= capacity:
+            return
+        capacity = max(size, 2*capacity)
+        means = np.empty((capacity, self._means.shape[1]))
+        means[:self._size] = self._means[:self._size]
+        covars = np.empty((capacity, *self._covars.shape[1:]))
+        covars[:self._size] = self._covars[:self._size]
+        self._means, self._covars = means, covars
+
+    def _set_row(self, index, state):
+        if self._is_columnar(state):
+            if self._ndim is None:
+                self._ndim = state.state_vector.shape[0]
+                self._means = np.empty((self._means.shape[0], self._ndim))
+                self._covars = np.empty((self._covars.shape[0], self._ndim, self._ndim))
+            self._means[index] = state.state_vector[:, 0]
+            self._covars[index] = state.covar
+            state_type = type(state)
+            self._types[index] = state_type
+            self._properties[index] = tuple(
+                None if name == 'prior' else getattr(state, name)
+                for name in _other_properties(state_type))
+        else:
+            self._types[index] = None
+            self._properties[index] = state
+        self._timestamps[index] = state.timestamp
+        self._keys[index] = key = next(self._key_counter)
+        try:
+            self._states[key] = state
+        except TypeError:  # Not weak referencable
+            pass
+
+    def _materialise(self, index):
+        state_type = self._types[index]
+        if state_type is None:
+            return self._properties[index]
+        key = self._keys[index]
+        state = self._states.get(key)
+        if state is None:
+            state = state_type(
+                state_vector=self._means[index, :, np.newaxis].copy().view(StateVector),
+                covar=self._covars[index].copy().view(CovarianceMatrix),
+                timestamp=self._timestamps[index],
+                **dict(zip(_other_properties(state_type), self._properties[index])))
+            self._states[key] = state
+        return state
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._materialise(i) for i in range(*index.indices(self._size))]
+        return self._materialise(self._index(index))
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            states = list(self)
+            states[index] = value
+            self.clear()
+            self.extend(states)
+        else:
+            self._set_row(self._index(index), value)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            indices = range(*index.indices(self._size))
+        else:
+            indices = [self._index(index)]
+        self._means = np.delete(self._means, indices, axis=0)
+        self._covars = np.delete(self._covars, indices, axis=0)
+        for name in ('_timestamps', '_types', '_properties', '_keys'):
+            values = getattr(self, name)
+            for i in sorted(indices, reverse=True):
+                del values[i]
+        self._size -= len(indices)
+
+    def insert(self, index, value):
+        if index < 0:
+            index = max(index + self._size, 0)
+        index = min(index, self._size)
+        self._reserve(self._size + 1)
+        if index < self._size:
+            self._means[index+1:self._size+1] = self._means[index:self._size].copy()
+            self._covars[index+1:self._size+1] = self._covars[index:self._size].copy()
+        for name in ('_timestamps', '_types', '_properties', '_keys'):
+            getattr(self, name).insert(index, None)
+        self._size += 1
+        self._set_row(index, value)
+
+    def append(self, value):
+        self.insert(self._size, value)
+
+    def clear(self):
+        self.__init__(capacity=self._means.shape[0])
@@ -2,7 +2,7 @@ from collections.abc import Sequence
 import typing
 
 from .detection import MissedDetection
-from .numeric import Probability
+from .numeric import Probability, Probabilities
 from ..base import Property
 from ..types import Type
 from ..types.detection import Detection
@@ -104,12 +104,12 @@ class MultipleHypothesis(Type, Sequence):
             raise ValueError("MultipleHypothesis not composed of Probability"
                              " hypotheses!")
 
-        sum_weights = Probability.sum(
-            hypothesis.probability for hypothesis in self.single_hypotheses)
+        probabilities = Probabilities(
+            [hypothesis.probability for hypothesis in self.single_hypotheses])
 
-        for hypothesis in self.single_hypotheses:
-            hypothesis.probability =\
-                (hypothesis.probability * total_weight)/sum_weights
+        for hypothesis, probability in zip(
+                self.single_hypotheses, probabilities.normalise(total_weight)):
+            hypothesis.probability = probability
 
     def get_missed_detection_probability(self):
         for hypothesis in self.single_hypotheses:
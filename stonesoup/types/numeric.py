@@ -1,7 +1,19 @@
+import functools
 from math import log, log1p, exp, trunc, ceil, floor
 from numbers import Real, Integral
 
 import numpy as np
+from scipy.special import logsumexp
+
+
+def _defer_to_probabilities(method):
+    """Return `NotImplemented` for :class:`Probabilities`, so its reflected method is used"""
+    @functools.wraps(method)
+    def wrapper(self, other):
+        if isinstance(other, Probabilities):
+            return NotImplemented
+        return method(self, other)
+    return wrapper
 
 
 class Probability(Real):
@@ -49,31 +61,37 @@ class Probability(Real):
         else:
             return hash(value)
 
+    @_defer_to_probabilities
     def __eq__(self, other):
         if other < 0:
             return False
         return self.log_value == self._log(other)
 
+    @_defer_to_probabilities
     def __le__(self, other):
         if other < 0:
             return False
         return self.log_value <= self._log(other)
 
+    @_defer_to_probabilities
     def __lt__(self, other):
         if other < 0:
             return False
         return self.log_value < self._log(other)
 
+    @_defer_to_probabilities
     def __ge__(self, other):
         if other < 0:
             return True
         return self.log_value >= self._log(other)
 
+    @_defer_to_probabilities
     def __gt__(self, other):
         if other < 0:
             return True
         return self.log_value > self._log(other)
 
+    @_defer_to_probabilities
     def __add__(self, other):
         if other < 0:
             return self - -other
@@ -92,9 +110,11 @@ class Probability(Real):
         return Probability(log_l + log1p(exp(log_s - log_l)),
                            log_value=True)
 
+    @_defer_to_probabilities
     def __radd__(self, other):
         return self + other
 
+    @_defer_to_probabilities
     def __sub__(self, other):
         if other < 0:
             return self + -other
@@ -117,6 +137,7 @@ class Probability(Real):
         return Probability(log_l + log1p(-exp_diff),
                            log_value=True)
 
+    @_defer_to_probabilities
     def __rsub__(self, other):
         if other < 0:  # Result will be negative
             return other + -float(self)
@@ -139,6 +160,7 @@ class Probability(Real):
         return Probability(log_l + log1p(-exp_diff),
                            log_value=True)
 
+    @_defer_to_probabilities
     def __mul__(self, other):
         try:
             return Probability(self.log_value + self._log(other),
@@ -146,9 +168,11 @@ class Probability(Real):
         except ValueError:
             return float(self) * other
 
+    @_defer_to_probabilities
     def __rmul__(self, other):
         return self * other
 
+    @_defer_to_probabilities
     def __truediv__(self, other):
         try:
             return Probability(self.log_value - self._log(other),
@@ -156,6 +180,7 @@ class Probability(Real):
         except ValueError:
             return float(self) / other
 
+    @_defer_to_probabilities
     def __rtruediv__(self, other):
         try:
             return Probability(self._log(other) - self.log_value,
@@ -239,6 +264,8 @@ class Probability(Real):
     @classmethod
     def sum(cls, values):
         """Carry out LogSumExp"""
+        if isinstance(values, Probabilities):
+            return values.sum()
         log_values = np.array([cls._log(value) for value in values])
         if len(log_values) == 0:
             return Probability(0)
@@ -269,3 +296,233 @@ class Probability(Real):
 
 
 Probability.from_log_ufunc = np.frompyfunc(Probability.from_log, 1, 1)
+
+
+class Probabilities(np.lib.mixins.NDArrayOperatorsMixin):
+    """Probabilities class.
+
+    Array equivalent of :class:`Probability`, with values stored as natural log values in a
+    :class:`numpy.ndarray`. Multiplication, division, addition, powers and comparisons (with other
+    :class:`Probabilities`, :class:`Probability` or non-negative values) are carried out on the log
+    values, as are :meth:`sum` (using LogSumExp) and :meth:`normalise`. Other operations are
+    carried out on float values, returning a :class:`numpy.ndarray`.
+
+    Indexing a single element returns a :class:`Probability`, and iterating over a one dimensional
+    instance yields :class:`Probability` instances. It isn't a :class:`numpy.ndarray` though, so
+    doesn't support all array attributes and methods; use :func:`numpy.asarray` for float values,
+    or :meth:`astype` with `object` for an array of :class:`Probability`.
+
+    Parameters
+    ----------
+    values : array_like
+        Values for probabilities.
+    log_value : bool
+        Set to `True` if :attr:`values` already log values. Default `False`.
+    """
+
+    _log_ufuncs = {
+        np.multiply: np.add,
+        np.true_divide: np.subtract,
+        np.add: np.logaddexp,
+        np.maximum: np.maximum,
+        np.minimum: np.minimum,
+        np.fmax: np.fmax,
+        np.fmin: np.fmin,
+    }
+    _comparison_ufuncs = {
+        np.equal, np.not_equal, np.less, np.less_equal, np.greater, np.greater_equal}
+
+    def __init__(self, values, *, log_value=False):
+        if log_value:
+            self._log_value = np.asarray(values, dtype=np.float64)
+        else:
+            self._log_value = self._log(values)
+
+    @property
+    def log_value(self):
+        """Log values, as :class:`numpy.ndarray`"""
+        return self._log_value
+
+    @staticmethod
+    def _log(values):
+        if isinstance(values, Probabilities):
+            return values.log_value
+        elif isinstance(values, Probability):
+            return np.float64(values.log_value)
+        elif isinstance(values, (list, tuple)) \
+                and all(isinstance(value, Probability) for value in values):
+            return np.fromiter(
+                (value.log_value for value in values), dtype=np.float64, count=len(values))
+        values = np.asarray(values)
+        if values.dtype == object:
+            return np.array(
+                [Probability._log(value) for value in values.flat],
+                dtype=np.float64).reshape(values.shape)
+        values = values.astype(np.float64, copy=False)
+        if np.any(values < 0):
+            raise ValueError("values must be greater than or equal to 0")
+        with np.errstate(divide='ignore'):
+            return np.log(values)
+
+    @staticmethod
+    def _is_log_operand(value):
+        if isinstance(value, (Probabilities, Probability)):
+            return True
+        if isinstance(value, np.ndarray):
+            return value.dtype != object and np.all(value >= 0)
+        return isinstance(value, Real) and value >= 0
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is not None and np.dtype(dtype) == object:
+            return Probability.from_log_ufunc(self._log_value)
+        values = np.exp(self._log_value)
+        if dtype is not None:
+            values = values.astype(dtype, copy=False)
+        return values
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        out = kwargs.get('out', ())
+        if method == '__call__' and len(out) == 1 and isinstance(out[0], Probabilities) \
+                and set(kwargs) == {'out'} and ufunc in self._log_ufuncs \
+                and all(map(self._is_log_operand, inputs)):
+            # In place operation e.g. `*=`
+            out[0].log_value[...] = self._log_ufuncs[ufunc](*map(self._log, inputs))
+            return out[0]
+        elif method == '__call__' and not kwargs:
+            if ufunc in self._log_ufuncs and all(map(self._is_log_operand, inputs)):
+                return Probabilities(
+                    self._log_ufuncs[ufunc](*map(self._log, inputs)), log_value=True)
+            elif ufunc in self._comparison_ufuncs and all(map(self._is_log_operand, inputs)):
+                return ufunc(*map(self._log, inputs))
+            elif ufunc is np.log:
+                return self._log(inputs[0]).copy()
+            elif ufunc is np.sqrt:
+                return Probabilities(self._log(inputs[0]) / 2, log_value=True)
+            elif ufunc is np.power and isinstance(inputs[0], Probabilities) \
+                    and not isinstance(inputs[1], Probabilities):
+                return Probabilities(self._log(inputs[0]) * np.asarray(inputs[1], dtype=float),
+                                     log_value=True)
+        elif method == 'reduce' and ufunc in (np.add, np.multiply) \
+                and set(kwargs).issubset({'axis', 'keepdims'}) \
+                and isinstance(inputs[0], Probabilities):
+            if ufunc is np.add:
+                return inputs[0].sum(**kwargs)
+            else:
+                return inputs[0].prod(**kwargs)
+
+        # Otherwise fall back to operating on float values
+        inputs = tuple(
+            np.asarray(value) if isinstance(value, Probabilities) else value
+            for value in inputs)
+        if 'out' in kwargs:
+            kwargs['out'] = tuple(
+                np.asarray(value) if isinstance(value, Probabilities) else value
+                for value in kwargs['out'])
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def _wrap(self, log_value):
+        if np.ndim(log_value) == 0:
+            return Probability(float(log_value), log_value=True)
+        return Probabilities(log_value, log_value=True)
+
+    def __getitem__(self, item):
+        return self._wrap(self._log_value[item])
+
+    def __setitem__(self, item, value):
+        self._log_value[item] = self._log(value)
+
+    def __len__(self):
+        return len(self._log_value)
+
+    def __iter__(self):
+        if self.ndim == 1:
+            for log_value in self._log_value.tolist():
+                yield Probability(log_value, log_value=True)
+        else:
+            for log_value in self._log_value:
+                yield self._wrap(log_value)
+
+    def __copy__(self):
+        return Probabilities(self._log_value.copy(), log_value=True)
+
+    def __repr__(self):
+        values = np.exp(self._log_value)
+        if np.any((values == 0) & (self._log_value != -np.inf)):  # Too close to zero
+            return f"{type(self).__name__}({self._log_value.tolist()!r}, log_value=True)"
+        return f"{type(self).__name__}({values.tolist()!r})"
+
+    @property
+    def shape(self):
+        return self._log_value.shape
+
+    @property
+    def ndim(self):
+        return self._log_value.ndim
+
+    @property
+    def size(self):
+        return self._log_value.size
+
+    def copy(self):
+        return self.__copy__()
+
+    def astype(self, dtype, **kwargs):
+        """Copy of values as :class:`numpy.ndarray` of type `dtype`"""
+        return np.array(self.__array__(dtype), copy=True)
+
+    def tolist(self):
+        """Values as (nested) list of :class:`Probability`"""
+        return self.astype(object).tolist()
+
+    def reshape(self, *shape, **kwargs):
+        return Probabilities(self._log_value.reshape(*shape, **kwargs), log_value=True)
+
+    def sum(self, axis=None, dtype=None, out=None, keepdims=False, **kwargs):
+        """Sum of probabilities, carried out with LogSumExp
+
+        Returns
+        -------
+        Probability or Probabilities
+            :class:`Probability` if result is a scalar, otherwise :class:`Probabilities`
+        """
+        if self.size == 0:
+            return self._wrap(np.full(
+                np.sum(self._log_value, axis=axis, keepdims=keepdims).shape, -np.inf))
+        with np.errstate(divide='ignore'):
+            return self._wrap(logsumexp(self._log_value, axis=axis, keepdims=keepdims))
+
+    def prod(self, axis=None, dtype=None, out=None, keepdims=False, **kwargs):
+        """Product of probabilities, carried out as sum of log values"""
+        return self._wrap(np.sum(self._log_value, axis=axis, keepdims=keepdims))
+
+    def max(self, axis=None, out=None, keepdims=False, **kwargs):
+        return self._wrap(np.max(self._log_value, axis=axis, keepdims=keepdims))
+
+    def min(self, axis=None, out=None, keepdims=False, **kwargs):
+        return self._wrap(np.min(self._log_value, axis=axis, keepdims=keepdims))
+
+    def argmax(self, *args, **kwargs):
+        return np.argmax(self._log_value, *args, **kwargs)
+
+    def argmin(self, *args, **kwargs):
+        return np.argmin(self._log_value, *args, **kwargs)
+
+    def normalise(self, total_weight=1, axis=None):
+        """Normalise probabilities, such that they sum to `total_weight`
+
+        Parameters
+        ----------
+        total_weight : float or Probability
+            Value to normalise to. Default 1.
+        axis : int, optional
+            Axis along which to normalise. Default `None`, normalising all values.
+
+        Returns
+        -------
+        Probabilities
+            Normalised probabilities
+        """
+        log_sum = self.sum(axis=axis, keepdims=True)
+        return Probabilities(
+            self._log_value - self._log(log_sum) + Probability._log(total_weight),
+            log_value=True)
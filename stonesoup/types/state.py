@@ -1,5 +1,7 @@
+import bisect
 import copy
 import datetime
+import itertools
 import uuid
 from collections import abc
 from numbers import Integral
@@ -13,7 +15,7 @@ from ..base import Property, clearable_cached_property
 from .array import StateVector, CovarianceMatrix, PrecisionMatrix, StateVectors
 from .base import Type
 from .particle import Particle, MultiModelParticle, RaoBlackwellisedParticle
-from .numeric import Probability
+from .numeric import Probability, Probabilities
 
 
 class State(Type):
@@ -234,6 +236,85 @@ class ASDState(Type):
 State.register(ASDState)
 
 
+def _slice_states(states, start, stop):
+    try:
+        return states[start:stop]
+    except TypeError:  # e.g. deque
+        return list(itertools.islice(states, start, stop))
+
+
+class _TimestampIndex:
+    """Sorted index of timestamps of a sequence of states
+
+    Holds the timestamps of the states, in sequence order, where they are in non-decreasing
+    order (otherwise :attr:`sorted` is `False` and the index shouldn't be used for searching).
+    The index is tied to a specific sequence of states, and detects states appended to, or
+    replaced in, it directly by checking the length and last state.
+    """
+    __slots__ = ('states', 'timestamps', 'sorted', 'last')
+
+    def __init__(self, states):
+        self.states = states
+        self.timestamps = []
+        self.sorted = True
+        self.last = None
+        self.extend(states)
+
+    def extend(self, states):
+        for state in states:
+            self.append(state)
+
+    def append(self, state):
+        timestamp = state.timestamp
+        if self.sorted:
+            if timestamp is None:
+                self.sorted = False
+            elif self.timestamps and timestamp < self.timestamps[-1]:
+                self.sorted = False
+        self.timestamps.append(timestamp)
+        self.last = state
+
+    def insert(self, index, state):
+        """Insert timestamp of state already inserted into sequence at normalised `index`"""
+        if index >= len(self.timestamps):
+            self.append(state)
+            return
+        timestamp = state.timestamp
+        if self.sorted and (
+                timestamp is None
+                or (index > 0 and timestamp < self.timestamps[index - 1])
+                or timestamp > self.timestamps[index]):
+            self.sorted = False
+        self.timestamps.insert(index, timestamp)
+
+    def is_valid(self, states):
+        """Update for states appended directly, returning `False` if otherwise invalid"""
+        if states is not self.states:
+            return False
+        n_index, n_states = len(self.timestamps), len(states)
+        if n_states < n_index:
+            return False
+        if n_index and states[n_index - 1] is not self.last:
+            return False
+        if n_states > n_index:
+            # States appended to sequence directly
+            self.extend(_slice_states(states, n_index, n_states))
+        return True
+
+    def position(self, timestamp, before=False):
+        """Index of last state at `timestamp` (or at or before, if `before` is `True`)"""
+        index = bisect.bisect_right(self.timestamps, timestamp) - 1
+        if index < 0 or (not before and self.timestamps[index] != timestamp):
+            return None
+        return index
+
+    def range(self, start, stop):
+        """Start and stop indexes of states with timestamps in interval [`start`, `stop`)"""
+        return (bisect.bisect_left(self.timestamps, start) if start is not None else 0,
+                bisect.bisect_left(self.timestamps, stop) if stop is not None
+                else len(self.timestamps))
+
+
 class StateMutableSequence(Type, abc.MutableSequence):
     """A mutable sequence for :class:`~.State` instances
 
@@ -258,6 +339,11 @@ class StateMutableSequence(Type, abc.MutableSequence):
     >>> for state in sequence[t1:]:
     ...     print(state.state_vector, state.timestamp)
     [[1]] 2018-01-01 14:01:00
+
+    Where the states are in time order, lookups by timestamp use an index of the timestamps,
+    maintained as states are added and removed, such that they take logarithmic rather than linear
+    time. States appended directly to :attr:`states` are also indexed, but other direct
+    modifications of :attr:`states` aren't detected, so should be made via the sequence itself.
     """
 
     states: MutableSequence[State] = Property(
@@ -276,15 +362,45 @@ class StateMutableSequence(Type, abc.MutableSequence):
         return self.states.__len__()
 
     def __setitem__(self, index, value):
+        self._clear_timestamp_index()
         return self.states.__setitem__(index, value)
 
     def __delitem__(self, index):
+        timestamp_index = self.__dict__.get('_timestamp_index')
+        if timestamp_index is not None and timestamp_index.sorted \
+                and timestamp_index.is_valid(self.states):
+            self.states.__delitem__(index)
+            # Removing states from sorted timestamps leaves them sorted
+            del timestamp_index.timestamps[index]
+            timestamp_index.last = self.states[-1] if self.states else None
+            return
+        self._clear_timestamp_index()
         return self.states.__delitem__(index)
 
+    def _clear_timestamp_index(self):
+        self.__dict__.pop('_timestamp_index', None)
+
+    @property
+    def _sorted_timestamp_index(self):
+        """Timestamp index of states, or `None` if states not in time order"""
+        timestamp_index = self.__dict__.get('_timestamp_index')
+        if timestamp_index is None or not timestamp_index.is_valid(self.states):
+            timestamp_index = self.__dict__['_timestamp_index'] = _TimestampIndex(self.states)
+        if timestamp_index.sorted:
+            return timestamp_index
+        return None
+
     def __getitem__(self, index):
         if isinstance(index, slice) and (
                 isinstance(index.start, datetime.datetime)
                 or isinstance(index.stop, datetime.datetime)):
+            timestamp_index = self._sorted_timestamp_index
+            if timestamp_index is not None \
+                    and isinstance(index.start, (datetime.datetime, type(None))) \
+                    and isinstance(index.stop, (datetime.datetime, type(None))):
+                start, stop = timestamp_index.range(index.start, index.stop)
+                return StateMutableSequence(
+                    _slice_states(self.states, start, stop)[::index.step])
             items = []
             for state in self.states:
                 try:
@@ -299,6 +415,12 @@ class StateMutableSequence(Type, abc.MutableSequence):
                 items.append(state)
             return StateMutableSequence(items[::index.step])
         elif isinstance(index, datetime.datetime):
+            timestamp_index = self._sorted_timestamp_index
+            if timestamp_index is not None:
+                position = timestamp_index.position(index)
+                if position is None:
+                    raise IndexError('timestamp not found in states')
+                return self.states[position]
             for state in reversed(self.states):
                 if state.timestamp == index:
                     return state
@@ -340,11 +462,94 @@ class StateMutableSequence(Type, abc.MutableSequence):
         inst.__dict__.update(self.__dict__)
         property_name = self.__class__.states._property_name
         inst.__dict__[property_name] = copy.copy(self.__dict__[property_name])
+        inst.__dict__.pop('_timestamp_index', None)
         return inst
 
     def insert(self, index, value):
+        timestamp_index = self.__dict__.get('_timestamp_index')
+        if timestamp_index is not None and timestamp_index.is_valid(self.states):
+            length = len(self.states)
+            if index < 0:
+                index = max(index + length, 0)
+            index = min(index, length)
+            self.states.insert(index, value)
+            timestamp_index.insert(index, value)
+            return
         return self.states.insert(index, value)
 
+    def append(self, value):
+        timestamp_index = self.__dict__.get('_timestamp_index')
+        self.states.append(value)
+        if timestamp_index is not None and timestamp_index.states is self.states \
+                and len(timestamp_index.timestamps) == len(self.states) - 1:
+            timestamp_index.append(value)
+
+    def timestamp_index(self, timestamp):
+        """Index of the last state at a given timestamp
+
+        Parameters
+        ----------
+        timestamp : datetime.datetime
+            Timestamp to search for
+
+        Returns
+        -------
+        int
+            Index of last state in the sequence with timestamp `timestamp`
+
+        Raises
+        ------
+        IndexError
+            If no state has timestamp `timestamp`
+        """
+        timestamp_index = self._sorted_timestamp_index
+        if timestamp_index is not None:
+            position = timestamp_index.position(timestamp)
+        else:
+            position = next(
+                (len(self.states) - 1 - reverse_index
+                 for reverse_index, state in enumerate(reversed(self.states))
+                 if state.timestamp == timestamp),
+                None)
+        if position is None:
+            raise IndexError('timestamp not found in states')
+        return position
+
+    def state_at_or_before(self, timestamp):
+        """Last state at or before a given timestamp
+
+        Parameters
+        ----------
+        timestamp : datetime.datetime
+            Timestamp to search for
+
+        Returns
+        -------
+        State
+            Last state in the sequence with timestamp at or before `timestamp`. Where states
+            aren't in time order, this is the latest such state, with ties resolved to the last in
+            the sequence.
+
+        Raises
+        ------
+        IndexError
+            If no state is at or before `timestamp`
+        """
+        timestamp_index = self._sorted_timestamp_index
+        if timestamp_index is not None:
+            position = timestamp_index.position(timestamp, before=True)
+            if position is None:
+                raise IndexError('no states at or before timestamp')
+            return self.states[position]
+        latest_state = None
+        for state in self.states:
+            if state.timestamp <= timestamp and (
+                    latest_state is None or state.timestamp >= latest_state.timestamp):
+                latest_state = state
+        if latest_state is None:
+            raise IndexError('no states at or before timestamp')
+        return latest_state
+
     @property
     def state(self):
         return self.states[-1]
@@ -638,7 +843,10 @@ class ParticleState(State):
         if weight is not None and log_weight is not None:
             raise ValueError("Cannot provide both weight and log weight")
         elif log_weight is None and weight is not None:
-            log_weight = np.log(np.asarray(weight, dtype=np.float64))
+            if isinstance(weight, Probabilities):
+                log_weight = weight.log_value
+            else:
+                log_weight = np.log(np.asarray(weight, dtype=np.float64))
             if idx is not None:
                 args[idx] = log_weight
             else:
@@ -653,8 +861,8 @@ class ParticleState(State):
         if self.particle_list and isinstance(self.particle_list, list):
             self.state_vector = \
                 StateVectors([particle.state_vector for particle in self.particle_list])
-            self.weight = \
-                np.array([Probability(particle.weight) for particle in self.particle_list])
+            self.log_weight = np.array(
+                [Probability(particle.weight).log_value for particle in self.particle_list])
             parent_list = [particle.parent for particle in self.particle_list]
 
             if parent_list.count(None) == 0:
@@ -747,6 +955,8 @@ class ParticleState(State):
     def weight(self, value):
         if value is None:
             self.log_weight = None
+        elif isinstance(value, Probabilities):
+            self.log_weight = value.log_value
         else:
             self.log_weight = np.log(np.asarray(value, dtype=np.float64))
             self.__dict__['weight'] = np.asanyarray(value)
@@ -763,6 +973,22 @@ class ParticleState(State):
             self.__dict__['weight'] = weight
             return weight
 
+    @property
+    def weight_probabilities(self):
+        """Weights of particles as :class:`~.Probabilities`
+
+        Unlike :attr:`weight`, an array of :class:`~.Probability`, this holds :attr:`log_weight`
+        without conversion, for arithmetic carried out on log values. Set to update
+        :attr:`log_weight`.
+        """
+        if self.log_weight is None:
+            return None
+        return Probabilities(self.log_weight, log_value=True).copy()
+
+    @weight_probabilities.setter
+    def weight_probabilities(self, value):
+        self.weight = None if value is None else Probabilities(value)
+
 State.register(ParticleState)  # noqa: E305
 ParticleState.log_weight._clear_cached.add('weight')
 
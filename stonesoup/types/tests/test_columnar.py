@@ -0,0 +1,125 @@
+import copy
+import datetime
+import gc
+import pickle
+
+import numpy as np
+import pytest
+
+from ..columnar import ColumnarStates
+from ..detection import Detection
+from ..hypothesis import SingleHypothesis
+from ..particle import Particle
+from ..prediction import GaussianStatePrediction
+from ..state import GaussianState, ParticleState
+from ..track import Track
+from ..update import GaussianStateUpdate
+
+
+@pytest.fixture()
+def states():
+    timestamp = datetime.datetime(2020, 1, 1)
+    states = []
+    for i in range(5):
+        state_timestamp = timestamp + datetime.timedelta(seconds=i)
+        prediction = GaussianStatePrediction([[i], [1]], np.eye(2)*i, state_timestamp)
+        if i % 2:
+            states.append(prediction)
+        else:
+            hypothesis = SingleHypothesis(
+                prediction, Detection([[i]], timestamp=state_timestamp))
+            states.append(GaussianStateUpdate(
+                [[i], [1]], np.eye(2)*i, hypothesis, state_timestamp))
+    return states
+
+
+def assert_states_equal(state, other_state):
+    assert type(state) is type(other_state)
+    assert np.array_equal(state.state_vector, other_state.state_vector)
+    assert np.array_equal(state.covar, other_state.covar)
+    assert state.timestamp == other_state.timestamp
+    assert getattr(state, 'hypothesis', None) is getattr(other_state, 'hypothesis', None)
+
+
+def test_columnar_states(states):
+    columnar_states = ColumnarStates(states)
+    assert len(columnar_states) == len(states)
+    assert columnar_states.ndim == 2
+    assert columnar_states.timestamps == [state.timestamp for state in states]
+
+    # Same objects returned whilst referenced
+    for state, columnar_state in zip(states, columnar_states):
+        assert state is columnar_state
+
+    # Recreated from columns when not
+    state_copies = copy.copy(states)
+    states.clear()
+    gc.collect()
+    for state, columnar_state in zip(state_copies, columnar_states):
+        assert_states_equal(state, columnar_state)
+    state = columnar_states[-1]
+    assert columnar_states[-1] is state
+
+    assert [state.timestamp for state in columnar_states[1:4]] \
+        == [state.timestamp for state in state_copies[1:4]]
+
+
+def test_columnar_states_mutate(states):
+    columnar_states = ColumnarStates(states[:2], capacity=1)
+
+    columnar_states.append(states[3])
+    columnar_states.insert(2, states[2])
+    columnar_states.insert(-10, states[4])
+    assert list(columnar_states) == [states[4], *states[:4]]
+
+    del columnar_states[0]
+    assert list(columnar_states) == states[:4]
+    del columnar_states[1:3]
+    assert list(columnar_states) == [states[0], states[3]]
+
+    columnar_states[-1] = states[1]
+    assert list(columnar_states) == [states[0], states[1]]
+    columnar_states[:1] = states[2:4]
+    assert list(columnar_states) == [states[2], states[3], states[1]]
+
+    with pytest.raises(IndexError):
+        columnar_states[3]
+
+    columnar_states.clear()
+    assert len(columnar_states) == 0
+
+
+def test_columnar_states_object_fallback(states):
+    particle_state = ParticleState(None, particle_list=[Particle([[0], [1]], 1)])
+    other_dim_state = GaussianState([[1]], [[1]])
+    columnar_states = ColumnarStates([*states, particle_state, other_dim_state])
+    del states, particle_state, other_dim_state
+    gc.collect()
+
+    assert isinstance(columnar_states[-2], ParticleState)
+    assert columnar_states[-1].ndim == 1
+
+
+def test_columnar_states_copy(states):
+    columnar_states = ColumnarStates(states)
+    for new_columnar_states in (copy.copy(columnar_states),
+                                pickle.loads(pickle.dumps(columnar_states))):
+        new_columnar_states.append(states[0])
+        assert len(columnar_states) == len(states)
+        assert len(new_columnar_states) == len(states) + 1
+        for state, new_state in zip(columnar_states, new_columnar_states):
+            assert np.array_equal(state.state_vector, new_state.state_vector)
+
+
+def test_columnar_track(states):
+    track = Track(ColumnarStates(states[:-1]))
+    track.append(states[-1])
+    assert track.state is states[-1]
+    assert len(track) == len(states)
+    assert track[states[2].timestamp] is states[2]
+    assert len(track[states[1].timestamp:states[3].timestamp]) == 2
+    assert len(track.metadatas) == len(states)
+
+    track_copy = copy.copy(track)
+    track_copy.append(states[0])
+    assert len(track) == len(states)
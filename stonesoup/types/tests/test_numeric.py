@@ -4,7 +4,7 @@ import numpy as np
 import pytest
 from pytest import approx
 
-from ..numeric import Probability
+from ..numeric import Probability, Probabilities
 
 
 def test_probability_init():
@@ -210,3 +210,85 @@ def test_probability_hash():
 
     # Actual zero should match
     assert hash(Probability(0)) == hash(0)
+
+
+def test_probabilities_init():
+    probabilities = Probabilities([0.2, 0.3, 0])
+    assert np.allclose(probabilities.log_value, [log(0.2), log(0.3), -np.inf])
+    assert len(probabilities) == 3
+    assert probabilities.shape == (3, )
+
+    probabilities = Probabilities(np.log([0.2, 0.3]), log_value=True)
+    assert np.allclose(np.asarray(probabilities), [0.2, 0.3])
+
+    probabilities = Probabilities([Probability(0.2), Probability(-1000, log_value=True)])
+    assert probabilities.log_value[1] == -1000
+    assert isinstance(probabilities[1], Probability)
+    assert probabilities[1].log_value == -1000
+    assert all(isinstance(probability, Probability) for probability in probabilities)
+    assert isinstance(probabilities[:1], Probabilities)
+    assert "log_value=True" in repr(probabilities)
+
+    with pytest.raises(ValueError, match="values must be greater than or equal to 0"):
+        Probabilities([0.2, -0.1])
+
+
+def test_probabilities_operations():
+    values = np.array([0.1, 0.2, 0.7])
+    probabilities = Probabilities(values)
+
+    for result, expected in (
+            (probabilities * 2, values * 2),
+            (2 * probabilities, values * 2),
+            (Probability(0.5) * probabilities, values * 0.5),
+            (probabilities * probabilities, values * values),
+            (probabilities / 2, values / 2),
+            (1 / probabilities, 1 / values),
+            (probabilities + 0.1, values + 0.1),
+            (probabilities + probabilities, values * 2),
+            (probabilities ** 2, values ** 2),
+            (np.sqrt(probabilities), np.sqrt(values))):
+        assert isinstance(result, Probabilities)
+        assert np.allclose(np.asarray(result), expected)
+
+    # Float fallback
+    assert isinstance(probabilities - 0.05, np.ndarray)
+    assert np.allclose(probabilities - 0.05, values - 0.05)
+    assert np.allclose(np.exp(probabilities), np.exp(values))
+    assert np.allclose(np.log(probabilities), np.log(values))
+
+    assert np.array_equal(probabilities > 0.15, values > 0.15)
+    assert np.array_equal(probabilities == Probability(0.2), values == 0.2)
+
+    probabilities_copy = probabilities.copy()
+    probabilities_copy *= 2
+    assert np.allclose(np.asarray(probabilities_copy), values * 2)
+    assert np.allclose(np.asarray(probabilities), values)
+
+    probabilities_copy[0] = Probability(0.5)
+    assert float(probabilities_copy[0]) == approx(0.5)
+
+
+def test_probabilities_sum():
+    log_values = np.array([-1000, -1001, -1002])
+    probabilities = Probabilities(log_values, log_value=True)
+
+    total = probabilities.sum()
+    assert isinstance(total, Probability)
+    assert total.log_value == approx(-1000 + log(1 + np.exp(-1) + np.exp(-2)))
+    assert np.sum(probabilities).log_value == approx(total.log_value)
+    assert Probability.sum(probabilities).log_value == approx(total.log_value)
+    assert probabilities.prod().log_value == approx(-3003)
+    assert Probabilities([]).sum() == 0
+    assert Probabilities([0, 0]).sum() == 0
+
+    normalised = probabilities.normalise()
+    assert isinstance(normalised, Probabilities)
+    assert float(normalised.sum()) == approx(1)
+    assert float(probabilities.normalise(2).sum()) == approx(2)
+
+    probabilities = Probabilities([[0.1, 0.3], [0.2, 0.2]])
+    assert np.allclose(np.asarray(probabilities.sum(axis=1)), [0.4, 0.4])
+    assert np.allclose(np.asarray(probabilities.normalise(axis=0)), [[1/3, 0.6], [2/3, 0.4]])
+    assert float(probabilities.max()) == approx(0.3)
+    assert probabilities.argmax() == 1
@@ -1,5 +1,6 @@
 import copy
 import datetime
+from collections import deque
 
 import numpy as np
 import pytest
@@ -8,7 +9,7 @@ import scipy.linalg
 from ..angle import Bearing
 from ..array import StateVector, StateVectors, CovarianceMatrix
 from ..groundtruth import GroundTruthState
-from ..numeric import Probability
+from ..numeric import Probability, Probabilities
 from ..particle import Particle
 from ..state import CreatableFromState
 from ..state import State, GaussianState, ParticleState, EnsembleState, \
@@ -299,6 +300,29 @@ def test_particlestate_weighted():
     assert np.allclose(state.covar, CovarianceMatrix([[1875]]))
 
 
+def test_particlestate_weight_probabilities():
+    state = ParticleState(StateVectors([[0, 1, 2]]), weight=np.array([0.2, 0.3, 0.5]))
+    state.log_weight = np.log([0.5, 0.25, 0.25])
+
+    # Weight remains an array, of Probability, after log weight changed
+    assert isinstance(state.weight, np.ndarray)
+    assert state.weight.dtype == object
+    assert isinstance(state.weight[0], Probability)
+    assert state.weight.T.shape == state.weight.ravel().shape == (3, )
+    assert np.allclose(state.weight.astype(float), [0.5, 0.25, 0.25])
+
+    probabilities = state.weight_probabilities
+    assert isinstance(probabilities, Probabilities)
+    assert np.allclose(probabilities.log_value, state.log_weight)
+
+    state.weight_probabilities = Probabilities([1/3, 1/3, 1/3])
+    assert np.allclose(state.log_weight, np.log(1/3))
+
+    state = ParticleState(StateVectors([[0, 1]]), weight=Probabilities([0.25, 0.75]))
+    assert isinstance(state.weight, np.ndarray)
+    assert np.allclose(state.log_weight, np.log([0.25, 0.75]))
+
+
 def test_particlestate_angle():
     num_particles = 10
 
@@ -474,6 +498,61 @@ def test_state_mutable_sequence_slice():
         sequence[timestamp-delta]
 
 
+@pytest.mark.parametrize('states_type', [list, deque])
+def test_state_mutable_sequence_timestamp_index(states_type):
+    timestamp = datetime.datetime(2018, 1, 1, 14)
+    delta = datetime.timedelta(minutes=1)
+    sequence = StateMutableSequence(
+        states_type(State([[n]], timestamp=timestamp+delta*n) for n in range(0, 20, 2)))
+
+    def check(sequence):
+        # Compare against linear search
+        for n in range(-1, 22):
+            time = timestamp + delta*n
+            matching = [state for state in sequence.states if state.timestamp == time]
+            if matching:
+                assert sequence[time] is matching[-1]
+                assert sequence.states[sequence.timestamp_index(time)] is matching[-1]
+            else:
+                with pytest.raises(IndexError):
+                    sequence[time]
+                with pytest.raises(IndexError):
+                    sequence.timestamp_index(time)
+            previous = [state for state in sequence.states if state.timestamp <= time]
+            if previous:
+                assert sequence.state_at_or_before(time) \
+                    is max(reversed(previous), key=lambda state: state.timestamp)
+            else:
+                with pytest.raises(IndexError):
+                    sequence.state_at_or_before(time)
+            for m in range(n, 22, 5):
+                stop = timestamp + delta*m
+                assert list(sequence[time:stop]) == [
+                    state for state in sequence.states if time <= state.timestamp < stop]
+
+    check(sequence)
+    sequence.append(State([[20]], timestamp=timestamp+delta*20))
+    check(sequence)
+    sequence.insert(2, State([[3]], timestamp=timestamp+delta*3))
+    check(sequence)
+    sequence.insert(-100, State([[-1]], timestamp=timestamp-delta))
+    check(sequence)
+    del sequence[4]
+    check(sequence)
+    sequence[0] = State([[0]], timestamp=timestamp)
+    check(sequence)
+    # Direct modification of states
+    sequence.states.append(State([[21]], timestamp=timestamp+delta*21))
+    check(sequence)
+    # Out of order states
+    sequence.insert(3, State([[15]], timestamp=timestamp+delta*15))
+    check(sequence)
+    del sequence[3]
+    check(sequence)
+    sequence.states = states_type([State([[5]], timestamp=timestamp+delta*5)])
+    check(sequence)
+
+
 def test_state_mutable_sequence_sequence_init():
     """Test initialising with an existing sequence"""
     state_vector = StateVector([[0]])
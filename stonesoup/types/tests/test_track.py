@@ -1,5 +1,6 @@
 import copy
 import datetime
+import pickle
 
 import numpy as np
 import pytest
@@ -8,7 +9,7 @@ from ..detection import Detection
 from ..hypothesis import SingleHypothesis
 from ..numeric import Probability
 from ..state import State, GaussianState, ParticleState
-from ..track import Track
+from ..track import Track, TrackMetadata
 from ..update import Update
 
 
@@ -181,6 +182,61 @@ def test_track_metadata():
            {'colour': 'green', 'side': 'enemy', 'speed': 'fast', 'size': 'small'}
 
 
+def test_track_metadata_shared():
+    track = Track(init_metadata={'colour': 'blue'})
+    for i in range(100):
+        track.append(Update(hypothesis=SingleHypothesis(
+            None, Detection(np.array([[0]]), metadata={'index': i} if i % 2 else {}))))
+
+    assert all(isinstance(metadata, TrackMetadata) for metadata in track.metadatas)
+    for i, metadata in enumerate(track.metadatas):
+        expected = {'colour': 'blue'}
+        if i:
+            expected['index'] = i - (not i % 2)
+        assert metadata == expected
+        assert metadata._depth <= TrackMetadata.checkpoint_interval
+
+    # Consecutive entries share underlying items
+    assert track.metadatas[-2]._base is track.metadatas[-1]._base
+
+    # Modifying an entry doesn't affect others
+    track.metadatas[50]['colour'] = 'red'
+    del track.metadatas[51]['colour']
+    assert track.metadatas[50] == {'colour': 'red', 'index': 49}
+    assert track.metadatas[51] == {'index': 51}
+    assert track.metadatas[49]['colour'] == track.metadatas[52]['colour'] == 'blue'
+    with pytest.raises(KeyError):
+        del track.metadatas[51]['colour']
+
+    track.metadata['speed'] = 'fast'
+    assert 'speed' in track.metadatas[-1]
+    assert 'speed' not in track.metadatas[-2]
+    assert type(track.metadata.copy()) is dict
+
+    pickled_metadata = pickle.loads(pickle.dumps(track.metadatas[51]))
+    assert pickled_metadata == {'index': 51}
+    assert isinstance(pickled_metadata, TrackMetadata)
+
+
+def test_track_metadata_unchanged():
+    track = Track()
+    for i in range(10):
+        track.append(Update(hypothesis=SingleHypothesis(
+            None, Detection(np.array([[0]]), metadata={'mmsi': 1234, 'speed': i // 5}))))
+        # Only items which change are stored for each entry
+        assert track.metadata._changes.keys() == ({'mmsi', 'speed'} if i == 0 else
+                                                  {'speed'} if i == 5 else set())
+
+    for i, metadata in enumerate(track.metadatas):
+        assert metadata == {'mmsi': 1234, 'speed': i // 5}
+
+    track.metadata.update({'mmsi': 1234, 'speed': 1})
+    assert not track.metadata._changes
+    track.metadata['speed'] = 2
+    assert track.metadata._changes == {'speed': 2}
+    assert dict(track.metadata) == {'mmsi': 1234, 'speed': 2}
+
+
 def test_copy():
     metadatas = [{'update_number': i} for i in range(3)]
 
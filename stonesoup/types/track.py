@@ -1,5 +1,6 @@
 import copy
 import uuid
+from collections import abc
 from typing import MutableSequence, MutableMapping
 
 from .multihypothesis import MultipleHypothesis
@@ -8,6 +9,131 @@ from .update import Update
 from ..base import Property
 
 
+_DELETED = object()
+
+
+class TrackMetadata(abc.MutableMapping):
+    """Track metadata entry
+
+    A mutable mapping used for entries of :attr:`Track.metadatas`, which shares unchanged items
+    with the entries before it. Each entry holds only the items changed since the previous
+    entry, on top of a chain of immutable layers shared with earlier entries, such that recording
+    metadata for a new state is proportional to the number of items changed rather than the
+    total number of items. Setting an item to its current value leaves the entry unchanged. The
+    chain is collapsed into a single layer every :attr:`checkpoint_interval` entries to bound the
+    cost of item lookup.
+
+    Modifying an entry doesn't affect any other entry. :meth:`copy` returns a :class:`dict`.
+    """
+    checkpoint_interval = 32
+
+    __slots__ = ('_base', '_depth', '_changes', '_merged')
+
+    def __init__(self, items=None):
+        self._base = None  # Tuple of (items, parent layer), or None
+        self._depth = 0
+        self._changes = {}
+        self._merged = None  # Items of all layers, built when iterated
+        if items is not None:
+            self._changes.update(items)
+
+    def __getitem__(self, key):
+        value = self._changes.get(key, _DELETED)
+        if value is _DELETED and key not in self._changes:
+            layer = self._base
+            while layer is not None:
+                items, layer = layer
+                if key in items:
+                    value = items[key]
+                    break
+        if value is _DELETED:
+            raise KeyError(key)
+        return value
+
+    @staticmethod
+    def _unchanged(current, value):
+        return current is value \
+            or (type(current) is type(value) and current == value) is True
+
+    def __setitem__(self, key, value):
+        # Unchanged items aren't stored, such that only items which have changed are recorded
+        if not self._unchanged(self.get(key, _DELETED), value):
+            self._changes[key] = value
+            self._merged = None
+
+    def update(self, other=(), /, **kwargs):
+        # Typically a full mapping of items (as from each detection's metadata), so compared
+        # with all current items at once
+        items = self._items()
+        changes = {key: value for key, value in dict(other, **kwargs).items()
+                   if not self._unchanged(items.get(key, _DELETED), value)}
+        if changes:
+            self._changes.update(changes)
+            self._merged = None
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._changes[key] = _DELETED
+        self._merged = None
+
+    def _items(self):
+        """Items of all layers, which mustn't be modified"""
+        if self._merged is None:
+            layers = []
+            layer = self._base
+            while layer is not None:
+                items, layer = layer
+                layers.append(items)
+            merged = {}
+            for items in reversed(layers):
+                merged.update(items)
+            merged.update(self._changes)
+            self._merged = {key: value for key, value in merged.items() if value is not _DELETED}
+        return self._merged
+
+    def __iter__(self):
+        return iter(self._items())
+
+    def __len__(self):
+        return len(self._items())
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self._items()!r})'
+
+    def __reduce__(self):
+        return type(self), (self._items(), )
+
+    def copy(self):
+        return dict(self._items())
+
+    def derive(self):
+        """Create a new entry with the same items as this entry
+
+        This entry's changes are moved into a layer shared by both entries, so neither entry is
+        copied in full (other than at checkpoints).
+
+        Returns
+        -------
+        : :class:`TrackMetadata`
+            New entry, equal to this entry
+        """
+        if self._depth >= self.checkpoint_interval:
+            self._base = (self._items(), None)
+            self._depth = 1
+            self._changes = {}
+        elif self._changes:
+            self._base = (self._changes, self._base)
+            self._depth += 1
+            self._changes = {}
+        inst = type(self).__new__(type(self))
+        inst._base = self._base
+        inst._depth = self._depth
+        inst._changes = {}
+        inst._merged = self._merged
+        return inst
+
+
 class Track(StateMutableSequence):
     """Track type
 
@@ -84,7 +210,7 @@ class Track(StateMutableSequence):
         """
         # Update metadata
         self._update_metadata_from_state(value)
-        return self.states.append(value)
+        return super().append(value)
 
     @property
     def metadata(self):
@@ -103,8 +229,7 @@ class Track(StateMutableSequence):
         index: Int
             Index of :attr:`metadatas` to update from.
         """
-        # Plus one for 0th initial track meta data
-        self.metadatas = self.metadatas[:index]
+        del self.metadatas[index:]
 
         for future_state in self.states[index:]:
             self._update_metadata_from_state(future_state)
@@ -120,7 +245,11 @@ class Track(StateMutableSequence):
             Update (or subclassed) objects. Calling this method with a non-Update (subclass) object
             will NOT raise an error, but will have no effect on the metadata.
         """
-        self.metadatas.append(self.metadata.copy())
+        metadata = self.metadata
+        if isinstance(metadata, TrackMetadata):
+            self.metadatas.append(metadata.derive())
+        else:
+            self.metadatas.append(TrackMetadata(metadata))
 
         if isinstance(state, Update):
             if isinstance(state.hypothesis, MultipleHypothesis):
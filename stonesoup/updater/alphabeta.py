@@ -1,7 +1,6 @@
-from functools import lru_cache
-
 import numpy as np
 
+from ..cache import cache_method
 from ..base import Property
 from ..updater import Updater
 from ..types.prediction import MeasurementPrediction
@@ -65,7 +64,7 @@ class AlphaBetaUpdater(Updater):
                                                   "assume that the velocity elements interleave "
                                                   "the position elements in the state vector.")
 
-    @lru_cache()
+    @cache_method
     def predict_measurement(self, prediction, measurement_model=None, **kwargs):
         """Return the predicted measurement
 
@@ -1,7 +1,6 @@
-from functools import lru_cache
-
 import numpy as np
 
+from ..cache import cache_method
 from .kalman import KalmanUpdater
 from ..types.prediction import ASDGaussianMeasurementPrediction
 from ..types.update import ASDGaussianStateUpdate
@@ -21,7 +20,7 @@ class ASDKalmanUpdater(KalmanUpdater):
         Electronic Systems,
         vol. 47, no. 4, pp. 2766-2778, OCTOBER 2011, doi: 10.1109/TAES.2011.6034663.
     """
-    @lru_cache()
+    @cache_method
     def predict_measurement(self, predicted_state, measurement_model=None,
                             **kwargs):
         r"""Predict the measurement implied by the predicted state mean
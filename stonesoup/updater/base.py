@@ -68,6 +68,30 @@ class Updater(Base):
         """
         raise NotImplementedError
 
+    def batch_predict_measurement(
+            self, state_predictions, measurement_model=None, **kwargs):
+        """Get measurement predictions from multiple state predictions
+
+        By default this calls :meth:`predict_measurement` for each state prediction in turn,
+        but updaters may predict measurements of all of them together.
+
+        Parameters
+        ----------
+        state_predictions : sequence of :class:`~.StatePrediction`
+            The state predictions, for example those of many tracks
+        measurement_model: :class:`~.MeasurementModel`, optional
+            The measurement model used to generate the measurement predictions. The default is
+            `None`, in which case the updater will use the measurement model specified on
+            initialisation
+
+        Returns
+        -------
+        : list of :class:`~.MeasurementPrediction`
+            The predicted measurements, in the same order
+        """
+        return [self.predict_measurement(state_prediction, measurement_model, **kwargs)
+                for state_prediction in state_predictions]
+
     @abstractmethod
     def update(self, hypothesis, **kwargs):
         """Update state using prediction and measurement.
@@ -1,7 +1,6 @@
-from functools import lru_cache
-
 import numpy as np
 
+from ..cache import cache_method
 from ..base import Property
 from .base import Updater
 from ..types.prediction import MeasurementPrediction
@@ -80,7 +79,7 @@ class ChernoffUpdater(Updater):
         default=0.5,
         doc="A weighting parameter in the range :math:`(0,1]`")
 
-    @lru_cache()
+    @cache_method
     def predict_measurement(self, predicted_state, measurement_model=None,  **kwargs):
         r"""
         This function predicts the measurement of a state in situations where measurements consist
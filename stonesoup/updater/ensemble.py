@@ -1,8 +1,7 @@
-from functools import lru_cache
-
 import numpy as np
 import scipy
 
+from ..cache import cache_method
 from .kalman import KalmanUpdater
 from ..base import Property
 from ..types.state import State, EnsembleState
@@ -107,7 +106,7 @@ class EnsembleUpdater(KalmanUpdater):
                 predicted_state, measurement_model=measurement_model, **kwargs)
         return hypothesis
 
-    @lru_cache()
+    @cache_method
     def predict_measurement(self, predicted_state, measurement_model=None,
                             **kwargs):
         r"""Predict the measurement implied by the predicted state mean
@@ -174,9 +173,15 @@ class EnsembleUpdater(KalmanUpdater):
         # Calculate Kalman Gain according to Dr. Jan Mandel's EnKF formalism.
         innovation_ensemble = pred_state.state_vector - pred_state.mean
 
-        meas_innovation = (
-            self.measurement_model.function(pred_state, num_samples=num_vectors)
-            - self.measurement_model.function(State(pred_state.mean)))
+        if self.measurement_model.angle_types is None:
+            meas_innovation = (
+                self.measurement_model.function(pred_state, num_samples=num_vectors)
+                - self.measurement_model.function(State(pred_state.mean)))
+        else:
+            # Float innovations, with angles wrapped, avoiding object arrays of angles
+            meas_innovation = self.measurement_model.wrap_angles(
+                self.measurement_model.float_function(pred_state)
+                - self.measurement_model.float_function(State(pred_state.mean)))
 
         # Calculate Kalman Gain
         kalman_gain = 1/(num_vectors-1) * innovation_ensemble @ meas_innovation.T @ \
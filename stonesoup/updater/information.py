@@ -1,7 +1,6 @@
-from functools import lru_cache
-
 import numpy as np
 
+from ..cache import cache_method
 from ..base import Property
 from ..types.prediction import GaussianMeasurementPrediction
 from ..types.update import Update
@@ -61,7 +60,7 @@ class InformationKalmanUpdater(KalmanUpdater):
 
         return inv_measurement_covar
 
-    @lru_cache()
+    @cache_method
     def predict_measurement(self, predicted_state, measurement_model=None, **kwargs):
         r"""There's no direct analogue of a predicted measurement in the information form. This
         method is therefore provided to return the predicted measurement as would the standard
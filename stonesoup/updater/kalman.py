@@ -2,12 +2,13 @@ import warnings
 
 import numpy as np
 import scipy.linalg as la
-from functools import lru_cache
 
+from ..cache import cache_method
 from ..base import Property
 from .base import Updater
-from ..types.array import CovarianceMatrix, StateVector
+from ..types.array import CovarianceMatrix, Matrix, StateVector, StateVectors
 from ..types.prediction import MeasurementPrediction
+from ..types.state import State
 from ..types.update import Update
 from ..models.base import LinearModel
 from ..models.measurement.linear import LinearGaussian
@@ -188,7 +189,7 @@ class KalmanUpdater(Updater):
 
         return post_cov.view(CovarianceMatrix), kalman_gain
 
-    @lru_cache()
+    @cache_method
     def predict_measurement(self, predicted_state, measurement_model=None,
                             **kwargs):
         r"""Predict the measurement implied by the predicted state mean
@@ -227,6 +228,78 @@ class KalmanUpdater(Updater):
         return MeasurementPrediction.from_state(
             predicted_state, pred_meas, innov_cov, cross_covar=meas_cross_cov)
 
+    def batch_predict_measurement(self, predicted_states, measurement_model=None, **kwargs):
+        r"""Predict the measurements implied by multiple predicted state means
+
+        Equivalent to calling :meth:`predict_measurement` for each predicted state, but where
+        the methods used by :meth:`predict_measurement` aren't overridden (other than by
+        :class:`~.ExtendedKalmanUpdater`), predictions for all states are made in single array
+        operations: one call of the measurement model function, and of
+        :meth:`~.MeasurementModel.jacobian` where the measurement model is non-linear.
+
+        Parameters
+        ----------
+        predicted_states : sequence of :class:`~.GaussianState`
+            The predicted states :math:`\mathbf{x}_{k|k-1}`, :math:`P_{k|k-1}`
+        measurement_model : :class:`~.MeasurementModel`
+            The measurement model. If omitted, the model in the updater object
+            is used
+        **kwargs : various
+            These are passed to :meth:`~.MeasurementModel.function` and
+            :meth:`~.MeasurementModel.matrix` or :meth:`~.MeasurementModel.jacobian`
+
+        Returns
+        -------
+        : list of :class:`GaussianMeasurementPrediction`
+            The measurement predictions, in the same order
+        """
+        predicted_states = list(predicted_states)
+        measurement_model = self._check_measurement_model(measurement_model)
+        if len(predicted_states) < 2 or 'linearisation_point' in kwargs \
+                or not self._batchable_measurement_prediction() \
+                or len({state.timestamp for state in predicted_states}) > 1:
+            return super().batch_predict_measurement(
+                predicted_states, measurement_model, **kwargs)
+
+        states = State(
+            StateVectors([state.state_vector for state in predicted_states]),
+            timestamp=predicted_states[0].timestamp)
+        pred_meas = measurement_model.function(states, **kwargs)
+
+        if type(self)._measurement_matrix is KalmanUpdater._measurement_matrix \
+                or isinstance(measurement_model, LinearModel):
+            hh = measurement_model.matrix(**kwargs)
+        else:
+            hh = measurement_model.jacobian(states, **kwargs)
+            if np.shape(hh) != (len(predicted_states), *np.shape(pred_meas)[:1],
+                                measurement_model.ndim_state):
+                # Model jacobian not evaluated for each state
+                return super().batch_predict_measurement(
+                    predicted_states, measurement_model, **kwargs)
+
+        # The measurement cross covariances and innovation covariances
+        covars = np.array([state.covar for state in predicted_states])
+        meas_cross_covs = covars @ np.swapaxes(hh, -1, -2)
+        innov_covs = hh @ meas_cross_covs + measurement_model.covar()
+
+        return [
+            MeasurementPrediction.from_state(
+                predicted_state, pred_meas[:, index:index+1].view(StateVector),
+                innov_cov.view(CovarianceMatrix), cross_covar=meas_cross_cov.view(Matrix))
+            for index, (predicted_state, innov_cov, meas_cross_cov) in enumerate(zip(
+                predicted_states, innov_covs, meas_cross_covs))]
+
+    def _batchable_measurement_prediction(self):
+        """Whether :meth:`batch_predict_measurement` can predict all measurements together, as
+        the methods used by :meth:`predict_measurement` aren't overridden"""
+        updater_type = type(self)
+        return all(
+            getattr(updater_type, name) is getattr(KalmanUpdater, name)
+            for name in ('predict_measurement', '_measurement_cross_covariance',
+                         '_innovation_covariance')) \
+            and updater_type._measurement_matrix in (
+                KalmanUpdater._measurement_matrix, ExtendedKalmanUpdater._measurement_matrix)
+
     def update(self, hypothesis, **kwargs):
         r"""The Kalman update method. Given a hypothesised association between
         a predicted state or predicted measurement and an actual measurement,
@@ -364,7 +437,7 @@ class UnscentedKalmanUpdater(KalmanUpdater):
         doc="Secondary spread scaling parameter. Default is calculated as "
             "3-Ns")
 
-    @lru_cache()
+    @cache_method
     def predict_measurement(self, predicted_state, measurement_model=None):
         """Unscented Kalman Filter measurement prediction step. Uses the
         unscented transform to estimate a Gauss-distributed predicted
@@ -1,5 +1,4 @@
 import copy
-from functools import lru_cache
 from typing import Callable
 import warnings
 
@@ -7,10 +6,11 @@ import numpy as np
 from scipy.linalg import inv
 from scipy.special import logsumexp
 
+from ..cache import cache_method
 from .base import Updater
 from .kalman import KalmanUpdater, ExtendedKalmanUpdater
 from ..base import Property
-from ..functions import cholesky_eps, sde_euler_maruyama_integration
+from ..functions import cholesky_eps, match_float_dtype, sde_euler_maruyama_integration
 from ..predictor.particle import MultiModelPredictor, RaoBlackwellisedMultiModelPredictor
 from ..resampler import Resampler
 from ..regulariser import Regulariser
@@ -83,8 +83,10 @@ class ParticleUpdater(Updater):
         else:
             measurement_model = hypothesis.measurement.measurement_model
 
-        new_weight = predicted_state.log_weight + measurement_model.logpdf(
-            hypothesis.measurement, predicted_state, **kwargs)
+        new_weight = match_float_dtype(
+            predicted_state.log_weight + measurement_model.logpdf(
+                hypothesis.measurement, predicted_state, **kwargs),
+            predicted_state.log_weight)
 
         # Apply constraints if defined
         if self.constraint_func is not None:
@@ -111,7 +113,7 @@ class ParticleUpdater(Updater):
 
         return predicted_state
 
-    @lru_cache()
+    @cache_method
     def predict_measurement(self, state_prediction, measurement_model=None,
                             **kwargs):
 
@@ -240,7 +242,7 @@ class GromovFlowKalmanParticleUpdater(GromovFlowParticleUpdater):
         return ParticleStateUpdate(
             particle_update.state_vector,
             hypothesis,
-            weight=particle_update.weight,
+            log_weight=particle_update.log_weight,
             fixed_covar=kalman_update.covar,
             timestamp=particle_update.timestamp)
 
@@ -256,7 +258,7 @@ class GromovFlowKalmanParticleUpdater(GromovFlowParticleUpdater):
 
         return ParticleMeasurementPrediction(
             state_vector=particle_prediction.state_vector,
-            weight=state_prediction.weight,
+            log_weight=state_prediction.log_weight,
             fixed_covar=kalman_prediction.covar,
             timestamp=particle_prediction.timestamp)
 
@@ -1,10 +1,11 @@
 from abc import abstractmethod
 
-from scipy.stats import multivariate_normal
 import numpy as np
 
 from ..base import Base, Property
+from ..functions import gaussian_logpdf
 from .kalman import KalmanUpdater
+from ..types.array import CovarianceMatrix, StateVector
 from ..types.update import GaussianMixtureUpdate
 from ..types.state import TaggedWeightedGaussianState
 from ..types.numeric import Probability
@@ -53,38 +54,26 @@ class PointProcessUpdater(Base):
             GaussianMixtureMultiTargetTracker with updated \
             components at time :math:`k+1`
         """
+        detected_components = self._detected_components(hypotheses[:-1])
+
         updated_components = list()
         weight_sum_list = list()
         # Loop over all measurements
-        for multi_hypothesis in hypotheses[:-1]:
+        for multi_hypothesis, components in zip(hypotheses[:-1], detected_components):
             updated_measurement_components = list()
             # Initialise weight sum for measurement to clutter intensity
             weight_sum = 0
-            # For every valid single hypothesis, update that component with
-            # measurements and calculate new weight
-            for hypothesis in multi_hypothesis:
-                measurement_prediction = \
-                    self.updater.predict_measurement(
-                            hypothesis.prediction, hypothesis.measurement.measurement_model)
-                measurement = hypothesis.measurement
+            # For every valid single hypothesis, add the updated component
+            # and its new weight
+            for hypothesis, (new_weight, mean, covar) in zip(multi_hypothesis, components):
                 prediction = hypothesis.prediction
-                # Calculate new weight and add to weight sum
-                q = multivariate_normal.pdf(
-                    measurement.state_vector.flatten(),
-                    mean=measurement_prediction.mean.flatten(),
-                    cov=measurement_prediction.covar
-                )
-                new_weight = self.prob_detection\
-                    * prediction.weight * q * self.prob_survival
                 weight_sum += new_weight
-                # Perform single target Kalman Update
-                temp_updated_component = self.updater.update(hypothesis)
                 updated_component = TaggedWeightedGaussianState(
                     tag=prediction.tag if prediction.tag != "birth" else None,
                     weight=new_weight,
-                    state_vector=temp_updated_component.mean,
-                    covar=temp_updated_component.covar,
-                    timestamp=temp_updated_component.timestamp
+                    state_vector=mean,
+                    covar=covar,
+                    timestamp=hypothesis.measurement.timestamp
                 )
                 # Add updated component to mixture
                 updated_measurement_components.append(updated_component)
@@ -121,6 +110,103 @@ class PointProcessUpdater(Base):
         return GaussianMixtureUpdate(hypothesis=hypotheses,
                                      components=updated_components)
 
+    def _detected_components(self, hypotheses):
+        """Unnormalised weight, posterior mean and covariance of each detection hypothesis
+
+        With the standard Kalman update equations (as used by :class:`~.KalmanUpdater`,
+        :class:`~.ExtendedKalmanUpdater` and :class:`~.UnscentedKalmanUpdater`), the
+        measurement prediction, Kalman gain and posterior covariance depend only on the
+        component and measurement model, not the measurement. These are therefore computed
+        once per component, with the likelihoods and posterior means for all measurements
+        associated with that component computed as array operations. Other updaters are
+        applied to each hypothesis in turn.
+
+        Parameters
+        ----------
+        hypotheses : list of :class:`~.MultipleHypothesis`
+            Detection hypotheses for each measurement
+
+        Returns
+        -------
+        : list of list of tuple
+            Weight, posterior mean and posterior covariance for each hypothesis, in the same
+            structure as `hypotheses`
+        """
+        results = [[None]*len(multi_hypothesis) for multi_hypothesis in hypotheses]
+
+        # Group hypotheses which share a component and measurement model
+        groups = {}
+        for i, multi_hypothesis in enumerate(hypotheses):
+            for j, hypothesis in enumerate(multi_hypothesis):
+                measurement_model = self.updater._check_measurement_model(
+                    hypothesis.measurement.measurement_model)
+                groups.setdefault(
+                    (id(hypothesis.prediction), measurement_model), []).append((i, j, hypothesis))
+
+        batchable = self._batchable_updater()
+        for (_, measurement_model), group in groups.items():
+            hypothesis = group[0][2]
+            prediction = hypothesis.prediction
+            if hypothesis.measurement_prediction is None:
+                hypothesis.measurement_prediction = self.updater.predict_measurement(
+                    prediction, measurement_model=measurement_model)
+            measurement_prediction = hypothesis.measurement_prediction
+
+            measurement_vectors = [hyp.measurement.state_vector for *_, hyp in group]
+            if not batchable or measurement_prediction.state_vector.dtype == object \
+                    or prediction.state_vector.dtype == object \
+                    or any(vector.dtype == object for vector in measurement_vectors):
+                for i, j, hyp in group:
+                    results[i][j] = self._detected_component(hyp)
+                continue
+
+            for *_, hyp in group:
+                if hyp.measurement_prediction is None:
+                    hyp.measurement_prediction = measurement_prediction
+
+            # Kalman gain and posterior covariance, common to all measurements
+            posterior_covariance, kalman_gain = self.updater._posterior_covariance(hypothesis)
+            if self.updater.force_symmetric_covariance:
+                posterior_covariance = (posterior_covariance + posterior_covariance.T)/2
+
+            innovations = np.hstack(measurement_vectors).astype(np.float64) \
+                - np.asarray(measurement_prediction.state_vector, dtype=np.float64)
+            posterior_means = np.asarray(prediction.state_vector, dtype=np.float64) \
+                + np.asarray(kalman_gain) @ innovations
+            likelihoods = np.exp(gaussian_logpdf(innovations, measurement_prediction.covar))
+
+            for (i, j, hyp), posterior_mean, likelihood in zip(
+                    group, posterior_means.T, likelihoods):
+                new_weight = self.prob_detection \
+                    * prediction.weight * likelihood * self.prob_survival
+                results[i][j] = (
+                    new_weight,
+                    StateVector(posterior_mean),
+                    CovarianceMatrix(posterior_covariance.copy()))
+        return results
+
+    def _batchable_updater(self):
+        """Whether :attr:`updater` uses the standard Kalman gain, mean and covariance updates"""
+        updater_type = type(self.updater)
+        return all(
+            getattr(updater_type, name, None) is getattr(KalmanUpdater, name)
+            for name in ('update', '_posterior_mean', '_posterior_covariance'))
+
+    def _detected_component(self, hypothesis):
+        """Unnormalised weight, posterior mean and covariance of a single hypothesis"""
+        measurement_prediction = self.updater.predict_measurement(
+            hypothesis.prediction, hypothesis.measurement.measurement_model)
+        # Calculate new weight
+        q = np.exp(gaussian_logpdf(
+            np.asarray(hypothesis.measurement.state_vector, dtype=np.float64)
+            - np.asarray(measurement_prediction.mean, dtype=np.float64),
+            measurement_prediction.covar)[0])
+        new_weight = self.prob_detection \
+            * hypothesis.prediction.weight * q * self.prob_survival
+        # Perform single target Kalman Update
+        updated_component = self.updater.update(hypothesis)
+        return new_weight, updated_component.mean, updated_component.covar
+
     @abstractmethod
     def _calculate_update_terms(self, updated_sum_list, hypotheses):
         raise NotImplementedError
@@ -79,18 +79,18 @@ def test_diekf():
     # Check state vector is correct
     assert np.allclose(
         updated_state.state_vector,
-        StateVector([[1.810], [1.203], [0.605], [0.901], [0.]]),
+        StateVector([[1.811], [1.205], [0.604], [0.899], [-0.003]]),
         atol=1e-3)
 
     # Check covariance matrix is correct
     assert np.allclose(
         updated_state.covar,
         CovarianceMatrix(
-            [[0.666, 0.167, 0.011, 0.002, 0.],
-             [0.167, 0.427, 0.002, -0.007, -0.008],
-             [0.011, 0.002, 1.604,  0.401, 0.],
-             [0.002, -0.007, 0.401, 0.486, 0.008],
-             [0., -0.008, 0., 0.008, 0.009]]),
+            [[0.667, 0.168, 0.011, 0.002, -0.001],
+             [0.168, 0.426, 0., -0.007, -0.008],
+             [0.011, 0., 1.606,  0.405, 0.003],
+             [0.002, -0.007, 0.405, 0.486, 0.008],
+             [-0.001, -0.008, 0.003, 0.008, 0.010]]),
         atol=1.e-3)
 
     prediction = sub_predictor.predict(updated_state, time3)
@@ -102,14 +102,14 @@ def test_diekf():
 
     assert np.allclose(
         updated_state.state_vector,
-        StateVector([[2.555], [1.010], [1.226], [0.820], [0.002]]),
+        StateVector([[2.557], [1.015], [1.224], [0.815], [0.]]),
         atol=1e-3)
     assert np.allclose(
         updated_state.covar,
         CovarianceMatrix(
-            [[5.904e-01,  2.501e-01, 2.800e-02, 3.878e-04, -5.127e-03],
-             [2.501e-01,  2.984e-01, -4.381e-03, -2.161e-02, -1.362e-02],
-             [2.800e-02, -4.381e-03, 2.121e+00, 6.620e-01, 9.775e-03],
-             [3.878e-04, -2.161e-02, 6.620e-01, 4.395e-01, 1.740e-02],
-             [-5.127e-03, -1.362e-02, 9.775e-03, 1.740e-02, 1.107e-02]]),
+            [[5.907e-01,  2.500e-01, 2.638e-02, -2.040e-04, -5.354e-03],
+             [2.500e-01,  2.956e-01, -5.292e-03, -1.890e-02, -1.262e-02],
+             [2.638e-02, -5.292e-03, 2.127e+00, 6.658e-01, 1.211e-02],
+             [-2.040e-04, -1.890e-02, 6.658e-01, 4.378e-01, 1.693e-02],
+             [-5.354e-03, -1.262e-02, 1.211e-02, 1.693e-02, 1.105e-02]]),
         atol=1e-3)
@@ -4,6 +4,7 @@ import pytest
 import numpy as np
 
 from stonesoup.models.measurement.linear import LinearGaussian
+from stonesoup.models.measurement.nonlinear import CartesianToBearingRange
 from stonesoup.types.detection import Detection
 from stonesoup.types.hypothesis import SingleHypothesis
 from stonesoup.types.prediction import (
@@ -133,6 +134,40 @@ def test_kalman(UpdaterClass, measurement_model, prediction, measurement):
     assert posterior.timestamp == prediction.timestamp
 
 
+@pytest.mark.parametrize(
+    "UpdaterClass, measurement_model",
+    [
+        (KalmanUpdater, LinearGaussian(ndim_state=4, mapping=[0, 2], noise_covar=np.eye(2))),
+        (ExtendedKalmanUpdater,
+         CartesianToBearingRange(ndim_state=4, mapping=[0, 2], noise_covar=np.diag([0.01, 1]))),
+        (IteratedKalmanUpdater,
+         CartesianToBearingRange(ndim_state=4, mapping=[0, 2], noise_covar=np.diag([0.01, 1]))),
+        (UnscentedKalmanUpdater,
+         CartesianToBearingRange(ndim_state=4, mapping=[0, 2], noise_covar=np.diag([0.01, 1]))),
+    ],
+    ids=["standard", "extended", "iterated", "unscented"]
+)
+def test_batch_predict_measurement(UpdaterClass, measurement_model):
+    updater = UpdaterClass(measurement_model=measurement_model)
+    predictions = [
+        GaussianStatePrediction(np.random.randn(4, 1) * 10, np.diag([1., 0.5, 2., 0.1]) * scale)
+        for scale in range(1, 6)]
+
+    measurement_predictions = updater.batch_predict_measurement(predictions)
+    assert len(measurement_predictions) == len(predictions)
+    for prediction, measurement_prediction in zip(predictions, measurement_predictions):
+        eval_measurement_prediction = updater.predict_measurement(prediction)
+        assert type(measurement_prediction.state_vector[0, 0]) \
+            is type(eval_measurement_prediction.state_vector[0, 0])
+        assert np.allclose(measurement_prediction.state_vector.astype(float),
+                           eval_measurement_prediction.state_vector.astype(float),
+                           0, atol=1.e-14)
+        assert np.allclose(measurement_prediction.covar,
+                           eval_measurement_prediction.covar, 0, atol=1.e-14)
+        assert np.allclose(measurement_prediction.cross_covar,
+                           eval_measurement_prediction.cross_covar, 0, atol=1.e-14)
+
+
 def test_sqrt_kalman():
     measurement_model = LinearGaussian(ndim_state=2, mapping=[0],
                                        noise_covar=np.array([[0.04]]))
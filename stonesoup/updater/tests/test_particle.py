@@ -18,7 +18,7 @@ from ...types.prediction import (
 from ...updater.particle import (
     ParticleUpdater, GromovFlowParticleUpdater,
     GromovFlowKalmanParticleUpdater, BernoulliParticleUpdater)
-from ...predictor.particle import BernoulliParticlePredictor
+from ...predictor.particle import BernoulliParticlePredictor, ParticlePredictor
 from ...models.transition.linear import ConstantVelocity, CombinedLinearGaussianTransitionModel
 from ...types.update import BernoulliParticleStateUpdate
 from ...sampler.particle import ParticleSampler
@@ -263,3 +263,39 @@ def test_regularised_particle(transition_model, model_flag):
     assert updated_state.hypothesis.measurement_prediction == measurement_prediction
     assert updated_state.hypothesis.prediction == prediction
     assert updated_state.hypothesis.measurement == measurement
+
+
+@pytest.mark.parametrize('dtype', (np.float64, np.float32))
+def test_particle_dtype(dtype, monkeypatch):
+    def raise_particle(*args, **kwargs):
+        raise AssertionError("Particle object created")
+    monkeypatch.setattr(Particle, '__init__', raise_particle)
+
+    np.random.seed(1990)
+    timestamp = datetime.datetime(2020, 1, 1)
+    transition_model = CombinedLinearGaussianTransitionModel([ConstantVelocity(0.05)]*2)
+    measurement_model = LinearGaussian(
+        ndim_state=4, mapping=[0, 2], noise_covar=np.diag([0.5, 0.5]))
+    predictor = ParticlePredictor(transition_model)
+    updater = ParticleUpdater(
+        measurement_model, resampler=SystematicResampler(), regulariser=MCMCRegulariser())
+
+    nparts = 1000
+    state = ParticleState(
+        StateVectors(np.random.normal(size=(4, nparts)).astype(dtype)),
+        log_weight=np.full(nparts, -np.log(nparts), dtype=dtype),
+        timestamp=timestamp)
+    for step in range(1, 4):
+        timestamp += datetime.timedelta(seconds=1)
+        prediction = predictor.predict(state, timestamp=timestamp)
+        assert prediction.state_vector.dtype == dtype
+        detection = Detection(
+            [[step], [step]], timestamp=timestamp, measurement_model=measurement_model)
+        state = updater.update(SingleHypothesis(prediction, detection))
+        assert isinstance(state.state_vector, StateVectors)
+        assert state.state_vector.dtype == dtype
+        assert state.log_weight.dtype == dtype
+        assert np.isclose(np.sum(np.exp(state.log_weight, dtype=np.float64)), 1, atol=1e-4)
+        # Weights not converted to Probability objects
+        assert 'weight' not in state.__dict__
+    assert np.allclose(state.mean[[0, 2], 0], [2.5, 2.5], atol=1)
@@ -4,9 +4,11 @@ import numpy as np
 from scipy.stats import multivariate_normal
 
 
+from stonesoup.types.detection import Detection
 from stonesoup.types.hypothesis import SingleHypothesis
 from stonesoup.types.multihypothesis import MultipleHypothesis
-from stonesoup.types.prediction import GaussianMeasurementPrediction
+from stonesoup.types.prediction import (
+    GaussianMeasurementPrediction, TaggedWeightedGaussianStatePrediction)
 from stonesoup.types.state import GaussianState
 from stonesoup.updater.kalman import (
     KalmanUpdater, ExtendedKalmanUpdater, UnscentedKalmanUpdater)
@@ -164,3 +166,45 @@ def test_lcc_single_component_update(UpdaterClass, measurement_model,
     assert miss_detected_component.timestamp == prediction.timestamp
     l1 = 1
     assert miss_detected_component.weight == prediction.weight*(1-prob_detection)*l1
+
+
+@pytest.mark.parametrize("UpdaterClass", [PHDUpdater, LCCUpdater], ids=["phd", "lcc"])
+def test_batched_update(UpdaterClass, measurement_model, timestamp):
+    rng = np.random.default_rng(1)
+    predictions = [
+        TaggedWeightedGaussianStatePrediction(
+            rng.uniform(-10, 10, (2, 1)), np.diag([4., 0.04]), weight=0.5, tag=tag,
+            timestamp=timestamp)
+        for tag in (1, 2, 3, "birth")]
+    measurements = [
+        Detection(rng.uniform(-10, 10, (1, 1)), timestamp=timestamp,
+                  measurement_model=measurement_model)
+        for _ in range(5)]
+    # Gated, such that not every component is hypothesised with every measurement
+    hypotheses = [
+        MultipleHypothesis([SingleHypothesis(prediction, measurement)
+                            for prediction in predictions[i % 2:]])
+        for i, measurement in enumerate(measurements)]
+    hypotheses.append(MultipleHypothesis(
+        [SingleHypothesis(prediction, None) for prediction in predictions]))
+
+    updater = UpdaterClass(
+        updater=KalmanUpdater(measurement_model), prob_detection=0.9,
+        clutter_spatial_density=1e-3)
+    reference_updater = UpdaterClass(
+        updater=KalmanUpdater(measurement_model), prob_detection=0.9,
+        clutter_spatial_density=1e-3)
+    # Apply the underlying updater to each hypothesis in turn
+    reference_updater._batchable_updater = lambda: False
+
+    updated_mixture = updater.update(hypotheses)
+    reference_mixture = reference_updater.update(hypotheses)
+
+    assert len(updated_mixture) == len(reference_mixture) == 3*4 + 2*3 + 3
+    for component, reference_component in zip(updated_mixture, reference_mixture):
+        if reference_component.tag in {1, 2, 3}:  # Birth components get new tags
+            assert component.tag == reference_component.tag
+        assert component.timestamp == reference_component.timestamp
+        assert np.allclose(component.mean, reference_component.mean, 0, atol=1.e-14)
+        assert np.allclose(component.covar, reference_component.covar, 0, atol=1.e-14)
+        assert float(component.weight) == pytest.approx(float(reference_component.weight))
@@ -0,0 +1,153 @@
+import os
+from pathlib import Path
+
+import numpy as np
+
+from ..base import Property
+from ..reader import DetectionReader
+from ..reader.binary import _SCAN_DTYPE, _STATE_DTYPE, _DETECTION_DTYPE
+from ..tracker import Tracker
+from .base import Writer
+
+
+class BinaryLogWriter(Writer):
+    """Binary Log Writer
+
+    Writes tracks and/or detections to an append only, columnar binary log, which can be read
+    with :class:`~.BinaryLogTrackReader` and :class:`~.BinaryLogDetectionReader`. Only the
+    changes of each scan are logged: new tracks, states added to tracks since the previous scan,
+    and deleted tracks, so the log grows in proportion to the number of states (rather than with
+    the square of track length, as with :class:`~.YAMLWriter`). See :mod:`stonesoup.reader.binary`
+    for the format.
+
+    Scans are held in memory until :attr:`segment_size` scans have been logged, at which point
+    they are written as a new segment. Segments are written complete (and remaining scans on
+    exit), such that a log can be read whilst being written.
+
+    Note
+    ----
+    Only the state vector, covariance (where present) and timestamp of each state are logged,
+    along with the state vector and timestamp of each detection. States are assumed not to be
+    modified or removed once added to a track.
+    """
+    path: Path = Property(doc="Directory to save log to, which must not already contain a log. "
+                              "Str will be converted to Path")
+    detections_source: DetectionReader = Property(default=None)
+    tracks_source: Tracker = Property(default=None)
+    segment_size: int = Property(
+        default=1000, doc="Number of scans written to each segment of the log. Default 1000.")
+
+    def __init__(self, path, *args, **kwargs):
+        if not isinstance(path, Path):
+            path = Path(path)  # Ensure Path
+        super().__init__(path, *args, **kwargs)
+        if not any((self.detections_source, self.tracks_source)):
+            raise ValueError("At least one source required")
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        if any(path.name.isdigit() for path in self.path.iterdir()):
+            raise FileExistsError(f"Log already exists in {self.path}")
+
+        self._segment_number = 0
+        self._track_indexes = {}  # Index of tracks existing at previous scan
+        self._track_lengths = {}  # Number of states logged of each track
+        self._next_track_index = 0
+        self._new_segment()
+
+    def _new_segment(self):
+        self._scans = []
+        self._track_ids = []
+        self._states = []
+        self._deleted = []
+        self._detections = []
+        self._values = []
+        self._values_size = 0
+
+    def _add_values(self, *arrays):
+        offset = self._values_size
+        for array in arrays:
+            array = np.asarray(array, dtype=np.float64).ravel()
+            self._values.append(array)
+            self._values_size += array.size
+        return offset
+
+    def write(self):
+        if self.tracks_source:
+            gen = self.tracks_source
+        elif self.detections_source:
+            gen = self.detections_source
+        else:  # pragma: no cover
+            raise RuntimeError("At least one source required")
+
+        for time, _ in gen:
+            if self.tracks_source:
+                self._log_tracks(self.tracks_source.tracks)
+            if self.detections_source:
+                self._log_detections(self.detections_source.detections)
+            self._scans.append((
+                time, len(self._track_ids), len(self._states), len(self._deleted),
+                len(self._detections)))
+            if len(self._scans) >= self.segment_size:
+                self.flush()
+
+    def _log_tracks(self, tracks):
+        tracks = set(tracks)
+        for track in tracks:
+            track_index = self._track_indexes.get(track)
+            if track_index is None:
+                track_index = self._track_indexes[track] = self._next_track_index
+                self._next_track_index += 1
+                self._track_ids.append(str(track.id))
+                self._track_lengths[track] = 0
+            logged_length = self._track_lengths[track]
+            for state in track.states[logged_length:]:
+                state_vector = state.state_vector
+                covar = getattr(state, 'covar', None)
+                has_covar = covar is not None \
+                    and np.shape(covar) == (state_vector.shape[0], state_vector.shape[0])
+                offset = self._add_values(state_vector, *((covar, ) if has_covar else ()))
+                self._states.append(
+                    (track_index, state.timestamp, offset, state_vector.shape[0], has_covar))
+            self._track_lengths[track] = len(track)
+
+        for track in self._track_indexes.keys() - tracks:
+            self._deleted.append(self._track_indexes.pop(track))
+            del self._track_lengths[track]
+
+    def _log_detections(self, detections):
+        for detection in detections:
+            offset = self._add_values(detection.state_vector)
+            self._detections.append(
+                (detection.timestamp, offset, detection.state_vector.shape[0]))
+
+    def flush(self):
+        """Write scans logged since the last segment as a new segment"""
+        if not self._scans:
+            return
+        arrays = {
+            'scans': np.array(self._scans, dtype=_SCAN_DTYPE),
+            'track_ids': np.array(self._track_ids, dtype=str),
+            'states': np.array(self._states, dtype=_STATE_DTYPE),
+            'deleted': np.array(self._deleted, dtype=np.int64),
+            'detections': np.array(self._detections, dtype=_DETECTION_DTYPE),
+            'values': np.concatenate(self._values) if self._values else np.empty(0),
+        }
+        # Written to temporary directory, so only complete segments are read
+        name = f'{self._segment_number:08d}'
+        temp_path = self.path / f'.{name}'
+        temp_path.mkdir()
+        for array_name, array in arrays.items():
+            np.save(temp_path / f'{array_name}.npy', array)
+        os.replace(temp_path, self.path / name)
+        self._segment_number += 1
+        self._new_segment()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        if getattr(self, '_scans', None):
+            self.flush()
+
+    def __del__(self):
+        self.__exit__()
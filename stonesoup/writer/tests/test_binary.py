@@ -0,0 +1,52 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from ..binary import BinaryLogWriter
+
+
+def test_detections_binary(detection_reader, tmpdir):
+    path = tmpdir.join("detections")
+
+    with BinaryLogWriter(path.strpath, detections_source=detection_reader,
+                         segment_size=2) as writer:
+        writer.write()
+
+    assert sorted(segment.basename for segment in path.listdir()) == ['00000000', '00000001']
+    scans = np.concatenate([np.load(path.join(segment, 'scans.npy').strpath)
+                            for segment in ('00000000', '00000001')])
+    assert scans['time'].tolist() == [
+        datetime.datetime(2018, 1, 1, 14, minute) for minute in range(3)]
+    assert scans['detections'].tolist() == [0, 1, 2]  # Within each segment
+    detections = np.load(path.join('00000001', 'detections.npy').strpath)
+    assert detections['ndim'].tolist() == [1, 1]
+    assert np.load(path.join('00000001', 'values.npy').strpath).tolist() == [2, 2]
+
+
+def test_tracks_binary(tracker, tmpdir):
+    path = tmpdir.join("tracks")
+
+    with BinaryLogWriter(path.strpath, tracks_source=tracker) as writer:
+        writer.write()
+
+    segment = path.join('00000000')
+    scans = np.load(segment.join('scans.npy').strpath)
+    assert scans['tracks'].tolist() == [0, 1]
+    assert scans['states'].tolist() == [0, 1]
+    assert np.load(segment.join('track_ids.npy').strpath).tolist() == ['0']
+    states = np.load(segment.join('states.npy').strpath)
+    assert states['track'].tolist() == [0]
+    assert states['timestamp'].tolist() == [datetime.datetime(2018, 1, 1, 14, 1)]
+    assert not states['covar'][0]
+
+
+def test_binary_bad_init(detection_reader, tmpdir):
+    path = tmpdir.join("bad_init")
+    with pytest.raises(ValueError, match="At least one source required"):
+        BinaryLogWriter(path.strpath)
+
+    with BinaryLogWriter(path.strpath, detections_source=detection_reader) as writer:
+        writer.write()
+    with pytest.raises(FileExistsError, match="Log already exists"):
+        BinaryLogWriter(path.strpath, detections_source=detection_reader)